@@ -1,4 +1,5 @@
 # -*- mode: python ; coding: utf-8 -*-
+from PyInstaller.utils.hooks import collect_submodules
 
 
 a = Analysis(
@@ -6,7 +7,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('F:\\2025 NEW PROJECTS\\Pasindu\\Shine Art Studio\\pos_system\\assets', 'assets')],
-    hiddenimports=[],
+    hiddenimports=collect_submodules('ui') + collect_submodules('services'),
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
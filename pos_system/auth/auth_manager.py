@@ -3,12 +3,15 @@ import sqlite3
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+from database.connection_pool import get_pool
+
 
 class AuthManager:
     """Handle user authentication and password management"""
     
     def __init__(self, db_path='pos_database.db'):
         self.db_path = db_path
+        self.pool = get_pool(db_path)
         self.current_user = None
     
     def hash_password(self, password: str) -> str:
@@ -22,38 +25,39 @@ class AuthManager:
     def authenticate(self, username: str, password: str) -> Optional[Dict[str, Any]]:
         """Authenticate a user and return user info if successful"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM users 
-                WHERE username = ? AND is_active = 1
-            ''', (username,))
-            
-            user = cursor.fetchone()
-            
-            if user and self.verify_password(password, user['password_hash']):
-                self.current_user = dict(user)
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
                 
-                # Update last_login timestamp
-                current_time = datetime.now().strftime('%Y-%m-%d %H:%M')
                 cursor.execute('''
-                    UPDATE users SET last_login = ? WHERE id = ?
-                ''', (current_time, user['id']))
-                conn.commit()
+                    SELECT * FROM users 
+                    WHERE username = ? AND is_active = 1
+                ''', (username,))
                 
-                # Store last_login in current_user
-                self.current_user['last_login'] = current_time
+                user = cursor.fetchone()
                 
-                # Load user permissions
-                self._load_user_permissions(cursor, user['id'], user['role'])
+                if user and self.verify_password(password, user['password_hash']):
+                    self.current_user = dict(user)
+                    
+                    # Update last_login timestamp
+                    current_time = datetime.now().strftime('%Y-%m-%d %H:%M')
+                    
+                    def work(write_conn):
+                        write_conn.execute('''
+                            UPDATE users SET last_login = ? WHERE id = ?
+                        ''', (current_time, user['id']))
+                        write_conn.commit()
+                    
+                    self.pool.run_write(work)
+                    
+                    # Store last_login in current_user
+                    self.current_user['last_login'] = current_time
+                    
+                    # Load user permissions
+                    self._load_user_permissions(cursor, user['id'], user['role'])
+                    
+                    return self.current_user
                 
-                conn.close()
-                return self.current_user
-            
-            conn.close()
-            return None
+                return None
             
         except sqlite3.Error as e:
             print(f"Authentication error: {e}")
@@ -165,21 +169,19 @@ class AuthManager:
     
     def change_password(self, user_id: int, new_password: str) -> bool:
         """Change user password"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            new_hash = self.hash_password(new_password)
-            cursor.execute('''
+        new_hash = self.hash_password(new_password)
+        
+        def work(conn):
+            conn.execute('''
                 UPDATE users 
                 SET password_hash = ?
                 WHERE id = ?
             ''', (new_hash, user_id))
-            
             conn.commit()
-            conn.close()
             return True
-            
+        
+        try:
+            return self.pool.run_write(work)
         except sqlite3.Error as e:
             print(f"Password change error: {e}")
             return False
@@ -187,21 +189,19 @@ class AuthManager:
     def create_user(self, username: str, password: str, role: str, 
                    full_name: str) -> Optional[int]:
         """Create a new user (admin only)"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            password_hash = self.hash_password(password)
-            cursor.execute('''
+        password_hash = self.hash_password(password)
+        
+        def work(conn):
+            cursor = conn.execute('''
                 INSERT INTO users (username, password_hash, role, full_name)
                 VALUES (?, ?, ?, ?)
             ''', (username, password_hash, role, full_name))
-            
             user_id = cursor.lastrowid
             conn.commit()
-            conn.close()
             return user_id
-            
+        
+        try:
+            return self.pool.run_write(work)
         except sqlite3.Error as e:
             print(f"User creation error: {e}")
             return None
@@ -209,14 +209,12 @@ class AuthManager:
     def get_all_users(self) -> list:
         """Get all users (admin only)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT id, username, role, full_name, is_active FROM users')
-            users = [dict(row) for row in cursor.fetchall()]
-            conn.close()
-            return users
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('SELECT id, username, role, full_name, is_active FROM users')
+                users = [dict(row) for row in cursor.fetchall()]
+                return users
             
         except sqlite3.Error as e:
             print(f"Error fetching users: {e}")
@@ -224,20 +222,17 @@ class AuthManager:
     
     def toggle_user_status(self, user_id: int) -> bool:
         """Activate or deactivate a user (admin only)"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+        def work(conn):
+            conn.execute('''
                 UPDATE users 
                 SET is_active = CASE WHEN is_active = 1 THEN 0 ELSE 1 END
                 WHERE id = ?
             ''', (user_id,))
-            
             conn.commit()
-            conn.close()
             return True
-            
+        
+        try:
+            return self.pool.run_write(work)
         except sqlite3.Error as e:
             print(f"Error toggling user status: {e}")
             return False
@@ -0,0 +1,81 @@
+"""
+Benchmark: month-close report batch throughput
+Builds every Daily, Weekly and Monthly executive, industrial and financial
+report for one month of seeded data three ways: one report after another
+with each generator querying its own data (before), the batch builder in a
+single process sharing one dataset per period, and the batch builder on a
+process pool with one worker per CPU core. Reports per minute for each.
+
+Usage: python benchmarks/bench_batch_reports.py [start YYYY-MM-DD] [end YYYY-MM-DD]
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.seed_data import create_seeded_database, remove_database
+from services.batch_reports import batch_periods, generate_batch_reports
+from services.executive_report_generator import ExecutiveReportGenerator
+from services.industrial_report_generator import IndustrialReportGenerator
+from services.financial_report_generator import FinancialReportGenerator
+
+
+def serial_reports(db_path: str, start_date: str, end_date: str, output_dir: str) -> int:
+    """Every report generated on its own, as the Reports page does"""
+    count = 0
+    for period_type, start, end in batch_periods(start_date, end_date):
+        ExecutiveReportGenerator(db_path, output_dir).generate_report(start, end, period_type)
+        IndustrialReportGenerator(db_path, output_dir).generate_report(start, end, period_type)
+        FinancialReportGenerator(output_dir, db_path).generate_period_report(start, end, period_type)
+        count += 3
+    return count
+
+
+def timed(call):
+    """(seconds, report count) of one run"""
+    started = time.perf_counter()
+    count = call()
+    return time.perf_counter() - started, count
+
+
+def main():
+    today = datetime.now()
+    end_date = sys.argv[2] if len(sys.argv) > 2 else (today - timedelta(days=1)).strftime('%Y-%m-%d')
+    start_date = sys.argv[1] if len(sys.argv) > 1 else (today - timedelta(days=30)).strftime('%Y-%m-%d')
+    cores = os.cpu_count() or 1
+
+    db_path = create_seeded_database(customers=500, bills=4000, invoices=1500,
+                                     bookings=400, expenses=300, days=60)
+    output_dir = tempfile.mkdtemp(prefix='pos_batch_')
+    try:
+        runs = [
+            ("Serial, each report queries (before)",
+             timed(lambda: serial_reports(db_path, start_date, end_date, output_dir))),
+            ("Batch, 1 process, shared datasets",
+             timed(lambda: len(generate_batch_reports(db_path, start_date, end_date,
+                                                      output_dir=output_dir, workers=1)))),
+            (f"Batch, {cores} worker process(es)",
+             timed(lambda: len(generate_batch_reports(db_path, start_date, end_date,
+                                                      output_dir=output_dir, workers=cores)))),
+        ]
+    finally:
+        shutil.rmtree(output_dir)
+        remove_database(db_path)
+
+    print("\n" + "=" * 72)
+    print(f"Reports for {start_date} to {end_date} on {cores} CPU core(s)")
+    print("=" * 72)
+    print(f"{'Run':<40} | {'Reports':>7} | {'Seconds':>8} | {'Per min':>8}")
+    print("-" * 72)
+    for label, (seconds, count) in runs:
+        print(f"{label:<40} | {count:>7} | {seconds:>8.1f} | {count / seconds * 60:>8.1f}")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: bill history load with and without per-row item counts
+Compares the previous history load (500 bills, then get_bill_items once per
+row to count its items) against listings that return item_count directly,
+on a database with 10k bills.
+
+Usage: python benchmarks/bench_bill_history.py [bills] [repeats]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.seed_data import create_seeded_database, remove_database
+from database import DatabaseManager
+
+
+def per_row_counts(db_manager: DatabaseManager) -> list:
+    """History rows the way they were loaded before item_count: N+1 queries"""
+    bills = db_manager.get_all_bills(limit=500)
+    return [len(db_manager.get_bill_items(bill['id'])) for bill in bills]
+
+
+def listing_counts(db_manager: DatabaseManager) -> list:
+    """Same 500 rows with the item count from the listing query"""
+    return [bill['item_count'] for bill in db_manager.get_all_bills(limit=500)]
+
+
+def first_page(db_manager: DatabaseManager) -> list:
+    """What the history screen now loads before the first scroll"""
+    bills, _ = db_manager.get_bills_page()
+    return [bill['item_count'] for bill in bills]
+
+
+def time_call(call, repeats: int) -> float:
+    """Average milliseconds per call"""
+    call()  # warm the page cache
+    started = time.perf_counter()
+    for _ in range(repeats):
+        call()
+    return (time.perf_counter() - started) * 1000 / repeats
+
+
+def main():
+    bills = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    print(f"Seeding benchmark database with {bills:,} bills...")
+    db_path = create_seeded_database(bills=bills, invoices=1000)
+    db_manager = DatabaseManager(db_path)
+
+    try:
+        assert per_row_counts(db_manager) == listing_counts(db_manager)
+        before = time_call(lambda: per_row_counts(db_manager), repeats)
+        after = time_call(lambda: listing_counts(db_manager), repeats)
+        paged = time_call(lambda: first_page(db_manager), repeats)
+    finally:
+        db_manager.pool.close()
+        remove_database(db_path)
+
+    print("\n" + "=" * 60)
+    print(f"{'Approach':<34} | {'ms / load':>10}")
+    print("=" * 60)
+    print(f"{'500 bills + per-row item query':<34} | {before:>10.2f}")
+    print(f"{'500 bills with item_count':<34} | {after:>10.2f}")
+    print(f"{'First page (100) with item_count':<34} | {paged:>10.2f}")
+    print("=" * 60)
+    print(f"Speedup (500 rows): {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
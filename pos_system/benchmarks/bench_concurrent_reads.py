@@ -0,0 +1,75 @@
+"""
+Benchmark: read throughput vs. thread count
+Compares pooled WAL readers running in parallel against the previous
+model where a single class-wide lock serialized every query.
+
+Usage: python benchmarks/bench_concurrent_reads.py [seconds_per_run]
+"""
+
+import os
+import sys
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.seed_data import create_seeded_database, remove_database
+from database import DatabaseManager
+
+READ_QUERY = '''
+    SELECT DATE(b.created_at) AS day, COUNT(*) AS bills, SUM(bi.total_price) AS revenue
+    FROM bills b
+    JOIN bill_items bi ON bi.bill_id = b.id
+    GROUP BY day
+'''
+
+
+def run(db_manager: DatabaseManager, threads: int, seconds: float, global_lock=None) -> float:
+    """Run READ_QUERY from several threads and return queries per second"""
+    counts = [0] * threads
+    stop = threading.Event()
+
+    def worker(index):
+        while not stop.is_set():
+            if global_lock is not None:
+                with global_lock:
+                    db_manager.execute_query(READ_QUERY)
+            else:
+                db_manager.execute_query(READ_QUERY)
+            counts[index] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    for w in workers:
+        w.start()
+    time.sleep(seconds)
+    stop.set()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - started
+    return sum(counts) / elapsed
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+
+    print("Seeding benchmark database...")
+    db_path = create_seeded_database(bills=20000, invoices=5000)
+    db_manager = DatabaseManager(db_path)
+
+    print("\n" + "=" * 60)
+    print(f"{'Threads':>8} | {'Global lock (q/s)':>18} | {'WAL readers (q/s)':>18} | {'Speedup':>7}")
+    print("=" * 60)
+    try:
+        for threads in (1, 2, 4, 8):
+            locked = run(db_manager, threads, seconds, global_lock=threading.Lock())
+            parallel = run(db_manager, threads, seconds)
+            print(f"{threads:>8} | {locked:>18.1f} | {parallel:>18.1f} | {parallel / locked:>6.2f}x")
+    finally:
+        db_manager.pool.close()
+        remove_database(db_path)
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: billing customer autocomplete
+Compares the per-keystroke SQL search the billing screen used to run against
+the in-memory customer lookup cache, for mobile prefixes typed at the till on
+a database with 50k customers.
+
+Usage: python benchmarks/bench_customer_lookup.py [customers] [repeats]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.seed_data import create_seeded_database, remove_database
+from database import DatabaseManager
+
+# Prefixes as the suggestions fire: one per keystroke from the fifth digit
+PREFIXES = ['07000', '070001', '0700012', '07000123', '070001234', 'Customer 0123']
+
+
+def like_search(db_manager: DatabaseManager, prefix: str) -> list:
+    """The autocomplete query before the search index"""
+    return db_manager.execute_query('''
+        SELECT * FROM customers
+        WHERE full_name LIKE ? OR mobile_number LIKE ?
+        ORDER BY full_name
+    ''', (f'%{prefix}%', f'%{prefix}%'))[:5]
+
+
+def time_call(call, repeats: int) -> float:
+    """Average microseconds per call"""
+    call()  # warm the page cache / load the lookup cache
+    started = time.perf_counter()
+    for _ in range(repeats):
+        call()
+    return (time.perf_counter() - started) * 1000000 / repeats
+
+
+def main():
+    customers = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    print(f"Seeding benchmark database with {customers:,} customers...")
+    db_path = create_seeded_database(customers=customers, bills=100, invoices=100,
+                                     bookings=10, expenses=10)
+    db_manager = DatabaseManager(db_path)
+
+    started = time.perf_counter()
+    db_manager.lookup_customers('0')
+    load_ms = (time.perf_counter() - started) * 1000
+
+    print("\n" + "=" * 70)
+    print(f"{'Prefix':<16} | {'LIKE us':>10} | {'FTS5 us':>10} | {'Cache us':>10} | {'Speedup':>8}")
+    print("=" * 70)
+    try:
+        for prefix in PREFIXES:
+            like = time_call(lambda: like_search(db_manager, prefix), max(repeats // 20, 1))
+            fts = time_call(lambda: db_manager.search_customers(prefix, limit=5), repeats)
+            cached = time_call(lambda: db_manager.lookup_customers(prefix), repeats)
+            print(f"{prefix:<16} | {like:>10.1f} | {fts:>10.1f} | {cached:>10.1f} | "
+                  f"{fts / cached:>7.1f}x")
+    finally:
+        db_manager.pool.close()
+        remove_database(db_path)
+    print("=" * 70)
+    print(f"Cache load: {load_ms:.1f} ms (once per process, or after another terminal writes)")
+    print("Speedup: FTS5 / cache")
+
+
+if __name__ == "__main__":
+    main()
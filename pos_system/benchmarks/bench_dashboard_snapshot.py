@@ -0,0 +1,108 @@
+"""
+Benchmark: dashboard snapshot vs. per-KPI fan-out
+Compares get_dashboard_snapshot() against the original dashboard queries:
+one raw SQL query per KPI over the invoice, item and expense tables, each
+on a fresh connection, as DashboardService ran them before the snapshot
+(and before daily_rollups). Uses a database with 100k invoices.
+
+Usage: python benchmarks/bench_dashboard_snapshot.py [invoices] [repeats]
+"""
+
+import os
+import sys
+import time
+import sqlite3
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.seed_data import create_seeded_database, remove_database
+from services.dashboard_service import DashboardService
+
+
+# Each KPI query as DashboardService ran it before the snapshot (and before
+# daily_rollups existed), pinned here so later service changes do not move
+# the baseline
+FAN_OUT_QUERIES = [
+    ('today_sales', "SELECT COALESCE(SUM(total_amount), 0) FROM invoices WHERE DATE(created_at) = :today"),
+    ('today_invoices', "SELECT COUNT(*) FROM invoices WHERE DATE(created_at) = :today"),
+    ('total_invoices', "SELECT COUNT(*) FROM invoices"),
+    ('pending_balances', "SELECT COALESCE(SUM(balance_amount), 0) FROM invoices WHERE balance_amount > 0"),
+    ('total_customers', "SELECT COUNT(*) FROM customers"),
+    ('pending_bookings', "SELECT COUNT(*) FROM bookings WHERE status = 'Pending'"),
+    ('low_stock_frames', "SELECT COUNT(*) FROM photo_frames WHERE quantity < 10"),
+    ('weekly_sales', "SELECT COALESCE(SUM(total_amount), 0) FROM invoices WHERE DATE(created_at) >= :week_ago"),
+    ('monthly_sales', "SELECT COALESCE(SUM(total_amount), 0) FROM invoices WHERE DATE(created_at) >= :first_day"),
+    ('frame_profit', """
+        SELECT COALESCE(SUM(quantity), 0), COALESCE(SUM(total_price), 0), COALESCE(SUM(buying_price), 0)
+        FROM invoice_items WHERE item_type = 'Frame'"""),
+    ('today_frame_profit', """
+        SELECT COALESCE(SUM(ii.quantity), 0), COALESCE(SUM(ii.total_price), 0), COALESCE(SUM(ii.buying_price), 0)
+        FROM invoice_items ii JOIN invoices i ON ii.invoice_id = i.id
+        WHERE ii.item_type = 'Frame' AND DATE(i.created_at) = :today"""),
+    ('monthly_frame_profit', """
+        SELECT COALESCE(SUM(ii.quantity), 0), COALESCE(SUM(ii.total_price), 0), COALESCE(SUM(ii.buying_price), 0)
+        FROM invoice_items ii JOIN invoices i ON ii.invoice_id = i.id
+        WHERE ii.item_type = 'Frame' AND DATE(i.created_at) >= :first_day"""),
+    ('opening_balance', "SELECT opening_balance FROM daily_balances WHERE balance_date = :today"),
+    ('period_expenses', "SELECT COALESCE(SUM(amount), 0) FROM manual_expenses WHERE expense_date = :today"),
+]
+
+
+def fan_out(db_path: str) -> dict:
+    """Admin dashboard stats the way they were gathered before the snapshot:
+    one query per KPI, each on a connection of its own"""
+    now = datetime.now()
+    params = {
+        'today': now.strftime('%Y-%m-%d'),
+        'week_ago': (now - timedelta(days=7)).strftime('%Y-%m-%d'),
+        'first_day': now.replace(day=1).strftime('%Y-%m-%d'),
+    }
+    stats = {}
+    for name, sql in FAN_OUT_QUERIES:
+        conn = sqlite3.connect(db_path)
+        stats[name] = conn.execute(sql, params).fetchone()
+        conn.close()
+    return stats
+
+
+def snapshot(service: DashboardService) -> dict:
+    """Admin dashboard stats from the combined snapshot"""
+    return service.get_dashboard_snapshot(include_frame_profit=True).as_dict()
+
+
+def time_call(call, repeats: int) -> float:
+    """Average milliseconds per call"""
+    call()  # warm the page cache
+    started = time.perf_counter()
+    for _ in range(repeats):
+        call()
+    return (time.perf_counter() - started) * 1000 / repeats
+
+
+def main():
+    invoices = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    print(f"Seeding benchmark database with {invoices:,} invoices...")
+    db_path = create_seeded_database(invoices=invoices, bills=1000)
+    service = DashboardService(db_path)
+
+    try:
+        before = time_call(lambda: fan_out(db_path), repeats)
+        after = time_call(lambda: snapshot(service), repeats)
+    finally:
+        service.pool.close()
+        remove_database(db_path)
+
+    print("\n" + "=" * 60)
+    print(f"{'Approach':<28} | {'ms / refresh':>12}")
+    print("=" * 60)
+    print(f"{'Original per-KPI queries':<28} | {before:>12.2f}")
+    print(f"{'Single snapshot':<28} | {after:>12.2f}")
+    print("=" * 60)
+    print(f"Speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: image asset rendering with and without the image cache
+Times what building the login window, sidebar and window icons costs in
+image work: decoding and LANCZOS-resizing every asset as before, reading
+the stored thumbnails after a restart, and the in-memory hits of later
+logins and page builds.
+
+Usage: python benchmarks/bench_image_assets.py [repeats]
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+from utils import resource_path
+from utils.image_cache import ImageCache, render
+from ui.components import ICON_SIZES
+
+# (asset, size, mask) variants drawn at login and when the main window opens
+VARIANTS = [(resource_path(os.path.join('assets', 'logos', 'appLogo.ico')), size, None)
+            for size in ICON_SIZES] * 2 + [
+    (resource_path(os.path.join('assets', 'login_images', 'loginimage01.jpg')), (576, 864), None),
+    (resource_path(os.path.join('assets', 'logos', 'studio-logo.png')), (220, 50), None),
+    (resource_path(os.path.join('assets', 'logos', 'studio-logo.png')), (220, 50), None),
+    (resource_path(os.path.join('assets', 'profile_pictures', 'user_1.png')), (40, 40), 'circle'),
+]
+
+
+def uncached():
+    """Every variant decoded and resized from its file"""
+    for path, size, mask in VARIANTS:
+        with Image.open(path) as img:
+            render(img, size, mask)
+
+
+def time_call(call, repeats: int) -> float:
+    """Average milliseconds per call"""
+    started = time.perf_counter()
+    for _ in range(repeats):
+        call()
+    return (time.perf_counter() - started) * 1000 / repeats
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    thumbs = tempfile.mkdtemp(prefix='pos_thumbs_')
+    try:
+        warm = ImageCache(thumbs)
+        first_run = time_call(lambda: [warm.get(*variant) for variant in VARIANTS], 1)
+
+        def restart():
+            cache = ImageCache(thumbs)
+            for variant in VARIANTS:
+                cache.get(*variant)
+
+        before = time_call(uncached, repeats)
+        after_restart = time_call(restart, repeats)
+        in_memory = time_call(lambda: [warm.get(*variant) for variant in VARIANTS], repeats)
+    finally:
+        shutil.rmtree(thumbs)
+
+    print("\n" + "=" * 60)
+    print(f"{len(VARIANTS)} image variants per login, average of {repeats} runs")
+    print("=" * 60)
+    print(f"{'Decode and resize every time (before)':<42} | {before:>8.2f} ms")
+    print(f"{'First run, rendering thumbnails':<42} | {first_run:>8.2f} ms")
+    print(f"{'Restart, thumbnails from disk':<42} | {after_restart:>8.2f} ms")
+    print(f"{'Later logins, from memory':<42} | {in_memory:>8.2f} ms")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark: receipt and invoice PDF generation
+Times every PDF the till and booking desk print - A4 invoice, booking
+invoice, booking settlement, thermal bill and balance settlement receipt -
+and reports receipts per second. Also times the per-receipt style setup the
+generators used to do (a fresh stylesheet, paragraph and table styles for
+every PDF) against looking the same styles up in the shared registry.
+
+Usage: python benchmarks/bench_receipts.py [repeats]
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import TableStyle
+
+from services import pdf_styles as styles
+from services.bill_generator import BillGenerator
+from services.invoice_generator import InvoiceGenerator
+
+CUSTOMER = {'full_name': 'Nimal Perera', 'mobile_number': '0771234567'}
+INVOICE = {'invoice_number': 'INV000123', 'created_at': '2026-10-16 10:30', 'subtotal': 12500.0,
+           'discount': 500.0, 'category_service_cost': 0, 'total_amount': 12000.0,
+           'advance_payment': 0, 'balance_amount': 12000.0}
+INVOICE_ITEMS = [{'item_name': f'Photo Frame {i} - 8x12', 'item_type': 'Frame', 'item_id': i,
+                  'quantity': 2, 'unit_price': 1250.0, 'total_price': 2500.0} for i in range(5)]
+BOOKING = {'customer_name': 'Nimal Perera', 'mobile_number': '0771234567', 'booking_date': '2026-10-20',
+           'photoshoot_category': 'Wedding - Full Day', 'full_amount': 85000.0, 'advance_payment': 25000.0}
+SETTLEMENT = {'booking_id': 42, 'settlement_date': '2026-10-16', 'original_booking_date': '2026-09-01',
+              'customer_name': 'Nimal Perera', 'mobile_number': '0771234567',
+              'photoshoot_category': 'Wedding - Full Day', 'full_amount': 85000.0,
+              'original_advance': 25000.0, 'final_payment': 60000.0, 'cash_received': 60000.0, 'change_given': 0}
+BILL = {'bill_number': 'BILL000123', 'created_at': '2026-10-16 10:30:00', 'created_by_name': 'Staff',
+        'subtotal': 7500.0, 'discount': 0, 'service_charge': 500.0, 'total_amount': 8000.0,
+        'advance_amount': 0, 'balance_due': 0, 'cash_given': 10000.0}
+BILL_ITEMS = [{'item_name': f'Passport Photo set {i}', 'quantity': 1, 'total_price': 1500.0} for i in range(5)]
+RECEIPT = {'bill_number': 'BILL000123', 'original_date': '2026-10-01 09:00:00',
+           'settlement_date': '2026-10-16 10:30', 'total_amount': 8000.0, 'advance_paid': 3000.0,
+           'balance_settled': 5000.0, 'cash_received': 5000.0, 'change_given': 0}
+
+
+def fresh_styles():
+    """The styles one invoice used to build before it could draw anything"""
+    getSampleStyleSheet()
+    summary = ParagraphStyle('Sum', fontSize=11, alignment=TA_RIGHT)
+    built = [
+        ParagraphStyle('InvTitle', fontSize=28, textColor=colors.HexColor('#1a1a2e'),
+                       alignment=TA_RIGHT, fontName='Helvetica-Bold'),
+        ParagraphStyle('Meta', fontSize=11, alignment=TA_RIGHT, leading=15),
+        ParagraphStyle('Co', fontSize=13, fontName='Helvetica-Bold'),
+        ParagraphStyle('Reg', fontSize=10, textColor=colors.HexColor('#444444')),
+        ParagraphStyle('Addr', fontSize=10, textColor=colors.HexColor('#555555')),
+        ParagraphStyle('BillTo', fontSize=12, fontName='Helvetica-Bold'),
+        ParagraphStyle('Cust', fontSize=11),
+        ParagraphStyle('HDesc', fontSize=11, leading=13, textColor=colors.white, fontName='Helvetica-Bold'),
+        ParagraphStyle('HCenter', fontSize=11, alignment=TA_CENTER, textColor=colors.white, fontName='Helvetica-Bold'),
+        ParagraphStyle('HRight', fontSize=11, alignment=TA_RIGHT, textColor=colors.white, fontName='Helvetica-Bold'),
+        ParagraphStyle('Desc', fontSize=11, leading=13),
+        ParagraphStyle('Center', fontSize=11, alignment=TA_CENTER),
+        ParagraphStyle('Right', fontSize=11, alignment=TA_RIGHT),
+        summary,
+        ParagraphStyle('SumBold', parent=summary, fontName='Helvetica-Bold'),
+        ParagraphStyle('TermsTitle', fontSize=10, fontName='Helvetica-Bold', alignment=TA_LEFT,
+                       textColor=colors.HexColor('#333333')),
+        ParagraphStyle('TermsText', fontSize=9, alignment=TA_LEFT, textColor=colors.HexColor('#555555'), leading=12),
+        ParagraphStyle('ContactText', fontSize=10, alignment=TA_LEFT, textColor=colors.HexColor('#555555'), leading=13),
+        ParagraphStyle('Footer1', fontSize=9, alignment=TA_CENTER, textColor=colors.HexColor('#666666')),
+        ParagraphStyle('Footer2', fontSize=8, alignment=TA_CENTER, textColor=colors.HexColor('#999999'), leading=11),
+    ]
+    built += [TableStyle(style.getCommands()) for style in (
+        styles.RIGHT_COLUMN, styles.HEADER_ROW, styles.INFO_BLOCK, styles.INFO_ROW, styles.ITEMS_TABLE,
+        styles.SUMMARY_TABLE, styles.SUMMARY_CONTAINER, styles.CONTACT_ROW, styles.CENTERED)]
+    return built
+
+
+def registry_styles():
+    """The same styles looked up in the shared registry"""
+    return [styles.INVOICE_TITLE, styles.META, styles.COMPANY_NAME, styles.COMPANY_REG, styles.COMPANY_LINE,
+            styles.BILL_TO, styles.CUSTOMER_LINE, styles.HEADER_CELL, styles.HEADER_CELL_CENTER,
+            styles.HEADER_CELL_RIGHT, styles.CELL, styles.CELL_CENTER, styles.CELL_RIGHT, styles.SUMMARY,
+            styles.SUMMARY_BOLD, styles.TERMS_TITLE, styles.TERMS_TEXT, styles.CONTACT_TEXT,
+            styles.FOOTER_THANKS, styles.FOOTER_CREDIT, styles.RIGHT_COLUMN, styles.HEADER_ROW,
+            styles.INFO_BLOCK, styles.INFO_ROW, styles.ITEMS_TABLE, styles.SUMMARY_TABLE,
+            styles.SUMMARY_CONTAINER, styles.CONTACT_ROW, styles.CENTERED]
+
+
+def time_call(call, repeats: int) -> float:
+    """Average milliseconds per call"""
+    started = time.perf_counter()
+    for _ in range(repeats):
+        call()
+    return (time.perf_counter() - started) * 1000 / repeats
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    output_dir = tempfile.mkdtemp(prefix='pos_receipts_bench_')
+    cwd = os.getcwd()
+    # generate_invoice opens the relative pos_database.db for service names
+    os.chdir(output_dir)
+    try:
+        invoices = InvoiceGenerator(output_dir)
+        bills = BillGenerator(output_dir)
+        receipts = [
+            ("A4 invoice", lambda: invoices.generate_invoice(INVOICE, INVOICE_ITEMS, CUSTOMER)),
+            ("A4 booking invoice", lambda: invoices.generate_booking_invoice(BOOKING, 'Staff')),
+            ("A4 booking settlement", lambda: invoices.generate_booking_settlement_invoice(SETTLEMENT)),
+            ("Thermal bill", lambda: bills.generate_bill(BILL, BILL_ITEMS, CUSTOMER)),
+            ("Thermal settlement receipt",
+             lambda: bills.generate_settlement_receipt(RECEIPT, BILL_ITEMS, CUSTOMER)),
+        ]
+        for _, call in receipts:
+            call()  # Warm fonts, images and imports
+        runs = [(label, time_call(call, repeats)) for label, call in receipts]
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(output_dir)
+
+    print("\n" + "=" * 60)
+    print(f"Receipt generation, average of {repeats} runs")
+    print("=" * 60)
+    for label, ms in runs:
+        print(f"{label:<32} | {ms:>8.2f} ms | {1000 / ms:>7.1f} /s")
+    print("-" * 60)
+    print(f"{'Style setup, fresh per receipt':<32} | {time_call(fresh_styles, repeats * 10):>8.3f} ms")
+    print(f"{'Style setup, shared registry':<32} | {time_call(registry_styles, repeats * 10):>8.3f} ms")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: report chart rendering
+Times the revenue pie and income/expense bar drawn for every executive and
+industrial report: through pyplot as before, on a private Agg figure, from
+the chart cache, and as ReportLab vector drawings. Also prints the size of
+a one-page PDF holding both charts as images and as vector drawings.
+
+Usage: python benchmarks/bench_report_charts.py [repeats]
+"""
+
+import os
+import sys
+import time
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reportlab.lib.units import mm
+from reportlab.platypus import SimpleDocTemplate
+
+from services.chart_service import ChartService, MUTED_STYLE, PALETTE, render_png, render_drawing
+
+REVENUE = {'Wedding Photography': 250000.0, 'Birthday Shoot': 120000.0,
+           'Passport Photos': 30000.0, 'Studio Portrait': 80000.0}
+TOTALS = {'Income': 480000.0, 'Expenses': 150000.0}
+
+
+def pyplot_charts():
+    """Both charts drawn through pyplot global state, as the reports used to"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(6, 3), facecolor='white')
+    ax.pie(list(REVENUE.values()), labels=list(REVENUE.keys()), autopct='%1.1f%%',
+           startangle=90, colors=PALETTE[:len(REVENUE)], textprops={'fontsize': 8})
+    ax.axis('equal')
+    plt.tight_layout()
+    plt.savefig(BytesIO(), format='png', dpi=150, bbox_inches='tight')
+    plt.close()
+
+    fig, ax = plt.subplots(figsize=(6, 3), facecolor='white')
+    ax.barh(list(TOTALS.keys()), list(TOTALS.values()), color=['#8C00FF', '#333333'])
+    plt.tight_layout()
+    plt.savefig(BytesIO(), format='png', dpi=150, bbox_inches='tight')
+    plt.close()
+
+
+def time_call(call, repeats: int) -> float:
+    """Average milliseconds per call"""
+    started = time.perf_counter()
+    for _ in range(repeats):
+        call()
+    return (time.perf_counter() - started) * 1000 / repeats
+
+
+def pdf_size(vector: bool) -> int:
+    """Bytes of a PDF holding both charts"""
+    charts = ChartService()
+    buffer = BytesIO()
+    SimpleDocTemplate(buffer).build([
+        charts.flowable('pie', REVENUE, 140*mm, 70*mm, MUTED_STYLE, vector=vector),
+        charts.flowable('bar', TOTALS, 140*mm, 50*mm, MUTED_STYLE, vector=vector),
+    ])
+    return len(buffer.getvalue())
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    started = time.perf_counter()
+    import matplotlib.pyplot  # noqa: F401 - the import the report modules used to pay
+    pyplot_import = (time.perf_counter() - started) * 1000
+
+    cached = ChartService()
+    cached.png('pie', REVENUE, MUTED_STYLE)
+    cached.png('bar', TOTALS, MUTED_STYLE)
+
+    runs = [
+        ("pyplot, every report (before)", time_call(pyplot_charts, repeats)),
+        ("Agg figure, uncached", time_call(lambda: (render_png('pie', REVENUE, MUTED_STYLE),
+                                                    render_png('bar', TOTALS, MUTED_STYLE)), repeats)),
+        ("Chart cache hit", time_call(lambda: (cached.png('pie', REVENUE, MUTED_STYLE),
+                                               cached.png('bar', TOTALS, MUTED_STYLE)), repeats)),
+        ("ReportLab vector drawing", time_call(lambda: (render_drawing('pie', REVENUE, 140*mm, 70*mm),
+                                                        render_drawing('bar', TOTALS, 140*mm, 50*mm)), repeats)),
+    ]
+
+    print("\n" + "=" * 60)
+    print(f"Pie and bar chart per report, average of {repeats} runs")
+    print("=" * 60)
+    for label, ms in runs:
+        print(f"{label:<42} | {ms:>8.2f} ms")
+    print("-" * 60)
+    print(f"{'pyplot import at module load (before)':<42} | {pyplot_import:>8.2f} ms")
+    print(f"{'PDF with PNG charts':<42} | {pdf_size(False) / 1024:>8.1f} KB")
+    print(f"{'PDF with vector charts':<42} | {pdf_size(True) / 1024:>8.1f} KB")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark: LIKE scans vs. the FTS5 search index
+Runs the previous leading-wildcard LIKE searches and the FTS5-backed
+DatabaseManager search methods for the same terms on a database with 200k
+customers, bills, invoices and bookings.
+
+Usage: python benchmarks/bench_search.py [documents] [repeats]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.seed_data import create_seeded_database, remove_database
+from database import DatabaseManager
+
+# The searches as they were before the index: (name, query, placeholder count)
+LIKE_SEARCHES = {
+    'customers': ('''
+        SELECT * FROM customers
+        WHERE full_name LIKE ? OR mobile_number LIKE ?
+        ORDER BY full_name
+    ''', 2),
+    'bills': ('''
+        SELECT b.*, COALESCE(c.full_name, b.guest_name) as full_name, c.mobile_number
+        FROM bills b
+        LEFT JOIN customers c ON b.customer_id = c.id
+        WHERE b.bill_number LIKE ? OR COALESCE(c.full_name, b.guest_name) LIKE ?
+           OR c.mobile_number LIKE ?
+        ORDER BY b.created_at DESC
+    ''', 3),
+    'invoices': ('''
+        SELECT i.*, COALESCE(c.full_name, i.guest_name, b.customer_name) as full_name,
+               COALESCE(c.mobile_number, b.mobile_number) as mobile_number
+        FROM invoices i
+        LEFT JOIN customers c ON i.customer_id = c.id
+        LEFT JOIN bookings b ON i.booking_id = b.id
+        WHERE i.invoice_number LIKE ? OR c.full_name LIKE ? OR c.mobile_number LIKE ?
+           OR i.guest_name LIKE ? OR b.customer_name LIKE ? OR b.mobile_number LIKE ?
+        ORDER BY i.created_at DESC
+    ''', 6),
+    'bookings': ('''
+        SELECT * FROM bookings
+        WHERE customer_name LIKE ? OR mobile_number LIKE ?
+        ORDER BY booking_date DESC
+    ''', 2),
+}
+
+# (table, search term) pairs typed into the search boxes
+TERMS = [
+    ('customers', 'Customer 0123'),
+    ('customers', '0700012'),
+    ('bills', 'BILL0500'),
+    ('bills', 'Guest 777'),
+    ('invoices', 'INV0123'),
+    ('invoices', '0760001'),
+    ('bookings', 'Booking Client 42'),
+    ('bookings', 'nobody'),
+]
+
+
+def like_search(db_manager: DatabaseManager, table: str, term: str) -> list:
+    """Previous search: leading-wildcard LIKE on every column"""
+    query, placeholders = LIKE_SEARCHES[table]
+    return db_manager.execute_query(query, (f'%{term}%',) * placeholders)
+
+
+def fts_search(db_manager: DatabaseManager, table: str, term: str) -> list:
+    """Indexed prefix search"""
+    return getattr(db_manager, f'search_{table}')(term)
+
+
+def time_call(call, repeats: int) -> float:
+    """Average milliseconds per call"""
+    call()  # warm the page cache
+    started = time.perf_counter()
+    for _ in range(repeats):
+        call()
+    return (time.perf_counter() - started) * 1000 / repeats
+
+
+def main():
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print(f"Seeding benchmark database with {documents:,} searchable documents...")
+    db_path = create_seeded_database(customers=documents // 10, bills=documents // 2,
+                                     invoices=documents * 7 // 20, bookings=documents // 20,
+                                     expenses=100)
+    db_manager = DatabaseManager(db_path)
+
+    print("\n" + "=" * 72)
+    print(f"{'Search':<30} | {'LIKE ms':>9} | {'FTS5 ms':>9} | {'Rows':>11} | {'Speedup':>7}")
+    print("=" * 72)
+    try:
+        for table, term in TERMS:
+            like_rows = len(like_search(db_manager, table, term))
+            fts_rows = len(fts_search(db_manager, table, term))
+            before = time_call(lambda: like_search(db_manager, table, term), repeats)
+            after = time_call(lambda: fts_search(db_manager, table, term), repeats)
+            label = f"{table}: {term}"
+            print(f"{label:<30} | {before:>9.2f} | {after:>9.2f} | "
+                  f"{like_rows:>5}/{fts_rows:<5} | {before / after:>6.1f}x")
+    finally:
+        db_manager.pool.close()
+        remove_database(db_path)
+    print("=" * 72)
+    print("Rows: LIKE/FTS5 matches (FTS5 matches word prefixes, not substrings)")
+
+
+if __name__ == "__main__":
+    main()
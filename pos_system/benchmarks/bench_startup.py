@@ -0,0 +1,133 @@
+"""
+Benchmark: application startup imports
+Runs `python -X importtime` in fresh interpreters to time what importing
+main.py (everything the login window needs) costs, broken down by top-level
+package, plus the extra imports paid the first time each page is opened.
+
+With --record, the medians are appended to benchmarks/startup_history.csv
+so startup time can be tracked from commit to commit.
+
+Usage: python benchmarks/bench_startup.py [runs] [--record]
+"""
+
+import csv
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_FILE = os.path.join(APP_DIR, 'benchmarks', 'startup_history.csv')
+HISTORY_FIELDS = ['date', 'commit', 'python', 'login_ms', 'dashboard_ms', 'billing_ms', 'all_pages_ms']
+
+sys.path.insert(0, APP_DIR)
+
+
+def import_times(code: str) -> dict:
+    """Module -> (self us, cumulative us) for the imports code triggers in a fresh interpreter"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=APP_DIR, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def page_code(path: str) -> str:
+    """Import main, then the module of the page frame at path"""
+    # An import statement, not importlib: -X importtime only sees the former
+    return f"import main; import {path.partition(':')[0]}"
+
+
+def total_ms(times: dict) -> float:
+    """Milliseconds spent importing everything in times"""
+    return sum(self_us for self_us, _ in times.values()) / 1000
+
+
+def by_package(times: dict) -> dict:
+    """Self time in ms grouped by top-level package"""
+    packages = {}
+    for name, (self_us, _) in times.items():
+        package = name.split('.')[0]
+        packages[package] = packages.get(package, 0) + self_us / 1000
+    return packages
+
+
+def median_run(code: str, runs: int) -> dict:
+    """Import times of the run whose total is the median"""
+    samples = sorted((import_times(code) for _ in range(runs)), key=total_ms)
+    return samples[len(samples) // 2]
+
+
+def git_commit() -> str:
+    """Short hash of the checked-out commit, marked -dirty with uncommitted changes"""
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'], cwd=APP_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def record(row: dict):
+    """Append a row to the startup history"""
+    new_file = not os.path.exists(HISTORY_FILE)
+    with open(HISTORY_FILE, 'a', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=HISTORY_FIELDS)
+        if new_file:
+            writer.writeheader()
+        writer.writerow(row)
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    runs = int(args[0]) if args else 5
+
+    from main import FRAME_CLASSES
+
+    login = median_run('import main', runs)
+    login_ms = total_ms(login)
+
+    print("\n" + "=" * 60)
+    print(f"Login path (import main), median of {runs} runs: {login_ms:.1f} ms")
+    print("=" * 60)
+    print(f"{'Package':<30} | {'Self ms':>10}")
+    print("-" * 60)
+    for package, ms in sorted(by_package(login).items(), key=lambda item: -item[1])[:15]:
+        print(f"{package:<30} | {ms:>10.1f}")
+
+    print("\n" + "=" * 60)
+    print(f"{'First visit to page':<30} | {'Extra ms':>10} | Heaviest new package")
+    print("=" * 60)
+    page_ms = {}
+    for page, path in FRAME_CLASSES.items():
+        times = median_run(page_code(path), runs)
+        extra = {name: t for name, t in times.items() if name not in login}
+        page_ms[page] = total_ms(extra)
+        packages = by_package(extra)
+        heaviest = max(packages, key=packages.get) if packages else '-'
+        print(f"{page:<30} | {page_ms[page]:>10.1f} | {heaviest}")
+
+    every_page = median_run('; '.join(page_code(path) for path in FRAME_CLASSES.values()), runs)
+    all_pages_ms = total_ms(every_page)
+    print("=" * 60)
+    print(f"Everything imported (all pages): {all_pages_ms:.1f} ms")
+
+    if '--record' in sys.argv:
+        record({
+            'date': datetime.now().strftime('%Y-%m-%d'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'login_ms': f"{login_ms:.1f}",
+            'dashboard_ms': f"{page_ms['dashboard']:.1f}",
+            'billing_ms': f"{page_ms['billing']:.1f}",
+            'all_pages_ms': f"{all_pages_ms:.1f}",
+        })
+        print(f"Recorded in {os.path.relpath(HISTORY_FILE, APP_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Synthetic data generator shared by the benchmark scripts
+Builds a throwaway database populated with customers, bills, invoices,
+bookings and expenses spread over a date range.
+"""
+
+import os
+import sys
+import random
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import initialize_database
+from database.connection_pool import ConnectionPool
+
+
+def create_seeded_database(customers: int = 2000, bills: int = 10000,
+                           invoices: int = 10000, bookings: int = 2000,
+                           expenses: int = 1000, days: int = 365,
+                           seed: int = 42) -> str:
+    """Create a temporary database filled with synthetic data and return its path"""
+    fd, db_path = tempfile.mkstemp(prefix='pos_bench_', suffix='.db')
+    os.close(fd)
+    initialize_database(db_path)
+
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(days=days)
+
+    def random_timestamp():
+        moment = start + timedelta(seconds=rng.randint(0, days * 86400))
+        return moment.strftime('%Y-%m-%d %H:%M:%S')
+
+    pool = ConnectionPool(db_path)
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        user_ids = [row[0] for row in cursor.execute('SELECT id FROM users')]
+        frame_rows = cursor.execute('SELECT id, frame_name, size, price FROM photo_frames').fetchall()
+        service_rows = cursor.execute('SELECT id, service_name, price FROM services').fetchall()
+
+        cursor.executemany(
+            'INSERT INTO customers (full_name, mobile_number, created_at) VALUES (?, ?, ?)',
+            [(f"Customer {i:06d}", f"07{i:08d}", random_timestamp()) for i in range(customers)]
+        )
+        customer_ids = [row[0] for row in cursor.execute('SELECT id FROM customers')]
+
+        bill_rows = []
+        for i in range(bills):
+            total = round(rng.uniform(500, 20000), 2)
+            guest = rng.random() < 0.3
+            advance = rng.random() < 0.2
+            paid = round(total * 0.5, 2) if advance else 0
+            bill_rows.append((
+                f"BILL{i + 1:06d}",
+                None if guest else rng.choice(customer_ids),
+                f"Guest {i}" if guest else None,
+                total, 0, 0, total, total,
+                paid, round(total - paid, 2) if advance else 0,
+                rng.choice(user_ids), random_timestamp()
+            ))
+        cursor.executemany('''
+            INSERT INTO bills (bill_number, customer_id, guest_name, subtotal, discount,
+                               service_charge, total_amount, cash_given, advance_amount,
+                               balance_due, created_by, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', bill_rows)
+
+        item_rows = []
+        for (bill_id,) in cursor.execute('SELECT id FROM bills').fetchall():
+            for _ in range(rng.randint(1, 4)):
+                if rng.random() < 0.5:
+                    frame = rng.choice(frame_rows)
+                    qty = rng.randint(1, 3)
+                    item_rows.append((bill_id, 'Frame', frame[0], f"{frame[1]} ({frame[2]})",
+                                      qty, frame[3], frame[3] * qty, frame[3] * 0.6 * qty))
+                else:
+                    service = rng.choice(service_rows)
+                    item_rows.append((bill_id, 'Service', service[0], service[1],
+                                      1, service[2], service[2], 0))
+        cursor.executemany('''
+            INSERT INTO bill_items (bill_id, item_type, item_id, item_name,
+                                    quantity, unit_price, total_price, buying_price)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', item_rows)
+
+        categories = ['Wedding', 'Birthday', 'Graduation', 'Portrait', 'Event']
+        statuses = ['Pending', 'Completed', 'Cancelled']
+        booking_rows = []
+        for i in range(bookings):
+            amount = round(rng.uniform(10000, 150000), 2)
+            advance = round(amount * 0.3, 2)
+            created = random_timestamp()
+            booking_rows.append((
+                f"Booking Client {i}", f"076{i:07d}", rng.choice(categories),
+                amount, advance, amount - advance, created[:10], 'Studio', '',
+                rng.choice(statuses), rng.choice(user_ids), created
+            ))
+        cursor.executemany('''
+            INSERT INTO bookings (customer_name, mobile_number, photoshoot_category,
+                                  full_amount, advance_payment, balance_amount,
+                                  booking_date, location, description, status,
+                                  created_by, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', booking_rows)
+        booking_ids = [row[0] for row in cursor.execute('SELECT id FROM bookings')]
+
+        invoice_rows = []
+        for i in range(invoices):
+            total = round(rng.uniform(1000, 80000), 2)
+            paid = round(total * rng.choice([0.5, 1.0]), 2)
+            booking_id = rng.choice(booking_ids) if booking_ids and rng.random() < 0.3 else None
+            guest = booking_id is None and rng.random() < 0.3
+            invoice_rows.append((
+                f"INV{i + 1:06d}", booking_id,
+                None if guest or booking_id else rng.choice(customer_ids),
+                f"Guest {i}" if guest else None,
+                total, 0, 0, 0, total, paid, round(total - paid, 2),
+                rng.choice(user_ids), random_timestamp()
+            ))
+        cursor.executemany('''
+            INSERT INTO invoices (invoice_number, booking_id, customer_id, guest_name,
+                                  subtotal, discount, category_service_cost, advance_payment,
+                                  total_amount, paid_amount, balance_amount, created_by, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', invoice_rows)
+
+        invoice_item_rows = []
+        for (invoice_id,) in cursor.execute('SELECT id FROM invoices').fetchall():
+            frame = rng.choice(frame_rows)
+            invoice_item_rows.append((invoice_id, 'Frame', frame[0], f"{frame[1]} ({frame[2]})",
+                                      1, frame[3], frame[3], frame[3] * 0.6))
+        cursor.executemany('''
+            INSERT INTO invoice_items (invoice_id, item_type, item_id, item_name,
+                                       quantity, unit_price, total_price, buying_price)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', invoice_item_rows)
+
+        expense_rows = []
+        for i in range(expenses):
+            ts = random_timestamp()
+            expense_rows.append((f"Expense {i}", round(rng.uniform(100, 5000), 2),
+                                 ts[:10], rng.choice(user_ids), ts))
+        cursor.executemany('''
+            INSERT INTO manual_expenses (description, amount, expense_date, created_by, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', expense_rows)
+
+        conn.commit()
+    pool.close()
+    return db_path
+
+
+def remove_database(db_path: str):
+    """Delete a benchmark database and its WAL side files"""
+    for suffix in ('', '-wal', '-shm'):
+        try:
+            os.remove(db_path + suffix)
+        except OSError:
+            pass
@@ -0,0 +1,92 @@
+"""
+Report: cold-start profiles written by --profile-startup
+Prints the phases, milestones and slowest imports of the latest run in the
+startup profile log, and the median of each phase over the recent runs so a
+regression in a packaged build stands out against earlier ones.
+
+Usage: python benchmarks/startup_profile_report.py [log file] [runs]
+"""
+
+import os
+import sys
+import json
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.startup_profiler import DEFAULT_LOG
+
+
+def load_runs(path: str) -> list:
+    """Every record in a startup profile log, oldest first"""
+    runs = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                runs.append(json.loads(line))
+    return runs
+
+
+def phase_medians(runs: list) -> dict:
+    """Phase name -> median duration in ms over runs"""
+    durations = {}
+    for run in runs:
+        for phase in run['phases']:
+            if phase['duration_ms'] is not None:
+                durations.setdefault(phase['name'], []).append(phase['duration_ms'])
+    return {name: statistics.median(values) for name, values in durations.items()}
+
+
+def print_run(run: dict):
+    """Phases, milestones and slowest imports of one run"""
+    kind = 'packaged exe' if run['frozen'] else 'script'
+    print("\n" + "=" * 72)
+    print(f"Latest run: {run['date']} ({kind}, Python {run['python']})")
+    print("=" * 72)
+    print(f"{'Phase':<44} | {'Start ms':>9} | {'Took ms':>9}")
+    print("-" * 72)
+    for phase in run['phases']:
+        label = '  ' * phase['depth'] + phase['name']
+        # A phase still open when the log was written (the app exited inside it)
+        took = f"{phase['duration_ms']:.1f}" if phase['duration_ms'] is not None else 'open'
+        print(f"{label:<44} | {phase['start_ms']:>9.1f} | {took:>9}")
+
+    print("\n" + f"{'Milestone':<44} | {'At ms':>9}")
+    print("-" * 72)
+    for mark in run['marks']:
+        print(f"{mark['name']:<44} | {mark['at_ms']:>9.1f}")
+
+    print("\n" + f"{'Import (slowest cumulative)':<44} | {'Self ms':>9} | {'Cum. ms':>9}")
+    print("-" * 72)
+    for name, self_ms, cumulative_ms in run['imports'][:20]:
+        print(f"{name:<44} | {self_ms:>9.1f} | {cumulative_ms:>9.1f}")
+    print(f"{run['import_count']} modules imported in {run['import_ms']:.1f} ms")
+
+
+def main():
+    args = sys.argv[1:]
+    path = args[0] if args else DEFAULT_LOG
+    recent = int(args[1]) if len(args) > 1 else 5
+
+    if not os.path.exists(path):
+        print(f"No startup profile at {path}; run main.py with --profile-startup first")
+        return
+
+    runs = load_runs(path)
+    print_run(runs[-1])
+
+    if len(runs) > 1:
+        latest = phase_medians(runs[-1:])
+        earlier = phase_medians(runs[-1 - recent:-1])
+        print("\n" + "=" * 72)
+        print(f"{'Phase':<44} | {'Latest':>9} | {'Median before':>13}")
+        print("=" * 72)
+        for name, took in latest.items():
+            before = earlier.get(name)
+            before_text = f"{before:.1f}" if before is not None else '-'
+            print(f"{name:<44} | {took:>9.1f} | {before_text:>13}")
+
+
+if __name__ == "__main__":
+    main()
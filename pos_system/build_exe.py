@@ -24,6 +24,8 @@ PyInstaller.__main__.run([
     '--hidden-import=tkcalendar',
     '--hidden-import=babel.numbers',
     '--hidden-import=darkdetect',
+    '--collect-submodules=ui',
+    '--collect-submodules=services',
     '--collect-all=customtkinter',
     '--collect-all=tkcalendar',
     '--noconfirm'
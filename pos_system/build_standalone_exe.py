@@ -117,6 +117,8 @@ def build_exe():
         '--windowed',               # No console window (GUI only)
         '--add-data', 'assets;assets',  # Include assets folder
         '--icon=assets/logos/app_icon.ico',  # Application icon
+        '--collect-submodules', 'ui',        # Pages are imported lazily by name
+        '--collect-submodules', 'services',  # So are the report/PDF services
         '--name', 'ShineArt_POS',   # Output EXE name
         'main.py'                   # Entry point
     ]
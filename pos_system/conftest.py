@@ -0,0 +1,54 @@
+"""
+Shared pytest fixtures
+Throwaway databases live under pytest's tmp_path (or are removed with
+their WAL side files) and every pooled connection to them is closed on
+teardown, so no .db, -wal or -shm files or open connections outlive a
+test, whether it passes or fails.
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from database import DatabaseManager, initialize_database
+from database.connection_pool import close_all_pools
+from benchmarks.seed_data import create_seeded_database, remove_database
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path of an initialized throwaway database"""
+    path = str(tmp_path / 'pos_test.db')
+    initialize_database(path)
+    yield path
+    close_all_pools()
+
+
+@pytest.fixture
+def empty_db_path(tmp_path):
+    """Path for a database the test creates itself"""
+    yield str(tmp_path / 'pos_test.db')
+    close_all_pools()
+
+
+@pytest.fixture
+def db(db_path):
+    """DatabaseManager over an initialized throwaway database"""
+    return DatabaseManager(db_path)
+
+
+@pytest.fixture
+def seeded_db():
+    """Factory for synthetic databases: seeded_db(**sizes) returns a path"""
+    paths = []
+
+    def seed(**sizes):
+        paths.append(create_seeded_database(**sizes))
+        return paths[-1]
+
+    yield seed
+    close_all_pools()
+    for path in paths:
+        remove_database(path)
@@ -1,4 +1,6 @@
 from .schema import DatabaseSchema, initialize_database
 from .db_manager import DatabaseManager
+from .connection_pool import ConnectionPool, get_pool, close_all_pools
 
-__all__ = ['DatabaseSchema', 'initialize_database', 'DatabaseManager']
+__all__ = ['DatabaseSchema', 'initialize_database', 'DatabaseManager',
+           'ConnectionPool', 'get_pool', 'close_all_pools']
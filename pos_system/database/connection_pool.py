@@ -0,0 +1,240 @@
+import sqlite3
+import os
+import time
+import queue
+import atexit
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Callable
+
+
+# Pragmas applied once when a pooled connection is opened
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'busy_timeout': 30000,
+}
+
+
+def _reject_memory(db_path: str):
+    """Refuse in-memory databases, which a per-thread pool cannot share"""
+    if db_path == ':memory:' or db_path.startswith('file::memory:'):
+        # Every pooled connection (including the writer's) would open its own
+        # empty database, so writes would never be visible to readers
+        raise ValueError("ConnectionPool needs a database file, not ':memory:'")
+
+
+class ConnectionPool:
+    """Per-thread pool of long-lived SQLite connections for one database file.
+
+    Each thread gets its own connection, opened lazily with the configured
+    pragmas applied once. Connections are health-checked after sitting idle
+    and are closed when their owning thread exits or the pool shuts down.
+    
+    Reads run directly on the caller's connection so WAL readers proceed in
+    parallel. Writes submitted through run_write() are queued to a single
+    writer thread, so they are serialized without blocking readers.
+    """
+
+    def __init__(self, db_path: str, pragmas: Optional[Dict[str, Any]] = None,
+                 timeout: float = 30.0, health_check_interval: float = 60.0):
+        _reject_memory(db_path)
+        self.db_path = db_path
+        self.pragmas = dict(DEFAULT_PRAGMAS if pragmas is None else pragmas)
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self._local = threading.local()
+        self._registry_lock = threading.Lock()
+        # (owning thread, connection) for every open connection
+        self._connections = []
+        self._generation = 0
+        self._write_queue = queue.Queue()
+        self._writer = None
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a new connection and apply pragmas"""
+        # check_same_thread=False only so close() can run from the main thread;
+        # each connection is still used exclusively by the thread that opened it
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
+
+        with self._registry_lock:
+            self._prune_dead_threads()
+            self._connections.append((threading.current_thread(), conn))
+        return conn
+
+    def _prune_dead_threads(self):
+        """Close connections whose owning thread has exited (registry lock held)"""
+        alive = []
+        for thread, conn in self._connections:
+            if thread.is_alive():
+                alive.append((thread, conn))
+            else:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+        self._connections = alive
+
+    def _discard(self, conn: sqlite3.Connection):
+        """Close and forget a single connection"""
+        with self._registry_lock:
+            self._connections = [(t, c) for t, c in self._connections if c is not conn]
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        """Cheap liveness probe for an idle connection"""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _acquire(self) -> sqlite3.Connection:
+        """Return this thread's connection, (re)opening it if needed"""
+        conn = getattr(self._local, 'conn', None)
+
+        if conn is not None and self._local.generation != self._generation:
+            # Pool was closed since this thread last used it
+            conn = None
+
+        if conn is not None and time.monotonic() - self._local.last_used > self.health_check_interval:
+            if not self._is_healthy(conn):
+                self._discard(conn)
+                conn = None
+
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            self._local.generation = self._generation
+
+        self._local.last_used = time.monotonic()
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow this thread's connection for the duration of a block.
+
+        Nested blocks on the same thread share the connection. When the
+        outermost block exits, any transaction the caller did not commit
+        is rolled back so no locks are held between calls.
+        """
+        depth = getattr(self._local, 'depth', 0)
+        conn = self._local.conn if depth else self._acquire()
+        self._local.depth = depth + 1
+        try:
+            yield conn
+        finally:
+            self._local.depth = depth
+            if depth == 0 and conn.in_transaction:
+                try:
+                    conn.rollback()
+                except sqlite3.Error:
+                    pass
+
+    # ==================== Writer Queue ====================
+    
+    def _writer_loop(self):
+        """Execute queued write jobs one at a time on the writer connection"""
+        while True:
+            job = self._write_queue.get()
+            if job is None:
+                break
+            work, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                with self.connection() as conn:
+                    future.set_result(work(conn))
+            except BaseException as e:
+                future.set_exception(e)
+    
+    def _ensure_writer(self):
+        """Start the writer thread if it is not running"""
+        with self._registry_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name='db-writer', daemon=True
+                )
+                self._writer.start()
+    
+    def run_write(self, work: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run work(conn) on the writer thread and return its result.
+        
+        work is responsible for committing. Any exception it raises is
+        re-raised in the calling thread after the transaction is rolled back.
+        """
+        if threading.current_thread() is self._writer:
+            # Already on the writer (nested write) - run inline to avoid deadlock
+            with self.connection() as conn:
+                return work(conn)
+        
+        self._ensure_writer()
+        future = Future()
+        self._write_queue.put((work, future))
+        return future.result()
+    
+    def _stop_writer(self):
+        """Drain pending writes and stop the writer thread"""
+        with self._registry_lock:
+            writer = self._writer
+            self._writer = None
+        if writer is not None and writer.is_alive():
+            self._write_queue.put(None)
+            if writer is not threading.current_thread():
+                writer.join(timeout=self.timeout)
+    
+    def close(self):
+        """Close every connection owned by this pool"""
+        self._stop_writer()
+        with self._registry_lock:
+            connections = self._connections
+            self._connections = []
+            self._generation += 1
+        for _, conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def open_connection_count(self) -> int:
+        """Number of connections currently held open by the pool"""
+        with self._registry_lock:
+            return len(self._connections)
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _pool_key(db_path: str) -> str:
+    """Normalise a database path so relative and absolute paths share a pool"""
+    _reject_memory(db_path)
+    return os.path.abspath(db_path)
+
+
+def get_pool(db_path: str = 'pos_database.db') -> ConnectionPool:
+    """Get the shared connection pool for a database file"""
+    key = _pool_key(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(key)
+            _pools[key] = pool
+        return pool
+
+
+def close_all_pools():
+    """Close every shared connection pool (called on application shutdown)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_all_pools)
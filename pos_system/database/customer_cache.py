@@ -0,0 +1,165 @@
+import re
+import time
+import sqlite3
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, List, Any, Optional, Tuple
+
+from .connection_pool import ConnectionPool, get_pool
+
+
+# Customers are looked up by prefix on every keystroke at the till, so the
+# whole table is held in memory as a sorted list of (token, customer id)
+# entries: each mobile number's digits and each lower-cased word of the
+# name. A prefix query is a bisect followed by a short forward scan.
+#
+# Triggers bump customer_changes.version on every write to customers. Writes
+# made through DatabaseManager are applied in place; any other change (another
+# terminal, a restore) shows up as a version this cache has not seen and the
+# next lookup reloads the table.
+
+def customer_tokens(full_name: str, mobile_number: str) -> List[str]:
+    """Lookup keys for a customer: mobile digits and lower-cased name words"""
+    tokens = re.findall(r'\w+', (full_name or '').lower())
+    digits = re.sub(r'\D', '', mobile_number or '')
+    if digits:
+        tokens.append(digits)
+    return sorted(set(tokens))
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    """Version of the customers table as counted by its triggers"""
+    row = conn.execute('SELECT version FROM customer_changes WHERE id = 1').fetchone()
+    return row[0] if row else 0
+
+
+class CustomerCache:
+    """In-memory prefix index over customers for autocomplete"""
+
+    def __init__(self, pool: ConnectionPool, check_interval: float = 1.0):
+        self.pool = pool
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked_at = 0.0
+        self._customers: Dict[int, Dict[str, Any]] = {}
+        self._tokens: Dict[int, List[str]] = {}
+        self._entries: List[Tuple[str, int]] = []
+
+    def _load(self):
+        """Read every customer and rebuild the index (lock held)"""
+        with self.pool.connection() as conn:
+            # One read transaction so the rows match the version read with
+            # them; the pool rolls it back when the block exits
+            if not conn.in_transaction:
+                conn.execute('BEGIN')
+            version = current_version(conn)
+            rows = conn.execute('SELECT * FROM customers').fetchall()
+
+        self._customers = {row['id']: dict(row) for row in rows}
+        self._tokens = {customer_id: customer_tokens(customer['full_name'], customer['mobile_number'])
+                        for customer_id, customer in self._customers.items()}
+        self._entries = sorted((token, customer_id)
+                               for customer_id, tokens in self._tokens.items()
+                               for token in tokens)
+        self._version = version
+
+    def _ensure_current(self):
+        """Reload when another connection has written to customers (lock held)"""
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        if self._version is not None:
+            with self.pool.connection() as conn:
+                if current_version(conn) == self._version:
+                    return
+        self._load()
+
+    def _index(self, customer: Dict[str, Any]):
+        """Add a customer's entries (lock held)"""
+        tokens = customer_tokens(customer['full_name'], customer['mobile_number'])
+        self._customers[customer['id']] = customer
+        self._tokens[customer['id']] = tokens
+        for token in tokens:
+            insort(self._entries, (token, customer['id']))
+
+    def _unindex(self, customer_id: int):
+        """Remove a customer's entries (lock held)"""
+        self._customers.pop(customer_id, None)
+        for token in self._tokens.pop(customer_id, []):
+            position = bisect_left(self._entries, (token, customer_id))
+            if position < len(self._entries) and self._entries[position] == (token, customer_id):
+                del self._entries[position]
+
+    def apply(self, version: int, customer_id: int, customer: Optional[Dict[str, Any]]):
+        """Record a write made through this process.
+
+        version is customer_changes.version read in the writing transaction;
+        customer is the row as written, or None once deleted. If any other
+        write came in between, the cache reloads on the next lookup instead.
+        """
+        with self._lock:
+            if self._version is None:
+                return
+            if version != self._version + 1:
+                self._version = None
+                return
+            self._unindex(customer_id)
+            if customer is not None:
+                self._index(dict(customer))
+            self._version = version
+
+    def invalidate(self):
+        """Force a reload on the next lookup"""
+        with self._lock:
+            self._version = None
+
+    def _prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """Slice of entries whose token starts with prefix (lock held)"""
+        start = bisect_left(self._entries, (prefix,))
+        end = bisect_left(self._entries, (prefix + '\U0010ffff',), start)
+        return start, end
+
+    def lookup(self, term: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Customers with a name word or mobile number starting with every word of term"""
+        words = set(re.findall(r'\w+', term.lower()))
+        if not words:
+            return []
+
+        with self._lock:
+            self._ensure_current()
+            # Scan the word with the fewest entries and check the others per customer
+            ranges = sorted(((self._prefix_range(word), word) for word in words),
+                            key=lambda item: item[0][1] - item[0][0])
+            (start, end), _ = ranges[0]
+            rest = [word for _, word in ranges[1:]]
+            results = []
+            seen = set()
+            for position in range(start, end):
+                customer_id = self._entries[position][1]
+                if customer_id in seen:
+                    continue
+                seen.add(customer_id)
+                if rest and not all(any(token.startswith(word) for token in self._tokens[customer_id])
+                                    for word in rest):
+                    continue
+                results.append(dict(self._customers[customer_id]))
+                if len(results) == limit:
+                    break
+            return results
+
+
+_caches: Dict[str, CustomerCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_customer_cache(db_path: str = 'pos_database.db') -> CustomerCache:
+    """Get the shared customer lookup cache for a database file"""
+    pool = get_pool(db_path)
+    with _caches_lock:
+        cache = _caches.get(pool.db_path)
+        if cache is None:
+            cache = CustomerCache(pool)
+            _caches[pool.db_path] = cache
+        return cache
@@ -0,0 +1,21 @@
+from datetime import datetime, timedelta
+from typing import Tuple
+
+
+# Timestamps are stored as 'YYYY-MM-DD HH:MM:SS' text, so comparing them
+# against 'YYYY-MM-DD' bounds is both correct and able to use an index,
+# unlike wrapping the column in DATE(...).
+
+def next_day(date: str) -> str:
+    """Return the calendar day after a 'YYYY-MM-DD' date"""
+    return (datetime.strptime(date, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+
+
+def day_range(date: str) -> Tuple[str, str]:
+    """Half-open [start, end) timestamp bounds covering one day"""
+    return date, next_day(date)
+
+
+def date_range(start_date: str, end_date: str) -> Tuple[str, str]:
+    """Half-open [start, end) timestamp bounds covering start_date..end_date inclusive"""
+    return start_date, next_day(end_date)
@@ -1,32 +1,42 @@
 import sqlite3
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
-import threading
+
+from .connection_pool import get_pool
+from .customer_cache import current_version, get_customer_cache
+from .date_ranges import day_range
+from .search_index import match_expression
 
 
 class DatabaseManager:
-    """Central database manager for all CRUD operations"""
+    """Central database manager for all CRUD operations.
     
-    _lock = threading.Lock()
+    Reads run concurrently on each thread's pooled WAL connection; writes are
+    serialized through the pool's writer queue.
+    """
     
     def __init__(self, db_path='pos_database.db'):
         self.db_path = db_path
+        self.pool = get_pool(db_path)
+        self.customer_cache = get_customer_cache(db_path)
         
     def get_connection(self):
-        """Get database connection with timeout and WAL mode"""
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
-        conn.row_factory = sqlite3.Row
-        # Enable WAL mode for better concurrent access
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA busy_timeout=30000")
-        return conn
+        """Borrow this thread's pooled connection (WAL mode, busy timeout already applied)"""
+        return self.pool.connection()
+    
+    def data_version(self) -> Tuple[int, int]:
+        """Token that changes whenever the database has been written.
+        
+        Combines SQLite's data_version (commits by other connections,
+        including the pool's writer) with this thread's own changes.
+        """
+        with self.get_connection() as conn:
+            return conn.execute('PRAGMA data_version').fetchone()[0], conn.total_changes
     
     def execute_query(self, query: str, params: Tuple = ()) -> List[Dict[str, Any]]:
         """Execute a SELECT query and return results as list of dicts"""
-        conn = None
         try:
-            with self._lock:
-                conn = self.get_connection()
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(query, params)
                 rows = cursor.fetchall()
@@ -34,53 +44,170 @@ class DatabaseManager:
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             return []
-        finally:
-            if conn:
-                conn.close()
     
     def execute_update(self, query: str, params: Tuple = ()) -> bool:
         """Execute INSERT, UPDATE, or DELETE query"""
-        conn = None
+        def work(conn):
+            conn.execute(query, params)
+            conn.commit()
+            return True
+        
         try:
-            with self._lock:
-                conn = self.get_connection()
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                conn.commit()
-                return True
+            return self.pool.run_write(work)
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             return False
-        finally:
-            if conn:
-                conn.close()
     
     def execute_insert(self, query: str, params: Tuple = ()) -> Optional[int]:
         """Execute INSERT query and return last inserted id"""
-        conn = None
+        def work(conn):
+            cursor = conn.execute(query, params)
+            last_id = cursor.lastrowid
+            conn.commit()
+            return last_id
+        
         try:
-            with self._lock:
-                conn = self.get_connection()
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                last_id = cursor.lastrowid
-                conn.commit()
-                return last_id
+            return self.pool.run_write(work)
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return None
+    
+    def _fetch_page(self, query: str, conditions: List[str], params: List[Any], alias: str,
+                    cursor: Optional[Tuple[str, int]], page_size: int
+                    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, int]]]:
+        """Run a newest-first listing one keyset page at a time.
+        
+        query ends before its WHERE clause; alias is the table whose
+        (created_at, id) orders the rows. Returns the page and the cursor for
+        the next one (None once the listing is exhausted).
+        """
+        conditions = list(conditions)
+        params = list(params)
+        if cursor is not None:
+            conditions.append(f'({alias}.created_at, {alias}.id) < (?, ?)')
+            params.extend(cursor)
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(f'({condition})' for condition in conditions)
+        query += f' ORDER BY {alias}.created_at DESC, {alias}.id DESC LIMIT ?'
+        
+        # One extra row tells us whether another page exists
+        rows = self.execute_query(query, tuple(params) + (page_size + 1,))
+        if len(rows) <= page_size:
+            return rows, None
+        rows = rows[:page_size]
+        return rows, (rows[-1]['created_at'], rows[-1]['id'])
+    
+    def _count_rows(self, query: str, conditions: List[str], params: List[Any]) -> int:
+        """COUNT(*) for a listing query built with the same conditions as _fetch_page"""
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(f'({condition})' for condition in conditions)
+        rows = self.execute_query(f'SELECT COUNT(*) as total FROM ({query})', tuple(params))
+        return rows[0]['total'] if rows else 0
+    
+    # ==================== Document Number Sequences ====================
+    
+    BILL_PREFIX = 'BILL'
+    DEFAULT_INVOICE_PREFIX = 'INV'
+    
+    # Tables whose document numbers are drawn from number_sequences
+    _NUMBERED_COLUMNS = {'bills': 'bill_number', 'invoices': 'invoice_number'}
+    
+    def _invoice_prefix(self, cursor) -> str:
+        """Invoice number prefix from the invoice_prefix setting"""
+        try:
+            cursor.execute("SELECT setting_value FROM settings WHERE setting_key = 'invoice_prefix'")
+            row = cursor.fetchone()
+        except sqlite3.OperationalError:
+            row = None  # Settings table not created yet
+        prefix = (row[0] or '').strip() if row else ''
+        return prefix or self.DEFAULT_INVOICE_PREFIX
+    
+    def _next_number(self, cursor, table: str) -> str:
+        """Allocate the next document number for a table.
+        
+        Must run inside the caller's write transaction so the allocation
+        commits (or rolls back) together with the row that uses it.
+        """
+        column = self._NUMBERED_COLUMNS[table]
+        prefix = self.BILL_PREFIX if table == 'bills' else self._invoice_prefix(cursor)
+        
+        cursor.execute('UPDATE number_sequences SET last_value = last_value + 1 WHERE prefix = ?',
+                       (prefix,))
+        if cursor.rowcount:
+            cursor.execute('SELECT last_value FROM number_sequences WHERE prefix = ?', (prefix,))
+            value = cursor.fetchone()[0]
+        else:
+            # First use of this prefix: continue after any numbers already issued
+            cursor.execute(f'''
+                SELECT MAX(CAST(SUBSTR({column}, ?) AS INTEGER)) FROM {table}
+                WHERE SUBSTR({column}, 1, ?) = ?
+            ''', (len(prefix) + 1, len(prefix), prefix))
+            value = (cursor.fetchone()[0] or 0) + 1
+            cursor.execute('INSERT INTO number_sequences (prefix, last_value) VALUES (?, ?)',
+                           (prefix, value))
+        return f"{prefix}{str(value).zfill(6)}"
+    
+    def _insert_numbered(self, table: str, number: Optional[str], query: str,
+                         params: Tuple) -> Optional[int]:
+        """Insert a numbered document; query takes the number as its first parameter"""
+        def work(conn):
+            cursor = conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            cursor.execute(query, (number or self._next_number(cursor, table),) + tuple(params))
+            last_id = cursor.lastrowid
+            conn.commit()
+            return last_id
+        
+        try:
+            return self.pool.run_write(work)
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return None
+    
+    def _reserve_number(self, table: str) -> Optional[str]:
+        """Allocate a document number in its own transaction"""
+        def work(conn):
+            cursor = conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            number = self._next_number(cursor, table)
+            conn.commit()
+            return number
+        
+        try:
+            return self.pool.run_write(work)
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             return None
-        finally:
-            if conn:
-                conn.close()
     
     # Customer operations
+    def _write_customer(self, query: str, params: Tuple, customer_id: Optional[int] = None):
+        """Run a customer write and hand the row and change version to the lookup cache.
+        
+        Returns the customer id written, or None on error.
+        """
+        def work(conn):
+            cursor = conn.execute(query, params)
+            written_id = cursor.lastrowid if customer_id is None else customer_id
+            row = conn.execute('SELECT * FROM customers WHERE id = ?', (written_id,)).fetchone()
+            version = current_version(conn)
+            conn.commit()
+            return written_id, row, version
+        
+        try:
+            written_id, row, version = self.pool.run_write(work)
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return None
+        self.customer_cache.apply(version, written_id, dict(row) if row else None)
+        return written_id
+    
     def add_customer(self, full_name: str, mobile_number: str) -> Optional[int]:
         """Add a new customer"""
         query = '''
             INSERT INTO customers (full_name, mobile_number)
             VALUES (?, ?)
         '''
-        return self.execute_insert(query, (full_name, mobile_number))
+        return self._write_customer(query, (full_name, mobile_number))
     
     def update_customer(self, customer_id: int, full_name: str, mobile_number: str) -> bool:
         """Update customer details"""
@@ -89,12 +216,13 @@ class DatabaseManager:
             SET full_name = ?, mobile_number = ?, updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
         '''
-        return self.execute_update(query, (full_name, mobile_number, customer_id))
+        return self._write_customer(query, (full_name, mobile_number, customer_id),
+                                    customer_id) is not None
     
     def delete_customer(self, customer_id: int) -> bool:
         """Delete a customer"""
         query = 'DELETE FROM customers WHERE id = ?'
-        return self.execute_update(query, (customer_id,))
+        return self._write_customer(query, (customer_id,), customer_id) is not None
     
     def get_customer_by_id(self, customer_id: int) -> Optional[Dict[str, Any]]:
         """Get customer by ID"""
@@ -113,15 +241,27 @@ class DatabaseManager:
         query = 'SELECT * FROM customers ORDER BY full_name'
         return self.execute_query(query)
     
-    def search_customers(self, search_term: str) -> List[Dict[str, Any]]:
-        """Search customers by name or mobile"""
+    def search_customers(self, search_term: str, limit: int = 500) -> List[Dict[str, Any]]:
+        """Search customers by name or mobile prefix, best matches first"""
+        match = match_expression(search_term)
+        if not match:
+            return []
         query = '''
-            SELECT * FROM customers 
-            WHERE full_name LIKE ? OR mobile_number LIKE ?
-            ORDER BY full_name
+            SELECT c.* FROM customers_fts f
+            JOIN customers c ON c.id = f.rowid
+            WHERE customers_fts MATCH ?
+            ORDER BY f.rank, c.full_name
+            LIMIT ?
         '''
-        search_pattern = f'%{search_term}%'
-        return self.execute_query(query, (search_pattern, search_pattern))
+        return self.execute_query(query, (match, limit))
+    
+    def lookup_customers(self, prefix: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Autocomplete customers by mobile or name prefix from the in-memory cache"""
+        try:
+            return self.customer_cache.lookup(prefix, limit)
+        except sqlite3.Error as e:
+            print(f"Error looking up customers: {e}")
+            return []
     
     # Category operations
     def add_category(self, category_name: str, service_cost: float = None) -> Optional[int]:
@@ -261,23 +401,25 @@ class DatabaseManager:
         return self.execute_update(query, (quantity_change, frame_id))
     
     # Invoice operations
-    def create_invoice(self, invoice_number: str, customer_id: int, subtotal: float,
+    def create_invoice(self, invoice_number: Optional[str], customer_id: int, subtotal: float,
                       discount: float, total_amount: float, paid_amount: float,
                       balance_amount: float, created_by: int, 
                       category_service_cost: float = 0, advance_payment: float = 0,
                       guest_name: str = None, booking_id: int = None) -> Optional[int]:
         """Create a new invoice with category service cost and advance payment.
         For guest customers, customer_id is None and guest_name is provided.
-        For bookings, booking_id links invoice to booking."""
+        For bookings, booking_id links invoice to booking.
+        Pass invoice_number=None to allocate the next number atomically."""
         query = '''
             INSERT INTO invoices (invoice_number, booking_id, customer_id, guest_name, subtotal, discount,
                                 category_service_cost, advance_payment, total_amount, 
                                 paid_amount, balance_amount, created_by)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         '''
-        return self.execute_insert(query, (invoice_number, booking_id, customer_id, guest_name, 
-                                          subtotal, discount, category_service_cost, advance_payment,
-                                          total_amount, paid_amount, balance_amount, created_by))
+        return self._insert_numbered('invoices', invoice_number, query,
+                                     (booking_id, customer_id, guest_name, 
+                                      subtotal, discount, category_service_cost, advance_payment,
+                                      total_amount, paid_amount, balance_amount, created_by))
     
     def add_invoice_item(self, invoice_id: int, item_type: str, item_id: int,
                         item_name: str, quantity: int, unit_price: float,
@@ -329,11 +471,14 @@ class DatabaseManager:
         return self.execute_query(query, (invoice_id,))
     
     def get_all_invoices(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get all invoices with customer info (handles both registered and guest customers, and bookings)"""
+        """Get all invoices with customer info (handles both registered and guest customers, and bookings).
+        Booking invoices also carry booking_category and booking_status."""
         query = '''
             SELECT i.*, 
                    COALESCE(c.full_name, i.guest_name, b.customer_name) as full_name, 
-                   COALESCE(c.mobile_number, b.mobile_number) as mobile_number
+                   COALESCE(c.mobile_number, b.mobile_number) as mobile_number,
+                   b.photoshoot_category as booking_category,
+                   b.status as booking_status
             FROM invoices i
             LEFT JOIN customers c ON i.customer_id = c.id
             LEFT JOIN bookings b ON i.booking_id = b.id
@@ -342,82 +487,117 @@ class DatabaseManager:
         '''
         return self.execute_query(query, (limit,))
     
-    def search_invoices(self, search_term: str) -> List[Dict[str, Any]]:
-        """Search invoices by invoice number or customer name/mobile (handles guest customers and bookings)"""
+    def search_invoices(self, search_term: str, limit: int = 500) -> List[Dict[str, Any]]:
+        """Search invoices by invoice number or customer name/mobile prefix, best matches first
+        (handles guest customers and bookings)"""
+        match = match_expression(search_term)
+        if not match:
+            return []
         query = '''
             SELECT i.*, 
                    COALESCE(c.full_name, i.guest_name, b.customer_name) as full_name, 
-                   COALESCE(c.mobile_number, b.mobile_number) as mobile_number
-            FROM invoices i
+                   COALESCE(c.mobile_number, b.mobile_number) as mobile_number,
+                   b.photoshoot_category as booking_category,
+                   b.status as booking_status
+            FROM invoices_fts f
+            JOIN invoices i ON i.id = f.rowid
             LEFT JOIN customers c ON i.customer_id = c.id
             LEFT JOIN bookings b ON i.booking_id = b.id
-            WHERE i.invoice_number LIKE ? 
-               OR c.full_name LIKE ? 
-               OR c.mobile_number LIKE ?
-               OR i.guest_name LIKE ?
-               OR b.customer_name LIKE ?
-               OR b.mobile_number LIKE ?
-            ORDER BY i.created_at DESC
+            WHERE invoices_fts MATCH ?
+            ORDER BY f.rank, i.created_at DESC
+            LIMIT ?
         '''
-        search_pattern = f'%{search_term}%'
-        return self.execute_query(query, (search_pattern, search_pattern, search_pattern, search_pattern, search_pattern, search_pattern))
-    
-    def generate_invoice_number(self) -> str:
-        """Generate a unique invoice number"""
-        query = 'SELECT MAX(id) as max_id FROM invoices'
-        result = self.execute_query(query)
-        max_id = result[0]['max_id'] if result and result[0]['max_id'] else 0
-        return f"INV{str(max_id + 1).zfill(6)}"
+        return self.execute_query(query, (match, limit))
+    
+    # Booking invoices: created from a booking, or numbered by the booking flow
+    _BOOKING_INVOICE = "i.booking_id IS NOT NULL OR i.invoice_number LIKE 'BK-%'"
+    
+    _INVOICE_LISTING = '''
+        SELECT i.*, 
+               COALESCE(c.full_name, i.guest_name, b.customer_name) as full_name, 
+               COALESCE(c.mobile_number, b.mobile_number) as mobile_number,
+               b.photoshoot_category as booking_category,
+               b.status as booking_status
+        FROM invoices i
+        LEFT JOIN customers c ON i.customer_id = c.id
+        LEFT JOIN bookings b ON i.booking_id = b.id
+    '''
+    
+    def _invoice_conditions(self, booking_only: bool, status: str,
+                            search_term: str) -> Tuple[List[str], List[Any]]:
+        """WHERE conditions shared by the invoice page and count queries"""
+        conditions, params = [], []
+        if booking_only:
+            conditions.append(self._BOOKING_INVOICE)
+        if status and status != 'All':
+            # Invoices without a booking count as completed
+            conditions.append("COALESCE(b.status, 'Completed') = ?")
+            params.append(status)
+        if search_term:
+            conditions.append('i.id IN (SELECT rowid FROM invoices_fts WHERE invoices_fts MATCH ?)')
+            params.append(match_expression(search_term) or '""')
+        return conditions, params
+    
+    def get_invoices_page(self, booking_only: bool = False, status: str = 'All', search_term: str = '',
+                          cursor: Optional[Tuple[str, int]] = None, page_size: int = 100
+                          ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, int]]]:
+        """Get one page of invoices, newest first, filtered in SQL.
+        status filters on the booking status ('All' for every invoice); pass
+        the returned cursor back in to fetch the following page."""
+        conditions, params = self._invoice_conditions(booking_only, status, search_term)
+        return self._fetch_page(self._INVOICE_LISTING, conditions, params, 'i', cursor, page_size)
+    
+    def count_invoices(self, booking_only: bool = False, status: str = 'All', search_term: str = '') -> int:
+        """Count the invoices get_invoices_page would list with the same filters"""
+        conditions, params = self._invoice_conditions(booking_only, status, search_term)
+        return self._count_rows(self._INVOICE_LISTING, conditions, params)
+    
+    def generate_invoice_number(self) -> Optional[str]:
+        """Reserve the next invoice number (uses the invoice_prefix setting).
+        Prefer create_invoice(None, ...) which allocates inside the insert."""
+        return self._reserve_number('invoices')
     
     def delete_invoice(self, invoice_id: int) -> bool:
         """Delete an invoice and its items (CASCADE)"""
-        conn = None
+        def work(conn):
+            cursor = conn.cursor()
+            
+            # Delete invoice items first
+            cursor.execute('DELETE FROM invoice_items WHERE invoice_id = ?', (invoice_id,))
+            
+            # Delete the invoice
+            cursor.execute('DELETE FROM invoices WHERE id = ?', (invoice_id,))
+            
+            conn.commit()
+            return True
+        
         try:
-            with self._lock:
-                conn = self.get_connection()
-                cursor = conn.cursor()
-                
-                # Delete invoice items first
-                cursor.execute('DELETE FROM invoice_items WHERE invoice_id = ?', (invoice_id,))
-                
-                # Delete the invoice
-                cursor.execute('DELETE FROM invoices WHERE id = ?', (invoice_id,))
-                
-                conn.commit()
-                return True
+            return self.pool.run_write(work)
         except sqlite3.Error as e:
+            # Uncommitted work is rolled back by the writer before re-raising
             print(f"Delete invoice error: {e}")
-            if conn:
-                conn.rollback()
             return False
-        finally:
-            if conn:
-                conn.close()
     
     def delete_all_invoices(self) -> bool:
         """Delete all invoices and their items"""
-        conn = None
+        def work(conn):
+            cursor = conn.cursor()
+            
+            # Delete all invoice items first
+            cursor.execute('DELETE FROM invoice_items')
+            
+            # Delete all invoices
+            cursor.execute('DELETE FROM invoices')
+            
+            conn.commit()
+            return True
+        
         try:
-            with self._lock:
-                conn = self.get_connection()
-                cursor = conn.cursor()
-                
-                # Delete all invoice items first
-                cursor.execute('DELETE FROM invoice_items')
-                
-                # Delete all invoices
-                cursor.execute('DELETE FROM invoices')
-                
-                conn.commit()
-                return True
+            return self.pool.run_write(work)
         except sqlite3.Error as e:
+            # Uncommitted work is rolled back by the writer before re-raising
             print(f"Delete all invoices error: {e}")
-            if conn:
-                conn.rollback()
             return False
-        finally:
-            if conn:
-                conn.close()
     
     # Booking operations
     def create_booking(self, customer_name: str, mobile_number: str, 
@@ -484,17 +664,21 @@ class DatabaseManager:
         results = self.execute_query(query, (booking_id,))
         return results[0] if results else None
     
-    def search_bookings(self, search_term: str) -> List[Dict[str, Any]]:
-        """Search bookings by customer name or mobile"""
+    def search_bookings(self, search_term: str, limit: int = 500) -> List[Dict[str, Any]]:
+        """Search bookings by customer name or mobile prefix, best matches first"""
+        match = match_expression(search_term)
+        if not match:
+            return []
         query = '''
             SELECT b.*, u.full_name as created_by_name
-            FROM bookings b
+            FROM bookings_fts f
+            JOIN bookings b ON b.id = f.rowid
             JOIN users u ON b.created_by = u.id
-            WHERE b.customer_name LIKE ? OR b.mobile_number LIKE ?
-            ORDER BY b.booking_date DESC
+            WHERE bookings_fts MATCH ?
+            ORDER BY f.rank, b.booking_date DESC
+            LIMIT ?
         '''
-        search_pattern = f'%{search_term}%'
-        return self.execute_query(query, (search_pattern, search_pattern))
+        return self.execute_query(query, (match, limit))
     
     # ==================== User Permissions Operations ====================
     
@@ -593,19 +777,19 @@ class DatabaseManager:
             SELECT i.*, c.full_name as customer_name, c.mobile_number as customer_mobile
             FROM invoices i
             LEFT JOIN customers c ON i.customer_id = c.id
-            WHERE i.created_by = ? AND DATE(i.created_at) = ?
+            WHERE i.created_by = ? AND i.created_at >= ? AND i.created_at < ?
             ORDER BY i.created_at ASC
         '''
-        return self.execute_query(query, (user_id, date))
+        return self.execute_query(query, (user_id, *day_range(date)))
     
     def get_staff_bookings_by_date(self, user_id: int, date: str) -> List[Dict[str, Any]]:
         """Get all bookings created by a staff member on a specific date"""
         query = '''
             SELECT * FROM bookings
-            WHERE created_by = ? AND DATE(created_at) = ?
+            WHERE created_by = ? AND created_at >= ? AND created_at < ?
             ORDER BY created_at ASC
         '''
-        return self.execute_query(query, (user_id, date))
+        return self.execute_query(query, (user_id, *day_range(date)))
     
     def get_staff_customers_by_date(self, user_id: int, date: str) -> List[Dict[str, Any]]:
         """Get all customers added on a specific date
@@ -613,10 +797,10 @@ class DatabaseManager:
         """
         query = '''
             SELECT * FROM customers
-            WHERE DATE(created_at) = ?
+            WHERE created_at >= ? AND created_at < ?
             ORDER BY created_at ASC
         '''
-        return self.execute_query(query, (date,))
+        return self.execute_query(query, day_range(date))
     
     def get_staff_daily_summary(self, user_id: int, date: str) -> Dict[str, Any]:
         """Get a summary of staff daily work"""
@@ -638,7 +822,7 @@ class DatabaseManager:
         }
     
     # Bill operations (thermal receipts for normal sales)
-    def create_bill(self, bill_number: str, customer_id: int, subtotal: float,
+    def create_bill(self, bill_number: Optional[str], customer_id: int, subtotal: float,
                    discount: float, total_amount: float, created_by: int,
                    service_charge: float = 0, cash_given: float = 0,
                    guest_name: str = None, advance_amount: float = 0,
@@ -646,6 +830,7 @@ class DatabaseManager:
         """Create a new bill (thermal receipt) for normal sales.
         For guest customers, customer_id is None and guest_name is provided.
         Supports both full and advance payment.
+        Pass bill_number=None to allocate the next number atomically.
         created_at: Optional custom timestamp (YYYY-MM-DD HH:MM:SS format)"""
         if created_at:
             query = '''
@@ -654,9 +839,10 @@ class DatabaseManager:
                                  balance_due, created_by, created_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             '''
-            return self.execute_insert(query, (bill_number, customer_id, guest_name, subtotal,
-                                              discount, service_charge, total_amount, 
-                                              cash_given, advance_amount, balance_due, created_by, created_at))
+            return self._insert_numbered('bills', bill_number, query,
+                                         (customer_id, guest_name, subtotal,
+                                          discount, service_charge, total_amount, 
+                                          cash_given, advance_amount, balance_due, created_by, created_at))
         else:
             query = '''
                 INSERT INTO bills (bill_number, customer_id, guest_name, subtotal, discount,
@@ -664,9 +850,10 @@ class DatabaseManager:
                                  balance_due, created_by)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             '''
-            return self.execute_insert(query, (bill_number, customer_id, guest_name, subtotal,
-                                              discount, service_charge, total_amount, 
-                                              cash_given, advance_amount, balance_due, created_by))
+            return self._insert_numbered('bills', bill_number, query,
+                                         (customer_id, guest_name, subtotal,
+                                          discount, service_charge, total_amount, 
+                                          cash_given, advance_amount, balance_due, created_by))
     
     def add_bill_item(self, bill_id: int, item_type: str, item_id: int,
                      item_name: str, quantity: int, unit_price: float,
@@ -680,19 +867,120 @@ class DatabaseManager:
         return self.execute_insert(query, (bill_id, item_type, item_id, item_name,
                                           quantity, unit_price, total_price, buying_price))
     
+    def checkout_bill(self, cart_items: List[Dict[str, Any]], customer_id: Optional[int],
+                      created_by: int, discount: float = 0, service_charge: float = 0,
+                      cash_given: float = 0, guest_name: str = None,
+                      service_charge_label: str = None,
+                      created_at: str = None) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Create a complete bill in a single transaction.
+        
+        cart_items use the billing cart format: dicts with 'type' ('Service' or
+        'Frame'), 'id', 'name', 'quantity', 'unit_price' and 'total'. Prices the
+        bill, applies the advance/full payment split, inserts the bill and all
+        items, decrements frame stock and reads back the joined bill row - all
+        under one commit. Returns (bill, items), or None if anything fails
+        (including insufficient frame stock), in which case nothing is written.
+        """
+        if not cart_items:
+            return None
+        
+        subtotal = sum(item['total'] for item in cart_items)
+        total = max(0, subtotal + service_charge - discount)
+        
+        # Full payment when cash covers the total, otherwise an advance
+        if cash_given >= total:
+            advance_amount, balance_due = total, 0.0
+        else:
+            advance_amount, balance_due = cash_given, total - cash_given
+        
+        if created_at is None:
+            created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Units of each frame being sold
+        frame_quantities: Dict[int, int] = {}
+        for item in cart_items:
+            if item['type'] == 'Frame':
+                frame_quantities[item['id']] = frame_quantities.get(item['id'], 0) + item['quantity']
+        
+        def work(conn):
+            cursor = conn.cursor()
+            # Take the write lock up front so the number and stock checks cannot race
+            cursor.execute('BEGIN IMMEDIATE')
+            
+            bill_number = self._next_number(cursor, 'bills')
+            
+            buying_prices = {}
+            if frame_quantities:
+                placeholders = ', '.join('?' * len(frame_quantities))
+                cursor.execute(
+                    f'SELECT id, buying_price FROM photo_frames WHERE id IN ({placeholders})',
+                    tuple(frame_quantities)
+                )
+                buying_prices = {row['id']: row['buying_price'] or 0 for row in cursor.fetchall()}
+            
+            cursor.execute('''
+                INSERT INTO bills (bill_number, customer_id, guest_name, subtotal, discount,
+                                 service_charge, total_amount, cash_given, advance_amount, 
+                                 balance_due, created_by, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (bill_number, customer_id, guest_name, subtotal, discount, service_charge,
+                  total, cash_given, advance_amount, balance_due, created_by, created_at))
+            bill_id = cursor.lastrowid
+            
+            item_rows = [
+                (bill_id, item['type'], item['id'], item['name'], item['quantity'],
+                 item['unit_price'], item['total'],
+                 buying_prices.get(item['id'], 0) * item['quantity'] if item['type'] == 'Frame' else 0)
+                for item in cart_items
+            ]
+            if service_charge > 0 and service_charge_label:
+                item_rows.append((bill_id, 'CategoryService', 0,
+                                  f"Service Charge - {service_charge_label}",
+                                  1, service_charge, service_charge, 0))
+            cursor.executemany('''
+                INSERT INTO bill_items (bill_id, item_type, item_id, item_name,
+                                       quantity, unit_price, total_price, buying_price)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', item_rows)
+            
+            if frame_quantities:
+                cursor.executemany('''
+                    UPDATE photo_frames 
+                    SET quantity = quantity - ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ? AND quantity >= ?
+                ''', [(qty, frame_id, qty) for frame_id, qty in frame_quantities.items()])
+                if cursor.rowcount != len(frame_quantities):
+                    raise sqlite3.IntegrityError("Insufficient frame stock")
+            
+            cursor.execute(self._BILL_BY_ID_QUERY, (bill_id,))
+            bill = dict(cursor.fetchone())
+            cursor.execute('SELECT * FROM bill_items WHERE bill_id = ?', (bill_id,))
+            items = [dict(row) for row in cursor.fetchall()]
+            
+            conn.commit()
+            return bill, items
+        
+        try:
+            return self.pool.run_write(work)
+        except sqlite3.Error as e:
+            # The writer rolls the whole checkout back before re-raising
+            print(f"Checkout error: {e}")
+            return None
+    
+    _BILL_BY_ID_QUERY = '''
+        SELECT b.*, 
+               COALESCE(c.full_name, b.guest_name) as full_name,
+               c.mobile_number,
+               u.full_name as created_by_name
+        FROM bills b
+        LEFT JOIN customers c ON b.customer_id = c.id
+        JOIN users u ON b.created_by = u.id
+        WHERE b.id = ?
+    '''
+    
     def get_bill_by_id(self, bill_id: int) -> Optional[Dict[str, Any]]:
         """Get bill with customer details"""
-        query = '''
-            SELECT b.*, 
-                   COALESCE(c.full_name, b.guest_name) as full_name,
-                   c.mobile_number,
-                   u.full_name as created_by_name
-            FROM bills b
-            LEFT JOIN customers c ON b.customer_id = c.id
-            JOIN users u ON b.created_by = u.id
-            WHERE b.id = ?
-        '''
-        results = self.execute_query(query, (bill_id,))
+        results = self.execute_query(self._BILL_BY_ID_QUERY, (bill_id,))
         return results[0] if results else None
     
     def get_bill_items(self, bill_id: int) -> List[Dict[str, Any]]:
@@ -700,20 +988,19 @@ class DatabaseManager:
         query = 'SELECT * FROM bill_items WHERE bill_id = ?'
         return self.execute_query(query, (bill_id,))
     
-    def generate_bill_number(self) -> str:
-        """Generate a unique bill number"""
-        query = 'SELECT MAX(id) as max_id FROM bills'
-        result = self.execute_query(query)
-        max_id = result[0]['max_id'] if result and result[0]['max_id'] else 0
-        return f"BILL{str(max_id + 1).zfill(6)}"
+    def generate_bill_number(self) -> Optional[str]:
+        """Reserve the next bill number.
+        Prefer create_bill(None, ...) or checkout_bill which allocate inside the insert."""
+        return self._reserve_number('bills')
     
     def get_all_bills(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get all bills with customer info"""
+        """Get all bills with customer info and item counts"""
         query = '''
             SELECT b.*, 
                    COALESCE(c.full_name, b.guest_name) as full_name,
                    c.mobile_number,
-                   u.full_name as created_by_name
+                   u.full_name as created_by_name,
+                   (SELECT COUNT(*) FROM bill_items bi WHERE bi.bill_id = b.id) as item_count
             FROM bills b
             LEFT JOIN customers c ON b.customer_id = c.id
             LEFT JOIN users u ON b.created_by = u.id
@@ -722,23 +1009,100 @@ class DatabaseManager:
         '''
         return self.execute_query(query, (limit,))
     
-    def search_bills(self, search_term: str) -> List[Dict[str, Any]]:
-        """Search bills by bill number, customer name, or mobile"""
+    def search_bills(self, search_term: str, limit: int = 500) -> List[Dict[str, Any]]:
+        """Search bills by bill number, customer name, or mobile prefix, best matches first"""
+        match = match_expression(search_term)
+        if not match:
+            return []
         query = '''
             SELECT b.*, 
                    COALESCE(c.full_name, b.guest_name) as full_name,
                    c.mobile_number,
-                   u.full_name as created_by_name
-            FROM bills b
+                   u.full_name as created_by_name,
+                   (SELECT COUNT(*) FROM bill_items bi WHERE bi.bill_id = b.id) as item_count
+            FROM bills_fts f
+            JOIN bills b ON b.id = f.rowid
             LEFT JOIN customers c ON b.customer_id = c.id
             LEFT JOIN users u ON b.created_by = u.id
-            WHERE b.bill_number LIKE ?
-               OR COALESCE(c.full_name, b.guest_name) LIKE ?
-               OR c.mobile_number LIKE ?
-            ORDER BY b.created_at DESC
+            WHERE bills_fts MATCH ?
+            ORDER BY f.rank, b.created_at DESC
+            LIMIT ?
         '''
-        search_pattern = f"%{search_term}%"
-        return self.execute_query(query, (search_pattern, search_pattern, search_pattern))
+        return self.execute_query(query, (match, limit))
+    
+    # Item counts come from the bill_id index, one lookup per listed bill
+    _BILL_LISTING = '''
+        SELECT b.*, 
+               COALESCE(c.full_name, b.guest_name) as full_name,
+               c.mobile_number,
+               u.full_name as created_by_name,
+               (SELECT COUNT(*) FROM bill_items bi WHERE bi.bill_id = b.id) as item_count
+        FROM bills b
+        LEFT JOIN customers c ON b.customer_id = c.id
+        LEFT JOIN users u ON b.created_by = u.id
+    '''
+    
+    def _bill_conditions(self, customer_type: str, payment_status: str,
+                         search_term: str) -> Tuple[List[str], List[Any]]:
+        """WHERE conditions shared by the bill page and count queries"""
+        conditions, params = [], []
+        if customer_type == 'registered':
+            conditions.append('b.customer_id IS NOT NULL')
+        elif customer_type == 'guest':
+            conditions.append("b.customer_id IS NULL AND b.guest_name IS NOT NULL AND b.guest_name != ''")
+        if payment_status == 'paid':
+            conditions.append('COALESCE(b.balance_due, 0) = 0')
+        elif payment_status == 'pending':
+            conditions.append('b.balance_due > 0')
+        if search_term:
+            conditions.append('b.id IN (SELECT rowid FROM bills_fts WHERE bills_fts MATCH ?)')
+            params.append(match_expression(search_term) or '""')
+        return conditions, params
+    
+    def get_bills_page(self, customer_type: str = 'all', payment_status: str = 'all', search_term: str = '',
+                       cursor: Optional[Tuple[str, int]] = None, page_size: int = 100
+                       ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, int]]]:
+        """Get one page of bills, newest first, filtered in SQL.
+        customer_type is 'all', 'registered' or 'guest'; payment_status is
+        'all', 'paid' or 'pending'. Pass the returned cursor back in to fetch
+        the following page."""
+        conditions, params = self._bill_conditions(customer_type, payment_status, search_term)
+        return self._fetch_page(self._BILL_LISTING, conditions, params, 'b', cursor, page_size)
+    
+    def count_bills(self, customer_type: str = 'all', payment_status: str = 'all', search_term: str = '') -> int:
+        """Count the bills get_bills_page would list with the same filters"""
+        conditions, params = self._bill_conditions(customer_type, payment_status, search_term)
+        return self._count_rows(self._BILL_LISTING, conditions, params)
+    
+    def delete_bill(self, bill_id: int) -> bool:
+        """Delete one bill and its items"""
+        def work(conn):
+            cursor = conn.cursor()
+            cursor.execute('DELETE FROM bill_items WHERE bill_id = ?', (bill_id,))
+            cursor.execute('DELETE FROM bills WHERE id = ?', (bill_id,))
+            conn.commit()
+            return cursor.rowcount > 0
+        
+        try:
+            return self.pool.run_write(work)
+        except sqlite3.Error as e:
+            print(f"Delete bill error: {e}")
+            return False
+    
+    def delete_all_bills(self) -> bool:
+        """Delete all bills and their items"""
+        def work(conn):
+            cursor = conn.cursor()
+            cursor.execute('DELETE FROM bill_items')
+            cursor.execute('DELETE FROM bills')
+            conn.commit()
+            return True
+        
+        try:
+            return self.pool.run_write(work)
+        except sqlite3.Error as e:
+            print(f"Delete all bills error: {e}")
+            return False
     
     def get_bill_by_number(self, bill_number: str) -> Optional[Dict[str, Any]]:
         """Get bill by bill number with customer info"""
@@ -755,3 +1119,40 @@ class DatabaseManager:
         results = self.execute_query(query, (bill_number,))
         return results[0] if results else None
 
+    
+    # ==================== Daily Rollups ====================
+    
+    def get_daily_rollups(self, start_date: str, end_date: str, source: str = 'invoice',
+                          item_type: str = '', created_by: int = None) -> List[Dict[str, Any]]:
+        """Get per-day totals for a source ('invoice', 'bill' or 'expense').
+        item_type '' selects document totals; a line item type (e.g. 'Frame')
+        selects those lines. Pass created_by to restrict to one staff member."""
+        query = '''
+            SELECT day, SUM(doc_count) as doc_count, SUM(quantity) as quantity,
+                   SUM(amount) as amount, SUM(buying_cost) as buying_cost,
+                   SUM(balance) as balance
+            FROM daily_rollups
+            WHERE day BETWEEN ? AND ? AND source = ? AND item_type = ?
+              AND (? IS NULL OR created_by = ?)
+            GROUP BY day
+            ORDER BY day
+        '''
+        return self.execute_query(query, (start_date, end_date, source, item_type,
+                                          created_by, created_by))
+    
+    def rebuild_daily_rollups(self) -> bool:
+        """Recompute daily_rollups from the raw tables (backfill or repair)"""
+        from .rollups import rebuild_rollups
+        
+        def work(conn):
+            cursor = conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            rebuild_rollups(cursor)
+            conn.commit()
+            return True
+        
+        try:
+            return self.pool.run_write(work)
+        except sqlite3.Error as e:
+            print(f"Rebuild rollups error: {e}")
+            return False
@@ -0,0 +1,685 @@
+import sqlite3
+from typing import Callable, List, Tuple
+
+
+# The schema version is stored in SQLite's PRAGMA user_version header field,
+# so checking an up-to-date database costs a single PRAGMA read.
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Read the schema version recorded in the database header"""
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def _column_names(cursor: sqlite3.Cursor, table: str) -> List[str]:
+    """Column names of a table"""
+    cursor.execute(f'PRAGMA table_info({table})')
+    return [col[1] for col in cursor.fetchall()]
+
+
+def _add_column(cursor: sqlite3.Cursor, table: str, column: str, definition: str):
+    """Add a column unless the table already has it"""
+    if column not in _column_names(cursor, table):
+        cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+
+
+# Secondary indexes: (index name, table, columns)
+SECONDARY_INDEXES = [
+    ('idx_invoices_created_at', 'invoices', 'created_at'),
+    ('idx_invoices_created_by', 'invoices', 'created_by, created_at'),
+    ('idx_invoices_customer_id', 'invoices', 'customer_id'),
+    ('idx_invoices_booking_id', 'invoices', 'booking_id'),
+    ('idx_invoice_items_invoice_id', 'invoice_items', 'invoice_id'),
+    ('idx_bills_created_at', 'bills', 'created_at'),
+    ('idx_bills_created_by', 'bills', 'created_by, created_at'),
+    ('idx_bills_customer_id', 'bills', 'customer_id'),
+    ('idx_bill_items_bill_id', 'bill_items', 'bill_id'),
+    ('idx_bookings_created_at', 'bookings', 'created_at'),
+    ('idx_bookings_created_by', 'bookings', 'created_by, created_at'),
+    ('idx_bookings_status', 'bookings', 'status'),
+    ('idx_bookings_booking_date', 'bookings', 'booking_date'),
+    ('idx_customers_created_at', 'customers', 'created_at'),
+    ('idx_manual_expenses_expense_date', 'manual_expenses', 'expense_date'),
+]
+
+
+# Partial covering indexes for dashboard totals: (index name, table, columns, condition)
+PARTIAL_INDEXES = [
+    ('idx_invoices_pending_balance', 'invoices', 'balance_amount', 'balance_amount > 0'),
+]
+
+
+# ==================== Migrations ====================
+
+def _create_base_tables(cursor: sqlite3.Cursor):
+    """Create every table the application needs"""
+    # Users table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            role TEXT NOT NULL CHECK(role IN ('Admin', 'Staff')),
+            full_name TEXT NOT NULL,
+            profile_picture TEXT DEFAULT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            is_active INTEGER DEFAULT 1,
+            last_login TEXT DEFAULT NULL
+        )
+    ''')
+
+    # Customers table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS customers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            full_name TEXT NOT NULL,
+            mobile_number TEXT UNIQUE NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Categories table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS categories (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            category_name TEXT UNIQUE NOT NULL,
+            service_cost REAL DEFAULT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Services table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS services (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            service_name TEXT NOT NULL,
+            category_id INTEGER,
+            price REAL NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (category_id) REFERENCES categories (id)
+        )
+    ''')
+
+    # Photo frames table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS photo_frames (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            frame_name TEXT NOT NULL,
+            size TEXT NOT NULL,
+            price REAL NOT NULL,
+            buying_price REAL DEFAULT 0,
+            selling_price REAL DEFAULT 0,
+            quantity INTEGER NOT NULL DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Invoices table - customer_id is NULL for guest customers
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS invoices (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            invoice_number TEXT UNIQUE NOT NULL,
+            booking_id INTEGER,
+            customer_id INTEGER,
+            guest_name TEXT,
+            subtotal REAL NOT NULL,
+            discount REAL DEFAULT 0,
+            category_service_cost REAL DEFAULT 0,
+            advance_payment REAL DEFAULT 0,
+            total_amount REAL NOT NULL,
+            paid_amount REAL NOT NULL,
+            balance_amount REAL NOT NULL,
+            created_by INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (booking_id) REFERENCES bookings (id),
+            FOREIGN KEY (customer_id) REFERENCES customers (id),
+            FOREIGN KEY (created_by) REFERENCES users (id)
+        )
+    ''')
+
+    # Invoice items table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS invoice_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            invoice_id INTEGER NOT NULL,
+            item_type TEXT NOT NULL CHECK(item_type IN ('Service', 'Frame', 'CategoryService')),
+            item_id INTEGER NOT NULL,
+            item_name TEXT NOT NULL,
+            quantity INTEGER NOT NULL DEFAULT 1,
+            unit_price REAL NOT NULL,
+            total_price REAL NOT NULL,
+            buying_price REAL DEFAULT 0,
+            FOREIGN KEY (invoice_id) REFERENCES invoices (id)
+        )
+    ''')
+
+    # Bills table (thermal receipts for normal sales - no booking)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS bills (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            bill_number TEXT UNIQUE NOT NULL,
+            customer_id INTEGER,
+            guest_name TEXT,
+            subtotal REAL NOT NULL,
+            discount REAL DEFAULT 0,
+            service_charge REAL DEFAULT 0,
+            total_amount REAL NOT NULL,
+            cash_given REAL DEFAULT 0,
+            advance_amount REAL DEFAULT 0,
+            balance_due REAL DEFAULT 0,
+            created_by INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (customer_id) REFERENCES customers (id),
+            FOREIGN KEY (created_by) REFERENCES users (id)
+        )
+    ''')
+
+    # Bill items table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS bill_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            bill_id INTEGER NOT NULL,
+            item_type TEXT NOT NULL CHECK(item_type IN ('Service', 'Frame', 'CategoryService')),
+            item_id INTEGER NOT NULL,
+            item_name TEXT NOT NULL,
+            quantity INTEGER NOT NULL DEFAULT 1,
+            unit_price REAL NOT NULL,
+            total_price REAL NOT NULL,
+            buying_price REAL DEFAULT 0,
+            FOREIGN KEY (bill_id) REFERENCES bills (id)
+        )
+    ''')
+
+    # Bookings table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS bookings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            customer_name TEXT NOT NULL,
+            mobile_number TEXT NOT NULL,
+            photoshoot_category TEXT NOT NULL,
+            full_amount REAL NOT NULL,
+            advance_payment REAL NOT NULL,
+            balance_amount REAL NOT NULL,
+            booking_date DATE NOT NULL,
+            location TEXT,
+            description TEXT,
+            status TEXT DEFAULT 'Pending' CHECK(status IN ('Pending', 'Completed', 'Cancelled')),
+            created_by INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (created_by) REFERENCES users (id)
+        )
+    ''')
+
+    # User Permissions table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_permissions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL UNIQUE,
+            can_access_dashboard INTEGER DEFAULT 1,
+            can_access_billing INTEGER DEFAULT 1,
+            can_access_customers INTEGER DEFAULT 1,
+            can_access_categories INTEGER DEFAULT 1,
+            can_access_services INTEGER DEFAULT 1,
+            can_access_frames INTEGER DEFAULT 1,
+            can_access_bookings INTEGER DEFAULT 1,
+            can_access_invoices INTEGER DEFAULT 1,
+            can_access_support INTEGER DEFAULT 1,
+            can_access_user_guide INTEGER DEFAULT 1,
+            can_manage_expenses INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+    ''')
+
+    # Manual Expenses table for miscellaneous expenses
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS manual_expenses (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            description TEXT NOT NULL,
+            amount REAL NOT NULL,
+            expense_date DATE NOT NULL,
+            created_by INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (created_by) REFERENCES users (id)
+        )
+    ''')
+
+    # Daily Balance table to track opening/closing balances
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS daily_balances (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            balance_date DATE UNIQUE NOT NULL,
+            opening_balance REAL DEFAULT 0,
+            total_income REAL DEFAULT 0,
+            total_expenses REAL DEFAULT 0,
+            closing_balance REAL DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+
+def _add_legacy_columns(cursor: sqlite3.Cursor):
+    """Add columns introduced after the first release to older databases"""
+    _add_column(cursor, 'users', 'profile_picture', 'TEXT DEFAULT NULL')
+    _add_column(cursor, 'users', 'last_login', 'TEXT DEFAULT NULL')
+    _add_column(cursor, 'categories', 'service_cost', 'REAL DEFAULT NULL')
+    _add_column(cursor, 'services', 'category_id', 'INTEGER')
+    _add_column(cursor, 'photo_frames', 'buying_price', 'REAL DEFAULT 0')
+    _add_column(cursor, 'photo_frames', 'selling_price', 'REAL DEFAULT 0')
+    _add_column(cursor, 'invoices', 'guest_name', 'TEXT')
+    _add_column(cursor, 'invoices', 'category_service_cost', 'REAL DEFAULT 0')
+    _add_column(cursor, 'invoices', 'advance_payment', 'REAL DEFAULT 0')
+    _add_column(cursor, 'invoices', 'booking_id', 'INTEGER')
+    _add_column(cursor, 'invoice_items', 'buying_price', 'REAL DEFAULT 0')
+    _add_column(cursor, 'bills', 'advance_amount', 'REAL DEFAULT 0')
+    _add_column(cursor, 'bills', 'balance_due', 'REAL DEFAULT 0')
+    _add_column(cursor, 'user_permissions', 'can_manage_expenses', 'INTEGER DEFAULT 0')
+
+
+def _allow_guest_invoices(cursor: sqlite3.Cursor):
+    """Rebuild invoices so customer_id is nullable for guest customers"""
+    cursor.execute('PRAGMA table_info(invoices)')
+    if not any(col[1] == 'customer_id' and col[3] == 1 for col in cursor.fetchall()):
+        return
+
+    cursor.execute('''
+        CREATE TABLE invoices_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            invoice_number TEXT UNIQUE NOT NULL,
+            booking_id INTEGER,
+            customer_id INTEGER,
+            guest_name TEXT,
+            subtotal REAL NOT NULL,
+            discount REAL DEFAULT 0,
+            category_service_cost REAL DEFAULT 0,
+            advance_payment REAL DEFAULT 0,
+            total_amount REAL NOT NULL,
+            paid_amount REAL NOT NULL,
+            balance_amount REAL NOT NULL,
+            created_by INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (booking_id) REFERENCES bookings (id),
+            FOREIGN KEY (customer_id) REFERENCES customers (id),
+            FOREIGN KEY (created_by) REFERENCES users (id)
+        )
+    ''')
+
+    # Every column exists by now (added by the previous migration)
+    columns = ('id, invoice_number, booking_id, customer_id, guest_name, subtotal, '
+               'discount, category_service_cost, advance_payment, total_amount, '
+               'paid_amount, balance_amount, created_by, created_at')
+    cursor.execute(f'INSERT INTO invoices_new ({columns}) SELECT {columns} FROM invoices')
+    cursor.execute('DROP TABLE invoices')
+    cursor.execute('ALTER TABLE invoices_new RENAME TO invoices')
+
+
+def _create_secondary_indexes(cursor: sqlite3.Cursor):
+    """Index the date, owner and foreign-key columns used by reports"""
+    for index_name, table, columns in SECONDARY_INDEXES:
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({columns})')
+
+
+def _create_number_sequences(cursor: sqlite3.Cursor):
+    """Document number sequences (one row per prefix, e.g. BILL, INV)"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS number_sequences (
+            prefix TEXT PRIMARY KEY,
+            last_value INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+
+
+def _create_partial_indexes(cursor: sqlite3.Cursor):
+    """Index outstanding balances and frame sales for the dashboard snapshot"""
+    for index_name, table, columns, condition in PARTIAL_INDEXES:
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({columns}) WHERE {condition}')
+
+
+# Documents rolled up per day: (source, header table, items table,
+# items foreign key, outstanding balance column)
+ROLLUP_DOCUMENTS = [
+    ('invoice', 'invoices', 'invoice_items', 'invoice_id', 'balance_amount'),
+    ('bill', 'bills', 'bill_items', 'bill_id', 'balance_due'),
+]
+
+_ROLLUP_UPSERT = '''
+    INSERT INTO daily_rollups (day, source, created_by, item_type,
+                               doc_count, quantity, amount, buying_cost, balance)
+    {rows}
+    ON CONFLICT (day, source, created_by, item_type) DO UPDATE SET
+        doc_count = doc_count + excluded.doc_count,
+        quantity = quantity + excluded.quantity,
+        amount = amount + excluded.amount,
+        buying_cost = buying_cost + excluded.buying_cost,
+        balance = balance + excluded.balance;
+'''
+
+
+def _rollup_document_rows(source, items, fk, balance, ref, sign):
+    """Upserts adding (sign=+1) or removing (sign=-1) a document and its lines"""
+    header = _ROLLUP_UPSERT.format(rows=f'''
+        VALUES (DATE({ref}.created_at), '{source}', {ref}.created_by, '',
+                {sign}, 0, {sign} * {ref}.total_amount, 0, {sign} * {ref}.{balance})''')
+    lines = _ROLLUP_UPSERT.format(rows=f'''
+        SELECT DATE({ref}.created_at), '{source}', {ref}.created_by, item_type,
+               0, {sign} * SUM(quantity), {sign} * SUM(total_price), {sign} * SUM(buying_price), 0
+        FROM {items} WHERE {fk} = {ref}.id GROUP BY item_type''')
+    return header + lines
+
+
+def _rollup_line_rows(source, table, fk, ref, sign):
+    """Upsert adding or removing a single line item, dated by its document"""
+    return _ROLLUP_UPSERT.format(rows=f'''
+        SELECT DATE(created_at), '{source}', created_by, {ref}.item_type,
+               0, {sign} * {ref}.quantity, {sign} * {ref}.total_price, {sign} * {ref}.buying_price, 0
+        FROM {table} WHERE id = {ref}.{fk}''')
+
+
+def _rollup_expense_rows(ref, sign):
+    """Upsert adding or removing a manual expense"""
+    return _ROLLUP_UPSERT.format(rows=f'''
+        VALUES ({ref}.expense_date, 'expense', {ref}.created_by, '',
+                {sign}, 0, {sign} * {ref}.amount, 0, 0)''')
+
+
+def _create_daily_rollups(cursor: sqlite3.Cursor):
+    """Per-day sales, expense and frame profit totals kept current by triggers"""
+    # item_type is '' for document and expense totals, else the line item type
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS daily_rollups (
+            day TEXT NOT NULL,
+            source TEXT NOT NULL CHECK(source IN ('invoice', 'bill', 'expense')),
+            created_by INTEGER NOT NULL,
+            item_type TEXT NOT NULL DEFAULT '',
+            doc_count INTEGER NOT NULL DEFAULT 0,
+            quantity INTEGER NOT NULL DEFAULT 0,
+            amount REAL NOT NULL DEFAULT 0,
+            buying_cost REAL NOT NULL DEFAULT 0,
+            balance REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, source, created_by, item_type)
+        ) WITHOUT ROWID
+    ''')
+    
+    # Triggers run inside the writing statement's transaction, so every
+    # insert, update and delete path keeps the rollups consistent
+    triggers = []
+    for source, table, items, fk, balance in ROLLUP_DOCUMENTS:
+        # A deleted document takes its remaining lines with it; lines deleted
+        # first have already been subtracted by the line trigger
+        triggers.append((f'trg_{table}_rollup_insert', f'AFTER INSERT ON {table}',
+                         _rollup_document_rows(source, items, fk, balance, 'NEW', 1)))
+        triggers.append((f'trg_{table}_rollup_delete', f'AFTER DELETE ON {table}',
+                         _rollup_document_rows(source, items, fk, balance, 'OLD', -1)))
+        triggers.append((f'trg_{table}_rollup_update',
+                         f'AFTER UPDATE OF created_at, created_by, total_amount, {balance} ON {table}',
+                         _rollup_document_rows(source, items, fk, balance, 'OLD', -1) +
+                         _rollup_document_rows(source, items, fk, balance, 'NEW', 1)))
+        triggers.append((f'trg_{items}_rollup_insert', f'AFTER INSERT ON {items}',
+                         _rollup_line_rows(source, table, fk, 'NEW', 1)))
+        triggers.append((f'trg_{items}_rollup_delete', f'AFTER DELETE ON {items}',
+                         _rollup_line_rows(source, table, fk, 'OLD', -1)))
+        triggers.append((f'trg_{items}_rollup_update',
+                         f'AFTER UPDATE OF {fk}, item_type, quantity, total_price, buying_price ON {items}',
+                         _rollup_line_rows(source, table, fk, 'OLD', -1) +
+                         _rollup_line_rows(source, table, fk, 'NEW', 1)))
+    
+    triggers.append(('trg_manual_expenses_rollup_insert', 'AFTER INSERT ON manual_expenses',
+                     _rollup_expense_rows('NEW', 1)))
+    triggers.append(('trg_manual_expenses_rollup_delete', 'AFTER DELETE ON manual_expenses',
+                     _rollup_expense_rows('OLD', -1)))
+    triggers.append(('trg_manual_expenses_rollup_update',
+                     'AFTER UPDATE OF expense_date, created_by, amount ON manual_expenses',
+                     _rollup_expense_rows('OLD', -1) + _rollup_expense_rows('NEW', 1)))
+    
+    for name, event, body in triggers:
+        cursor.execute(f'CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN {body} END')
+    
+    # Backfill from existing rows
+    from .rollups import rebuild_rollups
+    rebuild_rollups(cursor)
+
+
+def _create_balance_ledger_state(cursor: sqlite3.Cursor):
+    """Track the earliest day whose running balance is out of date"""
+    # Single row; dirty_from is NULL while daily_balances is current
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS balance_ledger_state (
+            id INTEGER PRIMARY KEY CHECK(id = 1),
+            dirty_from TEXT
+        )
+    ''')
+    
+    # Any change to a day's income or expenses invalidates that day onwards
+    for name, event, row in (
+        ('trg_daily_rollups_ledger_insert', 'AFTER INSERT', 'NEW'),
+        ('trg_daily_rollups_ledger_update', 'AFTER UPDATE OF amount', 'NEW'),
+        ('trg_daily_rollups_ledger_delete', 'AFTER DELETE', 'OLD'),
+    ):
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {name} {event} ON daily_rollups
+            WHEN {row}.item_type = '' AND {row}.source IN ('invoice', 'expense')
+            BEGIN
+                UPDATE balance_ledger_state
+                SET dirty_from = MIN(COALESCE(dirty_from, {row}.day), {row}.day)
+                WHERE id = 1;
+            END
+        ''')
+    
+    # Recompute the whole history on first use; this also fills gap days
+    cursor.execute('''
+        INSERT OR IGNORE INTO balance_ledger_state (id, dirty_from)
+        SELECT 1, MIN(day) FROM daily_rollups
+        WHERE item_type = '' AND source IN ('invoice', 'expense')
+    ''')
+
+
+def _search_number(column):
+    """A document number followed by its digits without prefix or leading zeros"""
+    return (f"{column} || ' ' || LTRIM(LTRIM(UPPER({column}), "
+            f"'ABCDEFGHIJKLMNOPQRSTUVWXYZ-_/ '), '0')")
+
+
+# Full-text search documents: table -> (alias, SELECT of rowid, number,
+# names, mobiles). The digits of a document number are indexed on their own
+# as well, so "123" finds BILL000123.
+SEARCH_DOCUMENTS = {
+    'customers': ('c', '''
+        SELECT c.id, '', c.full_name, c.mobile_number
+        FROM customers c
+    '''),
+    'bills': ('b', f'''
+        SELECT b.id, {_search_number('b.bill_number')},
+               TRIM(COALESCE(c.full_name, '') || ' ' || COALESCE(b.guest_name, '')),
+               COALESCE(c.mobile_number, '')
+        FROM bills b
+        LEFT JOIN customers c ON b.customer_id = c.id
+    '''),
+    'invoices': ('i', f'''
+        SELECT i.id, {_search_number('i.invoice_number')},
+               TRIM(COALESCE(c.full_name, '') || ' ' || COALESCE(i.guest_name, '') || ' ' ||
+                    COALESCE(bk.customer_name, '')),
+               TRIM(COALESCE(c.mobile_number, '') || ' ' || COALESCE(bk.mobile_number, ''))
+        FROM invoices i
+        LEFT JOIN customers c ON i.customer_id = c.id
+        LEFT JOIN bookings bk ON i.booking_id = bk.id
+    '''),
+    'bookings': ('bk', '''
+        SELECT bk.id, '', bk.customer_name, bk.mobile_number
+        FROM bookings bk
+    '''),
+}
+
+
+# Customer and booking details are also indexed on the documents that
+# reference them: (referenced table, document table, foreign key column)
+SEARCH_REFERENCES = [
+    ('customers', 'bills', 'b.customer_id'),
+    ('customers', 'invoices', 'i.customer_id'),
+    ('bookings', 'invoices', 'i.booking_id'),
+]
+
+
+def _search_reindex(table, condition):
+    """Statements replacing the search rows of the documents matching condition"""
+    alias, select = SEARCH_DOCUMENTS[table]
+    return f'''
+        DELETE FROM {table}_fts WHERE rowid IN (SELECT {alias}.id FROM {table} {alias} WHERE {condition});
+        INSERT INTO {table}_fts (rowid, number, names, mobiles) {select} WHERE {condition};
+    '''
+
+
+def _search_reindex_references(table, ref):
+    """Statements reindexing the documents that reference row ref of table"""
+    return ''.join(_search_reindex(document, f'{column} = {ref}.id')
+                   for referenced, document, column in SEARCH_REFERENCES if referenced == table)
+
+
+def _create_search_index(cursor: sqlite3.Cursor):
+    """FTS5 tables over document numbers, names and mobiles, kept in sync by triggers"""
+    # One index per table, keyed by the row id, so triggers replace rows directly
+    for table in SEARCH_DOCUMENTS:
+        cursor.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5(
+                number, names, mobiles, tokenize = 'unicode61', prefix = '2 3'
+            )
+        ''')
+    
+    # Columns whose change alters a table's search row
+    indexed_columns = {
+        'customers': 'full_name, mobile_number',
+        'bills': 'bill_number, customer_id, guest_name',
+        'invoices': 'invoice_number, customer_id, guest_name, booking_id',
+        'bookings': 'customer_name, mobile_number',
+    }
+    
+    triggers = []
+    for table, (alias, _) in SEARCH_DOCUMENTS.items():
+        triggers.append((f'trg_{table}_search_insert', f'AFTER INSERT ON {table}',
+                         _search_reindex(table, f'{alias}.id = NEW.id')))
+        triggers.append((f'trg_{table}_search_update',
+                         f'AFTER UPDATE OF {indexed_columns[table]} ON {table}',
+                         _search_reindex(table, f'{alias}.id = NEW.id') +
+                         _search_reindex_references(table, 'NEW')))
+        triggers.append((f'trg_{table}_search_delete', f'AFTER DELETE ON {table}',
+                         f'DELETE FROM {table}_fts WHERE rowid = OLD.id;' +
+                         _search_reindex_references(table, 'OLD')))
+    
+    for name, event, body in triggers:
+        cursor.execute(f'CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN {body} END')
+    
+    # Backfill from existing rows
+    from .search_index import rebuild_search_index
+    rebuild_search_index(cursor)
+
+
+def _create_customer_changes(cursor: sqlite3.Cursor):
+    """Count writes to customers so in-memory lookups can tell they are stale"""
+    # Single row; every insert, update or delete bumps the version, whichever
+    # connection or process made it
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS customer_changes (
+            id INTEGER PRIMARY KEY CHECK(id = 1),
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    cursor.execute('INSERT OR IGNORE INTO customer_changes (id, version) VALUES (1, 0)')
+
+    for name, event in (
+        ('trg_customers_changes_insert', 'AFTER INSERT'),
+        ('trg_customers_changes_update', 'AFTER UPDATE'),
+        ('trg_customers_changes_delete', 'AFTER DELETE'),
+    ):
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {name} {event} ON customers
+            BEGIN
+                UPDATE customer_changes SET version = version + 1 WHERE id = 1;
+            END
+        ''')
+
+
+
+# Tables the period analytics read, and the write events that change them
+REPORT_DATA_TRIGGERS = [
+    (table, event)
+    for table in ('customers', 'bookings', 'invoices', 'manual_expenses')
+    for event in ('INSERT', 'UPDATE', 'DELETE')
+] + [
+    # Expense rows show the name of the user who added them
+    ('users', 'UPDATE OF full_name'),
+    ('users', 'DELETE'),
+]
+
+
+def _create_report_data_changes(cursor: sqlite3.Cursor):
+    """Count writes to report source tables so memoized period analytics can tell they are stale"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS report_data_changes (
+            id INTEGER PRIMARY KEY CHECK(id = 1),
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    cursor.execute('INSERT OR IGNORE INTO report_data_changes (id, version) VALUES (1, 0)')
+
+    for table, event in REPORT_DATA_TRIGGERS:
+        name = f"trg_{table}_report_changes_{event.split()[0].lower()}"
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON {table}
+            BEGIN
+                UPDATE report_data_changes SET version = version + 1 WHERE id = 1;
+            END
+        ''')
+
+# (version, description, migration) - append only; never renumber or edit
+# a migration once it has shipped
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Cursor], None]]] = [
+    (1, 'Create base tables', _create_base_tables),
+    (2, 'Add columns missing from older databases', _add_legacy_columns),
+    (3, 'Allow NULL customer_id on invoices', _allow_guest_invoices),
+    (4, 'Create secondary indexes', _create_secondary_indexes),
+    (5, 'Create number_sequences table', _create_number_sequences),
+    (6, 'Create partial indexes for dashboard totals', _create_partial_indexes),
+    (7, 'Create daily_rollups table and triggers', _create_daily_rollups),
+    (8, 'Track stale days in the balance ledger', _create_balance_ledger_state),
+    (9, 'Create full-text search index', _create_search_index),
+    (10, 'Track customer changes for lookup caches', _create_customer_changes),
+    (11, 'Track report data changes for analytics caches', _create_report_data_changes),
+]
+
+
+def run_migrations(conn: sqlite3.Connection, migrations=None) -> int:
+    """Apply pending migrations in order and return how many ran.
+
+    Each migration runs in its own transaction together with the
+    user_version bump, so a failure leaves the database at the last
+    completed version and the exception propagates to the caller.
+    """
+    migrations = MIGRATIONS if migrations is None else migrations
+    latest = migrations[-1][0] if migrations else 0
+    if get_schema_version(conn) >= latest:
+        return 0
+
+    applied = 0
+    cursor = conn.cursor()
+    for version, description, migrate in migrations:
+        # Take the write lock first so concurrent launches apply each step once
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            if get_schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            migrate(cursor)
+            cursor.execute(f'PRAGMA user_version = {int(version)}')
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        applied += 1
+        print(f"Applied migration {version}: {description}")
+    return applied
@@ -0,0 +1,73 @@
+import sqlite3
+import sys
+
+from .migrations import run_migrations
+
+
+# daily_rollups holds one row per (day, source, created_by, item_type).
+# Triggers created by the daily_rollups migration keep it current; the
+# rebuild below recomputes it from the raw tables for backfill or repair.
+
+def rebuild_rollups(cursor: sqlite3.Cursor):
+    """Recompute daily_rollups from invoices, bills and manual expenses (caller commits)"""
+    cursor.execute('DELETE FROM daily_rollups')
+
+    for source, table, items, fk, balance in (
+        ('invoice', 'invoices', 'invoice_items', 'invoice_id', 'balance_amount'),
+        ('bill', 'bills', 'bill_items', 'bill_id', 'balance_due'),
+    ):
+        # Document totals
+        cursor.execute(f'''
+            INSERT INTO daily_rollups (day, source, created_by, item_type,
+                                       doc_count, quantity, amount, buying_cost, balance)
+            SELECT DATE(created_at), '{source}', created_by, '',
+                   COUNT(*), 0, COALESCE(SUM(total_amount), 0), 0, COALESCE(SUM({balance}), 0)
+            FROM {table}
+            GROUP BY DATE(created_at), created_by
+        ''')
+
+        # Line items, dated and attributed by their document
+        cursor.execute(f'''
+            INSERT INTO daily_rollups (day, source, created_by, item_type,
+                                       doc_count, quantity, amount, buying_cost, balance)
+            SELECT DATE(d.created_at), '{source}', d.created_by, li.item_type,
+                   0, COALESCE(SUM(li.quantity), 0), COALESCE(SUM(li.total_price), 0),
+                   COALESCE(SUM(li.buying_price), 0), 0
+            FROM {items} li
+            JOIN {table} d ON li.{fk} = d.id
+            GROUP BY DATE(d.created_at), d.created_by, li.item_type
+        ''')
+
+    cursor.execute('''
+        INSERT INTO daily_rollups (day, source, created_by, item_type,
+                                   doc_count, quantity, amount, buying_cost, balance)
+        SELECT expense_date, 'expense', created_by, '',
+               COUNT(*), 0, COALESCE(SUM(amount), 0), 0, 0
+        FROM manual_expenses
+        GROUP BY expense_date, created_by
+    ''')
+
+
+def rebuild_daily_rollups(db_path: str = 'pos_database.db') -> int:
+    """Rebuild daily_rollups in one transaction and return the number of rows written"""
+    conn = sqlite3.connect(db_path, timeout=30.0)
+    try:
+        # Older databases get the table (and its triggers) first
+        run_migrations(conn)
+        cursor = conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        rebuild_rollups(cursor)
+        conn.commit()
+        return cursor.execute('SELECT COUNT(*) FROM daily_rollups').fetchone()[0]
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    # Usage: python -m database.rollups [db_path]
+    path = sys.argv[1] if len(sys.argv) > 1 else 'pos_database.db'
+    rows = rebuild_daily_rollups(path)
+    print(f"Rebuilt daily_rollups: {rows} rows in {path}")
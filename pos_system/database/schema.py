@@ -2,6 +2,9 @@ import sqlite3
 import os
 from datetime import datetime
 
+from .migrations import run_migrations
+
+
 class DatabaseSchema:
     def __init__(self, db_path='pos_database.db'):
         self.db_path = db_path
@@ -18,308 +21,14 @@ class DatabaseSchema:
         if self.conn:
             self.conn.close()
             
-    def create_tables(self):
-        """Create all database tables"""
+    def create_tables(self) -> int:
+        """Bring the schema up to date and return the number of migrations applied"""
         self.connect()
-        
-        # Users table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                role TEXT NOT NULL CHECK(role IN ('Admin', 'Staff')),
-                full_name TEXT NOT NULL,
-                profile_picture TEXT DEFAULT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                is_active INTEGER DEFAULT 1
-            )
-        ''')
-        
-        # Add profile_picture column if not exists (for existing databases)
-        try:
-            self.cursor.execute('ALTER TABLE users ADD COLUMN profile_picture TEXT DEFAULT NULL')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Add last_login column if not exists (for existing databases)
-        try:
-            self.cursor.execute('ALTER TABLE users ADD COLUMN last_login TEXT DEFAULT NULL')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Customers table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS customers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                full_name TEXT NOT NULL,
-                mobile_number TEXT UNIQUE NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Categories table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS categories (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                category_name TEXT UNIQUE NOT NULL,
-                service_cost REAL DEFAULT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Add service_cost column if not exists (for existing databases)
-        try:
-            self.cursor.execute('ALTER TABLE categories ADD COLUMN service_cost REAL DEFAULT NULL')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Services table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS services (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                service_name TEXT NOT NULL,
-                category_id INTEGER,
-                price REAL NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (category_id) REFERENCES categories (id)
-            )
-        ''')
-        
-        # Add category_id column if not exists (for existing databases)
-        try:
-            self.cursor.execute('ALTER TABLE services ADD COLUMN category_id INTEGER')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Photo frames table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS photo_frames (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                frame_name TEXT NOT NULL,
-                size TEXT NOT NULL,
-                price REAL NOT NULL,
-                buying_price REAL DEFAULT 0,
-                selling_price REAL DEFAULT 0,
-                quantity INTEGER NOT NULL DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Add buying_price column if not exists (for existing databases)
-        try:
-            self.cursor.execute('ALTER TABLE photo_frames ADD COLUMN buying_price REAL DEFAULT 0')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Add selling_price column if not exists (for existing databases)
-        try:
-            self.cursor.execute('ALTER TABLE photo_frames ADD COLUMN selling_price REAL DEFAULT 0')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Invoices table - customer_id is NULL for guest customers
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS invoices (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                invoice_number TEXT UNIQUE NOT NULL,
-                booking_id INTEGER,
-                customer_id INTEGER,
-                guest_name TEXT,
-                subtotal REAL NOT NULL,
-                discount REAL DEFAULT 0,
-                category_service_cost REAL DEFAULT 0,
-                advance_payment REAL DEFAULT 0,
-                total_amount REAL NOT NULL,
-                paid_amount REAL NOT NULL,
-                balance_amount REAL NOT NULL,
-                created_by INTEGER NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (booking_id) REFERENCES bookings (id),
-                FOREIGN KEY (customer_id) REFERENCES customers (id),
-                FOREIGN KEY (created_by) REFERENCES users (id)
-            )
-        ''')
-        
-        # Add guest_name column if not exists (for existing databases)
-        try:
-            self.cursor.execute('ALTER TABLE invoices ADD COLUMN guest_name TEXT')
-        except sqlite3.OperationalError:
-            pass
-        
-        # Add category_service_cost column if not exists
-        try:
-            self.cursor.execute('ALTER TABLE invoices ADD COLUMN category_service_cost REAL DEFAULT 0')
-        except sqlite3.OperationalError:
-            pass
-        
-        # Add advance_payment column if not exists
-        try:
-            self.cursor.execute('ALTER TABLE invoices ADD COLUMN advance_payment REAL DEFAULT 0')
-        except sqlite3.OperationalError:
-            pass
-        
-        # Add booking_id column if not exists
-        try:
-            self.cursor.execute('ALTER TABLE invoices ADD COLUMN booking_id INTEGER')
-        except sqlite3.OperationalError:
-            pass
-        
-        # Fix customer_id NOT NULL constraint for guest customers (migrate existing table)
-        self._migrate_invoices_table()
-        
-        # Invoice items table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS invoice_items (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                invoice_id INTEGER NOT NULL,
-                item_type TEXT NOT NULL CHECK(item_type IN ('Service', 'Frame', 'CategoryService')),
-                item_id INTEGER NOT NULL,
-                item_name TEXT NOT NULL,
-                quantity INTEGER NOT NULL DEFAULT 1,
-                unit_price REAL NOT NULL,
-                total_price REAL NOT NULL,
-                buying_price REAL DEFAULT 0,
-                FOREIGN KEY (invoice_id) REFERENCES invoices (id)
-            )
-        ''')
-        
-        # Add buying_price column if not exists
-        try:
-            self.cursor.execute('ALTER TABLE invoice_items ADD COLUMN buying_price REAL DEFAULT 0')
-        except sqlite3.OperationalError:
-            pass
-        
-        # Bills table (thermal receipts for normal sales - no booking)
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS bills (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                bill_number TEXT UNIQUE NOT NULL,
-                customer_id INTEGER,
-                guest_name TEXT,
-                subtotal REAL NOT NULL,
-                discount REAL DEFAULT 0,
-                service_charge REAL DEFAULT 0,
-                total_amount REAL NOT NULL,
-                cash_given REAL DEFAULT 0,
-                advance_amount REAL DEFAULT 0,
-                balance_due REAL DEFAULT 0,
-                created_by INTEGER NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (customer_id) REFERENCES customers (id),
-                FOREIGN KEY (created_by) REFERENCES users (id)
-            )
-        ''')
-        
-        # Add advance_amount and balance_due columns if they don't exist (migration)
-        try:
-            self.cursor.execute('ALTER TABLE bills ADD COLUMN advance_amount REAL DEFAULT 0')
-        except:
-            pass
-        try:
-            self.cursor.execute('ALTER TABLE bills ADD COLUMN balance_due REAL DEFAULT 0')
-        except:
-            pass
-        
-        # Bill items table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS bill_items (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                bill_id INTEGER NOT NULL,
-                item_type TEXT NOT NULL CHECK(item_type IN ('Service', 'Frame', 'CategoryService')),
-                item_id INTEGER NOT NULL,
-                item_name TEXT NOT NULL,
-                quantity INTEGER NOT NULL DEFAULT 1,
-                unit_price REAL NOT NULL,
-                total_price REAL NOT NULL,
-                buying_price REAL DEFAULT 0,
-                FOREIGN KEY (bill_id) REFERENCES bills (id)
-            )
-        ''')
-        
-        # Bookings table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS bookings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                customer_name TEXT NOT NULL,
-                mobile_number TEXT NOT NULL,
-                photoshoot_category TEXT NOT NULL,
-                full_amount REAL NOT NULL,
-                advance_payment REAL NOT NULL,
-                balance_amount REAL NOT NULL,
-                booking_date DATE NOT NULL,
-                location TEXT,
-                description TEXT,
-                status TEXT DEFAULT 'Pending' CHECK(status IN ('Pending', 'Completed', 'Cancelled')),
-                created_by INTEGER NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (created_by) REFERENCES users (id)
-            )
-        ''')
-        
-        # User Permissions table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS user_permissions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL UNIQUE,
-                can_access_dashboard INTEGER DEFAULT 1,
-                can_access_billing INTEGER DEFAULT 1,
-                can_access_customers INTEGER DEFAULT 1,
-                can_access_categories INTEGER DEFAULT 1,
-                can_access_services INTEGER DEFAULT 1,
-                can_access_frames INTEGER DEFAULT 1,
-                can_access_bookings INTEGER DEFAULT 1,
-                can_access_invoices INTEGER DEFAULT 1,
-                can_access_support INTEGER DEFAULT 1,
-                can_access_user_guide INTEGER DEFAULT 1,
-                can_manage_expenses INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (id)
-            )
-        ''')
-        
-        # Add can_manage_expenses column if not exists (for existing databases)
         try:
-            self.cursor.execute('ALTER TABLE user_permissions ADD COLUMN can_manage_expenses INTEGER DEFAULT 0')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Manual Expenses table for miscellaneous expenses
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS manual_expenses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                description TEXT NOT NULL,
-                amount REAL NOT NULL,
-                expense_date DATE NOT NULL,
-                created_by INTEGER NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (created_by) REFERENCES users (id)
-            )
-        ''')
-        
-        # Daily Balance table to track opening/closing balances
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS daily_balances (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                balance_date DATE UNIQUE NOT NULL,
-                opening_balance REAL DEFAULT 0,
-                total_income REAL DEFAULT 0,
-                total_expenses REAL DEFAULT 0,
-                closing_balance REAL DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        self.conn.commit()
-        self.close()
-        
+            return run_migrations(self.conn)
+        finally:
+            self.close()
+    
     def initialize_default_data(self):
         """Insert default data for testing"""
         self.connect()
@@ -383,88 +92,17 @@ class DatabaseSchema:
         self.conn.commit()
         self.close()
     
-    def _migrate_invoices_table(self):
-        """Migrate invoices table to allow NULL customer_id for guest customers and add booking_id"""
-        try:
-            # Check if customer_id column has NOT NULL constraint
-            self.cursor.execute("PRAGMA table_info(invoices)")
-            columns = self.cursor.fetchall()
-            
-            needs_migration = False
-            has_booking_id = False
-            
-            for col in columns:
-                if col[1] == 'customer_id' and col[3] == 1:
-                    needs_migration = True
-                if col[1] == 'booking_id':
-                    has_booking_id = True
-            
-            if needs_migration or not has_booking_id:
-                # Need to recreate table
-                self.cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS invoices_new (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        invoice_number TEXT UNIQUE NOT NULL,
-                        booking_id INTEGER,
-                        customer_id INTEGER,
-                        guest_name TEXT,
-                        subtotal REAL NOT NULL,
-                        discount REAL DEFAULT 0,
-                        category_service_cost REAL DEFAULT 0,
-                        advance_payment REAL DEFAULT 0,
-                        total_amount REAL NOT NULL,
-                        paid_amount REAL NOT NULL,
-                        balance_amount REAL NOT NULL,
-                        created_by INTEGER NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (booking_id) REFERENCES bookings (id),
-                        FOREIGN KEY (customer_id) REFERENCES customers (id),
-                        FOREIGN KEY (created_by) REFERENCES users (id)
-                    )
-                ''')
-                
-                # Copy existing data - handle missing columns
-                try:
-                    self.cursor.execute('''
-                        INSERT INTO invoices_new 
-                        SELECT id, invoice_number, 
-                               NULL as booking_id,
-                               customer_id, guest_name, subtotal, 
-                               discount, category_service_cost, advance_payment, 
-                               total_amount, paid_amount, balance_amount, created_by, created_at
-                        FROM invoices
-                    ''')
-                except sqlite3.OperationalError:
-                    # Fallback for older schemas
-                    try:
-                        self.cursor.execute('''
-                            INSERT INTO invoices_new (id, invoice_number, customer_id, subtotal, 
-                                   discount, total_amount, paid_amount, balance_amount, created_by, created_at)
-                            SELECT id, invoice_number, customer_id, subtotal, 
-                                   discount, total_amount, paid_amount, balance_amount, created_by, created_at
-                            FROM invoices
-                        ''')
-                    except:
-                        pass
-                
-                # Drop old table and rename new one
-                self.cursor.execute('DROP TABLE invoices')
-                self.cursor.execute('ALTER TABLE invoices_new RENAME TO invoices')
-                self.conn.commit()
-                print("Migrated invoices table successfully")
-        except sqlite3.Error as e:
-            print(f"Migration check: {e}")
-        
     def reset_database(self):
         """Drop all tables and recreate (use with caution)"""
         self.connect()
         
         tables = ['bill_items', 'bills', 'invoice_items', 'invoices', 'bookings', 
                   'photo_frames', 'services', 'categories', 'customers', 
-                  'user_permissions', 'users']
+                  'user_permissions', 'users', 'number_sequences']
         
         for table in tables:
             self.cursor.execute(f'DROP TABLE IF EXISTS {table}')
+        self.cursor.execute('PRAGMA user_version = 0')
         
         self.conn.commit()
         self.close()
@@ -476,8 +114,10 @@ class DatabaseSchema:
 def initialize_database(db_path='pos_database.db'):
     """Main function to initialize the database"""
     db = DatabaseSchema(db_path)
-    db.create_tables()
-    db.initialize_default_data()
+    # An up-to-date database costs one PRAGMA read; seed data only after
+    # the schema was created or upgraded
+    if db.create_tables():
+        db.initialize_default_data()
     print(f"Database initialized successfully at: {os.path.abspath(db_path)}")
     return db_path
 
@@ -0,0 +1,25 @@
+import re
+import sqlite3
+
+from .migrations import SEARCH_DOCUMENTS
+
+
+# Each searchable table has a <table>_fts FTS5 index whose rowid is the
+# table's id. Triggers created by the search index migration keep it
+# current; the rebuild below recomputes it for backfill or repair.
+
+def rebuild_search_index(cursor: sqlite3.Cursor):
+    """Recompute every <table>_fts index from its table (caller commits)"""
+    for table, (_, select) in SEARCH_DOCUMENTS.items():
+        cursor.execute(f'DELETE FROM {table}_fts')
+        cursor.execute(f'INSERT INTO {table}_fts (rowid, number, names, mobiles) {select}')
+        cursor.execute(f"INSERT INTO {table}_fts ({table}_fts) VALUES ('optimize')")
+
+
+def match_expression(search_term: str) -> str:
+    """FTS5 MATCH expression requiring every word of search_term as a token prefix.
+    
+    Returns '' when the term has nothing searchable (only punctuation).
+    """
+    # Quoting each word keeps user input from being read as FTS5 syntax
+    return ' '.join(f'"{word}"*' for word in re.findall(r'\w+', search_term))
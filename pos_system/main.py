@@ -1,47 +1,91 @@
+# Imported first so --profile-startup can time the imports below
+from utils.startup_profiler import startup_profiler
+startup_profiler.start()
+
 import customtkinter as ctk
 from tkinter import ttk
 from database import DatabaseManager
 from auth import AuthManager
-from ui.components import LoginWindow, Toast, MessageDialog
+from ui.components import LoginWindow, Toast, MessageDialog, PageCache, asset_image, window_icon_photos
 from ui.sidebar import Sidebar
-from PIL import Image
 import os
-from utils import resource_path
-
-# Import all frames
-from ui.customer_frame import CustomerManagementFrame
-from ui.service_frame import ServiceManagementFrame
-from ui.frame_frame import FrameManagementFrame
-from ui.billing_frame import BillingFrame
-from ui.booking_frame import BookingManagementFrame
-from ui.invoice_history_frame import InvoiceHistoryFrame
-from ui.bill_history_frame import BillHistoryFrame
-from ui.dashboard_frame import DashboardFrame
-from ui.users_frame import UsersManagementFrame
-from ui.settings_frame import SettingsFrame
-from ui.support_frame import SupportFrame
-from ui.user_guide_frame import UserGuideFrame
-from ui.profile_frame import ProfileFrame
-from ui.category_frame import CategoryManagementFrame
-from ui.permissions_frame import PermissionsFrame
-from ui.staff_reports_frame import StaffReportsFrame
+from utils import resource_path, import_attribute
 from services.user_service import UserService
 
+startup_profiler.mark("main imports done")
+
+# Page frames, imported the first time each page is opened so the login
+# window does not wait for every page (and ReportLab/matplotlib) to load
+FRAME_CLASSES = {
+    "dashboard": "ui.dashboard_frame:DashboardFrame",
+    "billing": "ui.billing_frame:BillingFrame",
+    "customers": "ui.customer_frame:CustomerManagementFrame",
+    "categories": "ui.category_frame:CategoryManagementFrame",
+    "services": "ui.service_frame:ServiceManagementFrame",
+    "frames": "ui.frame_frame:FrameManagementFrame",
+    "bookings": "ui.booking_frame:BookingManagementFrame",
+    "invoices": "ui.invoice_history_frame:InvoiceHistoryFrame",
+    "bills": "ui.bill_history_frame:BillHistoryFrame",
+    "users": "ui.users_frame:UsersManagementFrame",
+    "permissions": "ui.permissions_frame:PermissionsFrame",
+    "staff_reports": "ui.staff_reports_frame:StaffReportsFrame",
+    "settings": "ui.settings_frame:SettingsFrame",
+    "profile": "ui.profile_frame:ProfileFrame",
+    "support": "ui.support_frame:SupportFrame",
+    "guide": "ui.user_guide_frame:UserGuideFrame",
+}
+
 
 class MainApplication(ctk.CTk):
     """Main application window"""
     
     def __init__(self):
-        super().__init__()
+        with startup_profiler.phase("create Tk root"):
+            super().__init__()
         
         # Set appearance
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
         
         # Set application window icon
-        self._set_window_icon()
+        with startup_profiler.phase("window icon"):
+            self._set_window_icon()
+        
+        with startup_profiler.phase("ttk styles"):
+            self._configure_styles()
+        
+        # Hide main window initially
+        self.withdraw()
+        
+        # Window setup
+        self.title("Shine Art Studio - POS System")
+        self.geometry("1500x850")
+        self.minsize(1200, 700)
+        
+        # Initialize managers
+        with startup_profiler.phase("managers"):
+            self.db_manager = DatabaseManager()
+            self.auth_manager = AuthManager()
+            self.user_service = UserService()
         
-        # Configure ttk styles for modern tables
+        # Current user
+        self.current_user = None
+        
+        # Create main container
+        self.main_container = None
+        self.content_frame = None
+        self.sidebar = None
+        self.profile_image_label = None
+        # Constructed pages, kept between visits
+        self.pages = PageCache(self.db_manager.data_version)
+        
+        # Show login
+        with startup_profiler.phase("login window"):
+            self.show_login()
+        self.after_idle(lambda: startup_profiler.mark("login window drawn"))
+    
+    def _configure_styles(self):
+        """Configure ttk styles for modern tables"""
         style = ttk.Style()
         style.theme_use("clam")
         
@@ -108,31 +152,6 @@ class MainApplication(ctk.CTk):
         # Configure alternating row colors using tags (applied in frames)
         style.configure("oddrow.Treeview", background="#1e1e3f")
         style.configure("evenrow.Treeview", background="#252545")
-        
-        # Hide main window initially
-        self.withdraw()
-        
-        # Window setup
-        self.title("Shine Art Studio - POS System")
-        self.geometry("1500x850")
-        self.minsize(1200, 700)
-        
-        # Initialize managers
-        self.db_manager = DatabaseManager()
-        self.auth_manager = AuthManager()
-        self.user_service = UserService()
-        
-        # Current user
-        self.current_user = None
-        
-        # Create main container
-        self.main_container = None
-        self.content_frame = None
-        self.sidebar = None
-        self.profile_image_label = None
-        
-        # Show login
-        self.show_login()
     
     def _set_window_icon(self):
         """Set the application window icon"""
@@ -144,22 +163,10 @@ class MainApplication(ctk.CTk):
                 # Set the window icon using iconbitmap for Windows taskbar
                 self.iconbitmap(ico_path)
                 
-                # Also load as image for iconphoto
-                from PIL import ImageTk
-                icon_image = Image.open(ico_path)
-                
-                # Convert to RGBA if needed
-                if icon_image.mode != 'RGBA':
-                    icon_image = icon_image.convert('RGBA')
-                
-                # Also set iconphoto for other platforms/contexts
-                icon_sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-                icon_photos = []
-                for size in icon_sizes:
-                    resized = icon_image.resize(size, Image.Resampling.LANCZOS)
-                    icon_photos.append(ImageTk.PhotoImage(resized))
-                self._icon_photos = icon_photos  # Keep reference to prevent garbage collection
-                self.iconphoto(True, *icon_photos)
+                # Also set iconphoto for other platforms/contexts; the sizes
+                # are rendered once and reused on every call
+                self._icon_photos = window_icon_photos(ico_path)  # Keep reference to prevent garbage collection
+                self.iconphoto(True, *self._icon_photos)
         except Exception as e:
             print(f"Could not load application icon: {e}")
     
@@ -169,11 +176,13 @@ class MainApplication(ctk.CTk):
     
     def on_login_success(self, user):
         """Handle successful login"""
+        startup_profiler.mark("login succeeded")
         self.current_user = user
         self.deiconify()
         
         # Re-set window icon to ensure consistency
-        self._set_window_icon()
+        with startup_profiler.phase("window icon (after login)"):
+            self._set_window_icon()
         
         # Center window
         self.update_idletasks()
@@ -181,26 +190,24 @@ class MainApplication(ctk.CTk):
         y = (self.winfo_screenheight() // 2) - 425
         self.geometry(f"1500x850+{x}+{y}")
         
-        self.create_main_interface()
+        with startup_profiler.phase("main interface"):
+            self.create_main_interface()
+        
+        # The profile is complete once the dashboard has been drawn
+        self.after_idle(self._finish_startup_profile)
+    
+    def _finish_startup_profile(self):
+        """Record the first dashboard draw and write the startup profile"""
+        startup_profiler.mark("dashboard drawn")
+        startup_profiler.finish()
     
     def load_profile_image(self, user_id: int, size: tuple = (40, 40)):
         """Load user profile image with circular mask or return default"""
         try:
             profile_path = self.user_service.get_profile_picture(user_id)
             if profile_path and os.path.exists(profile_path):
-                img = Image.open(profile_path)
-                # Make it square first
-                img = img.resize(size, Image.Resampling.LANCZOS)
-                # Create circular mask
-                mask = Image.new('L', size, 0)
-                from PIL import ImageDraw
-                draw = ImageDraw.Draw(mask)
-                draw.ellipse((0, 0, size[0], size[1]), fill=255)
-                # Apply mask to create circular image
-                output = Image.new('RGBA', size, (0, 0, 0, 0))
-                img = img.convert('RGBA')
-                output.paste(img, (0, 0), mask)
-                return ctk.CTkImage(light_image=output, dark_image=output, size=size)
+                # Square, circle-masked image from the image cache
+                return asset_image(profile_path, size, mask='circle')
         except Exception as e:
             print(f"Error loading profile image: {e}")
         return None
@@ -213,7 +220,8 @@ class MainApplication(ctk.CTk):
         self.main_container.pack(fill="both", expand=True)
         
         # Create sidebar with navigation
-        self.sidebar = Sidebar(self.main_container, self.auth_manager, self.navigate_to)
+        with startup_profiler.phase("sidebar"):
+            self.sidebar = Sidebar(self.main_container, self.auth_manager, self.navigate_to)
         self.sidebar.pack(fill="y", side="left")
         
         # Right side container (top bar + content)
@@ -252,7 +260,8 @@ class MainApplication(ctk.CTk):
         self.content_frame.pack(fill="both", expand=True, padx=5, pady=5)
         
         # Show default view (Dashboard)
-        self.navigate_to("dashboard")
+        with startup_profiler.phase("dashboard page"):
+            self.navigate_to("dashboard")
         
         # Set parent for MessageDialog toasts
         MessageDialog.set_parent(self.content_frame)
@@ -289,42 +298,24 @@ class MainApplication(ctk.CTk):
             Toast.show_toast(self, "Access Denied", "You don't have permission to access this feature.", "error")
             return
         
-        self.clear_content()
-        
         # Update sidebar active state
         if self.sidebar:
             self.sidebar.set_active(page)
         
-        frame_classes = {
-            "dashboard": DashboardFrame,
-            "billing": BillingFrame,
-            "customers": CustomerManagementFrame,
-            "categories": CategoryManagementFrame,
-            "services": ServiceManagementFrame,
-            "frames": FrameManagementFrame,
-            "bookings": BookingManagementFrame,
-            "invoices": InvoiceHistoryFrame,
-            "bills": BillHistoryFrame,
-            "users": UsersManagementFrame,
-            "permissions": PermissionsFrame,
-            "staff_reports": StaffReportsFrame,
-            "settings": SettingsFrame,
-            "profile": ProfileFrame,
-            "support": SupportFrame,
-            "guide": UserGuideFrame,
-        }
-        
-        frame_class = frame_classes.get(page)
-        if frame_class:
-            # Pass main_app reference to ProfileFrame and DashboardFrame
-            if page in ["profile", "dashboard"]:
-                frame = frame_class(self.content_frame, self.auth_manager, self.db_manager, self)
-            else:
-                frame = frame_class(self.content_frame, self.auth_manager, self.db_manager)
-            frame.pack(fill="both", expand=True)
+        if page in FRAME_CLASSES:
+            def build():
+                frame_class = import_attribute(FRAME_CLASSES[page])
+                # Pass main_app reference to ProfileFrame and DashboardFrame
+                if page in ["profile", "dashboard"]:
+                    return frame_class(self.content_frame, self.auth_manager, self.db_manager, self)
+                return frame_class(self.content_frame, self.auth_manager, self.db_manager)
+            
+            # Cached pages are shown again as they were, refreshed if data changed
+            self.pages.show(page, build)
     
     def clear_content(self):
         """Clear content frame"""
+        self.pages.clear()
         for widget in self.content_frame.winfo_children():
             widget.destroy()
     
@@ -426,6 +417,8 @@ class MainApplication(ctk.CTk):
             self.auth_manager.logout()
             self.current_user = None
             
+            # Pages were built for the previous user's role and permissions
+            self.pages.clear()
             if self.main_container:
                 self.main_container.destroy()
                 self.main_container = None
@@ -445,11 +438,21 @@ def main():
     """Main entry point"""
     # Initialize database
     from database import initialize_database
-    initialize_database()
+    with startup_profiler.phase("initialize_database"):
+        initialize_database()
     
     # Start application
-    app = MainApplication()
+    with startup_profiler.phase("MainApplication.__init__"):
+        app = MainApplication()
     app.mainloop()
+    
+    # Stop background reports before their database connections go away
+    from services.report_jobs import shutdown_report_runner
+    shutdown_report_runner()
+    
+    # Release pooled database connections
+    from database import close_all_pools
+    close_all_pools()
 
 
 if __name__ == "__main__":
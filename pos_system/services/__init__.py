@@ -1,13 +1,26 @@
-from .invoice_generator import InvoiceGenerator
-from .bill_generator import BillGenerator
-from .dashboard_service import DashboardService
-from .settings_service import SettingsService
-from .user_service import UserService
-
-__all__ = [
-    'InvoiceGenerator',
-    'BillGenerator',
-    'DashboardService',
-    'SettingsService',
-    'UserService'
-]
+import importlib
+
+# The PDF generators import ReportLab; load each service on first access
+_EXPORTS = {
+    'InvoiceGenerator': '.invoice_generator',
+    'BillGenerator': '.bill_generator',
+    'DashboardService': '.dashboard_service',
+    'SettingsService': '.settings_service',
+    'UserService': '.user_service',
+    'ReportJobRunner': '.report_jobs',
+    'ReportJob': '.report_jobs',
+    'JobCancelled': '.report_jobs',
+    'get_report_runner': '.report_jobs',
+    'generate_batch_reports': '.batch_reports',
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,207 @@
+import sqlite3
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+from database.connection_pool import get_pool
+
+
+class BalanceLedger:
+    """Running opening/closing balances per day, kept in daily_balances.
+
+    Balances are derived from the invoice and expense totals in
+    daily_rollups. Writes only mark the earliest affected day as stale;
+    refresh() then recomputes from that day onwards in one windowed pass,
+    writing a row for every calendar day so the chain has no gaps.
+    """
+
+    def __init__(self, db_path='pos_database.db'):
+        self.db_path = db_path
+        self.pool = get_pool(db_path)
+
+    # Net movement per day and the balance carried in from before the range
+    _RECOMPUTE_QUERY = '''
+        WITH RECURSIVE days(day) AS (
+            SELECT :start_date
+            UNION ALL
+            SELECT DATE(day, '+1 day') FROM days WHERE day < :end_date
+        ),
+        totals AS (
+            SELECT day,
+                   SUM(CASE WHEN source = 'invoice' THEN amount ELSE 0 END) as income,
+                   SUM(CASE WHEN source = 'expense' THEN amount ELSE 0 END) as expenses
+            FROM daily_rollups
+            WHERE item_type = '' AND source IN ('invoice', 'expense')
+              AND day BETWEEN :start_date AND :end_date
+            GROUP BY day
+        ),
+        carried AS (
+            SELECT COALESCE(SUM(CASE WHEN source = 'invoice' THEN amount ELSE -amount END), 0) as balance
+            FROM daily_rollups
+            WHERE item_type = '' AND source IN ('invoice', 'expense') AND day < :start_date
+        ),
+        ledger AS (
+            SELECT d.day,
+                   COALESCE(t.income, 0) as income,
+                   COALESCE(t.expenses, 0) as expenses,
+                   (SELECT balance FROM carried)
+                       + SUM(COALESCE(t.income, 0) - COALESCE(t.expenses, 0))
+                         OVER (ORDER BY d.day) as closing
+            FROM days d
+            LEFT JOIN totals t ON t.day = d.day
+        )
+        INSERT INTO daily_balances
+            (balance_date, opening_balance, total_income, total_expenses, closing_balance, updated_at)
+        SELECT day, closing - income + expenses, income, expenses, closing, CURRENT_TIMESTAMP
+        FROM ledger
+        WHERE true
+        ON CONFLICT(balance_date) DO UPDATE SET
+            opening_balance = excluded.opening_balance,
+            total_income = excluded.total_income,
+            total_expenses = excluded.total_expenses,
+            closing_balance = excluded.closing_balance,
+            updated_at = CURRENT_TIMESTAMP
+    '''
+
+    def _recompute(self, cursor: sqlite3.Cursor, start_date: str, end_date: str):
+        """Rewrite daily_balances from start_date on (inside a write transaction).
+        
+        A change on one day moves every later closing balance, so the range
+        always extends to the last stored day.
+        """
+        cursor.execute('SELECT MAX(balance_date) FROM daily_balances')
+        last_day = cursor.fetchone()[0]
+        end_date = max(end_date, start_date, last_day or end_date)
+        cursor.execute(self._RECOMPUTE_QUERY, {'start_date': start_date, 'end_date': end_date})
+
+    def recompute(self, start_date: str, end_date: str = None) -> bool:
+        """Recompute balances from start_date through end_date (default: today)"""
+        end_date = end_date or datetime.now().strftime('%Y-%m-%d')
+
+        def work(conn):
+            cursor = conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            self._recompute(cursor, start_date, end_date)
+            conn.commit()
+            return True
+
+        try:
+            return self.pool.run_write(work)
+        except sqlite3.Error as e:
+            print(f"Error recomputing balances: {e}")
+            return False
+
+    def _dirty_from(self) -> Optional[str]:
+        """Earliest stale day, or None when the ledger is current"""
+        with self.pool.connection() as conn:
+            row = conn.execute('SELECT dirty_from FROM balance_ledger_state WHERE id = 1').fetchone()
+        return row[0] if row else None
+
+    def refresh(self) -> bool:
+        """Bring daily_balances up to date if any write marked days stale"""
+        try:
+            if self._dirty_from() is None:
+                return True
+        except sqlite3.Error as e:
+            print(f"Error refreshing balances: {e}")
+            return False
+
+        today = datetime.now().strftime('%Y-%m-%d')
+
+        def work(conn):
+            cursor = conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            # Re-read under the write lock; another thread may have refreshed
+            cursor.execute('SELECT dirty_from FROM balance_ledger_state WHERE id = 1')
+            dirty_from = cursor.fetchone()[0]
+            if dirty_from is not None:
+                self._recompute(cursor, dirty_from, today)
+                cursor.execute('UPDATE balance_ledger_state SET dirty_from = NULL WHERE id = 1')
+            conn.commit()
+            return True
+
+        try:
+            return self.pool.run_write(work)
+        except sqlite3.Error as e:
+            print(f"Error refreshing balances: {e}")
+            return False
+
+    def rebuild(self) -> bool:
+        """Recompute the full history from the first day with activity"""
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT MIN(day) FROM daily_rollups
+                    WHERE item_type = '' AND source IN ('invoice', 'expense')
+                ''')
+                first_day = cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"Error rebuilding balances: {e}")
+            return False
+
+        if first_day is None:
+            return True
+        return self.recompute(first_day)
+
+    def _fetch_balances(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        """Stored ledger rows for a date range"""
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT balance_date, opening_balance, total_income,
+                       total_expenses, closing_balance
+                FROM daily_balances
+                WHERE balance_date BETWEEN ? AND ?
+                ORDER BY balance_date
+            ''', (start_date, end_date))
+            return [dict(row) for row in cursor.fetchall()]
+
+    def get_balances(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        """Get the ledger row for every day in a date range"""
+        self.refresh()
+        try:
+            rows = self._fetch_balances(start_date, end_date)
+            expected = (datetime.strptime(end_date, '%Y-%m-%d') -
+                        datetime.strptime(start_date, '%Y-%m-%d')).days + 1
+            if len(rows) < expected:
+                # Days before the ledger's first row (or after today) are filled on demand
+                self.recompute(start_date, end_date)
+                rows = self._fetch_balances(start_date, end_date)
+            return rows
+        except sqlite3.Error as e:
+            print(f"Error getting balances: {e}")
+            return []
+
+    def get_opening_balance(self, date: Optional[str] = None) -> float:
+        """Get the balance carried into a specific date"""
+        if date is None:
+            date = datetime.now().strftime('%Y-%m-%d')
+        self.refresh()
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT opening_balance FROM daily_balances
+                    WHERE balance_date = ?
+                ''', (date,))
+                result = cursor.fetchone()
+                if result:
+                    return float(result[0])
+
+                # Outside the stored ledger: sum every earlier day directly
+                cursor.execute('''
+                    SELECT COALESCE(SUM(CASE WHEN source = 'invoice' THEN amount ELSE -amount END), 0)
+                    FROM daily_rollups
+                    WHERE item_type = '' AND source IN ('invoice', 'expense') AND day < ?
+                ''', (date,))
+                return float(cursor.fetchone()[0])
+        except sqlite3.Error as e:
+            print(f"Error getting opening balance: {e}")
+            return 0.0
+
+    def get_closing_balance(self, date: Optional[str] = None) -> float:
+        """Get the balance at the end of a specific date"""
+        if date is None:
+            date = datetime.now().strftime('%Y-%m-%d')
+        rows = self.get_balances(date, date)
+        return float(rows[0]['closing_balance']) if rows else 0.0
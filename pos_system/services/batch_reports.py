@@ -0,0 +1,198 @@
+"""
+Batch Report Builder
+
+Closing a month or year means producing every Daily, Weekly and Monthly
+executive, industrial and financial report for the period. Each period's
+data is fetched once in this process and shared by its three reports; the
+PDFs are then rendered in parallel on a process pool, one report per task,
+so matplotlib and ReportLab use every CPU core.
+
+API:  generate_batch_reports(db_path, '2026-09-01', '2026-09-30')
+CLI:  python -m services.batch_reports 2026-09-01 2026-09-30 [--workers N]
+          [--kinds executive,industrial,financial] [--periods daily,weekly,monthly]
+          [--db pos_database.db] [--out reports] [--vector-charts]
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.report_analytics import get_report_analytics
+from services.report_jobs import no_progress, JobCancelled
+
+REPORT_KINDS = ('executive', 'industrial', 'financial')
+PERIOD_TYPES = ('Daily', 'Weekly', 'Monthly')
+
+
+def batch_periods(start_date: str, end_date: str,
+                  period_types=PERIOD_TYPES) -> List[Tuple[str, str, str]]:
+    """(period type, start, end) for every day, Monday-Sunday week and calendar
+    month in the range, with weeks and months clipped to the range"""
+    first = datetime.strptime(start_date, '%Y-%m-%d')
+    last = datetime.strptime(end_date, '%Y-%m-%d')
+    if last < first:
+        raise ValueError(f"End date {end_date} is before start date {start_date}")
+
+    def clipped(period_type, start, end):
+        return (period_type, max(start, first).strftime('%Y-%m-%d'), min(end, last).strftime('%Y-%m-%d'))
+
+    periods = []
+    if 'Daily' in period_types:
+        day = first
+        while day <= last:
+            periods.append(clipped('Daily', day, day))
+            day += timedelta(days=1)
+    if 'Weekly' in period_types:
+        week = first - timedelta(days=first.weekday())
+        while week <= last:
+            periods.append(clipped('Weekly', week, week + timedelta(days=6)))
+            week += timedelta(days=7)
+    if 'Monthly' in period_types:
+        month = first.replace(day=1)
+        while month <= last:
+            following = (month + timedelta(days=32)).replace(day=1)
+            periods.append(clipped('Monthly', month, following - timedelta(days=1)))
+            month = following
+    return periods
+
+
+def build_report(db_path: str, output_dir: str, kind: str, period_type: str,
+                 start_date: str, end_date: str, dataset: Dict, vector_charts: bool = False) -> Dict:
+    """Render one report from a prefetched dataset (runs in a pool worker)"""
+    started = time.perf_counter()
+    record = {'kind': kind, 'period_type': period_type, 'start_date': start_date,
+              'end_date': end_date, 'filepath': None, 'error': None}
+    try:
+        if kind == 'executive':
+            from services.executive_report_generator import ExecutiveReportGenerator
+            result = ExecutiveReportGenerator(db_path, output_dir, vector_charts).generate_report(
+                start_date, end_date, period_type, dataset=dataset)
+        elif kind == 'industrial':
+            from services.industrial_report_generator import IndustrialReportGenerator
+            result = IndustrialReportGenerator(db_path, output_dir, vector_charts).generate_report(
+                start_date, end_date, period_type, dataset=dataset)
+        elif kind == 'financial':
+            from services.financial_report_generator import FinancialReportGenerator
+            result = FinancialReportGenerator(output_dir, db_path).generate_period_report(
+                start_date, end_date, period_type, dataset=dataset)
+        else:
+            raise ValueError(f"Unknown report kind: {kind}")
+        record['filepath'] = result['filepath']
+    except Exception as e:
+        record['error'] = str(e)
+    record['seconds'] = time.perf_counter() - started
+    return record
+
+
+def generate_batch_reports(db_path: str, start_date: str, end_date: str,
+                           kinds=REPORT_KINDS, period_types=PERIOD_TYPES,
+                           output_dir: str = 'reports', workers: Optional[int] = None,
+                           progress: Optional[Callable] = None, vector_charts: bool = False) -> List[Dict]:
+    """Generate every report of the given kinds and periods in the date range.
+
+    workers defaults to the CPU count; 1 renders in this process. progress
+    follows services.report_jobs, so a batch can also run as a report job
+    and be cancelled between reports. vector_charts draws the executive and
+    industrial charts as ReportLab vector graphics. Returns one record per
+    report with its filepath, or the error that stopped it.
+    """
+    progress = progress or no_progress
+    os.makedirs(output_dir, exist_ok=True)
+    periods = batch_periods(start_date, end_date, period_types)
+    total = len(periods) * len(kinds)
+    records = []
+
+    analytics = get_report_analytics(db_path)
+
+    def tasks():
+        # Datasets are fetched as the pool asks for work, not all up front
+        for period_type, start, end in periods:
+            dataset = analytics.period_dataset(start, end)
+            for kind in kinds:
+                yield (db_path, output_dir, kind, period_type, start, end, dataset, vector_charts)
+
+    def finished(record):
+        records.append(record)
+        progress(len(records) / total, f"{len(records)} of {total} reports")
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for task in tasks():
+            finished(build_report(*task))
+        return records
+
+    pending = set()
+    queued = tasks()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            for task in queued:
+                pending.add(pool.submit(build_report, *task))
+                # Keep a couple of tasks per worker in flight
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finished(future.result())
+            for future in wait(pending).done:
+                finished(future.result())
+        except JobCancelled:
+            for future in pending:
+                future.cancel()
+            raise
+    return records
+
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        description="Generate every daily, weekly and monthly report for a date range in parallel.")
+    parser.add_argument('start_date', help="First day, YYYY-MM-DD")
+    parser.add_argument('end_date', help="Last day, YYYY-MM-DD")
+    parser.add_argument('--kinds', default=','.join(REPORT_KINDS),
+                        help="Comma-separated report kinds (default: all)")
+    parser.add_argument('--periods', default='daily,weekly,monthly',
+                        help="Comma-separated period types (default: all)")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--db', default='pos_database.db', help="Database file")
+    parser.add_argument('--out', default='reports', help="Output folder")
+    parser.add_argument('--vector-charts', action='store_true',
+                        help="Draw charts as ReportLab vector graphics instead of images")
+    args = parser.parse_args(argv)
+
+    kinds = tuple(kind.strip() for kind in args.kinds.split(',') if kind.strip())
+    period_types = tuple(p.strip().capitalize() for p in args.periods.split(',') if p.strip())
+    for kind in kinds:
+        if kind not in REPORT_KINDS:
+            parser.error(f"unknown report kind: {kind}")
+    for period_type in period_types:
+        if period_type not in PERIOD_TYPES:
+            parser.error(f"unknown period type: {period_type.lower()}")
+
+    def show_progress(fraction, message=''):
+        print(f"\r{message} ({fraction:.0%})", end='', flush=True)
+
+    started = time.perf_counter()
+    records = generate_batch_reports(args.db, args.start_date, args.end_date, kinds, period_types,
+                                     args.out, args.workers, show_progress, args.vector_charts)
+    elapsed = time.perf_counter() - started
+    failed = [record for record in records if record['error']]
+
+    print()
+    print(f"Generated {len(records) - len(failed)} reports in {elapsed:.1f}s "
+          f"({len(records) / elapsed * 60:.0f} reports/minute) into {args.out}")
+    for record in failed:
+        print(f"  Failed {record['kind']} {record['period_type']} "
+              f"{record['start_date']} to {record['end_date']}: {record['error']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    # Needed for the process pool when run from a frozen executable
+    import multiprocessing
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -1,18 +1,12 @@
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch, mm
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-from reportlab.lib import colors
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.lib.units import mm
+from reportlab.platypus import Paragraph, Spacer, Table, Image
 from reportlab.graphics.shapes import Drawing, Line as RLLine
 from datetime import datetime
 import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import resource_path
-import os
+from services import pdf_styles as styles
 
 
 class BillGenerator:
@@ -29,120 +23,15 @@ class BillGenerator:
         filepath = os.path.join(self.bills_folder, filename)
         
         # Thermal receipt size: 80mm width (standard thermal printer)
-        page_width = 80 * mm
-        page_height = 200 * mm  # Dynamic, will expand as needed
-        
-        doc = SimpleDocTemplate(
-            filepath, 
-            pagesize=(page_width, page_height),
-            leftMargin=3*mm,
-            rightMargin=3*mm,
-            topMargin=3*mm,
-            bottomMargin=3*mm
-        )
+        doc = styles.thermal_document(filepath, 200*mm)  # Dynamic, will expand as needed
         
         story = []
         
-        # === PURE BLACK & WHITE STYLES (No Gray) ===
-        # Studio name - Bold centered
-        studio_name_style = ParagraphStyle(
-            'StudioName',
-            fontSize=12,
-            textColor=colors.HexColor('#000000'),  # Pure Black
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold',
-            spaceAfter=1*mm,
-            spaceBefore=0,
-            leading=14
-        )
-        
-        # Address and contact - centered
-        subheader_style = ParagraphStyle(
-            'BillSubheader',
-            fontSize=9,
-            textColor=colors.HexColor('#000000'),  # Pure Black
-            alignment=TA_CENTER,
-            spaceAfter=0.5*mm,
-            spaceBefore=0,
-            leading=11
-        )
-        
-        # Left-aligned metadata (Bill No, Date, Cashier, Customer)
-        left_meta_style = ParagraphStyle(
-            'LeftMeta',
-            fontSize=9,
-            textColor=colors.HexColor('#000000'),  # Pure Black
-            fontName='Helvetica',
-            alignment=TA_LEFT,
-            spaceAfter=1*mm,
-            spaceBefore=0,
-            leading=11
-        )
-        
-        # Normal text for table items
-        normal_style = ParagraphStyle(
-            'BillNormal',
-            fontSize=9,
-            textColor=colors.HexColor('#000000'),  # Pure Black
-            alignment=TA_LEFT,
-            spaceAfter=0,
-            spaceBefore=0,
-            leading=11
-        )
-        
-        # Right-aligned totals style
-        right_total_style = ParagraphStyle(
-            'RightTotal',
-            fontSize=9,
-            textColor=colors.HexColor('#000000'),  # Pure Black
-            fontName='Helvetica',
-            alignment=TA_RIGHT,
-            spaceAfter=1*mm,
-            spaceBefore=0,
-            leading=11
-        )
-        
-        # Grand total - BOLD and larger
-        grand_total_style = ParagraphStyle(
-            'GrandTotal',
-            fontSize=12,
-            textColor=colors.HexColor('#000000'),  # Pure Black
-            fontName='Helvetica-Bold',
-            alignment=TA_RIGHT,
-            spaceAfter=0,
-            spaceBefore=0,
-            leading=14
-        )
-        
-        # Elegant tagline footer
-        footer_elegant_style = ParagraphStyle(
-            'FooterElegant',
-            fontSize=9,
-            textColor=colors.HexColor('#000000'),  # Pure Black
-            fontName='Times-Italic',
-            alignment=TA_CENTER,
-            spaceAfter=0,
-            spaceBefore=0,
-            leading=11
-        )
-        
-        # Developer credit - small but still pure black
-        developer_style = ParagraphStyle(
-            'DeveloperCredit',
-            fontSize=6,
-            textColor=colors.HexColor('#000000'),  # Pure Black (not gray)
-            fontName='Helvetica',
-            alignment=TA_CENTER,
-            spaceAfter=0,
-            spaceBefore=0,
-            leading=7
-        )
-        
         # Hair-thin solid BLACK line separator (0.5pt)
         def create_black_separator():
             drawing = Drawing(74*mm, 1*mm)
             line = RLLine(0, 0.5*mm, 74*mm, 0.5*mm)
-            line.strokeColor = colors.HexColor('#000000')  # Pure Black
+            line.strokeColor = styles.BLACK  # Pure Black
             line.strokeWidth = 0.5  # Hair-thin line
             drawing.add(line)
             return drawing
@@ -160,12 +49,12 @@ class BillGenerator:
                 print(f"Logo error: {e}")
         
         # Studio Name - BOLD
-        story.append(Paragraph("<b>STUDIO SHINE ART</b>", studio_name_style))
+        story.append(Paragraph("<b>STUDIO SHINE ART</b>", styles.BILL_STUDIO_NAME))
         story.append(Spacer(1, 1*mm))
         
         # Centered studio identity
-        story.append(Paragraph("No: 52/1/1, Maravila Road, Nattandiya", subheader_style))
-        story.append(Paragraph("Reg No: 26/3610 | Tel: 0767898604 / 0322051680", subheader_style))
+        story.append(Paragraph("No: 52/1/1, Maravila Road, Nattandiya", styles.BILL_SUBHEADER))
+        story.append(Paragraph("Reg No: 26/3610 | Tel: 0767898604 / 0322051680", styles.BILL_SUBHEADER))
         story.append(Spacer(1, 3*mm))
         
         # Solid BLACK separator (no gray)
@@ -191,40 +80,28 @@ class BillGenerator:
         customer_name = customer_data.get('full_name', 'Guest')
         
         # All metadata LEFT-ALIGNED (Clean Sans-Serif)
-        story.append(Paragraph(f"<b>Bill No:</b> {bill_data['bill_number']}", left_meta_style))
-        story.append(Paragraph(f"<b>Date/Time:</b> {bill_date} | {bill_time}", left_meta_style))
-        story.append(Paragraph(f"<b>Cashier:</b> {cashier}", left_meta_style))
-        story.append(Paragraph(f"<b>Customer:</b> {customer_name}", left_meta_style))
+        story.append(Paragraph(f"<b>Bill No:</b> {bill_data['bill_number']}", styles.BILL_META))
+        story.append(Paragraph(f"<b>Date/Time:</b> {bill_date} | {bill_time}", styles.BILL_META))
+        story.append(Paragraph(f"<b>Cashier:</b> {cashier}", styles.BILL_META))
+        story.append(Paragraph(f"<b>Customer:</b> {customer_name}", styles.BILL_META))
         
         mobile = customer_data.get('mobile_number', '')
         if mobile and mobile != 'Guest Customer':
-            story.append(Paragraph(f"<b>Mobile:</b> {mobile}", left_meta_style))
+            story.append(Paragraph(f"<b>Mobile:</b> {mobile}", styles.BILL_META))
         
         story.append(Spacer(1, 3*mm))
         story.append(create_black_separator())
         story.append(Spacer(1, 3*mm))
         
         # === ITEMIZATION TABLE (MINIMALIST GRID - No Gray Backgrounds) ===
-        # Table header style - BOLD
-        table_header_style = ParagraphStyle(
-            'TableHeader',
-            fontSize=9,
-            textColor=colors.HexColor('#000000'),  # Pure Black
-            fontName='Helvetica-Bold',
-            alignment=TA_LEFT,
-            spaceAfter=0,
-            spaceBefore=0,
-            leading=11
-        )
-        
         # Build table data with proper alignment
         table_data = []
         
         # Header row: ITEM (Left), QTY (Center), AMT (Right)
         header_row = [
-            Paragraph("<b>ITEM</b>", table_header_style),
-            Paragraph("<b>QTY</b>", ParagraphStyle('TableHeaderCenter', parent=table_header_style, alignment=TA_CENTER)),
-            Paragraph("<b>AMT</b>", ParagraphStyle('TableHeaderRight', parent=table_header_style, alignment=TA_RIGHT))
+            Paragraph("<b>ITEM</b>", styles.BILL_TABLE_HEADER),
+            Paragraph("<b>QTY</b>", styles.BILL_TABLE_HEADER_CENTER),
+            Paragraph("<b>AMT</b>", styles.BILL_TABLE_HEADER_RIGHT)
         ]
         table_data.append(header_row)
         
@@ -235,32 +112,15 @@ class BillGenerator:
             total = item['total_price']
             
             item_row = [
-                Paragraph(item_name, normal_style),
-                Paragraph(str(qty), ParagraphStyle('CenterAlign', parent=normal_style, alignment=TA_CENTER)),
-                Paragraph(f"Rs. {total:.2f}", ParagraphStyle('RightAlign', parent=normal_style, alignment=TA_RIGHT))
+                Paragraph(item_name, styles.BILL_TEXT),
+                Paragraph(str(qty), styles.BILL_TEXT_CENTER),
+                Paragraph(f"Rs. {total:.2f}", styles.BILL_TEXT_RIGHT)
             ]
             table_data.append(item_row)
         
         # Create table with PURE BLACK & WHITE styling
         item_table = Table(table_data, colWidths=[42*mm, 15*mm, 17*mm])
-        item_table.setStyle(TableStyle([
-            # NO BACKGROUND (Pure White)
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#FFFFFF')),  # Pure White
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#000000')),  # Pure Black
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-            ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('TOPPADDING', (0, 0), (-1, -1), 2*mm),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 2*mm),
-            ('LEFTPADDING', (0, 0), (-1, -1), 1*mm),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 1*mm),
-            # Solid BLACK line below header only
-            ('LINEBELOW', (0, 0), (-1, 0), 0.5, colors.HexColor('#000000')),  # Pure Black
-            # No vertical lines (minimalist)
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        item_table.setStyle(styles.BILL_ITEMS_TABLE)
         
         story.append(item_table)
         story.append(Spacer(1, 4*mm))
@@ -274,18 +134,18 @@ class BillGenerator:
         total = bill_data['total_amount']
         
         # Right-aligned financial block
-        story.append(Paragraph(f"Subtotal: Rs. {subtotal:.2f}", right_total_style))
+        story.append(Paragraph(f"Subtotal: Rs. {subtotal:.2f}", styles.BILL_TOTAL))
         
         if service_charge > 0:
-            story.append(Paragraph(f"Service Charges: Rs. {service_charge:.2f}", right_total_style))
+            story.append(Paragraph(f"Service Charges: Rs. {service_charge:.2f}", styles.BILL_TOTAL))
         
         if discount > 0:
-            story.append(Paragraph(f"Discount: Rs. {discount:.2f}", right_total_style))
+            story.append(Paragraph(f"Discount: Rs. {discount:.2f}", styles.BILL_TOTAL))
         
         story.append(Spacer(1, 2*mm))
         
         # Grand Total - BOLD and larger (focal point)
-        story.append(Paragraph(f"<b>TOTAL: Rs. {total:.2f}</b>", grand_total_style))
+        story.append(Paragraph(f"<b>TOTAL: Rs. {total:.2f}</b>", styles.BILL_GRAND_TOTAL))
         story.append(Spacer(1, 2*mm))
         
         # === PAYMENT BREAKDOWN ===
@@ -295,33 +155,21 @@ class BillGenerator:
         # Determine payment status
         payment_status = "FULL PAYMENT" if balance_due == 0 else "ADVANCE PAYMENT"
         
-        # Payment status label - Bold and clear
-        payment_status_style = ParagraphStyle(
-            'PaymentStatus',
-            fontSize=10,
-            textColor=colors.HexColor('#000000'),  # Pure Black
-            fontName='Helvetica-Bold',
-            alignment=TA_CENTER,
-            spaceAfter=2*mm,
-            spaceBefore=0,
-            leading=12
-        )
-        
-        story.append(Paragraph(f"<b>[ {payment_status} ]</b>", payment_status_style))
+        story.append(Paragraph(f"<b>[ {payment_status} ]</b>", styles.BILL_PAYMENT_STATUS))
         story.append(Spacer(1, 2*mm))
         
         if advance_amount > 0 and balance_due > 0:
             # ADVANCE PAYMENT
-            story.append(Paragraph(f"<b>Advance Paid: Rs. {advance_amount:.2f}</b>", right_total_style))
-            story.append(Paragraph(f"<b>Remaining Balance: Rs. {balance_due:.2f}</b>", grand_total_style))
+            story.append(Paragraph(f"<b>Advance Paid: Rs. {advance_amount:.2f}</b>", styles.BILL_TOTAL))
+            story.append(Paragraph(f"<b>Remaining Balance: Rs. {balance_due:.2f}</b>", styles.BILL_GRAND_TOTAL))
         else:
             # FULL PAYMENT - Cash and Change
             cash_given = bill_data.get('cash_given', 0) or 0
             if cash_given > 0:
-                story.append(Paragraph(f"Cash Received: Rs. {cash_given:.2f}", right_total_style))
+                story.append(Paragraph(f"Cash Received: Rs. {cash_given:.2f}", styles.BILL_TOTAL))
                 change = cash_given - total
                 if change >= 0:
-                    story.append(Paragraph(f"Change: Rs. {change:.2f}", right_total_style))
+                    story.append(Paragraph(f"Change: Rs. {change:.2f}", styles.BILL_TOTAL))
         
         story.append(Spacer(1, 4*mm))
         story.append(create_black_separator())
@@ -329,11 +177,145 @@ class BillGenerator:
         
         # === FOOTER (PROFESSIONAL SIGNATURE) ===
         # Elegant tagline
-        story.append(Paragraph("<i>Capturing your dreams, Creating the art.</i>", footer_elegant_style))
+        story.append(Paragraph("<i>Capturing your dreams, Creating the art.</i>", styles.BILL_TAGLINE))
         story.append(Spacer(1, 4*mm))
         
         # Developer attribution - Pure Black (not gray)
-        story.append(Paragraph("System Developed by: Malinda Prabath | Email: malindaprabath876@gmail.com", developer_style))
+        story.append(Paragraph("System Developed by: Malinda Prabath | Email: malindaprabath876@gmail.com", styles.BILL_CREDIT))
+        story.append(Spacer(1, 2*mm))
+        
+        # Build PDF
+        doc.build(story)
+        
+        return filepath
+    
+    def generate_settlement_receipt(self, settlement_data, items, customer):
+        """Generate a thermal receipt for a settled balance"""
+        filename = f"SETTLEMENT_{settlement_data['bill_number']}.pdf"
+        filepath = os.path.join(self.bills_folder, filename)
+        
+        # Thermal receipt size
+        doc = styles.thermal_document(filepath, 250*mm)
+        
+        story = []
+        
+        # === HEADER WITH LOGO ===
+        logo_path = resource_path(os.path.join('assets', 'logos', 'billLogo.png'))
+        if os.path.exists(logo_path):
+            try:
+                logo = Image(logo_path, width=50*mm, height=15*mm)
+                logo.hAlign = 'CENTER'
+                story.append(logo)
+                story.append(Spacer(1, 2*mm))
+            except:
+                pass
+        
+        # Official Studio Details
+        story.append(Paragraph("<b>Shine Art Studio</b>", styles.RECEIPT_HEADER))
+        story.append(Paragraph("No: 52/1/1, Maravila Road, Nattandiya", styles.RECEIPT_SUBHEADER))
+        story.append(Paragraph("Reg No: 26/3610", styles.RECEIPT_SUBHEADER))
+        story.append(Paragraph("Tel: 0767898604 / 0322051680", styles.RECEIPT_SUBHEADER))
+        story.append(Spacer(1, 3*mm))
+        story.append(styles.receipt_rule())
+        story.append(Spacer(1, 3*mm))
+        
+        # === SETTLEMENT RECEIPT TITLE ===
+        story.append(Paragraph("<b>BALANCE SETTLEMENT RECEIPT</b>", styles.RECEIPT_HEADER))
+        story.append(Spacer(1, 3*mm))
+        
+        # Extract date from original date
+        original_date = settlement_data['original_date']
+        if ' ' in original_date:
+            advance_date_display = original_date.split(' ')[0]
+        else:
+            advance_date_display = original_date
+        
+        # Bill and Customer Details (Left-Aligned)
+        story.append(Paragraph(f"<b>Bill No:</b> {settlement_data['bill_number']}", styles.RECEIPT_META))
+        story.append(Paragraph(f"<b>Original Advance Date:</b> {advance_date_display}", styles.RECEIPT_META))
+        story.append(Spacer(1, 2*mm))
+        
+        story.append(Paragraph(f"<b>Customer:</b> {customer['full_name']}", styles.RECEIPT_META))
+        story.append(Paragraph(f"<b>Mobile:</b> {customer['mobile_number']}", styles.RECEIPT_META))
+        story.append(Spacer(1, 2*mm))
+        
+        story.append(Paragraph(f"<b>Settlement Date:</b> {settlement_data['settlement_date']}", styles.RECEIPT_META))
+        story.append(Spacer(1, 3*mm))
+        story.append(styles.receipt_rule())
+        story.append(Spacer(1, 3*mm))
+        
+        # === PAYMENT HISTORY ===
+        story.append(Paragraph("<b>Payment History</b>", styles.RECEIPT_HEADER))
+        story.append(Spacer(1, 2*mm))
+        
+        # Create financial breakdown table for proper alignment
+        financial_data = [
+            ['Original Total Amount:', f'Rs. {settlement_data["total_amount"]:.2f}'],
+            [f'Advance Paid ({advance_date_display}):', f'Rs. {settlement_data["advance_paid"]:.2f}'],
+            ['Remaining Balance:', f'Rs. {settlement_data["balance_settled"]:.2f}']
+        ]
+        
+        financial_table = Table(financial_data, colWidths=[45*mm, 29*mm])
+        financial_table.setStyle(styles.RECEIPT_AMOUNTS_TABLE)
+        
+        story.append(financial_table)
+        story.append(Spacer(1, 3*mm))
+        story.append(styles.receipt_rule())
+        story.append(Spacer(1, 3*mm))
+        
+        # === ITEMS TABLE ===
+        story.append(Paragraph("<b>Items Purchased</b>", styles.RECEIPT_META))
+        story.append(Spacer(1, 2*mm))
+        
+        # Build items table
+        item_data = [['Item', 'Qty', 'Amount']]
+        for item in items:
+            item_data.append([
+                item['item_name'],
+                str(item['quantity']),
+                f"Rs. {item['total_price']:.2f}"
+            ])
+        
+        col_widths = [42*mm, 12*mm, 20*mm]
+        item_table = Table(item_data, colWidths=col_widths)
+        item_table.setStyle(styles.RECEIPT_ITEMS_TABLE)
+        
+        story.append(item_table)
+        story.append(Spacer(1, 3*mm))
+        story.append(styles.receipt_rule())
+        story.append(Spacer(1, 3*mm))
+        
+        # === FINAL SETTLEMENT SUMMARY ===
+        story.append(Paragraph("<b>Settlement Summary</b>", styles.RECEIPT_HEADER))
+        story.append(Spacer(1, 2*mm))
+        
+        # Cash and change details
+        settlement_summary_data = [
+            ['Cash Received:', f'Rs. {settlement_data["cash_received"]:.2f}'],
+            ['Balance Settled:', f'Rs. {settlement_data["balance_settled"]:.2f}']
+        ]
+        
+        if settlement_data['change_given'] > 0:
+            settlement_summary_data.append(['Change Returned:', f'Rs. {settlement_data["change_given"]:.2f}'])
+        
+        settlement_table = Table(settlement_summary_data, colWidths=[45*mm, 29*mm])
+        settlement_table.setStyle(styles.RECEIPT_AMOUNTS_TABLE)
+        
+        story.append(settlement_table)
+        story.append(Spacer(1, 3*mm))
+        
+        # STATUS: FULLY PAID
+        story.append(Paragraph("<b>STATUS: FULLY PAID</b>", styles.RECEIPT_STATUS))
+        story.append(Spacer(1, 3*mm))
+        story.append(styles.receipt_rule())
+        story.append(Spacer(1, 3*mm))
+        
+        # === PROFESSIONAL FOOTER ===
+        story.append(Paragraph("Capturing your dreams, Creating the art.", styles.RECEIPT_FOOTER))
+        story.append(Spacer(1, 3*mm))
+        
+        # Developer credit
+        story.append(Paragraph("System Developed by: Malinda Prabath | Email: malindaprabath876@gmail.com", styles.RECEIPT_FOOTER))
         story.append(Spacer(1, 2*mm))
         
         # Build PDF
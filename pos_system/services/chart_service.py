@@ -0,0 +1,260 @@
+"""
+Report Chart Service
+
+The executive and industrial reports used to draw each pie and bar chart
+through pyplot (global figure state, tight_layout, a 150 dpi PNG) on every
+run, and imported pyplot when their module loaded. ChartService draws on a
+private Figure with the Agg canvas instead, imports matplotlib only when a
+raster chart is first needed, and keeps the PNG bytes of recent charts
+keyed by a hash of the chart's data and style, so regenerating a report
+whose figures have not changed reuses them.
+
+With vector=True, charts are built as native ReportLab drawings instead:
+no matplotlib at all, and smaller PDFs whose charts stay sharp when zoomed.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from typing import Dict, Optional
+
+from reportlab.lib import colors
+from reportlab.platypus import Image
+
+CHART_TYPES = ('pie', 'bar')
+
+# Top slice and the income bar in purple, the rest in greys
+PALETTE = ['#8C00FF', '#333333', '#666666', '#999999', '#CCCCCC']
+INCOME_COLOR = '#8C00FF'
+EXPENSE_COLOR = '#333333'
+
+# Colors for text, tick labels, axis lines and grid; None keeps matplotlib's default
+DEFAULT_STYLE = {'text': None, 'ticks': None, 'spines': None, 'grid': None}
+MUTED_STYLE = {'text': '#333333', 'ticks': '#666666', 'spines': '#CCCCCC', 'grid': '#CCCCCC'}
+
+FIGSIZE = (6, 3)
+DPI = 150
+
+# Vector charts use the reports' own font
+FONT = 'Helvetica'
+
+
+def chart_key(chart_type: str, data: Dict[str, float], style: Optional[Dict] = None) -> str:
+    """Hash of everything that changes how a chart looks"""
+    if chart_type not in CHART_TYPES:
+        raise ValueError(f"Unknown chart type: {chart_type}")
+    style = style or DEFAULT_STYLE
+    content = repr((chart_type, [(str(label), float(value)) for label, value in data.items()],
+                    sorted(style.items()), FIGSIZE, DPI))
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def _pie_slices(data: Dict[str, float]):
+    """(labels, sizes) of the slices worth drawing, or None when all are zero"""
+    filtered = [(label, size) for label, size in data.items() if size > 0]
+    if not filtered:
+        return None
+    return zip(*filtered)
+
+
+def render_png(chart_type: str, data: Dict[str, float], style: Optional[Dict] = None) -> Optional[bytes]:
+    """Draw a chart with matplotlib's Agg canvas and return PNG bytes (None for an empty pie)"""
+    # Loaded here so importing a report module does not pull in matplotlib
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    style = style or DEFAULT_STYLE
+    text_color = {'color': style['text']} if style['text'] else {}
+
+    fig = Figure(figsize=FIGSIZE, facecolor='white')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    if chart_type == 'pie':
+        slices = _pie_slices(data)
+        if slices is None:
+            return None
+        labels, sizes = slices
+        _, _, autotexts = ax.pie(
+            sizes, labels=labels, autopct='%1.1f%%',
+            startangle=90, colors=PALETTE[:len(labels)],
+            textprops={'fontsize': 8, 'color': 'black'}
+        )
+        for i, autotext in enumerate(autotexts):
+            autotext.set_color('white' if i == 0 else 'black')
+            autotext.set_fontsize(7)
+            autotext.set_weight('bold')
+        ax.axis('equal')
+
+    elif chart_type == 'bar':
+        categories = list(data.keys())
+        values = list(data.values())
+        bar_colors = [INCOME_COLOR if category == 'Income' else EXPENSE_COLOR for category in categories]
+        ax.barh(categories, values, color=bar_colors)
+        for i, value in enumerate(values):
+            ax.text(value + max(values) * 0.02, i, f'LKR {value:,.0f}',
+                    va='center', fontsize=8, **text_color)
+
+        ax.set_xlabel('Amount (LKR)', fontsize=8, **text_color)
+        if style['ticks']:
+            ax.tick_params(axis='both', labelsize=7, colors=style['ticks'])
+        else:
+            ax.tick_params(axis='both', labelsize=7)
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        if style['spines']:
+            ax.spines['left'].set_color(style['spines'])
+            ax.spines['bottom'].set_color(style['spines'])
+        grid_color = {'color': style['grid']} if style['grid'] else {}
+        ax.grid(axis='x', alpha=0.2, linestyle='--', **grid_color)
+
+    else:
+        raise ValueError(f"Unknown chart type: {chart_type}")
+
+    fig.tight_layout()
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=DPI, bbox_inches='tight', facecolor='white', edgecolor='none')
+    return buffer.getvalue()
+
+
+def render_drawing(chart_type: str, data: Dict[str, float], width: float, height: float,
+                   style: Optional[Dict] = None):
+    """Build a chart as a ReportLab vector Drawing (None for an empty pie)"""
+    from reportlab.graphics.shapes import Drawing, String
+    from reportlab.graphics.charts.piecharts import Pie
+    from reportlab.graphics.charts.barcharts import HorizontalBarChart
+
+    style = style or DEFAULT_STYLE
+    text_color = colors.HexColor(style['text'] or '#000000')
+    drawing = Drawing(width, height)
+
+    if chart_type == 'pie':
+        slices = _pie_slices(data)
+        if slices is None:
+            return None
+        labels, sizes = slices
+        total = float(sum(sizes))
+        pie = Pie()
+        diameter = height * 0.75
+        pie.x = (width - diameter) / 2
+        pie.y = (height - diameter) / 2
+        pie.width = pie.height = diameter
+        pie.data = list(sizes)
+        pie.labels = [f"{label} ({size / total:.1%})" for label, size in zip(labels, sizes)]
+        pie.startAngle = 90
+        pie.direction = 'anticlockwise'
+        pie.sideLabels = True
+        pie.slices.strokeColor = colors.white
+        pie.slices.strokeWidth = 0.5
+        pie.slices.fontName = FONT
+        pie.slices.fontSize = 7
+        pie.slices.fontColor = text_color
+        for i in range(len(pie.data)):
+            pie.slices[i].fillColor = colors.HexColor(PALETTE[i % len(PALETTE)])
+        drawing.add(pie)
+
+    elif chart_type == 'bar':
+        categories = list(data.keys())
+        values = [float(value) for value in data.values()]
+        chart = HorizontalBarChart()
+        chart.x = width * 0.14
+        chart.y = height * 0.22
+        chart.width = width * 0.66
+        chart.height = height * 0.70
+        chart.data = [values]
+        chart.categoryAxis.categoryNames = categories
+        chart.categoryAxis.labels.fontName = FONT
+        chart.categoryAxis.labels.fontSize = 7
+        chart.categoryAxis.labels.fillColor = colors.HexColor(style['ticks'] or '#000000')
+        chart.categoryAxis.strokeColor = colors.HexColor(style['spines'] or '#000000')
+        chart.valueAxis.valueMin = 0
+        chart.valueAxis.valueMax = max(values) * 1.25 or 1
+        chart.valueAxis.labels.fontName = FONT
+        chart.valueAxis.labels.fontSize = 7
+        chart.valueAxis.labels.fillColor = colors.HexColor(style['ticks'] or '#000000')
+        chart.valueAxis.strokeColor = colors.HexColor(style['spines'] or '#000000')
+        chart.valueAxis.visibleGrid = True
+        # Faint like the matplotlib grid drawn at alpha 0.2
+        grid = colors.HexColor(style['grid'] or '#B0B0B0')
+        chart.valueAxis.gridStrokeColor = colors.Color(grid.red, grid.green, grid.blue, alpha=0.4)
+        chart.valueAxis.gridStrokeDashArray = (2, 2)
+        chart.valueAxis.labelTextFormat = lambda value: f'{value:,.0f}'
+        chart.barLabelFormat = lambda value: f'LKR {value:,.0f}'
+        chart.barLabels.boxAnchor = 'w'
+        chart.barLabels.dx = 3
+        chart.barLabels.fontName = FONT
+        chart.barLabels.fontSize = 8
+        chart.barLabels.fillColor = text_color
+        chart.bars.strokeColor = None
+        for i, category in enumerate(categories):
+            chart.bars[(0, i)].fillColor = colors.HexColor(
+                INCOME_COLOR if category == 'Income' else EXPENSE_COLOR)
+        drawing.add(chart)
+        drawing.add(String(chart.x + chart.width / 2, 2, 'Amount (LKR)', fontName=FONT,
+                           fontSize=8, fillColor=text_color, textAnchor='middle'))
+
+    else:
+        raise ValueError(f"Unknown chart type: {chart_type}")
+
+    return drawing
+
+
+class ChartService:
+    """Report charts as cached PNG images or ReportLab vector drawings"""
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._pngs: 'OrderedDict[str, Optional[bytes]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def png(self, chart_type: str, data: Dict[str, float], style: Optional[Dict] = None) -> Optional[bytes]:
+        """PNG bytes of a chart, rendered once per distinct data and style"""
+        key = chart_key(chart_type, data, style)
+        with self._lock:
+            if key in self._pngs:
+                self._pngs.move_to_end(key)
+                self.hits += 1
+                return self._pngs[key]
+            self.misses += 1
+
+        png = render_png(chart_type, data, style)
+        with self._lock:
+            self._pngs[key] = png
+            self._pngs.move_to_end(key)
+            while len(self._pngs) > self.max_entries:
+                self._pngs.popitem(last=False)
+        return png
+
+    def flowable(self, chart_type: str, data: Dict[str, float], width: float, height: float,
+                 style: Optional[Dict] = None, vector: bool = False):
+        """A centred chart ready for a story, or None when there is nothing to draw"""
+        if vector:
+            chart = render_drawing(chart_type, data, width, height, style)
+        else:
+            png = self.png(chart_type, data, style)
+            chart = Image(BytesIO(png), width=width, height=height) if png else None
+        if chart is not None:
+            chart.hAlign = 'CENTER'
+        return chart
+
+    def clear(self):
+        """Forget every cached chart"""
+        with self._lock:
+            self._pngs.clear()
+            self.hits = self.misses = 0
+
+
+_service: Optional[ChartService] = None
+_service_lock = threading.Lock()
+
+
+def get_chart_service() -> ChartService:
+    """Get the shared chart service"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ChartService()
+        return _service
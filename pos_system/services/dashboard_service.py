@@ -1,6 +1,49 @@
 import sqlite3
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from database.connection_pool import get_pool
+from database.date_ranges import date_range
+from services.balance_ledger import BalanceLedger
+from services.report_analytics import get_report_analytics
+
+
+@dataclass
+class FrameProfit:
+    """Photo frame sales and profit over some period"""
+    total_frames_sold: int = 0
+    total_buying_cost: float = 0.0
+    total_selling_amount: float = 0.0
+    net_profit: float = 0.0
+
+
+@dataclass
+class DashboardSnapshot:
+    """Every dashboard KPI, computed together in one connection"""
+    today_sales: float = 0.0
+    today_invoices: int = 0
+    total_invoices: int = 0
+    pending_balances: float = 0.0
+    total_customers: int = 0
+    pending_bookings: int = 0
+    low_stock_frames: int = 0
+    weekly_sales: float = 0.0
+    monthly_sales: float = 0.0
+    # Balance summary for the selected period
+    period_start: str = ''
+    period_end: str = ''
+    period_income: float = 0.0
+    period_expenses: float = 0.0
+    opening_balance: float = 0.0
+    # Admin only; None when frame profit was not requested
+    frame_profit: Optional[FrameProfit] = None
+    today_frame_profit: Optional[FrameProfit] = None
+    monthly_frame_profit: Optional[FrameProfit] = None
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Stats dictionary in the shape returned by get_admin_dashboard_stats"""
+        return {key: value for key, value in asdict(self).items() if value is not None}
 
 
 class DashboardService:
@@ -8,21 +51,22 @@ class DashboardService:
     
     def __init__(self, db_path='pos_database.db'):
         self.db_path = db_path
+        self.pool = get_pool(db_path)
+        self.ledger = BalanceLedger(db_path)
     
     def get_today_sales(self) -> float:
         """Get total sales for today"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            today = datetime.now().strftime('%Y-%m-%d')
-            cursor.execute('''
-                SELECT COALESCE(SUM(total_amount), 0) 
-                FROM invoices 
-                WHERE DATE(created_at) = ?
-            ''', (today,))
-            result = cursor.fetchone()[0]
-            conn.close()
-            return float(result)
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                today = datetime.now().strftime('%Y-%m-%d')
+                cursor.execute('''
+                    SELECT COALESCE(SUM(amount), 0) 
+                    FROM daily_rollups 
+                    WHERE source = 'invoice' AND item_type = '' AND day = ?
+                ''', (today,))
+                result = cursor.fetchone()[0]
+                return float(result)
         except sqlite3.Error as e:
             print(f"Error getting today sales: {e}")
             return 0.0
@@ -30,113 +74,106 @@ class DashboardService:
     def get_total_invoices(self) -> int:
         """Get total number of invoices"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM invoices')
-            result = cursor.fetchone()[0]
-            conn.close()
-            return result
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT COUNT(*) FROM invoices')
+                result = cursor.fetchone()[0]
+                return result
         except sqlite3.Error:
             return 0
     
     def get_today_invoices(self) -> int:
         """Get number of invoices created today"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            today = datetime.now().strftime('%Y-%m-%d')
-            cursor.execute('''
-                SELECT COUNT(*) FROM invoices WHERE DATE(created_at) = ?
-            ''', (today,))
-            result = cursor.fetchone()[0]
-            conn.close()
-            return result
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                today = datetime.now().strftime('%Y-%m-%d')
+                cursor.execute('''
+                    SELECT COALESCE(SUM(doc_count), 0) FROM daily_rollups
+                    WHERE source = 'invoice' AND item_type = '' AND day = ?
+                ''', (today,))
+                result = cursor.fetchone()[0]
+                return result
         except sqlite3.Error:
             return 0
     
     def get_pending_balances(self) -> float:
         """Get total pending balance amounts"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT COALESCE(SUM(balance_amount), 0) 
-                FROM invoices 
-                WHERE balance_amount > 0
-            ''')
-            result = cursor.fetchone()[0]
-            conn.close()
-            return float(result)
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT COALESCE(SUM(balance_amount), 0) 
+                    FROM invoices 
+                    WHERE balance_amount > 0
+                ''')
+                result = cursor.fetchone()[0]
+                return float(result)
         except sqlite3.Error:
             return 0.0
     
     def get_total_customers(self) -> int:
         """Get total number of customers"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM customers')
-            result = cursor.fetchone()[0]
-            conn.close()
-            return result
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT COUNT(*) FROM customers')
+                result = cursor.fetchone()[0]
+                return result
         except sqlite3.Error:
             return 0
     
     def get_pending_bookings(self) -> int:
         """Get number of pending bookings"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM bookings WHERE status = 'Pending'")
-            result = cursor.fetchone()[0]
-            conn.close()
-            return result
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM bookings WHERE status = 'Pending'")
+                result = cursor.fetchone()[0]
+                return result
         except sqlite3.Error:
             return 0
     
     def get_low_stock_frames(self) -> int:
         """Get number of frames with low stock (< 10)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM photo_frames WHERE quantity < 10')
-            result = cursor.fetchone()[0]
-            conn.close()
-            return result
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT COUNT(*) FROM photo_frames WHERE quantity < 10')
+                result = cursor.fetchone()[0]
+                return result
         except sqlite3.Error:
             return 0
     
     def get_weekly_sales(self) -> float:
         """Get total sales for the week"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            week_ago = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-            cursor.execute('''
-                SELECT COALESCE(SUM(total_amount), 0) 
-                FROM invoices 
-                WHERE DATE(created_at) >= ?
-            ''', (week_ago,))
-            result = cursor.fetchone()[0]
-            conn.close()
-            return float(result)
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                week_ago = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+                cursor.execute('''
+                    SELECT COALESCE(SUM(amount), 0) 
+                    FROM daily_rollups 
+                    WHERE source = 'invoice' AND item_type = '' AND day >= ?
+                ''', (week_ago,))
+                result = cursor.fetchone()[0]
+                return float(result)
         except sqlite3.Error:
             return 0.0
     
     def get_monthly_sales(self) -> float:
         """Get total sales for the month"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            first_day = datetime.now().replace(day=1).strftime('%Y-%m-%d')
-            cursor.execute('''
-                SELECT COALESCE(SUM(total_amount), 0) 
-                FROM invoices 
-                WHERE DATE(created_at) >= ?
-            ''', (first_day,))
-            result = cursor.fetchone()[0]
-            conn.close()
-            return float(result)
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                first_day = datetime.now().replace(day=1).strftime('%Y-%m-%d')
+                cursor.execute('''
+                    SELECT COALESCE(SUM(amount), 0) 
+                    FROM daily_rollups 
+                    WHERE source = 'invoice' AND item_type = '' AND day >= ?
+                ''', (first_day,))
+                result = cursor.fetchone()[0]
+                return float(result)
         except sqlite3.Error:
             return 0.0
     
@@ -145,33 +182,32 @@ class DashboardService:
     def get_frame_profit_stats(self) -> Dict[str, Any]:
         """Get photo frame profit statistics - Admin only"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get total frames sold from invoice items
-            cursor.execute('''
-                SELECT 
-                    COALESCE(SUM(quantity), 0) as total_sold,
-                    COALESCE(SUM(total_price), 0) as total_selling,
-                    COALESCE(SUM(buying_price), 0) as total_buying
-                FROM invoice_items 
-                WHERE item_type = 'Frame'
-            ''')
-            result = cursor.fetchone()
-            
-            total_sold = result[0] or 0
-            total_selling = float(result[1] or 0)
-            total_buying = float(result[2] or 0)
-            net_profit = total_selling - total_buying
-            
-            conn.close()
-            
-            return {
-                'total_frames_sold': total_sold,
-                'total_buying_cost': total_buying,
-                'total_selling_amount': total_selling,
-                'net_profit': net_profit
-            }
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                # Get total frames sold from the invoice item rollups
+                cursor.execute('''
+                    SELECT 
+                        COALESCE(SUM(quantity), 0) as total_sold,
+                        COALESCE(SUM(amount), 0) as total_selling,
+                        COALESCE(SUM(buying_cost), 0) as total_buying
+                    FROM daily_rollups 
+                    WHERE source = 'invoice' AND item_type = 'Frame'
+                ''')
+                result = cursor.fetchone()
+                
+                total_sold = result[0] or 0
+                total_selling = float(result[1] or 0)
+                total_buying = float(result[2] or 0)
+                net_profit = total_selling - total_buying
+                
+                
+                return {
+                    'total_frames_sold': total_sold,
+                    'total_buying_cost': total_buying,
+                    'total_selling_amount': total_selling,
+                    'net_profit': net_profit
+                }
         except sqlite3.Error as e:
             print(f"Error getting frame profit stats: {e}")
             return {
@@ -184,34 +220,32 @@ class DashboardService:
     def get_today_frame_profit(self) -> Dict[str, Any]:
         """Get today's photo frame profit - Admin only"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            today = datetime.now().strftime('%Y-%m-%d')
-            
-            cursor.execute('''
-                SELECT 
-                    COALESCE(SUM(ii.quantity), 0) as total_sold,
-                    COALESCE(SUM(ii.total_price), 0) as total_selling,
-                    COALESCE(SUM(ii.buying_price), 0) as total_buying
-                FROM invoice_items ii
-                JOIN invoices i ON ii.invoice_id = i.id
-                WHERE ii.item_type = 'Frame' AND DATE(i.created_at) = ?
-            ''', (today,))
-            result = cursor.fetchone()
-            
-            total_sold = result[0] or 0
-            total_selling = float(result[1] or 0)
-            total_buying = float(result[2] or 0)
-            net_profit = total_selling - total_buying
-            
-            conn.close()
-            
-            return {
-                'total_frames_sold': total_sold,
-                'total_buying_cost': total_buying,
-                'total_selling_amount': total_selling,
-                'net_profit': net_profit
-            }
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                today = datetime.now().strftime('%Y-%m-%d')
+                
+                cursor.execute('''
+                    SELECT 
+                        COALESCE(SUM(quantity), 0) as total_sold,
+                        COALESCE(SUM(amount), 0) as total_selling,
+                        COALESCE(SUM(buying_cost), 0) as total_buying
+                    FROM daily_rollups
+                    WHERE source = 'invoice' AND item_type = 'Frame' AND day = ?
+                ''', (today,))
+                result = cursor.fetchone()
+                
+                total_sold = result[0] or 0
+                total_selling = float(result[1] or 0)
+                total_buying = float(result[2] or 0)
+                net_profit = total_selling - total_buying
+                
+                
+                return {
+                    'total_frames_sold': total_sold,
+                    'total_buying_cost': total_buying,
+                    'total_selling_amount': total_selling,
+                    'net_profit': net_profit
+                }
         except sqlite3.Error as e:
             print(f"Error getting today's frame profit: {e}")
             return {
@@ -224,34 +258,34 @@ class DashboardService:
     def get_monthly_frame_profit(self) -> Dict[str, Any]:
         """Get monthly photo frame profit - Admin only"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            first_day = datetime.now().replace(day=1).strftime('%Y-%m-%d')
-            
-            cursor.execute('''
-                SELECT 
-                    COALESCE(SUM(ii.quantity), 0) as total_sold,
-                    COALESCE(SUM(ii.total_price), 0) as total_selling,
-                    COALESCE(SUM(ii.buying_price), 0) as total_buying
-                FROM invoice_items ii
-                JOIN invoices i ON ii.invoice_id = i.id
-                WHERE ii.item_type = 'Frame' AND DATE(i.created_at) >= ?
-            ''', (first_day,))
-            result = cursor.fetchone()
-            
-            total_sold = result[0] or 0
-            total_selling = float(result[1] or 0)
-            total_buying = float(result[2] or 0)
-            net_profit = total_selling - total_buying
-            
-            conn.close()
-            
-            return {
-                'total_frames_sold': total_sold,
-                'total_buying_cost': total_buying,
-                'total_selling_amount': total_selling,
-                'net_profit': net_profit
-            }
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                today = datetime.now()
+                first_day = today.replace(day=1).strftime('%Y-%m-%d')
+                
+                cursor.execute('''
+                    SELECT 
+                        COALESCE(SUM(quantity), 0) as total_sold,
+                        COALESCE(SUM(amount), 0) as total_selling,
+                        COALESCE(SUM(buying_cost), 0) as total_buying
+                    FROM daily_rollups
+                    WHERE source = 'invoice' AND item_type = 'Frame'
+                    AND day BETWEEN ? AND ?
+                ''', (first_day, today.strftime('%Y-%m-%d')))
+                result = cursor.fetchone()
+                
+                total_sold = result[0] or 0
+                total_selling = float(result[1] or 0)
+                total_buying = float(result[2] or 0)
+                net_profit = total_selling - total_buying
+                
+                
+                return {
+                    'total_frames_sold': total_sold,
+                    'total_buying_cost': total_buying,
+                    'total_selling_amount': total_selling,
+                    'net_profit': net_profit
+                }
         except sqlite3.Error as e:
             print(f"Error getting monthly frame profit: {e}")
             return {
@@ -266,24 +300,22 @@ class DashboardService:
     def get_upcoming_bookings(self, limit: int = 5) -> list:
         """Get upcoming bookings for staff dashboard"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            today = datetime.now().strftime('%Y-%m-%d')
-            
-            cursor.execute('''
-                SELECT b.id, b.event_date, b.event_time, b.event_location, 
-                       b.event_type, b.status, c.full_name as customer_name
-                FROM bookings b
-                JOIN customers c ON b.customer_id = c.id
-                WHERE b.event_date >= ? AND b.status IN ('Pending', 'Confirmed')
-                ORDER BY b.event_date ASC, b.event_time ASC
-                LIMIT ?
-            ''', (today, limit))
-            
-            bookings = [dict(row) for row in cursor.fetchall()]
-            conn.close()
-            return bookings
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                today = datetime.now().strftime('%Y-%m-%d')
+                
+                cursor.execute('''
+                    SELECT b.id, b.event_date, b.event_time, b.event_location, 
+                           b.event_type, b.status, c.full_name as customer_name
+                    FROM bookings b
+                    JOIN customers c ON b.customer_id = c.id
+                    WHERE b.event_date >= ? AND b.status IN ('Pending', 'Confirmed')
+                    ORDER BY b.event_date ASC, b.event_time ASC
+                    LIMIT ?
+                ''', (today, limit))
+                
+                bookings = [dict(row) for row in cursor.fetchall()]
+                return bookings
         except sqlite3.Error as e:
             print(f"Error getting upcoming bookings: {e}")
             return []
@@ -291,20 +323,18 @@ class DashboardService:
     def get_recent_customers(self, limit: int = 5) -> list:
         """Get recently added customers for staff dashboard"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT id, full_name, mobile_number, created_at
-                FROM customers
-                ORDER BY created_at DESC
-                LIMIT ?
-            ''', (limit,))
-            
-            customers = [dict(row) for row in cursor.fetchall()]
-            conn.close()
-            return customers
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT id, full_name, mobile_number, created_at
+                    FROM customers
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                ''', (limit,))
+                
+                customers = [dict(row) for row in cursor.fetchall()]
+                return customers
         except sqlite3.Error as e:
             print(f"Error getting recent customers: {e}")
             return []
@@ -312,21 +342,19 @@ class DashboardService:
     def get_frame_stock_summary(self, limit: int = 5) -> list:
         """Get frame stock summary for staff dashboard (no prices)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # Get frames sorted by stock level (lowest first for alerts)
-            cursor.execute('''
-                SELECT id, frame_name, size, quantity
-                FROM photo_frames
-                ORDER BY quantity ASC
-                LIMIT ?
-            ''', (limit,))
-            
-            frames = [dict(row) for row in cursor.fetchall()]
-            conn.close()
-            return frames
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                # Get frames sorted by stock level (lowest first for alerts)
+                cursor.execute('''
+                    SELECT id, frame_name, size, quantity
+                    FROM photo_frames
+                    ORDER BY quantity ASC
+                    LIMIT ?
+                ''', (limit,))
+                
+                frames = [dict(row) for row in cursor.fetchall()]
+                return frames
         except sqlite3.Error as e:
             print(f"Error getting frame stock: {e}")
             return []
@@ -346,49 +374,151 @@ class DashboardService:
     
     def get_dashboard_stats(self) -> Dict[str, Any]:
         """Get all dashboard statistics"""
-        return {
-            'today_sales': self.get_today_sales(),
-            'today_invoices': self.get_today_invoices(),
-            'total_invoices': self.get_total_invoices(),
-            'pending_balances': self.get_pending_balances(),
-            'total_customers': self.get_total_customers(),
-            'pending_bookings': self.get_pending_bookings(),
-            'low_stock_frames': self.get_low_stock_frames(),
-            'weekly_sales': self.get_weekly_sales(),
-            'monthly_sales': self.get_monthly_sales(),
-        }
+        return self.get_dashboard_snapshot().as_dict()
     
     def get_admin_dashboard_stats(self) -> Dict[str, Any]:
         """Get dashboard statistics including admin-only frame profit data"""
-        stats = self.get_dashboard_stats()
-        stats['frame_profit'] = self.get_frame_profit_stats()
-        stats['today_frame_profit'] = self.get_today_frame_profit()
-        stats['monthly_frame_profit'] = self.get_monthly_frame_profit()
-        return stats
+        return self.get_dashboard_snapshot(include_frame_profit=True).as_dict()
+    
+    # ==================== Dashboard Snapshot ====================
+    
+    def get_dashboard_snapshot(self, period_start: str = None, period_end: str = None,
+                               include_frame_profit: bool = False) -> DashboardSnapshot:
+        """Compute all dashboard KPIs with two conditional-aggregate queries.
+        
+        period_start/period_end (inclusive, default today) select the range
+        used for the income/expense balance summary.
+        """
+        now = datetime.now()
+        today = now.strftime('%Y-%m-%d')
+        period_start = period_start or today
+        period_end = period_end or period_start
+        snapshot = DashboardSnapshot(period_start=period_start, period_end=period_end)
+        
+        params = {
+            'today': today,
+            'week_ago': (now - timedelta(days=7)).strftime('%Y-%m-%d'),
+            'first_day': now.replace(day=1).strftime('%Y-%m-%d'),
+            'period_start': period_start,
+            'period_end': period_end,
+        }
+        
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                # Read every figure from the same database snapshot
+                own_transaction = not conn.in_transaction
+                if own_transaction:
+                    cursor.execute('BEGIN')
+                
+                # Sales, expenses and frame profit in one pass over the daily
+                # rollups, which grow with the number of days rather than rows
+                cursor.execute('''
+                    SELECT 
+                        COALESCE(SUM(CASE WHEN item_type = '' THEN doc_count END), 0),
+                        COALESCE(SUM(CASE WHEN item_type = '' AND day = :today THEN amount END), 0),
+                        COALESCE(SUM(CASE WHEN item_type = '' AND day = :today THEN doc_count END), 0),
+                        COALESCE(SUM(CASE WHEN item_type = '' AND day >= :week_ago THEN amount END), 0),
+                        COALESCE(SUM(CASE WHEN item_type = '' AND day >= :first_day THEN amount END), 0),
+                        COALESCE(SUM(CASE WHEN item_type = ''
+                                          AND day BETWEEN :period_start AND :period_end
+                                          THEN amount END), 0),
+                        COALESCE(SUM(CASE WHEN item_type = 'Frame' THEN quantity END), 0),
+                        COALESCE(SUM(CASE WHEN item_type = 'Frame' THEN amount END), 0),
+                        COALESCE(SUM(CASE WHEN item_type = 'Frame' THEN buying_cost END), 0),
+                        COALESCE(SUM(CASE WHEN item_type = 'Frame' AND day = :today THEN quantity END), 0),
+                        COALESCE(SUM(CASE WHEN item_type = 'Frame' AND day = :today THEN amount END), 0),
+                        COALESCE(SUM(CASE WHEN item_type = 'Frame' AND day = :today THEN buying_cost END), 0),
+                        COALESCE(SUM(CASE WHEN item_type = 'Frame' AND day BETWEEN :first_day AND :today
+                                          THEN quantity END), 0),
+                        COALESCE(SUM(CASE WHEN item_type = 'Frame' AND day BETWEEN :first_day AND :today
+                                          THEN amount END), 0),
+                        COALESCE(SUM(CASE WHEN item_type = 'Frame' AND day BETWEEN :first_day AND :today
+                                          THEN buying_cost END), 0),
+                        (SELECT COALESCE(SUM(amount), 0) FROM daily_rollups
+                         WHERE source = 'expense' AND day BETWEEN :period_start AND :period_end)
+                    FROM daily_rollups
+                    WHERE source = 'invoice'
+                ''', params)
+                row = cursor.fetchone()
+                snapshot.total_invoices = row[0]
+                snapshot.today_sales = float(row[1])
+                snapshot.today_invoices = row[2]
+                snapshot.weekly_sales = float(row[3])
+                snapshot.monthly_sales = float(row[4])
+                snapshot.period_income = float(row[5])
+                snapshot.period_expenses = float(row[15])
+                if include_frame_profit:
+                    snapshot.frame_profit = self._frame_profit(*row[6:9])
+                    snapshot.today_frame_profit = self._frame_profit(*row[9:12])
+                    snapshot.monthly_frame_profit = self._frame_profit(*row[12:15])
+                
+                # Current state that is not a per-day total
+                cursor.execute('''
+                    SELECT 
+                        (SELECT COALESCE(SUM(balance_amount), 0) FROM invoices
+                         WHERE balance_amount > 0),
+                        (SELECT COUNT(*) FROM customers),
+                        (SELECT COUNT(*) FROM bookings WHERE status = 'Pending'),
+                        (SELECT COUNT(*) FROM photo_frames WHERE quantity < 10),
+                        (SELECT COALESCE(SUM(CASE WHEN source = 'invoice' THEN amount ELSE -amount END), 0)
+                         FROM daily_rollups
+                         WHERE item_type = '' AND source IN ('invoice', 'expense') AND day < :today)
+                ''', params)
+                row = cursor.fetchone()
+                snapshot.pending_balances = float(row[0])
+                snapshot.total_customers = row[1]
+                snapshot.pending_bookings = row[2]
+                snapshot.low_stock_frames = row[3]
+                snapshot.opening_balance = float(row[4])
+                
+                if own_transaction:
+                    conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error getting dashboard snapshot: {e}")
+            if include_frame_profit:
+                snapshot.frame_profit = FrameProfit()
+                snapshot.today_frame_profit = FrameProfit()
+                snapshot.monthly_frame_profit = FrameProfit()
+        
+        return snapshot
+    
+    @staticmethod
+    def _frame_profit(sold, selling, buying) -> FrameProfit:
+        """Build a FrameProfit from summed quantity, selling and buying amounts"""
+        selling = float(selling or 0)
+        buying = float(buying or 0)
+        return FrameProfit(
+            total_frames_sold=sold or 0,
+            total_buying_cost=buying,
+            total_selling_amount=selling,
+            net_profit=selling - buying
+        )
+    
+    def get_period_analytics(self, period_start: str, period_end: str) -> Dict[str, Any]:
+        """Report analytics for a period, shared with the PDF reports for the same period"""
+        return get_report_analytics(self.db_path).period_dataset(period_start, period_end)['analytics']
     
     # ==================== Expense Management ====================
     
     def add_manual_expense(self, description: str, amount: float, created_by: int, expense_date: str = None) -> bool:
         """Add a manual expense entry"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            if expense_date is None:
-                expense_date = datetime.now().strftime('%Y-%m-%d')
-            
-            cursor.execute('''
+        if expense_date is None:
+            expense_date = datetime.now().strftime('%Y-%m-%d')
+        
+        # The insert fires the rollup and balance ledger triggers, so it goes
+        # through the writer queue like every other write
+        def work(conn):
+            conn.execute('''
                 INSERT INTO manual_expenses (description, amount, expense_date, created_by)
                 VALUES (?, ?, ?, ?)
             ''', (description, amount, expense_date, created_by))
-            
             conn.commit()
-            conn.close()
-            
-            # Update daily balance after adding expense
-            self.update_daily_balance(expense_date)
-            
             return True
+        
+        try:
+            return self.pool.run_write(work)
         except sqlite3.Error as e:
             print(f"Error adding manual expense: {e}")
             return False
@@ -396,18 +526,17 @@ class DashboardService:
     def get_expenses_by_date(self, date: str) -> float:
         """Get total expenses for a specific date"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT COALESCE(SUM(amount), 0) 
-                FROM manual_expenses 
-                WHERE expense_date = ?
-            ''', (date,))
-            
-            result = cursor.fetchone()[0]
-            conn.close()
-            return float(result)
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT COALESCE(SUM(amount), 0) 
+                    FROM daily_rollups 
+                    WHERE source = 'expense' AND item_type = '' AND day = ?
+                ''', (date,))
+                
+                result = cursor.fetchone()[0]
+                return float(result)
         except sqlite3.Error as e:
             print(f"Error getting expenses by date: {e}")
             return 0.0
@@ -415,18 +544,17 @@ class DashboardService:
     def get_expenses_by_range(self, start_date: str, end_date: str) -> float:
         """Get total expenses for a date range"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT COALESCE(SUM(amount), 0) 
-                FROM manual_expenses 
-                WHERE expense_date BETWEEN ? AND ?
-            ''', (start_date, end_date))
-            
-            result = cursor.fetchone()[0]
-            conn.close()
-            return float(result)
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT COALESCE(SUM(amount), 0) 
+                    FROM daily_rollups 
+                    WHERE source = 'expense' AND item_type = '' AND day BETWEEN ? AND ?
+                ''', (start_date, end_date))
+                
+                result = cursor.fetchone()[0]
+                return float(result)
         except sqlite3.Error as e:
             print(f"Error getting expenses by range: {e}")
             return 0.0
@@ -434,106 +562,31 @@ class DashboardService:
     def get_expense_details_by_range(self, start_date: str, end_date: str) -> list:
         """Get detailed expense records for a date range"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT me.id, me.description, me.amount, me.expense_date, 
-                       u.full_name as created_by_name, me.created_at
-                FROM manual_expenses me
-                JOIN users u ON me.created_by = u.id
-                WHERE me.expense_date BETWEEN ? AND ?
-                ORDER BY me.expense_date DESC, me.created_at DESC
-            ''', (start_date, end_date))
-            
-            expenses = [dict(row) for row in cursor.fetchall()]
-            conn.close()
-            return expenses
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT me.id, me.description, me.amount, me.expense_date, 
+                           u.full_name as created_by_name, me.created_at
+                    FROM manual_expenses me
+                    JOIN users u ON me.created_by = u.id
+                    WHERE me.expense_date BETWEEN ? AND ?
+                    ORDER BY me.expense_date DESC, me.created_at DESC
+                ''', (start_date, end_date))
+                
+                expenses = [dict(row) for row in cursor.fetchall()]
+                return expenses
         except sqlite3.Error as e:
             print(f"Error getting expense details: {e}")
             return []
     
     def update_daily_balance(self, date: str) -> bool:
-        """Update or create daily balance record"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Calculate total income for the day
-            cursor.execute('''
-                SELECT COALESCE(SUM(total_amount), 0) 
-                FROM invoices 
-                WHERE DATE(created_at) = ?
-            ''', (date,))
-            total_income = float(cursor.fetchone()[0])
-            
-            # Calculate total expenses for the day
-            total_expenses = self.get_expenses_by_date(date)
-            
-            # Get previous day's closing balance for opening balance
-            prev_date = (datetime.strptime(date, '%Y-%m-%d') - timedelta(days=1)).strftime('%Y-%m-%d')
-            cursor.execute('''
-                SELECT closing_balance FROM daily_balances 
-                WHERE balance_date = ?
-            ''', (prev_date,))
-            prev_balance = cursor.fetchone()
-            opening_balance = float(prev_balance[0]) if prev_balance else 0.0
-            
-            # Calculate closing balance
-            closing_balance = opening_balance + total_income - total_expenses
-            
-            # Insert or update daily balance
-            cursor.execute('''
-                INSERT INTO daily_balances 
-                (balance_date, opening_balance, total_income, total_expenses, closing_balance, updated_at)
-                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(balance_date) DO UPDATE SET
-                    total_income = excluded.total_income,
-                    total_expenses = excluded.total_expenses,
-                    closing_balance = excluded.closing_balance,
-                    updated_at = CURRENT_TIMESTAMP
-            ''', (date, opening_balance, total_income, total_expenses, closing_balance))
-            
-            conn.commit()
-            conn.close()
-            return True
-        except sqlite3.Error as e:
-            print(f"Error updating daily balance: {e}")
-            return False
+        """Recompute the balance chain from a date onwards"""
+        return self.ledger.recompute(date)
     
     def get_opening_balance(self, date: str = None) -> float:
         """Get opening balance for a specific date"""
-        try:
-            if date is None:
-                date = datetime.now().strftime('%Y-%m-%d')
-            
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT opening_balance FROM daily_balances 
-                WHERE balance_date = ?
-            ''', (date,))
-            
-            result = cursor.fetchone()
-            conn.close()
-            
-            if result:
-                return float(result[0])
-            else:
-                # If no record exists, calculate from previous day
-                prev_date = (datetime.strptime(date, '%Y-%m-%d') - timedelta(days=1)).strftime('%Y-%m-%d')
-                cursor = sqlite3.connect(self.db_path).cursor()
-                cursor.execute('''
-                    SELECT closing_balance FROM daily_balances 
-                    WHERE balance_date = ?
-                ''', (prev_date,))
-                prev = cursor.fetchone()
-                return float(prev[0]) if prev else 0.0
-        except sqlite3.Error as e:
-            print(f"Error getting opening balance: {e}")
-            return 0.0
+        return self.ledger.get_opening_balance(date)
     
     def get_weekly_expenses(self) -> float:
         """Get total expenses for the week"""
@@ -560,26 +613,25 @@ class DashboardService:
     def get_income_by_month(self, year: int, month: int) -> float:
         """Get total income for a specific month and year"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get first day of month
-            first_day = datetime(year, month, 1).strftime('%Y-%m-%d')
-            
-            # Get last day of month
-            from calendar import monthrange
-            _, last_day = monthrange(year, month)
-            last_day_str = datetime(year, month, last_day).strftime('%Y-%m-%d')
-            
-            cursor.execute('''
-                SELECT COALESCE(SUM(total_amount), 0) 
-                FROM invoices 
-                WHERE DATE(created_at) BETWEEN ? AND ?
-            ''', (first_day, last_day_str))
-            
-            result = cursor.fetchone()[0]
-            conn.close()
-            return float(result)
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                # Get first day of month
+                first_day = datetime(year, month, 1).strftime('%Y-%m-%d')
+                
+                # Get last day of month
+                from calendar import monthrange
+                _, last_day = monthrange(year, month)
+                last_day_str = datetime(year, month, last_day).strftime('%Y-%m-%d')
+                
+                cursor.execute('''
+                    SELECT COALESCE(SUM(amount), 0) 
+                    FROM daily_rollups 
+                    WHERE source = 'invoice' AND item_type = '' AND day BETWEEN ? AND ?
+                ''', (first_day, last_day_str))
+                
+                result = cursor.fetchone()[0]
+                return float(result)
         except sqlite3.Error as e:
             print(f"Error getting income by month: {e}")
             return 0.0
@@ -602,18 +654,17 @@ class DashboardService:
     def get_income_by_range(self, start_date: str, end_date: str) -> float:
         """Get total income for a date range"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT COALESCE(SUM(total_amount), 0) 
-                FROM invoices 
-                WHERE DATE(created_at) BETWEEN ? AND ?
-            ''', (start_date, end_date))
-            
-            result = cursor.fetchone()[0]
-            conn.close()
-            return float(result)
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT COALESCE(SUM(amount), 0) 
+                    FROM daily_rollups 
+                    WHERE source = 'invoice' AND item_type = '' AND day BETWEEN ? AND ?
+                ''', (start_date, end_date))
+                
+                result = cursor.fetchone()[0]
+                return float(result)
         except sqlite3.Error as e:
             print(f"Error getting income by range: {e}")
             return 0.0
@@ -621,22 +672,20 @@ class DashboardService:
     def get_income_details_by_range(self, start_date: str, end_date: str) -> list:
         """Get detailed invoice records for a date range"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT i.id, i.invoice_number, i.total_amount, i.balance_amount,
-                       i.created_at, c.full_name as customer_name
-                FROM invoices i
-                LEFT JOIN customers c ON i.customer_id = c.id
-                WHERE DATE(i.created_at) BETWEEN ? AND ?
-                ORDER BY i.created_at DESC
-            ''', (start_date, end_date))
-            
-            invoices = [dict(row) for row in cursor.fetchall()]
-            conn.close()
-            return invoices
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT i.id, i.invoice_number, i.total_amount, i.balance_amount,
+                           i.created_at, c.full_name as customer_name
+                    FROM invoices i
+                    LEFT JOIN customers c ON i.customer_id = c.id
+                    WHERE i.created_at >= ? AND i.created_at < ?
+                    ORDER BY i.created_at DESC
+                ''', date_range(start_date, end_date))
+                
+                invoices = [dict(row) for row in cursor.fetchall()]
+                return invoices
         except sqlite3.Error as e:
             print(f"Error getting income details: {e}")
             return []
@@ -4,14 +4,15 @@ Professional Cover Page, Auto TOC, Dynamic Insights, and Developer Credits
 """
 
 import os
-import sqlite3
 from datetime import datetime, timedelta
-from io import BytesIO
 from typing import Dict, List, Tuple, Any
 import re
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import resource_path
+from services.report_analytics import get_report_analytics
+from services.report_jobs import no_progress, page_progress
+from services.chart_service import get_chart_service
 
 # ReportLab imports
 from reportlab.lib.pagesizes import A4
@@ -25,11 +26,6 @@ from reportlab.platypus import (
 from reportlab.lib import colors
 from reportlab.pdfgen import canvas as pdf_canvas
 
-# Matplotlib imports
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-
 
 class NumberedCanvas(pdf_canvas.Canvas):
     """Custom canvas for page numbering and footers"""
@@ -70,6 +66,7 @@ class ExecutiveReportGenerator:
     """Generate executive multi-page financial reports"""
     
     # Color palette
+    COLOR_WHITE = colors.HexColor('#FFFFFF')
     COLOR_BLACK = colors.HexColor('#000000')
     COLOR_DARKGRAY = colors.HexColor('#333333')
     COLOR_MEDIUMGRAY = colors.HexColor('#666666')
@@ -91,9 +88,12 @@ class ExecutiveReportGenerator:
     COMPANY_ADDRESS = "No: 52/1/1, Maravila Road, Nattandiya"
     COMPANY_CONTACT = "0767898604 / 0322051680"
     
-    def __init__(self, db_path='pos_database.db'):
+    def __init__(self, db_path='pos_database.db', reports_dir='reports', vector_charts=False):
         self.db_path = db_path
-        self.reports_dir = 'reports'
+        self.reports_dir = reports_dir
+        # Native ReportLab drawings instead of matplotlib PNGs
+        self.vector_charts = vector_charts
+        self.charts = get_chart_service()
         os.makedirs(self.reports_dir, exist_ok=True)
     
     def _clean_html(self, text: str) -> str:
@@ -107,56 +107,9 @@ class ExecutiveReportGenerator:
         """Format currency"""
         return f"LKR {amount:,.2f}"
     
-    def _create_chart(self, chart_type: str, data: Dict) -> BytesIO:
-        """Generate chart with purple accent"""
-        fig, ax = plt.subplots(figsize=(6, 3), facecolor='white')
-        
-        if chart_type == 'pie':
-            labels = list(data.keys())
-            sizes = list(data.values())
-            filtered = [(l, s) for l, s in zip(labels, sizes) if s > 0]
-            if not filtered:
-                plt.close()
-                return None
-            
-            labels, sizes = zip(*filtered)
-            colors_list = ['#8C00FF', '#333333', '#666666', '#999999', '#CCCCCC']
-            
-            wedges, texts, autotexts = ax.pie(
-                sizes, labels=labels, autopct='%1.1f%%',
-                startangle=90, colors=colors_list[:len(labels)],
-                textprops={'fontsize': 8}
-            )
-            
-            for i, autotext in enumerate(autotexts):
-                autotext.set_color('white' if i == 0 else 'black')
-                autotext.set_fontsize(7)
-                autotext.set_weight('bold')
-            
-            ax.axis('equal')
-            
-        elif chart_type == 'bar':
-            categories = list(data.keys())
-            values = list(data.values())
-            colors_bar = ['#8C00FF' if c == 'Income' else '#333333' for c in categories]
-            bars = ax.barh(categories, values, color=colors_bar)
-            
-            for i, (bar, value) in enumerate(zip(bars, values)):
-                ax.text(value + max(values) * 0.02, i, f'LKR {value:,.0f}',
-                       va='center', fontsize=8)
-            
-            ax.set_xlabel('Amount (LKR)', fontsize=8)
-            ax.tick_params(axis='both', labelsize=7)
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.grid(axis='x', alpha=0.2, linestyle='--')
-        
-        plt.tight_layout()
-        img_buffer = BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close()
-        return img_buffer
+    def _create_chart(self, chart_type: str, data: Dict, width: float, height: float):
+        """Chart flowable with purple accent, or None when there is nothing to draw"""
+        return self.charts.flowable(chart_type, data, width, height, vector=self.vector_charts)
     
     def get_report_summary(self, analytics: Dict, summary: Dict) -> Dict[str, str]:
         """Generate dynamic insights"""
@@ -216,87 +169,13 @@ class ExecutiveReportGenerator:
         
         return insights
     
-    def _fetch_analytics(self, start_date: str, end_date: str) -> Dict:
-        """Fetch analytics data"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        analytics = {
-            'user_insights': {},
-            'top_customers': [],
-            'service_revenue': {},
-            'booking_status': {},
-            'payment_metrics': {},
-            'income_details': [],
-            'expense_details': []
-        }
+    def generate_report(self, start_date: str, end_date: str, report_type: str = 'Daily',
+                        progress=None, dataset: Dict = None):
+        """Generate executive report; progress(fraction, message) is called between steps.
         
-        # User insights
-        cursor.execute('SELECT COUNT(*) FROM customers WHERE DATE(created_at) BETWEEN ? AND ?', 
-                      (start_date, end_date))
-        new_customers = cursor.fetchone()[0]
-        cursor.execute('SELECT COUNT(*) FROM customers')
-        total_customers = cursor.fetchone()[0]
-        analytics['user_insights'] = {
-            'new_customers': new_customers,
-            'total_customers': total_customers
-        }
-        
-        # Top customers
-        cursor.execute('''
-            SELECT customer_name, mobile_number, SUM(full_amount), COUNT(*)
-            FROM bookings WHERE DATE(booking_date) BETWEEN ? AND ?
-            GROUP BY customer_name, mobile_number ORDER BY 3 DESC LIMIT 5
-        ''', (start_date, end_date))
-        analytics['top_customers'] = cursor.fetchall()
-        
-        # Service revenue
-        cursor.execute('''
-            SELECT photoshoot_category, SUM(full_amount), COUNT(*)
-            FROM bookings WHERE DATE(booking_date) BETWEEN ? AND ? AND status = 'Completed'
-            GROUP BY photoshoot_category ORDER BY 2 DESC
-        ''', (start_date, end_date))
-        for row in cursor.fetchall():
-            analytics['service_revenue'][row[0]] = {'revenue': row[1], 'count': row[2]}
-        
-        # Booking status
-        cursor.execute('''
-            SELECT status, COUNT(*), SUM(full_amount)
-            FROM bookings WHERE DATE(booking_date) BETWEEN ? AND ?
-            GROUP BY status
-        ''', (start_date, end_date))
-        for row in cursor.fetchall():
-            analytics['booking_status'][row[0]] = {'count': row[1], 'value': row[2]}
-        
-        # Payment metrics
-        cursor.execute('''
-            SELECT SUM(advance_payment), SUM(balance_amount)
-            FROM bookings WHERE DATE(booking_date) BETWEEN ? AND ?
-        ''', (start_date, end_date))
-        pm = cursor.fetchone()
-        analytics['payment_metrics'] = {'advance_received': pm[0] or 0, 'balance_due': pm[1] or 0}
-        
-        # Income details
-        cursor.execute('''
-            SELECT booking_date, customer_name, photoshoot_category, full_amount, status
-            FROM bookings WHERE DATE(booking_date) BETWEEN ? AND ? AND status = 'Completed'
-            ORDER BY booking_date DESC
-        ''', (start_date, end_date))
-        analytics['income_details'] = cursor.fetchall()
-        
-        # Expenses
-        cursor.execute('''
-            SELECT expense_date, 'Manual Expense', description, amount, u.full_name
-            FROM manual_expenses me LEFT JOIN users u ON me.created_by = u.id
-            WHERE DATE(expense_date) BETWEEN ? AND ? ORDER BY expense_date DESC
-        ''', (start_date, end_date))
-        analytics['expense_details'] = cursor.fetchall()
-        
-        conn.close()
-        return analytics
-    
-    def generate_report(self, start_date: str, end_date: str, report_type: str = 'Daily'):
-        """Generate executive report"""
+        dataset is a period dataset from services.report_analytics, fetched when omitted.
+        """
+        progress = progress or no_progress
         filename = f"Executive_Report_{report_type}_{start_date}_to_{end_date}.pdf"
         filepath = os.path.join(self.reports_dir, filename)
         
@@ -310,20 +189,18 @@ class ExecutiveReportGenerator:
         page_width = A4[0] - 30*mm
         
         # Fetch data
-        analytics = self._fetch_analytics(start_date, end_date)
+        progress(0.05, "Fetching report data...")
+        if dataset is None:
+            dataset = get_report_analytics(self.db_path).period_dataset(start_date, end_date)
+        analytics = dataset['analytics']
+        opening_balance = dataset['opening_balance']
         
         # Calculate financials
         total_income = sum(row[3] for row in analytics['income_details'])
         total_expenses = sum(row[3] for row in analytics['expense_details'])
         net_balance = total_income - total_expenses
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT opening_balance FROM daily_balances WHERE balance_date = ?', (start_date,))
-        result = cursor.fetchone()
-        opening_balance = result[0] if result else 0.0
         closing_balance = opening_balance + net_balance
-        conn.close()
         
         summary = {
             'opening_balance': opening_balance,
@@ -336,6 +213,8 @@ class ExecutiveReportGenerator:
         # Get insights
         insights = self.get_report_summary(analytics, summary)
         
+        progress(0.3, "Laying out report...")
+        
         # ==================== COVER PAGE ====================
         story.append(Spacer(1, 40*mm))
         
@@ -514,6 +393,7 @@ class ExecutiveReportGenerator:
             story.append(Spacer(1, 4*mm))
         
         # ==================== SERVICE REVENUE ====================
+        progress(0.5, "Drawing service revenue chart...")
         if analytics['service_revenue']:
             story.append(Paragraph("5. SERVICE REVENUE BREAKDOWN", section_style))
             story.append(HRFlowable(width="100%", thickness=0.5, color=self.COLOR_PURPLE, spaceAfter=3*mm))
@@ -542,11 +422,9 @@ class ExecutiveReportGenerator:
             # Chart
             if len(analytics['service_revenue']) > 0:
                 chart_data = {cat: data['revenue'] for cat, data in analytics['service_revenue'].items()}
-                chart_buffer = self._create_chart('pie', chart_data)
-                if chart_buffer:
-                    chart_img = Image(chart_buffer, width=140*mm, height=70*mm)
-                    chart_img.hAlign = 'CENTER'
-                    story.append(chart_img)
+                chart = self._create_chart('pie', chart_data, 140*mm, 70*mm)
+                if chart is not None:
+                    story.append(chart)
                     story.append(Spacer(1, 4*mm))
         
         # ==================== BOOKING PERFORMANCE ====================
@@ -602,16 +480,15 @@ class ExecutiveReportGenerator:
         story.append(Spacer(1, 4*mm))
         
         # ==================== INCOME VS EXPENSES ====================
+        progress(0.65, "Drawing income vs expenses chart...")
         if total_income > 0 or total_expenses > 0:
             story.append(Paragraph("8. INCOME vs EXPENSES ANALYSIS", section_style))
             story.append(HRFlowable(width="100%", thickness=0.5, color=self.COLOR_PURPLE, spaceAfter=3*mm))
             
             chart_data = {'Income': total_income, 'Expenses': total_expenses}
-            chart_buffer = self._create_chart('bar', chart_data)
-            if chart_buffer:
-                chart_img = Image(chart_buffer, width=140*mm, height=50*mm)
-                chart_img.hAlign = 'CENTER'
-                story.append(chart_img)
+            chart = self._create_chart('bar', chart_data, 140*mm, 50*mm)
+            if chart is not None:
+                story.append(chart)
                 story.append(Spacer(1, 4*mm))
         
         # ==================== DETAILED INCOME ====================
@@ -679,8 +556,9 @@ class ExecutiveReportGenerator:
             story.append(expense_table)
         
         # Build PDF with custom canvas for footers
-        doc.build(story, onFirstPage=lambda c, d: None, 
-                 onLaterPages=lambda c, d: None, canvasmaker=NumberedCanvas)
+        progress(0.8, "Building PDF...")
+        doc.build(story, onFirstPage=page_progress(progress), 
+                 onLaterPages=page_progress(progress), canvasmaker=NumberedCanvas)
         
         return {
             'success': True,
@@ -692,14 +570,14 @@ class ExecutiveReportGenerator:
 
 
 # Convenience functions
-def generate_daily_report(db_path='pos_database.db', target_date=None):
+def generate_daily_report(db_path='pos_database.db', target_date=None, progress=None):
     if target_date is None:
         target_date = datetime.now().strftime('%Y-%m-%d')
     generator = ExecutiveReportGenerator(db_path)
-    return generator.generate_report(target_date, target_date, 'Daily')
+    return generator.generate_report(target_date, target_date, 'Daily', progress=progress)
 
 
-def generate_weekly_report(db_path='pos_database.db', start_date=None, end_date=None):
+def generate_weekly_report(db_path='pos_database.db', start_date=None, end_date=None, progress=None):
     """
     Generate weekly report. Can be called with:
     - No parameters: generates report for last 7 days
@@ -723,10 +601,11 @@ def generate_weekly_report(db_path='pos_database.db', start_date=None, end_date=
             end_date = datetime.strptime(end_date, '%Y-%m-%d')
     
     generator = ExecutiveReportGenerator(db_path)
-    return generator.generate_report(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'), 'Weekly')
+    return generator.generate_report(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'), 'Weekly',
+                                     progress=progress)
 
 
-def generate_monthly_report(db_path='pos_database.db', year=None, month=None):
+def generate_monthly_report(db_path='pos_database.db', year=None, month=None, progress=None):
     if year is None or month is None:
         now = datetime.now()
         year = now.year
@@ -737,4 +616,5 @@ def generate_monthly_report(db_path='pos_database.db', year=None, month=None):
     else:
         end_date = datetime(year, month + 1, 1) - timedelta(days=1)
     generator = ExecutiveReportGenerator(db_path)
-    return generator.generate_report(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'), 'Monthly')
+    return generator.generate_report(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'), 'Monthly',
+                                     progress=progress)
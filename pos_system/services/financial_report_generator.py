@@ -8,10 +8,11 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from datetime import datetime, timedelta
 import os
-import sqlite3
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import resource_path
+from services.report_analytics import get_report_analytics
+from services.report_jobs import no_progress, page_progress
 
 # Register Unicode font for Sinhala text support
 try:
@@ -38,7 +39,7 @@ class FinancialReportGenerator:
         self.db_path = db_path
         os.makedirs(report_folder, exist_ok=True)
     
-    def generate_daily_report(self, report_date: str = None):
+    def generate_daily_report(self, report_date: str = None, progress=None):
         """Generate daily financial report"""
         if report_date is None:
             report_date = datetime.now().strftime('%Y-%m-%d')
@@ -48,9 +49,9 @@ class FinancialReportGenerator:
         period_type = "Daily"
         period_label = datetime.strptime(report_date, '%Y-%m-%d').strftime('%B %d, %Y')
         
-        return self._generate_report(start_date, end_date, period_type, period_label)
+        return self._generate_report(start_date, end_date, period_type, period_label, progress)
     
-    def generate_weekly_report(self, end_date: str = None):
+    def generate_weekly_report(self, end_date: str = None, progress=None):
         """Generate weekly financial report"""
         if end_date is None:
             end_date = datetime.now().strftime('%Y-%m-%d')
@@ -62,9 +63,9 @@ class FinancialReportGenerator:
         period_type = "Weekly"
         period_label = f"{start_date_obj.strftime('%b %d')} - {end_date_obj.strftime('%b %d, %Y')}"
         
-        return self._generate_report(start_date, end_date, period_type, period_label)
+        return self._generate_report(start_date, end_date, period_type, period_label, progress)
     
-    def generate_monthly_report(self, year: int = None, month: int = None):
+    def generate_monthly_report(self, year: int = None, month: int = None, progress=None):
         """Generate monthly financial report"""
         if year is None or month is None:
             today = datetime.now()
@@ -82,20 +83,41 @@ class FinancialReportGenerator:
         period_type = "Monthly"
         period_label = datetime(year, month, 1).strftime('%B %Y')
         
-        return self._generate_report(start_date, end_date, period_type, period_label)
+        return self._generate_report(start_date, end_date, period_type, period_label, progress)
     
-    def _generate_report(self, start_date: str, end_date: str, period_type: str, period_label: str):
-        """Generate the actual PDF report"""
+    def generate_period_report(self, start_date: str, end_date: str, period_type: str,
+                               progress=None, dataset: dict = None):
+        """Generate a Daily, Weekly or Monthly report for an explicit date range"""
+        start = datetime.strptime(start_date, '%Y-%m-%d')
+        end = datetime.strptime(end_date, '%Y-%m-%d')
+        if period_type == "Daily":
+            period_label = start.strftime('%B %d, %Y')
+        elif period_type == "Monthly":
+            period_label = start.strftime('%B %Y')
+        else:
+            period_label = f"{start.strftime('%b %d')} - {end.strftime('%b %d, %Y')}"
+        return self._generate_report(start_date, end_date, period_type, period_label, progress, dataset)
+    
+    def _generate_report(self, start_date: str, end_date: str, period_type: str, period_label: str,
+                         progress=None, dataset: dict = None):
+        """Generate the actual PDF report; progress(fraction, message) is called between steps.
+        
+        dataset is a period dataset from services.report_analytics, fetched when omitted.
+        """
+        progress = progress or no_progress
         
         # Create filename
         filename = f"{period_type}_Report_{start_date}_to_{end_date}.pdf"
         filepath = os.path.join(self.report_folder, filename)
         
         # Fetch data
-        income_data = self._get_income_data(start_date, end_date)
-        bookings_data = self._get_bookings_data(start_date, end_date)
-        expenses_data = self._get_expenses_data(start_date, end_date)
-        opening_balance = self._get_opening_balance(start_date)
+        progress(0.05, "Fetching report data...")
+        if dataset is None:
+            dataset = get_report_analytics(self.db_path).period_dataset(start_date, end_date)
+        income_data = dataset['income']
+        bookings_data = dataset['bookings']
+        expenses_data = dataset['expenses']
+        opening_balance = dataset['opening_balance']
         
         # Calculate totals
         total_income = sum(item['amount'] for item in income_data)
@@ -117,6 +139,8 @@ class FinancialReportGenerator:
         styles = getSampleStyleSheet()
         page_width = A4[0] - 30*mm
         
+        progress(0.3, "Laying out report...")
+        
         # ==================== ENHANCED HEADER ====================
         # Logo - Centered and High Resolution
         logo_path = resource_path(os.path.join('assets', 'logos', 'invoiceLogo.png'))
@@ -576,7 +600,8 @@ class FinancialReportGenerator:
         story.append(footer)
         
         # Build PDF
-        doc.build(story)
+        progress(0.8, "Building PDF...")
+        doc.build(story, onFirstPage=page_progress(progress), onLaterPages=page_progress(progress))
         
         return {
             'success': True,
@@ -590,103 +615,3 @@ class FinancialReportGenerator:
                 'closing_balance': final_balance
             }
         }
-    
-    def _get_income_data(self, start_date: str, end_date: str) -> list:
-        """Fetch income data from invoices"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT 
-                    DATE(i.created_at) as date,
-                    i.invoice_number,
-                    COALESCE(c.full_name, i.guest_name, 'Guest') as customer_name,
-                    i.total_amount as amount
-                FROM invoices i
-                LEFT JOIN customers c ON i.customer_id = c.id
-                WHERE DATE(i.created_at) BETWEEN ? AND ?
-                ORDER BY i.created_at ASC
-            ''', (start_date, end_date))
-            
-            income = [dict(row) for row in cursor.fetchall()]
-            conn.close()
-            return income
-        except sqlite3.Error as e:
-            print(f"Error fetching income data: {e}")
-            return []
-    
-    def _get_bookings_data(self, start_date: str, end_date: str) -> list:
-        """Fetch bookings data"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT 
-                    booking_date as date,
-                    customer_name,
-                    photoshoot_category as category,
-                    status,
-                    full_amount as amount
-                FROM bookings
-                WHERE booking_date BETWEEN ? AND ?
-                ORDER BY booking_date ASC
-            ''', (start_date, end_date))
-            
-            bookings = [dict(row) for row in cursor.fetchall()]
-            conn.close()
-            return bookings
-        except sqlite3.Error as e:
-            print(f"Error fetching bookings data: {e}")
-            return []
-    
-    def _get_expenses_data(self, start_date: str, end_date: str) -> list:
-        """Fetch manual expenses data"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT 
-                    me.expense_date as date,
-                    me.description,
-                    u.full_name as added_by,
-                    me.amount
-                FROM manual_expenses me
-                JOIN users u ON me.created_by = u.id
-                WHERE me.expense_date BETWEEN ? AND ?
-                ORDER BY me.expense_date ASC
-            ''', (start_date, end_date))
-            
-            expenses = [dict(row) for row in cursor.fetchall()]
-            conn.close()
-            return expenses
-        except sqlite3.Error as e:
-            print(f"Error fetching expenses data: {e}")
-            return []
-    
-    def _get_opening_balance(self, date: str) -> float:
-        """Get opening balance for the period"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get previous day's closing balance
-            prev_date = (datetime.strptime(date, '%Y-%m-%d') - timedelta(days=1)).strftime('%Y-%m-%d')
-            
-            cursor.execute('''
-                SELECT closing_balance FROM daily_balances
-                WHERE balance_date = ?
-            ''', (prev_date,))
-            
-            result = cursor.fetchone()
-            conn.close()
-            
-            return float(result[0]) if result else 0.0
-        except sqlite3.Error as e:
-            print(f"Error fetching opening balance: {e}")
-            return 0.0
@@ -4,13 +4,13 @@ Multi-Page Executive Document with Cover Page, TOC, and Dynamic Insights
 """
 
 import os
-import sqlite3
 from datetime import datetime, timedelta
-from io import BytesIO
 from typing import Dict, List, Tuple, Any
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import resource_path
+from services.report_analytics import get_report_analytics
+from services.chart_service import get_chart_service, MUTED_STYLE
 
 # ReportLab imports
 from reportlab.lib.pagesizes import A4
@@ -19,17 +19,11 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT, TA_JUSTIFY
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, 
-    Image, HRFlowable, KeepTogether, PageBreak, TableOfContents
+    Image, HRFlowable, KeepTogether, PageBreak
 )
 from reportlab.lib import colors
 from reportlab.pdfgen import canvas
 
-# Matplotlib imports for charts
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-
 
 class IndustrialReportGenerator:
     """Generate multi-page executive financial analytics PDF reports"""
@@ -64,9 +58,12 @@ class IndustrialReportGenerator:
     COMPANY_CONTACT = "0767898604 / 0322051680"
     DEVELOPER_CREDIT = "System developed by Malinda Prabath | malindaprabath876@gmail.com | 076 220 6157"
     
-    def __init__(self, db_path='pos_database.db'):
+    def __init__(self, db_path='pos_database.db', reports_dir='reports', vector_charts=False):
         self.db_path = db_path
-        self.reports_dir = 'reports'
+        self.reports_dir = reports_dir
+        # Native ReportLab drawings instead of matplotlib PNGs
+        self.vector_charts = vector_charts
+        self.charts = get_chart_service()
         os.makedirs(self.reports_dir, exist_ok=True)
         self.current_page = 1
         self.total_pages = 0
@@ -200,196 +197,9 @@ class IndustrialReportGenerator:
         
         return insights
     
-    def _create_chart(self, chart_type: str, data: Dict, title: str) -> BytesIO:
-        """Generate matplotlib chart with purple accents and return as BytesIO"""
-        fig, ax = plt.subplots(figsize=(6, 3), facecolor='white')
-        
-        if chart_type == 'pie':
-            # Revenue distribution pie chart
-            labels = list(data.keys())
-            sizes = list(data.values())
-            
-            # Filter out zero values
-            filtered_data = [(l, s) for l, s in zip(labels, sizes) if s > 0]
-            if not filtered_data:
-                plt.close()
-                return None
-            
-            labels, sizes = zip(*filtered_data)
-            
-            # Black, white, and gray color scheme with purple accent for top slice
-            colors_list = ['#8C00FF', '#333333', '#666666', '#999999', '#CCCCCC']
-            
-            wedges, texts, autotexts = ax.pie(
-                sizes, labels=labels, autopct='%1.1f%%',
-                startangle=90, colors=colors_list[:len(labels)],
-                textprops={'fontsize': 8, 'color': 'black'}
-            )
-            
-            # Make percentage text bold and white on dark slices
-            for i, autotext in enumerate(autotexts):
-                autotext.set_color('white' if i == 0 else 'black')
-                autotext.set_fontsize(7)
-                autotext.set_weight('bold')
-            
-            ax.axis('equal')
-            
-        elif chart_type == 'bar':
-            # Expense vs Income comparison
-            categories = list(data.keys())
-            values = list(data.values())
-            
-            # Purple for income, dark gray for expenses
-            bar_colors = ['#8C00FF' if cat == 'Income' else '#333333' for cat in categories]
-            bars = ax.barh(categories, values, color=bar_colors)
-            
-            # Add value labels on bars
-            for i, (bar, value) in enumerate(zip(bars, values)):
-                ax.text(value + max(values) * 0.02, i, f'LKR {value:,.0f}',
-                       va='center', fontsize=8, color='#333333')
-            
-            ax.set_xlabel('Amount (LKR)', fontsize=8, color='#333333')
-            ax.tick_params(axis='both', labelsize=7, colors='#666666')
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_color('#CCCCCC')
-            ax.spines['bottom'].set_color('#CCCCCC')
-            ax.grid(axis='x', alpha=0.2, linestyle='--', color='#CCCCCC')
-        
-        plt.tight_layout()
-        
-        # Save to BytesIO
-        img_buffer = BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight', 
-                   facecolor='white', edgecolor='none')
-        img_buffer.seek(0)
-        plt.close()
-        
-        return img_buffer
-    
-    def _fetch_analytics_data(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        """Fetch comprehensive analytics data from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        analytics = {
-            'user_insights': {},
-            'top_customers': [],
-            'service_revenue': {},
-            'booking_status': {},
-            'payment_metrics': {},
-            'income_details': [],
-            'expense_details': [],
-            'booking_details': []
-        }
-        
-        # User Insights: New customers in period
-        cursor.execute('''
-            SELECT COUNT(*) FROM customers 
-            WHERE DATE(created_at) BETWEEN ? AND ?
-        ''', (start_date, end_date))
-        new_customers = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM customers')
-        total_customers = cursor.fetchone()[0]
-        
-        analytics['user_insights'] = {
-            'new_customers': new_customers,
-            'total_customers': total_customers,
-            'returning_customers': total_customers - new_customers
-        }
-        
-        # Top Customers by booking value
-        cursor.execute('''
-            SELECT b.customer_name, b.mobile_number, 
-                   SUM(b.full_amount) as total_spent,
-                   COUNT(*) as booking_count
-            FROM bookings b
-            WHERE DATE(b.booking_date) BETWEEN ? AND ?
-            GROUP BY b.customer_name, b.mobile_number
-            ORDER BY total_spent DESC
-            LIMIT 5
-        ''', (start_date, end_date))
-        analytics['top_customers'] = cursor.fetchall()
-        
-        # Service Revenue Breakdown by category
-        cursor.execute('''
-            SELECT b.photoshoot_category, 
-                   SUM(b.full_amount) as category_revenue,
-                   COUNT(*) as booking_count
-            FROM bookings b
-            WHERE DATE(b.booking_date) BETWEEN ? AND ?
-              AND b.status = 'Completed'
-            GROUP BY b.photoshoot_category
-            ORDER BY category_revenue DESC
-        ''', (start_date, end_date))
-        for row in cursor.fetchall():
-            analytics['service_revenue'][row[0]] = {
-                'revenue': row[1],
-                'count': row[2]
-            }
-        
-        # Booking Status Summary
-        cursor.execute('''
-            SELECT status, COUNT(*) as count, SUM(full_amount) as total_value
-            FROM bookings
-            WHERE DATE(booking_date) BETWEEN ? AND ?
-            GROUP BY status
-        ''', (start_date, end_date))
-        for row in cursor.fetchall():
-            analytics['booking_status'][row[0]] = {
-                'count': row[1],
-                'value': row[2]
-            }
-        
-        # Payment Metrics
-        cursor.execute('''
-            SELECT 
-                SUM(advance_payment) as total_advance,
-                SUM(balance_amount) as total_balance
-            FROM bookings
-            WHERE DATE(booking_date) BETWEEN ? AND ?
-        ''', (start_date, end_date))
-        payment_data = cursor.fetchone()
-        analytics['payment_metrics'] = {
-            'advance_received': payment_data[0] or 0,
-            'balance_due': payment_data[1] or 0
-        }
-        
-        # Income Details (Completed Bookings)
-        cursor.execute('''
-            SELECT booking_date, customer_name, photoshoot_category, 
-                   full_amount, status, advance_payment
-            FROM bookings
-            WHERE DATE(booking_date) BETWEEN ? AND ?
-              AND status = 'Completed'
-            ORDER BY booking_date DESC
-        ''', (start_date, end_date))
-        analytics['income_details'] = cursor.fetchall()
-        
-        # Booking Details (All)
-        cursor.execute('''
-            SELECT booking_date, customer_name, photoshoot_category, 
-                   full_amount, status
-            FROM bookings
-            WHERE DATE(booking_date) BETWEEN ? AND ?
-            ORDER BY booking_date DESC
-        ''', (start_date, end_date))
-        analytics['booking_details'] = cursor.fetchall()
-        
-        # Expense Details
-        cursor.execute('''
-            SELECT me.expense_date, 'Manual Expense' as category, me.description, 
-                   me.amount, u.full_name
-            FROM manual_expenses me
-            LEFT JOIN users u ON me.created_by = u.id
-            WHERE DATE(me.expense_date) BETWEEN ? AND ?
-            ORDER BY me.expense_date DESC
-        ''', (start_date, end_date))
-        analytics['expense_details'] = cursor.fetchall()
-        
-        conn.close()
-        return analytics
+    def _create_chart(self, chart_type: str, data: Dict, width: float, height: float):
+        """Chart flowable with purple accents and muted greys, or None when there is nothing to draw"""
+        return self.charts.flowable(chart_type, data, width, height, MUTED_STYLE, vector=self.vector_charts)
     
     def _create_thin_line(self, width: str = "100%") -> HRFlowable:
         """Create elegant thin horizontal line"""
@@ -443,7 +253,7 @@ class IndustrialReportGenerator:
         return f"LKR {amount:,.2f}"
     
     def generate_report(self, start_date: str, end_date: str, 
-                       report_type: str = 'Daily') -> Dict[str, Any]:
+                       report_type: str = 'Daily', dataset: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Generate comprehensive industrial financial analytics report
         
@@ -451,6 +261,7 @@ class IndustrialReportGenerator:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
             report_type: 'Daily', 'Weekly', or 'Monthly'
+            dataset: Period dataset from services.report_analytics (fetched when omitted)
         """
         # Create filename
         filename = f"Financial_Analytics_{report_type}_{start_date}_to_{end_date}.pdf"
@@ -519,25 +330,17 @@ class IndustrialReportGenerator:
         story.append(Spacer(1, 3*mm))
         
         # ==================== FETCH DATA ====================
-        analytics = self._fetch_analytics_data(start_date, end_date)
+        if dataset is None:
+            dataset = get_report_analytics(self.db_path).period_dataset(start_date, end_date)
+        analytics = dataset['analytics']
+        opening_balance = dataset['opening_balance']
         
         # Calculate financial summary
         total_income = sum(row[3] for row in analytics['income_details'])
         total_expenses = sum(row[3] for row in analytics['expense_details'])
         net_balance = total_income - total_expenses
         
-        # Get opening balance
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT opening_balance FROM daily_balances 
-            WHERE balance_date = ?
-        ''', (start_date,))
-        result = cursor.fetchone()
-        opening_balance = result[0] if result else 0.0
-        
         closing_balance = opening_balance + net_balance
-        conn.close()
         
         # ==================== EXECUTIVE SUMMARY ====================
         story.append(self._create_section_title("EXECUTIVE SUMMARY"))
@@ -668,11 +471,9 @@ class IndustrialReportGenerator:
             # Add Revenue Distribution Chart
             if len(analytics['service_revenue']) > 0:
                 chart_data = {cat: data['revenue'] for cat, data in analytics['service_revenue'].items()}
-                chart_buffer = self._create_chart('pie', chart_data, 'Revenue Distribution')
-                if chart_buffer:
-                    chart_img = Image(chart_buffer, width=140*mm, height=70*mm)
-                    chart_img.hAlign = 'CENTER'
-                    story.append(chart_img)
+                chart = self._create_chart('pie', chart_data, 140*mm, 70*mm)
+                if chart is not None:
+                    story.append(chart)
                     story.append(Spacer(1, 4*mm))
         
         # ==================== BOOKING STATUS SUMMARY ====================
@@ -740,11 +541,9 @@ class IndustrialReportGenerator:
         if total_income > 0 or total_expenses > 0:
             story.append(self._create_section_title("INCOME vs EXPENSES"))
             chart_data = {'Income': total_income, 'Expenses': total_expenses}
-            chart_buffer = self._create_chart('bar', chart_data, 'Financial Comparison')
-            if chart_buffer:
-                chart_img = Image(chart_buffer, width=140*mm, height=50*mm)
-                chart_img.hAlign = 'CENTER'
-                story.append(chart_img)
+            chart = self._create_chart('bar', chart_data, 140*mm, 50*mm)
+            if chart is not None:
+                story.append(chart)
                 story.append(Spacer(1, 4*mm))
         
         # ==================== DETAILED INCOME TRANSACTIONS ====================
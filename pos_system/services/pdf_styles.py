@@ -0,0 +1,300 @@
+"""
+PDF Style Registry
+
+Paragraph styles, table styles and page layouts shared by the invoice,
+bill and receipt generators. Each generate_* call used to rebuild dozens
+of ParagraphStyle and TableStyle objects (and some re-imported ReportLab
+or built a whole sample style sheet just for 'Normal'). They are built
+once here when the module loads and are read-only, so any generator can
+share them and a receipt only pays for its own content.
+
+Styles that depend on a document's rows (zebra striping, which summary
+row gets the rule above it) are applied by the generator with a second
+setStyle call on top of the shared base style.
+"""
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle
+
+
+class FrozenParagraphStyle(ParagraphStyle):
+    """ParagraphStyle that cannot be changed after it is built; derive variants with parent="""
+
+    def __init__(self, name, parent=None, **kw):
+        super().__init__(name, parent, **kw)
+        self.__dict__['_frozen'] = True
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get('_frozen'):
+            raise AttributeError(f"Shared PDF style {self.name!r} is read-only")
+        super().__setattr__(name, value)
+
+    def clone(self, name, parent=None, **kwds):
+        """A frozen variant of this style"""
+        return FrozenParagraphStyle(name, parent or self, **kwds)
+
+
+class FrozenTableStyle(TableStyle):
+    """TableStyle whose commands cannot be changed after it is built"""
+
+    def __init__(self, cmds=None, parent=None, **kw):
+        super().__init__(cmds, parent, **kw)
+        self._cmds = tuple(self._cmds)
+
+    def add(self, *cmd):
+        raise AttributeError("Shared PDF table styles are read-only")
+
+    def getCommands(self):
+        return list(self._cmds)
+
+
+# === COLORS ===
+BLACK = colors.HexColor('#000000')
+WHITE = colors.HexColor('#FFFFFF')
+NAVY = colors.HexColor('#1a1a2e')
+DARK_GREY = colors.HexColor('#333333')
+REG_GREY = colors.HexColor('#444444')
+TEXT_GREY = colors.HexColor('#555555')
+FOOTER_GREY = colors.HexColor('#666666')
+DEV_GREY = colors.HexColor('#888888')
+LIGHT_GREY = colors.HexColor('#999999')
+ZEBRA_GREY = colors.HexColor('#f5f5f5')
+BALANCE_RED = colors.HexColor('#c0392b')
+PAID_GREEN = colors.HexColor('#27ae60')
+FACEBOOK_BLUE = colors.HexColor('#1877f2')
+
+
+# === PAGE LAYOUTS ===
+A4_MARGINS = {'leftMargin': 15*mm, 'rightMargin': 15*mm, 'topMargin': 12*mm, 'bottomMargin': 12*mm}
+A4_CONTENT_WIDTH = A4[0] - 30*mm  # Available width after margins
+
+THERMAL_WIDTH = 80*mm  # Standard thermal printer roll
+THERMAL_MARGINS = {'leftMargin': 3*mm, 'rightMargin': 3*mm, 'topMargin': 3*mm, 'bottomMargin': 3*mm}
+
+
+def a4_document(filepath):
+    """SimpleDocTemplate for an A4 invoice"""
+    return SimpleDocTemplate(filepath, pagesize=A4, **A4_MARGINS)
+
+
+def thermal_document(filepath, page_height):
+    """SimpleDocTemplate for an 80mm thermal receipt"""
+    return SimpleDocTemplate(filepath, pagesize=(THERMAL_WIDTH, page_height), **THERMAL_MARGINS)
+
+
+# === A4 INVOICE PARAGRAPH STYLES ===
+NORMAL = FrozenParagraphStyle('Normal')
+
+INVOICE_TITLE = FrozenParagraphStyle('InvTitle', fontSize=28, textColor=NAVY, alignment=TA_RIGHT, fontName='Helvetica-Bold')
+SETTLEMENT_TITLE = INVOICE_TITLE.clone('SettleTitle', fontSize=24)
+META = FrozenParagraphStyle('Meta', fontSize=11, alignment=TA_RIGHT, leading=15)
+META_MUTED = FrozenParagraphStyle('MetaMuted', fontSize=10, alignment=TA_RIGHT, leading=15, textColor=TEXT_GREY)
+
+COMPANY_NAME = FrozenParagraphStyle('Co', fontSize=13, fontName='Helvetica-Bold')
+COMPANY_REG = FrozenParagraphStyle('Reg', fontSize=10, textColor=REG_GREY)
+COMPANY_LINE = FrozenParagraphStyle('Addr', fontSize=10, textColor=TEXT_GREY)
+BILL_TO = FrozenParagraphStyle('BillTo', fontSize=12, fontName='Helvetica-Bold')
+CUSTOMER_LINE = FrozenParagraphStyle('Cust', fontSize=11)
+CUSTOMER_LINE_MUTED = CUSTOMER_LINE.clone('CustMuted', textColor=TEXT_GREY)
+
+# Item table header - white text for black background
+HEADER_CELL = FrozenParagraphStyle('HDesc', fontSize=11, leading=13, textColor=colors.white, fontName='Helvetica-Bold')
+HEADER_CELL_CENTER = FrozenParagraphStyle('HCenter', fontSize=11, alignment=TA_CENTER, textColor=colors.white, fontName='Helvetica-Bold')
+HEADER_CELL_RIGHT = FrozenParagraphStyle('HRight', fontSize=11, alignment=TA_RIGHT, textColor=colors.white, fontName='Helvetica-Bold')
+CELL = FrozenParagraphStyle('Desc', fontSize=11, leading=13)
+CELL_CENTER = FrozenParagraphStyle('Center', fontSize=11, alignment=TA_CENTER)
+CELL_RIGHT = FrozenParagraphStyle('Right', fontSize=11, alignment=TA_RIGHT)
+
+SUMMARY = FrozenParagraphStyle('Sum', fontSize=11, alignment=TA_RIGHT)
+SUMMARY_BOLD = SUMMARY.clone('SumBold', fontName='Helvetica-Bold')
+SUMMARY_BALANCE = SUMMARY_BOLD.clone('Bal', textColor=BALANCE_RED)
+SUMMARY_PAID = SUMMARY_BOLD.clone('Paid', textColor=PAID_GREEN)
+STATUS_PAID = FrozenParagraphStyle('Status', fontSize=12, fontName='Helvetica-Bold', alignment=TA_CENTER, textColor=PAID_GREEN)
+
+TERMS_TITLE = FrozenParagraphStyle('TermsTitle', fontSize=10, fontName='Helvetica-Bold', alignment=TA_LEFT, textColor=DARK_GREY)
+TERMS_TEXT = FrozenParagraphStyle('TermsText', fontSize=9, fontName='Helvetica', alignment=TA_LEFT, textColor=TEXT_GREY, leading=12)
+
+CONTACT_TEXT = FrozenParagraphStyle('ContactText', fontSize=10, alignment=TA_LEFT, textColor=TEXT_GREY, leading=13)
+CONTACT_TEXT_SMALL = FrozenParagraphStyle('Social', fontSize=8, alignment=TA_LEFT, textColor=TEXT_GREY, leading=11)
+FACEBOOK_MARK = FrozenParagraphStyle('FB', fontSize=10, alignment=TA_CENTER, textColor=FACEBOOK_BLUE, fontName='Helvetica-Bold')
+FACEBOOK_MARK_SMALL = FACEBOOK_MARK.clone('FBSmall', fontSize=8)
+
+FOOTER = FrozenParagraphStyle('Footer', fontSize=9, alignment=TA_CENTER, textColor=DARK_GREY)
+FOOTER_THANKS = FrozenParagraphStyle('Footer1', fontSize=9, alignment=TA_CENTER, textColor=FOOTER_GREY)
+FOOTER_CREDIT = FrozenParagraphStyle('Footer2', fontSize=8, alignment=TA_CENTER, textColor=LIGHT_GREY, leading=11)
+FOOTER_CREDIT_TIGHT = FOOTER_CREDIT.clone('Footer2Tight', leading=10)
+DEV_CREDIT = FrozenParagraphStyle('Dev', fontSize=8, alignment=TA_CENTER, textColor=DEV_GREY)
+
+
+# === A4 INVOICE TABLE STYLES ===
+RIGHT_COLUMN = FrozenTableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'RIGHT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+HEADER_ROW = FrozenTableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+    ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+])
+INFO_BLOCK = FrozenTableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+])
+INFO_ROW = FrozenTableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP')])
+
+# Premium black theme: black header row, thin black grid
+_ITEMS_GRID = [
+    # Header row - BLACK background with WHITE text
+    ('BACKGROUND', (0, 0), (-1, 0), colors.black),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('TOPPADDING', (0, 0), (-1, 0), 10),
+    # All cells - thin elegant borders
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+    ('BOX', (0, 0), (-1, -1), 1, colors.black),
+    # Data rows - padding
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+    ('TOPPADDING', (0, 1), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+]
+# Description, advance/qty, full amount/unit price, amount
+ITEMS_TABLE = FrozenTableStyle(_ITEMS_GRID + [
+    ('ALIGN', (2, 1), (3, -1), 'RIGHT'),
+    ('ALIGN', (1, 1), (1, -1), 'CENTER'),
+])
+# White data rows only, for high-contrast printing
+ITEMS_TABLE_PLAIN = FrozenTableStyle([('BACKGROUND', (0, 1), (-1, -1), colors.white)], parent=ITEMS_TABLE)
+# Description, amount
+SETTLEMENT_ITEMS_TABLE = FrozenTableStyle(_ITEMS_GRID + [
+    ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+])
+
+
+def zebra_rows(row_count):
+    """Alternating light grey and white backgrounds for the data rows of a table"""
+    return [('BACKGROUND', (0, i), (-1, i), ZEBRA_GREY if i % 2 == 0 else colors.white)
+            for i in range(1, row_count)]
+
+
+SUMMARY_TABLE = FrozenTableStyle([
+    ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+    ('TOPPADDING', (0, 0), (-1, -1), 5),
+])
+
+
+def rule_above(row):
+    """Dark rule above one row of a summary table"""
+    return [('LINEABOVE', (0, row), (-1, row), 1, DARK_GREY)]
+
+
+SUMMARY_CONTAINER = FrozenTableStyle([('ALIGN', (1, 0), (1, 0), 'RIGHT')])
+CONTACT_ROW = FrozenTableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('ALIGN', (0, 0), (0, 0), 'CENTER'),
+    ('ALIGN', (1, 0), (1, 0), 'LEFT'),
+    ('ALIGN', (3, 0), (3, 0), 'CENTER'),
+    ('ALIGN', (4, 0), (4, 0), 'LEFT'),
+])
+CENTERED = FrozenTableStyle([('ALIGN', (0, 0), (-1, -1), 'CENTER')])
+
+
+# === THERMAL BILL PARAGRAPH STYLES (pure black & white, no grey) ===
+_BILL_TEXT = {'textColor': BLACK, 'spaceBefore': 0, 'leading': 11}
+
+BILL_STUDIO_NAME = FrozenParagraphStyle('StudioName', fontSize=12, textColor=BLACK, alignment=TA_CENTER,
+                                        fontName='Helvetica-Bold', spaceAfter=1*mm, spaceBefore=0, leading=14)
+BILL_SUBHEADER = FrozenParagraphStyle('BillSubheader', fontSize=9, alignment=TA_CENTER, spaceAfter=0.5*mm, **_BILL_TEXT)
+BILL_META = FrozenParagraphStyle('LeftMeta', fontSize=9, fontName='Helvetica', alignment=TA_LEFT, spaceAfter=1*mm, **_BILL_TEXT)
+BILL_TEXT = FrozenParagraphStyle('BillNormal', fontSize=9, alignment=TA_LEFT, spaceAfter=0, **_BILL_TEXT)
+BILL_TEXT_CENTER = BILL_TEXT.clone('CenterAlign', alignment=TA_CENTER)
+BILL_TEXT_RIGHT = BILL_TEXT.clone('RightAlign', alignment=TA_RIGHT)
+BILL_TABLE_HEADER = FrozenParagraphStyle('TableHeader', fontSize=9, fontName='Helvetica-Bold', alignment=TA_LEFT,
+                                         spaceAfter=0, **_BILL_TEXT)
+BILL_TABLE_HEADER_CENTER = BILL_TABLE_HEADER.clone('TableHeaderCenter', alignment=TA_CENTER)
+BILL_TABLE_HEADER_RIGHT = BILL_TABLE_HEADER.clone('TableHeaderRight', alignment=TA_RIGHT)
+BILL_TOTAL = FrozenParagraphStyle('RightTotal', fontSize=9, fontName='Helvetica', alignment=TA_RIGHT, spaceAfter=1*mm, **_BILL_TEXT)
+BILL_GRAND_TOTAL = FrozenParagraphStyle('GrandTotal', fontSize=12, textColor=BLACK, fontName='Helvetica-Bold',
+                                        alignment=TA_RIGHT, spaceAfter=0, spaceBefore=0, leading=14)
+BILL_PAYMENT_STATUS = FrozenParagraphStyle('PaymentStatus', fontSize=10, textColor=BLACK, fontName='Helvetica-Bold',
+                                           alignment=TA_CENTER, spaceAfter=2*mm, spaceBefore=0, leading=12)
+BILL_TAGLINE = FrozenParagraphStyle('FooterElegant', fontSize=9, fontName='Times-Italic', alignment=TA_CENTER,
+                                    spaceAfter=0, **_BILL_TEXT)
+BILL_CREDIT = FrozenParagraphStyle('DeveloperCredit', fontSize=6, textColor=BLACK, fontName='Helvetica',
+                                   alignment=TA_CENTER, spaceAfter=0, spaceBefore=0, leading=7)
+
+# Item, qty, amount with a hair-thin black line under the header only
+BILL_ITEMS_TABLE = FrozenTableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), WHITE),
+    ('TEXTCOLOR', (0, 0), (-1, -1), BLACK),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+    ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TOPPADDING', (0, 0), (-1, -1), 2*mm),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2*mm),
+    ('LEFTPADDING', (0, 0), (-1, -1), 1*mm),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 1*mm),
+    ('LINEBELOW', (0, 0), (-1, 0), 0.5, BLACK),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+
+# === THERMAL SETTLEMENT RECEIPT STYLES ===
+RECEIPT_SUBHEADER = FrozenParagraphStyle('Subheader', fontSize=8, textColor=colors.black, alignment=TA_CENTER,
+                                         fontName='Helvetica', spaceAfter=0, spaceBefore=0, leading=10)
+RECEIPT_HEADER = RECEIPT_SUBHEADER.clone('Header', fontSize=11, fontName='Helvetica-Bold', leading=13)
+RECEIPT_META = RECEIPT_SUBHEADER.clone('ReceiptMeta', alignment=TA_LEFT)
+RECEIPT_STATUS = RECEIPT_HEADER.clone('ReceiptStatus', fontSize=10, spaceAfter=2, leading=12)
+RECEIPT_FOOTER = RECEIPT_SUBHEADER.clone('ReceiptFooter', fontSize=7, leading=9)
+
+RECEIPT_RULE = FrozenTableStyle([
+    ('LINEABOVE', (0, 0), (-1, 0), 0.5, colors.black),
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+])
+# Label, amount
+RECEIPT_AMOUNTS_TABLE = FrozenTableStyle([
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+])
+# Item, qty, amount
+RECEIPT_ITEMS_TABLE = FrozenTableStyle([
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+    ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+    ('LEFTPADDING', (0, 0), (-1, -1), 1),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 1),
+    ('LINEBELOW', (0, 0), (-1, 0), 0.5, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+
+def receipt_rule():
+    """Solid black line across a thermal receipt"""
+    line = Table([['']], colWidths=[74*mm])
+    line.setStyle(RECEIPT_RULE)
+    return line
@@ -0,0 +1,218 @@
+"""
+Report Analytics
+
+The executive, industrial and financial reports used to run their own
+copies of the same aggregate SQL (top customers, service revenue, booking
+status, expenses), each on a fresh connection. ReportAnalytics computes a
+period's dataset once, in one read transaction on the pooled connection,
+and every report generator, the batch builder and the dashboard share it.
+
+Datasets are memoized per (start, end, data version). Triggers bump
+report_data_changes.version on every write to the tables read here, from
+any connection or process, so a cached period is never served stale.
+"""
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict
+
+from database.connection_pool import get_pool
+from database.date_ranges import date_range
+from services.balance_ledger import BalanceLedger
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    """report_data_changes.version as seen by this connection"""
+    row = conn.execute('SELECT version FROM report_data_changes WHERE id = 1').fetchone()
+    return row[0] if row else 0
+
+
+def empty_dataset() -> Dict[str, Any]:
+    """Dataset shape with no activity, returned when the database cannot be read"""
+    return {
+        'analytics': {
+            'user_insights': {'new_customers': 0, 'total_customers': 0, 'returning_customers': 0},
+            'top_customers': [],
+            'service_revenue': {},
+            'booking_status': {},
+            'payment_metrics': {'advance_received': 0, 'balance_due': 0},
+            'income_details': [],
+            'expense_details': [],
+            'booking_details': [],
+        },
+        'income': [],
+        'bookings': [],
+        'expenses': [],
+        'opening_balance': 0.0,
+    }
+
+
+class ReportAnalytics:
+    """Memoized per-period report datasets for one database file"""
+
+    def __init__(self, db_path: str = 'pos_database.db', max_entries: int = 32):
+        self.pool = get_pool(db_path)
+        self.db_path = self.pool.db_path
+        self.max_entries = max_entries
+        self._datasets: 'OrderedDict[tuple, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def data_version(self) -> int:
+        """Token that changes whenever a table read by the reports is written"""
+        with self.pool.connection() as conn:
+            return current_version(conn)
+
+    def period_dataset(self, start_date: str, end_date: str) -> Dict[str, Any]:
+        """Everything the reports need for start_date..end_date inclusive.
+
+        Shared between callers, so treat it as read-only. 'analytics' feeds
+        the executive and industrial reports; 'income', 'bookings' and
+        'expenses' feed the financial report.
+        """
+        try:
+            version = self.data_version()
+            key = (start_date, end_date, version)
+            with self._lock:
+                dataset = self._datasets.get(key)
+                if dataset is not None:
+                    self._datasets.move_to_end(key)
+                    return dataset
+
+            # The ledger may refresh itself through the writer, so it is read
+            # before the read transaction rather than from inside it
+            opening_balance = BalanceLedger(self.db_path).get_opening_balance(start_date)
+            with self.pool.connection() as conn:
+                if not conn.in_transaction:
+                    conn.execute('BEGIN')
+                read_version = current_version(conn)
+                dataset = self._query(conn, start_date, end_date)
+            dataset['opening_balance'] = opening_balance
+        except sqlite3.Error as e:
+            print(f"Error fetching report analytics: {e}")
+            return empty_dataset()
+
+        if read_version == version:
+            # A write in between would have made the balance older than the rows
+            with self._lock:
+                self._datasets[key] = dataset
+                self._datasets.move_to_end(key)
+                while len(self._datasets) > self.max_entries:
+                    self._datasets.popitem(last=False)
+        return dataset
+
+    def _query(self, conn: sqlite3.Connection, start_date: str, end_date: str) -> Dict[str, Any]:
+        """Run every report query for a period (inside one read transaction)"""
+        cursor = conn.cursor()
+        dataset = empty_dataset()
+        analytics = dataset['analytics']
+        period = (start_date, end_date)
+
+        # Customers
+        cursor.execute('''
+            SELECT (SELECT COUNT(*) FROM customers WHERE created_at >= ? AND created_at < ?),
+                   (SELECT COUNT(*) FROM customers)
+        ''', date_range(start_date, end_date))
+        new_customers, total_customers = cursor.fetchone()
+        analytics['user_insights'] = {
+            'new_customers': new_customers,
+            'total_customers': total_customers,
+            'returning_customers': total_customers - new_customers
+        }
+
+        # Booking aggregates; booking_date is a plain date, so BETWEEN uses its index
+        cursor.execute('''
+            SELECT customer_name, mobile_number, SUM(full_amount) as total_spent, COUNT(*)
+            FROM bookings WHERE booking_date BETWEEN ? AND ?
+            GROUP BY customer_name, mobile_number ORDER BY total_spent DESC LIMIT 5
+        ''', period)
+        analytics['top_customers'] = [tuple(row) for row in cursor.fetchall()]
+
+        cursor.execute('''
+            SELECT photoshoot_category, SUM(full_amount) as category_revenue, COUNT(*)
+            FROM bookings WHERE booking_date BETWEEN ? AND ? AND status = 'Completed'
+            GROUP BY photoshoot_category ORDER BY category_revenue DESC
+        ''', period)
+        for row in cursor.fetchall():
+            analytics['service_revenue'][row[0]] = {'revenue': row[1], 'count': row[2]}
+
+        cursor.execute('''
+            SELECT status, COUNT(*), SUM(full_amount)
+            FROM bookings WHERE booking_date BETWEEN ? AND ?
+            GROUP BY status
+        ''', period)
+        for row in cursor.fetchall():
+            analytics['booking_status'][row[0]] = {'count': row[1], 'value': row[2]}
+
+        cursor.execute('''
+            SELECT SUM(advance_payment), SUM(balance_amount)
+            FROM bookings WHERE booking_date BETWEEN ? AND ?
+        ''', period)
+        advance, balance = cursor.fetchone()
+        analytics['payment_metrics'] = {'advance_received': advance or 0, 'balance_due': balance or 0}
+
+        # Every booking in the period once; the detail lists are cut from it
+        cursor.execute('''
+            SELECT booking_date, customer_name, photoshoot_category, full_amount, status, advance_payment
+            FROM bookings WHERE booking_date BETWEEN ? AND ?
+            ORDER BY booking_date, id
+        ''', period)
+        bookings = [tuple(row) for row in cursor.fetchall()]
+        newest_first = bookings[::-1]
+        analytics['income_details'] = [row for row in newest_first if row[4] == 'Completed']
+        analytics['booking_details'] = [row[:5] for row in newest_first]
+        dataset['bookings'] = [
+            {'date': row[0], 'customer_name': row[1], 'category': row[2], 'status': row[4], 'amount': row[3]}
+            for row in bookings
+        ]
+
+        # Invoices (the financial report's income)
+        cursor.execute('''
+            SELECT DATE(i.created_at) as date, i.invoice_number,
+                   COALESCE(c.full_name, i.guest_name, 'Guest') as customer_name,
+                   i.total_amount as amount
+            FROM invoices i
+            LEFT JOIN customers c ON i.customer_id = c.id
+            WHERE i.created_at >= ? AND i.created_at < ?
+            ORDER BY i.created_at ASC
+        ''', date_range(start_date, end_date))
+        dataset['income'] = [dict(row) for row in cursor.fetchall()]
+
+        # Manual expenses, with the name of the user who added them
+        cursor.execute('''
+            SELECT me.expense_date, me.description, me.amount, u.id, u.full_name
+            FROM manual_expenses me
+            LEFT JOIN users u ON me.created_by = u.id
+            WHERE me.expense_date BETWEEN ? AND ?
+            ORDER BY me.expense_date, me.id
+        ''', period)
+        expenses = cursor.fetchall()
+        analytics['expense_details'] = [
+            (row[0], 'Manual Expense', row[1], row[2], row[4]) for row in reversed(expenses)
+        ]
+        # The financial report lists only expenses whose user still exists
+        dataset['expenses'] = [
+            {'date': row[0], 'description': row[1], 'added_by': row[4], 'amount': row[2]}
+            for row in expenses if row[3] is not None
+        ]
+        return dataset
+
+    def clear(self):
+        """Forget every memoized dataset"""
+        with self._lock:
+            self._datasets.clear()
+
+
+_engines: Dict[str, ReportAnalytics] = {}
+_engines_lock = threading.Lock()
+
+
+def get_report_analytics(db_path: str = 'pos_database.db') -> ReportAnalytics:
+    """Get the shared report analytics for a database file"""
+    pool = get_pool(db_path)
+    with _engines_lock:
+        engine = _engines.get(pool.db_path)
+        if engine is None:
+            engine = ReportAnalytics(pool.db_path)
+            _engines[pool.db_path] = engine
+        return engine
@@ -0,0 +1,175 @@
+"""
+Background Report Jobs
+
+PDF reports (matplotlib charts plus ReportLab layout) take seconds to build
+at month-end. ReportJobRunner runs them on a worker thread instead of inside
+a Tk callback, one at a time in the order they were requested.
+
+A report function opts into progress and cancellation by accepting a
+``progress`` keyword: it calls progress(fraction, message) between steps,
+and that call raises JobCancelled once the job has been cancelled. The UI
+polls ReportJob.status/progress with after() and never blocks on a job.
+"""
+
+import inspect
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED = (DONE, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a report function when its job has been cancelled"""
+
+
+def accepts_progress(func: Callable) -> bool:
+    """Whether func takes a progress keyword argument"""
+    try:
+        parameters = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return 'progress' in parameters
+
+
+def no_progress(fraction: float, message: str = ''):
+    """Progress callback used when a report runs outside a job"""
+
+
+def page_progress(progress: Callable, fraction: float = 0.9) -> Callable:
+    """doc.build page callback reporting each page, so a cancel stops the build"""
+    def on_page(canvas, doc):
+        progress(fraction, f"Writing page {doc.page}...")
+    return on_page
+
+
+class ReportJob:
+    """One queued or running report and its outcome"""
+
+    def __init__(self, job_id: int, name: str):
+        self.id = job_id
+        self.name = name
+        self.status = QUEUED
+        self.progress = 0.0
+        self.message = 'Waiting to start...'
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self._cancel_requested = threading.Event()
+        self._finished = threading.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_requested.is_set()
+
+    def cancel(self):
+        """Ask the job to stop; a queued job never starts"""
+        self._cancel_requested.set()
+
+    def report_progress(self, fraction: float, message: str = ''):
+        """Record progress from the report function; raises JobCancelled if cancelled"""
+        if self._cancel_requested.is_set():
+            raise JobCancelled(self.name)
+        self.progress = max(self.progress, min(1.0, float(fraction)))
+        if message:
+            self.message = message
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job finishes (for scripts and tests, not the UI)"""
+        return self._finished.wait(timeout)
+
+    def _finish(self, status: str, message: str, result: Any = None,
+                error: Optional[BaseException] = None):
+        self.result = result
+        self.error = error
+        self.message = message
+        if status == DONE:
+            self.progress = 1.0
+        self.status = status
+        self._finished.set()
+
+    def __repr__(self) -> str:
+        return f"<ReportJob {self.id} {self.name!r} {self.status} {self.progress:.0%}>"
+
+
+class ReportJobRunner:
+    """Queue of report jobs run on background worker threads"""
+
+    def __init__(self, max_workers: int = 1):
+        # One worker by default: reports write into the shared reports folder
+        # and finish in the order they were requested
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='report')
+        self._ids = itertools.count(1)
+        self._jobs: List[ReportJob] = []
+        self._lock = threading.Lock()
+
+    def submit(self, name: str, func: Callable, *args, **kwargs) -> ReportJob:
+        """Queue func(*args, **kwargs) and return its job straight away"""
+        job = ReportJob(next(self._ids), name)
+        if accepts_progress(func):
+            kwargs['progress'] = job.report_progress
+        with self._lock:
+            self._jobs = [j for j in self._jobs if not j.finished]
+            self._jobs.append(job)
+        self._executor.submit(self._run, job, func, args, kwargs)
+        return job
+
+    def _run(self, job: ReportJob, func: Callable, args: tuple, kwargs: dict):
+        """Worker thread: run one job and record how it ended"""
+        if job.cancel_requested:
+            job._finish(CANCELLED, 'Cancelled')
+            return
+        job.status = RUNNING
+        job.message = 'Starting...'
+        try:
+            result = func(*args, **kwargs)
+        except JobCancelled:
+            job._finish(CANCELLED, 'Cancelled')
+        except Exception as e:
+            print(f"Error generating {job.name}: {e}")
+            job._finish(FAILED, str(e), error=e)
+        else:
+            job._finish(DONE, 'Done', result=result)
+
+    def jobs(self) -> List[ReportJob]:
+        """Jobs that are queued or running"""
+        with self._lock:
+            return [job for job in self._jobs if not job.finished]
+
+    def shutdown(self, cancel: bool = True, wait: bool = False):
+        """Stop accepting jobs, cancelling the outstanding ones unless told not to"""
+        if cancel:
+            for job in self.jobs():
+                job.cancel()
+        self._executor.shutdown(wait=wait)
+
+
+_runner: Optional[ReportJobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_report_runner() -> ReportJobRunner:
+    """Get the shared report job runner"""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = ReportJobRunner()
+        return _runner
+
+
+def shutdown_report_runner():
+    """Cancel outstanding reports and wait for the worker to stop (at exit)"""
+    global _runner
+    with _runner_lock:
+        runner, _runner = _runner, None
+    if runner is not None:
+        runner.shutdown(cancel=True, wait=True)
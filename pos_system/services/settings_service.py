@@ -1,31 +1,35 @@
 import sqlite3
 from typing import Dict, Any, Optional
 
+from database.connection_pool import get_pool
+
 
 class SettingsService:
     """Manage application settings stored in database"""
     
     def __init__(self, db_path='pos_database.db'):
         self.db_path = db_path
+        self.pool = get_pool(db_path)
         self._ensure_settings_table()
         self._initialize_default_settings()
     
     def _ensure_settings_table(self):
         """Create settings table if not exists"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS settings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                setting_key TEXT UNIQUE NOT NULL,
-                setting_value TEXT,
-                setting_type TEXT DEFAULT 'string',
-                description TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        conn.commit()
-        conn.close()
+        def work(conn):
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS settings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    setting_key TEXT UNIQUE NOT NULL,
+                    setting_value TEXT,
+                    setting_type TEXT DEFAULT 'string',
+                    description TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            conn.commit()
+        
+        self.pool.run_write(work)
     
     def _initialize_default_settings(self):
         """Initialize default settings if not exist"""
@@ -48,12 +52,11 @@ class SettingsService:
     def get_setting(self, key: str) -> Optional[str]:
         """Get a setting value by key"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('SELECT setting_value FROM settings WHERE setting_key = ?', (key,))
-            result = cursor.fetchone()
-            conn.close()
-            return result[0] if result else None
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT setting_value FROM settings WHERE setting_key = ?', (key,))
+                result = cursor.fetchone()
+                return result[0] if result else None
         except sqlite3.Error as e:
             print(f"Error getting setting: {e}")
             return None
@@ -61,8 +64,7 @@ class SettingsService:
     def set_setting(self, key: str, value: str, setting_type: str = 'string', 
                    description: str = '') -> bool:
         """Set or update a setting"""
-        try:
-            conn = sqlite3.connect(self.db_path)
+        def work(conn):
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT INTO settings (setting_key, setting_value, setting_type, description)
@@ -72,8 +74,10 @@ class SettingsService:
                     updated_at = CURRENT_TIMESTAMP
             ''', (key, value, setting_type, description))
             conn.commit()
-            conn.close()
             return True
+        
+        try:
+            return self.pool.run_write(work)
         except sqlite3.Error as e:
             print(f"Error setting: {e}")
             return False
@@ -81,21 +85,18 @@ class SettingsService:
     def get_all_settings(self) -> Dict[str, Any]:
         """Get all settings as dictionary"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM settings ORDER BY setting_key')
-            rows = cursor.fetchall()
-            conn.close()
-            return {row['setting_key']: dict(row) for row in rows}
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT * FROM settings ORDER BY setting_key')
+                rows = cursor.fetchall()
+                return {row['setting_key']: dict(row) for row in rows}
         except sqlite3.Error as e:
             print(f"Error getting all settings: {e}")
             return {}
     
     def update_multiple_settings(self, settings: Dict[str, str]) -> bool:
         """Update multiple settings at once"""
-        try:
-            conn = sqlite3.connect(self.db_path)
+        def work(conn):
             cursor = conn.cursor()
             for key, value in settings.items():
                 cursor.execute('''
@@ -106,8 +107,10 @@ class SettingsService:
                         updated_at = CURRENT_TIMESTAMP
                 ''', (key, value))
             conn.commit()
-            conn.close()
             return True
+        
+        try:
+            return self.pool.run_write(work)
         except sqlite3.Error as e:
             print(f"Error updating settings: {e}")
             return False
@@ -6,6 +6,7 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.lib import colors
 from datetime import datetime
 import os
+from services.report_jobs import no_progress, page_progress
 
 
 class StaffReportGenerator:
@@ -15,14 +16,17 @@ class StaffReportGenerator:
         self.report_folder = report_folder
         os.makedirs(report_folder, exist_ok=True)
     
-    def generate_daily_report(self, staff_data: dict, date: str, work_records: dict):
+    def generate_daily_report(self, staff_data: dict, date: str, work_records: dict, progress=None):
         """Generate PDF report for staff daily work
         
         Args:
             staff_data: dict with staff info (id, full_name, username, role)
             date: Date string (YYYY-MM-DD)
             work_records: dict with invoices, bookings, customers data
+            progress: optional progress(fraction, message) callback
         """
+        progress = progress or no_progress
+        progress(0.1, "Laying out report...")
         
         # Create filename
         safe_name = staff_data['full_name'].replace(' ', '_')
@@ -242,7 +246,8 @@ class StaffReportGenerator:
         ))
         
         # Build PDF
-        doc.build(story)
+        progress(0.8, "Building PDF...")
+        doc.build(story, onFirstPage=page_progress(progress), onLaterPages=page_progress(progress))
         
         return filepath
     
@@ -0,0 +1,113 @@
+"""
+Test the daily balance ledger
+Tests: Opening/closing chain across gap days, backdated writes shift later
+       balances, stale marker cleared on refresh, range matches raw sums
+"""
+
+import os
+import sys
+import sqlite3
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from datetime import datetime, timedelta
+from services.balance_ledger import BalanceLedger
+from services.dashboard_service import DashboardService
+
+
+def _day(offset):
+    """Date string offset days from today"""
+    return (datetime.now() + timedelta(days=offset)).strftime('%Y-%m-%d')
+
+
+def _dirty_from(db_path):
+    """Earliest stale day recorded by the rollup triggers"""
+    conn = sqlite3.connect(db_path)
+    value = conn.execute('SELECT dirty_from FROM balance_ledger_state').fetchone()[0]
+    conn.close()
+    return value
+
+
+def test_chain_across_gap_days(db):
+    """Days without activity carry the previous closing balance forward"""
+    dashboard = DashboardService(db.db_path)
+    ledger = BalanceLedger(db.db_path)
+
+    assert dashboard.add_manual_expense('Rent', 1000, 1, _day(-5))
+    assert dashboard.add_manual_expense('Ink', 250, 1, _day(-1))
+
+    rows = ledger.get_balances(_day(-6), _day(0))
+    assert [row['balance_date'] for row in rows] == [_day(offset) for offset in range(-6, 1)]
+    closings = [row['closing_balance'] for row in rows]
+    assert closings == [0, -1000, -1000, -1000, -1000, -1250, -1250]
+    for previous, current in zip(rows, rows[1:]):
+        assert current['opening_balance'] == previous['closing_balance']
+
+    assert ledger.get_opening_balance(_day(-3)) == -1000
+    assert dashboard.get_opening_balance(_day(0)) == -1250
+    assert ledger.get_closing_balance(_day(-5)) == -1000
+    print("✅ Opening/closing chain has no gaps")
+    db.pool.close()
+
+
+def test_backdated_write_shifts_later_days(db):
+    """A write on an earlier day moves every later opening and closing balance"""
+    dashboard = DashboardService(db.db_path)
+    ledger = BalanceLedger(db.db_path)
+
+    assert dashboard.add_manual_expense('Ink', 300, 1, _day(-1))
+    assert ledger.get_opening_balance(_day(0)) == -300
+    assert _dirty_from(db.db_path) is None
+
+    assert dashboard.add_manual_expense('Backdated rent', 2000, 1, _day(-10))
+    assert _dirty_from(db.db_path) == _day(-10)
+    assert ledger.get_opening_balance(_day(-1)) == -2000
+    assert ledger.get_opening_balance(_day(0)) == -2300
+    assert _dirty_from(db.db_path) is None
+
+    invoice_id = db.create_invoice(None, None, 5000, 0, 5000, 5000, 0, 1, guest_name='Guest')
+    assert ledger.get_closing_balance(_day(0)) == 2700
+    assert db.delete_invoice(invoice_id)
+    assert ledger.get_closing_balance(_day(0)) == -2300
+    print("✅ Backdated and deleted rows shift later balances")
+    db.pool.close()
+
+
+def test_balances_match_raw_sums(seeded_db):
+    """Every stored day agrees with income and expenses summed from the raw tables"""
+    db_path = seeded_db(customers=100, bills=100, invoices=500,
+                        bookings=20, expenses=200, days=60)
+    ledger = BalanceLedger(db_path)
+    start, end = _day(-30), _day(0)
+    rows = ledger.get_balances(start, end)
+    assert len(rows) == 31
+
+    conn = sqlite3.connect(db_path)
+    for row in rows[::7] + rows[-1:]:
+        day = row['balance_date']
+        income = conn.execute('SELECT COALESCE(SUM(total_amount), 0) FROM invoices '
+                              'WHERE DATE(created_at) <= ?', (day,)).fetchone()[0]
+        expenses = conn.execute('SELECT COALESCE(SUM(amount), 0) FROM manual_expenses '
+                                'WHERE expense_date <= ?', (day,)).fetchone()[0]
+        assert abs(row['closing_balance'] - (income - expenses)) < 0.01, day
+    conn.close()
+
+    assert ledger.rebuild()
+    assert ledger.get_balances(start, end) == rows
+    print(f"✅ {len(rows)} ledger days match raw totals")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING BALANCE LEDGER")
+    print("="*60)
+
+    # The tests take fixtures from conftest.py, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All balance ledger tests passed")
+
+
+if __name__ == "__main__":
+    main()
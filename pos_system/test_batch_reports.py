@@ -0,0 +1,125 @@
+"""
+Test the batch report builder
+Tests: Day, week and month splitting, batch reports matching the reports
+       generated one by one, the process pool, cancellation, the CLI
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from services.batch_reports import batch_periods, generate_batch_reports, main as batch_main
+from services.report_analytics import ReportAnalytics
+from services.report_jobs import JobCancelled
+from services.executive_report_generator import ExecutiveReportGenerator
+from services.industrial_report_generator import IndustrialReportGenerator
+from services.financial_report_generator import FinancialReportGenerator
+
+
+def test_batch_periods():
+    """Days, Monday-Sunday weeks and calendar months, clipped to the range"""
+    periods = batch_periods('2026-08-27', '2026-09-02')
+    daily = [p for p in periods if p[0] == 'Daily']
+    assert len(daily) == 7 and daily[0] == ('Daily', '2026-08-27', '2026-08-27')
+    assert [p for p in periods if p[0] == 'Weekly'] == [
+        ('Weekly', '2026-08-27', '2026-08-30'),
+        ('Weekly', '2026-08-31', '2026-09-02'),
+    ]
+    assert [p for p in periods if p[0] == 'Monthly'] == [
+        ('Monthly', '2026-08-27', '2026-08-31'),
+        ('Monthly', '2026-09-01', '2026-09-02'),
+    ]
+    assert batch_periods('2026-02-01', '2026-02-28', ('Monthly',)) == [('Monthly', '2026-02-01', '2026-02-28')]
+    try:
+        batch_periods('2026-09-02', '2026-09-01')
+        assert False, "reversed range accepted"
+    except ValueError:
+        pass
+    print("✅ Date ranges split into days, weeks and months")
+
+
+def test_batch_matches_individual_reports(seeded_db, tmp_path):
+    """Reports from a shared dataset match the ones that query for themselves"""
+    db_path = seeded_db(customers=200, bills=1500, invoices=500,
+                        bookings=200, expenses=150, days=30)
+    output_dir = str(tmp_path)
+    end = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+    start = (datetime.now() - timedelta(days=10)).strftime('%Y-%m-%d')
+    dataset = ReportAnalytics(db_path).period_dataset(start, end)
+    builds = [
+        lambda **extra: ExecutiveReportGenerator(db_path, output_dir).generate_report(start, end, 'Weekly', **extra),
+        lambda **extra: IndustrialReportGenerator(db_path, output_dir).generate_report(start, end, 'Weekly', **extra),
+        lambda **extra: FinancialReportGenerator(output_dir, db_path).generate_period_report(start, end, 'Weekly', **extra),
+    ]
+    for build in builds:
+        own = build()
+        shared = build(dataset=dataset)
+        assert own['summary'] == shared['summary'], (own['filename'], own['summary'], shared['summary'])
+
+    records = generate_batch_reports(db_path, start, end, period_types=('Daily', 'Weekly'),
+                                     output_dir=output_dir, workers=1)
+    expected = len(batch_periods(start, end, ('Daily', 'Weekly'))) * 3
+    assert len(records) == expected
+    assert all(record['error'] is None for record in records), [r['error'] for r in records]
+    paths = [record['filepath'] for record in records]
+    assert len(set(paths)) == expected and all(os.path.exists(path) for path in paths)
+    print("✅ Batch reports match reports generated one by one")
+
+
+def test_process_pool_and_cancel(seeded_db, tmp_path):
+    """Worker processes produce the same reports; a cancel stops the batch"""
+    db_path = seeded_db(customers=100, bills=600, invoices=200,
+                        bookings=100, expenses=60, days=10)
+    output_dir = str(tmp_path)
+    end = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+    start = (datetime.now() - timedelta(days=3)).strftime('%Y-%m-%d')
+    seen = []
+    records = generate_batch_reports(db_path, start, end, period_types=('Daily',),
+                                     output_dir=output_dir, workers=2,
+                                     progress=lambda fraction, message='': seen.append(fraction))
+    assert len(records) == 9 and all(record['error'] is None for record in records)
+    assert seen[-1] == 1.0 and seen == sorted(seen)
+
+    def cancel_batch(fraction, message=''):
+        raise JobCancelled('batch')
+
+    try:
+        generate_batch_reports(db_path, start, end, output_dir=output_dir, workers=1,
+                               progress=cancel_batch)
+        assert False, "cancelled batch kept going"
+    except JobCancelled:
+        pass
+
+    # Cancelling a pooled batch drops the tasks that have not started
+    pooled_dir = str(tmp_path / 'pooled')
+    total = len(batch_periods(start, end)) * 3
+    try:
+        generate_batch_reports(db_path, start, end, output_dir=pooled_dir, workers=2,
+                               progress=cancel_batch)
+        assert False, "cancelled pooled batch kept going"
+    except JobCancelled:
+        pass
+    written = [name for name in os.listdir(pooled_dir) if name.endswith('.pdf')]
+    assert 1 <= len(written) < total, (len(written), total)
+
+    assert batch_main([start, end, '--kinds', 'financial', '--periods', 'monthly',
+                       '--workers', '1', '--db', db_path, '--out', output_dir]) == 0
+    print("✅ Process pool, cancellation and command line work")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING BATCH REPORTS")
+    print("="*60)
+
+    # The tests take fixtures from conftest.py, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All batch report tests passed")
+
+
+if __name__ == "__main__":
+    main()
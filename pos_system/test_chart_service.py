@@ -0,0 +1,107 @@
+"""
+Test the report chart service
+Tests: PNG cache keyed by data and style, vector drawings, empty charts,
+       reports built without pyplot, vector-chart reports
+"""
+
+import os
+import sys
+import subprocess
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from reportlab.lib.units import mm
+from reportlab.graphics.shapes import Drawing
+from reportlab.platypus import Image
+
+from services.chart_service import ChartService, chart_key, MUTED_STYLE
+
+REVENUE = {'Wedding': 250000.0, 'Birthday': 120000.0, 'Passport': 0.0, 'Portrait': 80000.0}
+
+
+def test_png_cache():
+    """Each distinct chart is rendered once; data or style changes render again"""
+    charts = ChartService()
+    first = charts.png('pie', REVENUE)
+    assert first.startswith(b'\x89PNG')
+    assert charts.png('pie', dict(REVENUE)) is first
+    assert (charts.hits, charts.misses) == (1, 1)
+
+    assert charts.png('pie', REVENUE, MUTED_STYLE) is not first
+    assert charts.png('pie', {**REVENUE, 'Wedding': 250001.0}) is not first
+    assert charts.misses == 3
+
+    assert chart_key('bar', {'Income': 1.0}) != chart_key('pie', {'Income': 1.0})
+    try:
+        chart_key('line', REVENUE)
+        assert False, "unknown chart type accepted"
+    except ValueError:
+        pass
+    print("✅ Chart PNGs are cached by data and style")
+
+
+def test_flowables():
+    """Raster and vector flowables, and nothing for an all-zero pie"""
+    charts = ChartService()
+    raster = charts.flowable('bar', {'Income': 4800.0, 'Expenses': 1500.0}, 140*mm, 50*mm)
+    vector = charts.flowable('bar', {'Income': 4800.0, 'Expenses': 1500.0}, 140*mm, 50*mm, vector=True)
+    assert isinstance(raster, Image) and raster.hAlign == 'CENTER'
+    assert isinstance(vector, Drawing) and vector.hAlign == 'CENTER'
+    assert (vector.width, vector.height) == (140*mm, 50*mm)
+    assert isinstance(charts.flowable('pie', REVENUE, 140*mm, 70*mm, MUTED_STYLE, vector=True), Drawing)
+
+    empty = {'Wedding': 0.0, 'Birthday': 0.0}
+    assert charts.flowable('pie', empty, 140*mm, 70*mm) is None
+    assert charts.flowable('pie', empty, 140*mm, 70*mm, vector=True) is None
+    print("✅ Raster and vector chart flowables")
+
+
+def test_reports_without_pyplot(seeded_db, tmp_path):
+    """Reports render their charts without importing pyplot; vector charts shrink the PDF"""
+    db_path = seeded_db(customers=200, bills=500, invoices=800,
+                        bookings=300, expenses=150, days=40)
+    output_dir = str(tmp_path)
+    end = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+    start = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+    # A fresh interpreter, so earlier imports in this process do not count
+    script = (
+        "import sys\n"
+        "from services.executive_report_generator import ExecutiveReportGenerator\n"
+        "from services.industrial_report_generator import IndustrialReportGenerator\n"
+        "assert 'matplotlib' not in sys.modules, 'matplotlib imported with the report modules'\n"
+        "for vector in (False, True):\n"
+        "    for generator in (ExecutiveReportGenerator, IndustrialReportGenerator):\n"
+        f"        result = generator({db_path!r}, {output_dir!r}, vector).generate_report(\n"
+        f"            {start!r}, {end!r}, 'Monthly')\n"
+        "        print(vector, generator.__name__, __import__('os').path.getsize(result['filepath']))\n"
+        "assert 'matplotlib.pyplot' not in sys.modules, 'pyplot imported'\n"
+    )
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)), timeout=300)
+    assert output.returncode == 0, output.stderr
+
+    sizes = {}
+    for line in output.stdout.splitlines():
+        parts = line.split()
+        if len(parts) == 3 and parts[0] in ('True', 'False'):
+            sizes[(parts[0] == 'True', parts[1])] = int(parts[2])
+    assert len(sizes) == 4, output.stdout
+    for name in ('ExecutiveReportGenerator', 'IndustrialReportGenerator'):
+        assert sizes[(True, name)] < sizes[(False, name)], sizes
+    print("✅ Reports chart without pyplot; vector charts make smaller PDFs")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING REPORT CHARTS")
+    print("="*60)
+
+    # The tests take fixtures from conftest.py, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All chart service tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Test the single-transaction bill checkout
+Tests: Pricing and payment split, stock decrement, service charge line,
+       all-or-nothing rollback on insufficient stock
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+
+def _frame_cart_item(frame, qty):
+    """Cart entry in the BillingFrame format"""
+    return {
+        'type': 'Frame',
+        'id': frame['id'],
+        'name': f"{frame['frame_name']} - {frame['size']}",
+        'quantity': qty,
+        'unit_price': frame['price'],
+        'total': frame['price'] * qty
+    }
+
+
+def test_checkout_creates_bill_items_and_stock(db):
+    """A checkout writes bill, items and stock changes together"""
+    frames = db.get_all_photo_frames()
+    frame_a, frame_b = frames[0], frames[1]
+    db.update_photo_frame(frame_a['id'], frame_a['frame_name'], frame_a['size'],
+                          frame_a['price'], frame_a['quantity'], buying_price=700)
+    service = db.get_all_services()[0]
+
+    cart = [
+        _frame_cart_item(frame_a, 2),
+        _frame_cart_item(frame_b, 1),
+        {'type': 'Service', 'id': service['id'], 'name': service['service_name'],
+         'quantity': 1, 'unit_price': service['price'], 'total': service['price']},
+    ]
+    subtotal = sum(item['total'] for item in cart)
+
+    result = db.checkout_bill(cart, None, 1, discount=100, service_charge=500,
+                              cash_given=1000, guest_name='Walk-in',
+                              service_charge_label='Studio')
+    assert result is not None
+    bill, items = result
+
+    assert bill['bill_number'] == 'BILL000001'
+    assert bill['full_name'] == 'Walk-in'
+    assert bill['created_by_name'] == 'System Administrator'
+    assert bill['subtotal'] == subtotal
+    assert bill['total_amount'] == subtotal + 500 - 100
+    # Cash below total is recorded as an advance
+    assert bill['advance_amount'] == 1000
+    assert bill['balance_due'] == bill['total_amount'] - 1000
+
+    assert len(items) == 4
+    frame_line = next(i for i in items if i['item_id'] == frame_a['id'] and i['item_type'] == 'Frame')
+    assert frame_line['buying_price'] == 1400
+    assert any(i['item_type'] == 'CategoryService' for i in items)
+
+    assert db.get_photo_frame_by_id(frame_a['id'])['quantity'] == frame_a['quantity'] - 2
+    assert db.get_photo_frame_by_id(frame_b['id'])['quantity'] == frame_b['quantity'] - 1
+    print(f"✅ Checkout created {bill['bill_number']} with {len(items)} items")
+    db.pool.close()
+
+
+def test_checkout_full_payment(db):
+    """Cash covering the total is a full payment"""
+    frame = db.get_all_photo_frames()[0]
+
+    bill, _ = db.checkout_bill([_frame_cart_item(frame, 1)], None, 1,
+                               cash_given=frame['price'] + 50, guest_name='Guest')
+    assert bill['advance_amount'] == frame['price']
+    assert bill['balance_due'] == 0
+    print("✅ Full payment recorded")
+    db.pool.close()
+
+
+def test_checkout_rolls_back_on_insufficient_stock(db):
+    """Nothing is written when any frame lacks stock"""
+    frames = db.get_all_photo_frames()
+    in_stock, short = frames[0], frames[1]
+
+    cart = [_frame_cart_item(in_stock, 1), _frame_cart_item(short, short['quantity'] + 1)]
+    assert db.checkout_bill(cart, None, 1, cash_given=100000, guest_name='Guest') is None
+
+    assert db.get_all_bills() == []
+    assert db.execute_query('SELECT COUNT(*) AS n FROM bill_items')[0]['n'] == 0
+    assert db.get_photo_frame_by_id(in_stock['id'])['quantity'] == in_stock['quantity']
+    print("✅ Insufficient stock rolls back the whole checkout")
+    db.pool.close()
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING BILL CHECKOUT")
+    print("="*60)
+
+    # The tests take fixtures from conftest.py, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All checkout tests passed")
+
+
+if __name__ == "__main__":
+    main()
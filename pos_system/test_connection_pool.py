@@ -0,0 +1,219 @@
+"""
+Test the pooled SQLite connection layer
+Tests: Per-thread reuse, pragmas, rollback on release, shutdown, shared pools,
+       writer queue serialization for managers and services, in-memory
+       databases rejected
+"""
+
+import os
+import sys
+import threading
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from database import DatabaseManager
+from database.connection_pool import ConnectionPool, get_pool
+from services.dashboard_service import DashboardService
+from services.user_service import UserService
+from services.settings_service import SettingsService
+from auth.auth_manager import AuthManager
+
+
+def test_connection_reused_within_thread(db_path):
+    """Repeated queries on one thread use a single connection"""
+    pool = ConnectionPool(db_path)
+
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert first is second
+    assert pool.open_connection_count() == 1
+    print("✅ Connection reused within a thread")
+    pool.close()
+
+
+def test_pragmas_applied_once(db_path):
+    """WAL mode and busy timeout are set when the connection opens"""
+    pool = ConnectionPool(db_path)
+
+    with pool.connection() as conn:
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        busy_timeout = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+
+    assert journal_mode.lower() == 'wal'
+    assert busy_timeout == 30000
+    print(f"✅ Pragmas applied: journal_mode={journal_mode}, busy_timeout={busy_timeout}")
+    pool.close()
+
+
+def test_threads_get_own_connections(db_path):
+    """Each thread borrows a distinct connection"""
+    pool = ConnectionPool(db_path)
+    seen = []
+
+    def worker():
+        with pool.connection() as conn:
+            conn.execute("SELECT COUNT(*) FROM users").fetchone()
+            seen.append(id(conn))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(set(seen)) == 4
+
+    # Connections of finished threads are closed on the next open
+    with pool.connection():
+        pass
+    assert pool.open_connection_count() == 1
+    print("✅ Per-thread connections opened and pruned")
+    pool.close()
+
+
+def test_uncommitted_work_rolled_back(db_path):
+    """Leaving a block without commit does not keep a write lock"""
+    pool = ConnectionPool(db_path)
+
+    with pool.connection() as conn:
+        conn.execute("INSERT INTO customers (full_name, mobile_number) VALUES ('Temp', '0000000000')")
+        assert conn.in_transaction
+
+    assert not conn.in_transaction
+    assert DatabaseManager(db_path).get_customer_by_mobile('0000000000') is None
+    print("✅ Uncommitted transaction rolled back on release")
+    pool.close()
+
+
+def test_close_and_reopen(db_path):
+    """Closing the pool drops connections; later use reopens transparently"""
+    pool = ConnectionPool(db_path)
+
+    with pool.connection() as before:
+        pass
+    pool.close()
+    assert pool.open_connection_count() == 0
+
+    with pool.connection() as after:
+        after.execute("SELECT 1").fetchone()
+
+    assert before is not after
+    print("✅ Pool closed and reopened cleanly")
+    pool.close()
+
+
+def test_services_share_pool(db_path):
+    """Managers and services for the same file share one pool"""
+    db_manager = DatabaseManager(db_path)
+    assert db_manager.pool is get_pool(db_path)
+    assert DashboardService(db_path).pool is db_manager.pool
+    assert UserService(db_path).pool is db_manager.pool
+    assert AuthManager(db_path).pool is db_manager.pool
+
+    # Many calls, still one connection on this thread plus the writer's
+    for _ in range(50):
+        db_manager.get_all_customers()
+    assert AuthManager(db_path).authenticate('admin', 'admin123') is not None
+    assert db_manager.pool.open_connection_count() == 2
+    print("✅ Services share a single pooled connection per thread")
+    db_manager.pool.close()
+
+
+def test_writes_serialized_on_writer_thread(db_path):
+    """Concurrent writes from many threads all land, via one writer thread"""
+    db_manager = DatabaseManager(db_path)
+    writer_threads = set()
+
+    def record_writer(conn):
+        writer_threads.add(threading.current_thread().name)
+        return True
+
+    def worker(offset):
+        for i in range(25):
+            db_manager.add_customer(f"Writer {offset}-{i}", f"071{offset:03d}{i:04d}")
+        db_manager.pool.run_write(record_writer)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(db_manager.search_customers('Writer')) == 200
+    assert writer_threads == {'db-writer'}
+    print("✅ 200 concurrent writes serialized through the writer queue")
+    db_manager.pool.close()
+
+
+def test_write_errors_propagate(db_path):
+    """A failed write is rolled back and reported to the caller"""
+    db_manager = DatabaseManager(db_path)
+
+    assert db_manager.add_customer('First', '0712345678') is not None
+    # UNIQUE(mobile_number) violation is surfaced as the usual None result
+    assert db_manager.add_customer('Duplicate', '0712345678') is None
+    assert len(db_manager.search_customers('0712345678')) == 1
+    print("✅ Write errors propagate and roll back")
+    db_manager.pool.close()
+
+
+def test_service_writes_use_writer_queue(db_path):
+    """Auth, user, settings and expense writes all execute on the writer thread"""
+    pool = get_pool(db_path)
+    pool.close()
+    writes = []
+    open_connection = pool._open
+
+    def traced_open():
+        conn = open_connection()
+        conn.set_trace_callback(lambda sql: writes.append(threading.current_thread().name)
+                                if sql.lstrip().split(None, 1)[0].upper()
+                                in ('INSERT', 'UPDATE', 'DELETE', 'CREATE') else None)
+        return conn
+
+    pool._open = traced_open
+    auth = AuthManager(db_path)
+    users = UserService(db_path)
+    settings = SettingsService(db_path)
+    assert auth.authenticate('admin', 'admin123') is not None
+    user_id = users.create_user('night_cashier', 'pass123', 'Staff', 'Night Cashier')
+    assert user_id is not None
+    assert users.update_password(user_id, 'pass456')
+    assert auth.toggle_user_status(user_id)
+    assert settings.set_setting('invoice_prefix', 'SAS')
+    assert DashboardService(db_path).add_manual_expense('Printer ink', 2500.0, 1)
+
+    assert len(writes) >= 6
+    assert set(writes) == {'db-writer'}, set(writes)
+    print(f"✅ {len(writes)} service write statements ran on the writer thread")
+
+
+def test_memory_database_rejected():
+    """':memory:' would give every pooled connection its own empty database"""
+    for path in (':memory:', 'file::memory:?cache=shared'):
+        for open_pool in (ConnectionPool, get_pool):
+            try:
+                open_pool(path)
+                assert False, f"{open_pool.__name__} accepted {path!r}"
+            except ValueError:
+                pass
+    print("✅ In-memory databases rejected by the pool")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING CONNECTION POOL")
+    print("="*60)
+
+    # The tests take fixtures from conftest.py, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All connection pool tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Test the customer lookup cache
+Tests: Mobile and name prefix lookups, in-place updates from this process,
+       reload after writes from another connection, agreement with SQL
+"""
+
+import os
+import sys
+import sqlite3
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from database import DatabaseManager
+
+
+def _names(customers):
+    """Customer names in result order"""
+    return [c['full_name'] for c in customers]
+
+
+def test_prefix_lookup(db):
+    """Mobile digits and name words match by prefix"""
+    db.add_customer('Nimal Perera', '077 123 4567')
+    db.add_customer('Kamal Perera', '0719876543')
+    db.add_customer('Sunil Silva', '0771239999')
+
+    assert _names(db.lookup_customers('07712')) == ['Nimal Perera', 'Sunil Silva']
+    assert _names(db.lookup_customers('0771234')) == ['Nimal Perera']
+    assert _names(db.lookup_customers('per', limit=10)) == ['Nimal Perera', 'Kamal Perera']
+    assert _names(db.lookup_customers('Per nim')) == ['Nimal Perera']
+    assert _names(db.lookup_customers('07712', limit=1)) == ['Nimal Perera']
+    assert db.lookup_customers('imal') == []
+    assert db.lookup_customers('  ') == []
+    print("✅ Prefix lookup over mobiles and names")
+    db.pool.close()
+
+
+def test_own_writes_update_in_place(db):
+    """Add, update and delete through DatabaseManager patch the cache without a reload"""
+    cache = db.customer_cache
+    customer = db.add_customer('Nimal Perera', '0771234567')
+    assert _names(db.lookup_customers('0771')) == ['Nimal Perera']
+    loaded = cache._version
+
+    added = db.add_customer('Ruwan Dias', '0774445555')
+    assert db.update_customer(customer, 'Nimal Jayasuriya', '0751234567')
+    assert cache._version == loaded + 2
+    assert _names(db.lookup_customers('0771')) == []
+    assert _names(db.lookup_customers('jaya')) == ['Nimal Jayasuriya']
+    assert _names(db.lookup_customers('0774')) == ['Ruwan Dias']
+
+    assert db.delete_customer(added)
+    assert db.lookup_customers('ruwan') == []
+    assert cache._entries == sorted(cache._entries) and len(cache._customers) == 1
+    print("✅ Writes from this process update the cache in place")
+    db.pool.close()
+
+
+def test_other_terminal_invalidates(db):
+    """A write from another connection is picked up on the next check"""
+    db.customer_cache.check_interval = 0
+    db.add_customer('Nimal Perera', '0771234567')
+    assert _names(db.lookup_customers('nimal')) == ['Nimal Perera']
+
+    other = sqlite3.connect(db.db_path)
+    other.execute("UPDATE customers SET full_name = 'Nimal Silva'")
+    other.execute("INSERT INTO customers (full_name, mobile_number) VALUES ('Kasun Perera', '0770000000')")
+    other.commit()
+    other.close()
+
+    # This process's next write skips the versions it missed, so it is not
+    # applied in place; the lookup reloads everything instead
+    db.add_customer('Ruwan Dias', '0774445555')
+    assert db.customer_cache._version is None
+    assert _names(db.lookup_customers('silva')) == ['Nimal Silva']
+    assert _names(db.lookup_customers('perera')) == ['Kasun Perera']
+    assert _names(db.lookup_customers('ruwan')) == ['Ruwan Dias']
+
+    other = sqlite3.connect(db.db_path)
+    other.execute("DELETE FROM customers WHERE full_name = 'Kasun Perera'")
+    other.commit()
+    other.close()
+    assert db.lookup_customers('kasun') == []
+    print("✅ Writes from other connections reload the cache")
+    db.pool.close()
+
+
+def test_matches_sql_prefix_search(seeded_db):
+    """Lookups agree with a LIKE prefix query on a seeded database"""
+    db_path = seeded_db(customers=3000, bills=10, invoices=10,
+                        bookings=10, expenses=10)
+    db = DatabaseManager(db_path)
+    for prefix in ('0700001', '07000029', 'customer 0012', '0799'):
+        expected = db.execute_query(
+            "SELECT id FROM customers WHERE mobile_number LIKE ? OR full_name LIKE ? "
+            "ORDER BY mobile_number", (prefix + '%', prefix + '%'))
+        found = db.lookup_customers(prefix, limit=1000)
+        assert sorted(c['id'] for c in found) == sorted(row['id'] for row in expected), prefix
+    print("✅ Cache lookups match SQL prefix queries")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING CUSTOMER LOOKUP CACHE")
+    print("="*60)
+
+    # The tests take fixtures from conftest.py, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All customer cache tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Test the incrementally maintained daily rollups
+Tests: Rollups follow inserts, updates and deletes through the normal write
+       paths, rebuild matches incremental state, per-staff queries, backfill
+"""
+
+import os
+import sys
+import sqlite3
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from datetime import datetime
+from database.rollups import rebuild_daily_rollups
+from services.dashboard_service import DashboardService
+
+
+def _rollup_rows(db_path):
+    """Non-empty rollup rows, rounded for comparison"""
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute('''
+        SELECT day, source, created_by, item_type, doc_count, quantity,
+               ROUND(amount, 2), ROUND(buying_cost, 2), ROUND(balance, 2)
+        FROM daily_rollups
+        WHERE doc_count != 0 OR quantity != 0 OR ROUND(amount, 2) != 0
+           OR ROUND(buying_cost, 2) != 0 OR ROUND(balance, 2) != 0
+        ORDER BY day, source, created_by, item_type
+    ''').fetchall()
+    conn.close()
+    return rows
+
+
+def _assert_matches_rebuild(db):
+    """Incremental rollups equal a full rebuild from the raw tables"""
+    incremental = _rollup_rows(db.db_path)
+    assert db.rebuild_daily_rollups()
+    assert _rollup_rows(db.db_path) == incremental
+    return incremental
+
+
+def test_rollups_follow_writes(db):
+    """Invoices, bills and expenses update the rollups in their own transaction"""
+    dashboard = DashboardService(db.db_path)
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    invoice_id = db.create_invoice(None, None, 3000, 0, 3000, 2000, 1000, 1, guest_name='Guest')
+    db.add_invoice_item(invoice_id, 'Frame', 1, 'Wooden Frame', 2, 1200, 2400, 1400)
+    db.add_invoice_item(invoice_id, 'Service', 1, 'ID Photo', 1, 600, 600)
+
+    frame = db.get_all_photo_frames()[0]
+    cart = [{'type': 'Frame', 'id': frame['id'], 'name': frame['frame_name'],
+             'quantity': 1, 'unit_price': frame['price'], 'total': frame['price']}]
+    bill, _ = db.checkout_bill(cart, None, 2, cash_given=frame['price'], guest_name='Walk-in')
+    assert dashboard.add_manual_expense('Printer ink', 750, 1, today)
+
+    assert dashboard.get_today_sales() == 3000
+    assert dashboard.get_today_invoices() == 1
+    assert dashboard.get_expenses_by_date(today) == 750
+    profit = dashboard.get_today_frame_profit()
+    assert profit['total_frames_sold'] == 2 and profit['net_profit'] == 1000
+
+    staff_bills = db.get_daily_rollups(today, today, source='bill', created_by=2)
+    assert staff_bills[0]['doc_count'] == 1 and staff_bills[0]['amount'] == frame['price']
+    assert db.get_daily_rollups(today, today, source='bill', created_by=1) == []
+
+    # Settling a bill and editing an item are updates, not new rows
+    db.execute_update('UPDATE bills SET balance_due = 0 WHERE id = ?', (bill['id'],))
+    db.execute_update("UPDATE invoice_items SET quantity = 3, total_price = 3600 "
+                      "WHERE invoice_id = ? AND item_type = 'Frame'", (invoice_id,))
+    assert dashboard.get_today_frame_profit()['total_frames_sold'] == 3
+    _assert_matches_rebuild(db)
+
+    # Deleting removes the document and its lines
+    assert db.delete_invoice(invoice_id)
+    assert dashboard.get_today_sales() == 0
+    assert dashboard.get_today_frame_profit()['total_frames_sold'] == 0
+    _assert_matches_rebuild(db)
+    print("✅ Rollups follow inserts, updates and deletes")
+    db.pool.close()
+
+
+def test_document_deleted_before_lines(db):
+    """Deleting a document first still removes its lines from the rollups"""
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    invoice_id = db.create_invoice(None, None, 1200, 0, 1200, 1200, 0, 1, guest_name='Guest')
+    db.add_invoice_item(invoice_id, 'Frame', 1, 'Wooden Frame', 1, 1200, 1200, 700)
+    db.execute_update('DELETE FROM invoices WHERE id = ?', (invoice_id,))
+    db.execute_update('DELETE FROM invoice_items WHERE invoice_id = ?', (invoice_id,))
+
+    assert db.get_daily_rollups(today, today, item_type='Frame')[0]['quantity'] == 0
+    assert _assert_matches_rebuild(db) == []
+    print("✅ Document-first delete leaves no stale line totals")
+    db.pool.close()
+
+
+def test_rebuild_matches_seeded_data(seeded_db):
+    """Triggers on a bulk-loaded database agree with a full rebuild"""
+    db_path = seeded_db(customers=100, bills=400, invoices=400,
+                        bookings=50, expenses=100, days=90)
+    before = _rollup_rows(db_path)
+    rows = rebuild_daily_rollups(db_path)
+
+    assert rows > 0
+    assert _rollup_rows(db_path) == before
+
+    conn = sqlite3.connect(db_path)
+    raw = conn.execute('SELECT ROUND(SUM(total_amount), 2) FROM invoices').fetchone()[0]
+    rolled = conn.execute("SELECT ROUND(SUM(amount), 2) FROM daily_rollups "
+                          "WHERE source = 'invoice' AND item_type = ''").fetchone()[0]
+    conn.close()
+    assert raw == rolled
+    print(f"✅ Rebuild reproduced {rows} rollup rows")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING DAILY ROLLUPS")
+    print("="*60)
+
+    # The tests take fixtures from conftest.py, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All daily rollup tests passed")
+
+
+if __name__ == "__main__":
+    main()
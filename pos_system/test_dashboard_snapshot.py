@@ -0,0 +1,104 @@
+"""
+Test the combined dashboard snapshot
+Tests: Snapshot matches the per-KPI methods, typed result shape,
+       statement count, period income/expense summary
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from services.dashboard_service import DashboardService, DashboardSnapshot, FrameProfit
+
+
+@pytest.fixture
+def service(seeded_db):
+    """Dashboard service over a small synthetic database"""
+    return DashboardService(seeded_db(customers=200, bills=300, invoices=600,
+                                      bookings=100, expenses=100, days=60))
+
+
+def test_snapshot_matches_individual_queries(service):
+    """Every snapshot KPI equals the value from its dedicated method"""
+    snapshot = service.get_dashboard_snapshot(include_frame_profit=True)
+
+    assert isinstance(snapshot, DashboardSnapshot)
+    assert isinstance(snapshot.monthly_frame_profit, FrameProfit)
+    assert snapshot.total_invoices == service.get_total_invoices() == 600
+    assert snapshot.today_invoices == service.get_today_invoices()
+    assert abs(snapshot.today_sales - service.get_today_sales()) < 0.01
+    assert abs(snapshot.pending_balances - service.get_pending_balances()) < 0.01
+    assert abs(snapshot.weekly_sales - service.get_weekly_sales()) < 0.01
+    assert abs(snapshot.monthly_sales - service.get_monthly_sales()) < 0.01
+    assert snapshot.total_customers == service.get_total_customers()
+    assert snapshot.pending_bookings == service.get_pending_bookings()
+    assert snapshot.low_stock_frames == service.get_low_stock_frames()
+
+    for field_name, method in (('frame_profit', service.get_frame_profit_stats),
+                               ('today_frame_profit', service.get_today_frame_profit),
+                               ('monthly_frame_profit', service.get_monthly_frame_profit)):
+        expected = method()
+        actual = getattr(snapshot, field_name)
+        assert actual.total_frames_sold == expected['total_frames_sold'], field_name
+        assert abs(actual.net_profit - expected['net_profit']) < 0.01, field_name
+
+    print(f"✅ Snapshot matches individual KPIs ({snapshot.total_invoices} invoices)")
+
+
+def test_snapshot_dict_shape(service):
+    """as_dict keeps the keys the dashboard frame reads"""
+    admin_stats = service.get_admin_dashboard_stats()
+    staff_stats = service.get_dashboard_stats()
+
+    for key in ('today_sales', 'today_invoices', 'total_invoices', 'pending_balances',
+                'total_customers', 'pending_bookings', 'low_stock_frames',
+                'weekly_sales', 'monthly_sales'):
+        assert key in admin_stats and key in staff_stats, key
+    assert set(admin_stats['frame_profit']) == {'total_frames_sold', 'total_buying_cost',
+                                                'total_selling_amount', 'net_profit'}
+    assert 'frame_profit' not in staff_stats
+    print("✅ Snapshot dictionary keeps the dashboard keys")
+
+
+def test_snapshot_statement_count(service):
+    """The whole admin dashboard is computed with two queries"""
+    statements = []
+
+    with service.pool.connection() as conn:
+        conn.set_trace_callback(statements.append)
+        service.get_dashboard_snapshot(include_frame_profit=True)
+        conn.set_trace_callback(None)
+
+    queries = [sql for sql in statements if sql.lstrip().upper().startswith(('SELECT', 'WITH'))]
+    assert len(queries) == 2, queries
+    assert statements[0] == 'BEGIN'
+    print("✅ Admin snapshot issued 2 queries in one read transaction")
+
+
+def test_snapshot_period_summary(service):
+    """Period income and expenses follow the requested range"""
+    start, end = '2000-01-01', '2100-12-31'
+
+    snapshot = service.get_dashboard_snapshot(start, end)
+    assert abs(snapshot.period_income - service.get_income_by_range(start, end)) < 0.01
+    assert abs(snapshot.period_expenses - service.get_expenses_by_range(start, end)) < 0.01
+    assert snapshot.period_start == start and snapshot.period_end == end
+    print(f"✅ Period summary: income LKR {snapshot.period_income:,.2f}, "
+          f"expenses LKR {snapshot.period_expenses:,.2f}")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING DASHBOARD SNAPSHOT")
+    print("="*60)
+
+    # The tests take fixtures from conftest.py, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All dashboard snapshot tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Test keyset pagination for bill and invoice history
+Tests: Pages cover every matching row exactly once in newest-first order,
+       SQL filters match the old Python filters, counts, item counts,
+       booking fields on invoices, delete one bill, delete all bills
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from database import DatabaseManager
+
+
+@pytest.fixture
+def db(seeded_db):
+    """DatabaseManager over a small synthetic database (instead of the empty one from conftest)"""
+    return DatabaseManager(seeded_db(customers=100, bills=700, invoices=700,
+                                     bookings=200, expenses=10, days=90))
+
+
+def _all_pages(fetch, page_size):
+    """Follow the cursors until the listing is exhausted"""
+    rows, cursor = fetch(None, page_size)
+    pages = 1
+    while cursor is not None:
+        page, cursor = fetch(cursor, page_size)
+        rows.extend(page)
+        pages += 1
+    return rows, pages
+
+
+def _newest_first(rows):
+    """Expected listing order"""
+    return sorted(rows, key=lambda row: (row['created_at'], row['id']), reverse=True)
+
+
+def test_bill_pages_match_python_filters(db):
+    """Every filter combination pages through the same rows the old code kept"""
+    every_bill = db.get_all_bills(limit=100000)
+
+    customer_filters = {
+        'all': lambda b: True,
+        'registered': lambda b: b['customer_id'] is not None,
+        'guest': lambda b: b['customer_id'] is None and b['guest_name'],
+    }
+    payment_filters = {
+        'all': lambda b: True,
+        'paid': lambda b: (b.get('balance_due', 0) or 0) == 0,
+        'pending': lambda b: (b.get('balance_due', 0) or 0) > 0,
+    }
+
+    for customer_type, keep_customer in customer_filters.items():
+        for payment_status, keep_payment in payment_filters.items():
+            expected = _newest_first([b for b in every_bill if keep_customer(b) and keep_payment(b)])
+            rows, pages = _all_pages(
+                lambda cursor, size: db.get_bills_page(customer_type, payment_status,
+                                                       cursor=cursor, page_size=size), 64)
+            assert [b['id'] for b in rows] == [b['id'] for b in expected], (customer_type, payment_status)
+            assert db.count_bills(customer_type, payment_status) == len(expected)
+            assert pages == len(expected) // 64 + 1
+
+    print(f"✅ Bill pages match Python filters ({len(every_bill)} bills)")
+
+
+def test_invoice_pages_with_status_and_search(db):
+    """Booking-only, status and search filters run in SQL"""
+    every_invoice = db.get_all_invoices(limit=100000)
+    statuses = {row['id']: row['status'] for row in db.get_all_bookings()}
+
+    booking_invoices = [inv for inv in every_invoice
+                        if inv['invoice_number'].startswith('BK-') or inv.get('booking_id')]
+    for status in ('All', 'Pending', 'Completed', 'Cancelled'):
+        expected = _newest_first([inv for inv in booking_invoices if status == 'All'
+                                  or statuses.get(inv.get('booking_id'), 'Completed') == status])
+        rows, _ = _all_pages(
+            lambda cursor, size: db.get_invoices_page(booking_only=True, status=status,
+                                                      cursor=cursor, page_size=size), 50)
+        assert [inv['id'] for inv in rows] == [inv['id'] for inv in expected], status
+        assert db.count_invoices(booking_only=True, status=status) == len(expected)
+
+    term = every_invoice[0]['invoice_number']
+    rows, cursor = db.get_invoices_page(search_term=term)
+    assert cursor is None and [inv['id'] for inv in rows] == [every_invoice[0]['id']]
+    assert db.get_invoices_page()[0] == _newest_first(every_invoice)[:100]
+    print(f"✅ Invoice pages filter by booking status and search ({len(booking_invoices)} booking invoices)")
+
+
+def test_bill_item_counts(db):
+    """Listings carry each bill's item count without a per-row query"""
+    bills, _ = db.get_bills_page(page_size=200)
+    listed = db.get_all_bills(limit=200)
+    searched = db.search_bills(bills[0]['bill_number'])
+
+    for bill in bills + listed + searched:
+        assert bill['item_count'] == len(db.get_bill_items(bill['id'])), bill['bill_number']
+    assert any(bill['item_count'] > 1 for bill in bills)
+    print("✅ Bill listings include item counts")
+
+
+def test_invoice_booking_fields(db):
+    """Invoice listings carry the booking category and status from their join"""
+    invoices, _ = db.get_invoices_page(booking_only=True, page_size=200)
+    listed = db.get_all_invoices(limit=200)
+    searched = db.search_invoices(invoices[0]['invoice_number'])
+
+    for invoice in invoices + listed + searched:
+        booking = db.get_booking_by_id(invoice['booking_id']) if invoice['booking_id'] else None
+        assert invoice['booking_category'] == (booking['photoshoot_category'] if booking else None)
+        assert invoice['booking_status'] == (booking['status'] if booking else None)
+    assert any(invoice['booking_category'] for invoice in invoices)
+    print("✅ Invoice listings include booking category and status")
+
+
+def test_delete_bill(db):
+    """Deleting one bill removes it and its items and leaves the rest"""
+    bill = db.get_all_bills(limit=1)[0]
+    assert db.get_bill_items(bill['id'])
+
+    assert db.delete_bill(bill['id'])
+    assert db.count_bills() == 699
+    assert db.get_bill_by_number(bill['bill_number']) is None
+    assert db.get_bill_items(bill['id']) == []
+    assert not db.delete_bill(bill['id'])
+    print("✅ Delete bill removed the bill and its items")
+
+
+def test_delete_all_bills(db):
+    """Delete all bills removes bills and their items in one write"""
+    assert db.count_bills() == 700
+
+    assert db.delete_all_bills()
+    assert db.count_bills() == 0
+    assert db.execute_query('SELECT COUNT(*) as n FROM bill_items')[0]['n'] == 0
+    assert db.get_bills_page() == ([], None)
+    print("✅ Delete all bills cleared bills and items")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING HISTORY PAGINATION")
+    print("="*60)
+
+    # The tests take fixtures from conftest.py, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All history pagination tests passed")
+
+
+if __name__ == "__main__":
+    main()
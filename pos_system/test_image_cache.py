@@ -0,0 +1,128 @@
+"""
+Test the image asset cache
+Tests: Memory and on-disk reuse of rendered variants, invalidation when the
+       file changes, circular avatar masks, bundled asset keys
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from PIL import Image
+
+from utils import image_cache
+from utils.image_cache import ImageCache
+
+
+class CountingCache(ImageCache):
+    """ImageCache counting how often an original is decoded"""
+
+    decodes = 0
+
+    def get(self, path, size=None, mask=None):
+        opened = Image.open
+
+        def counting_open(*args, **kwargs):
+            if args and args[0] == path:
+                CountingCache.decodes += 1
+            return opened(*args, **kwargs)
+
+        image_cache.Image.open = counting_open
+        try:
+            return super().get(path, size, mask)
+        finally:
+            image_cache.Image.open = opened
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """Directory with a source picture and an empty thumbnail store"""
+    root = str(tmp_path)
+    source = os.path.join(root, 'photo.png')
+    Image.new('RGB', (300, 200), (200, 30, 30)).save(source)
+    return root, source, os.path.join(root, 'thumbs')
+
+
+def test_variants_are_rendered_once(workspace):
+    """Repeat lookups come from memory, restarts from the thumbnail store"""
+    _, source, thumbs = workspace
+    CountingCache.decodes = 0
+    cache = CountingCache(thumbs)
+    first = cache.get(source, (64, 32))
+    assert first.size == (64, 32)
+    assert cache.get(source, (64, 32)) is first
+    assert CountingCache.decodes == 1
+    assert len(os.listdir(thumbs)) == 1
+
+    # A new process (new cache object) reads the stored thumbnail
+    restarted = CountingCache(thumbs)
+    again = restarted.get(source, (64, 32))
+    assert CountingCache.decodes == 1
+    assert again.size == (64, 32) and again.getpixel((10, 10))[:3] == (200, 30, 30)
+
+    # Originals at full size stay in memory only
+    assert cache.get(source).size == (300, 200)
+    assert len(os.listdir(thumbs)) == 1
+    print("✅ Variants rendered once, reused from memory and disk")
+
+
+def test_changed_file_invalidates(workspace):
+    """A new modification time renders again and replaces the old thumbnail"""
+    _, source, thumbs = workspace
+    cache = ImageCache(thumbs)
+    assert cache.get(source, (20, 20)).getpixel((5, 5))[:3] == (200, 30, 30)
+    old_files = os.listdir(thumbs)
+
+    Image.new('RGB', (300, 200), (10, 180, 10)).save(source)
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.get(source, (20, 20)).getpixel((5, 5))[:3] == (10, 180, 10)
+    new_files = os.listdir(thumbs)
+    assert len(new_files) == 1 and new_files != old_files
+    print("✅ Modified files are rendered again")
+
+
+def test_circle_mask(workspace):
+    """Avatars are centre-cropped and transparent outside the circle"""
+    _, source, thumbs = workspace
+    cache = ImageCache(thumbs)
+    avatar = cache.get(source, (40, 40), mask='circle')
+    assert avatar.mode == 'RGBA' and avatar.size == (40, 40)
+    assert avatar.getpixel((0, 0))[3] == 0
+    assert avatar.getpixel((20, 20)) == (200, 30, 30, 255)
+    assert cache.key(source, (40, 40), 'circle') != cache.key(source, (40, 40))
+    try:
+        cache.get(source, (40, 40), mask='hexagon')
+        assert False, "unknown mask accepted"
+    except ValueError:
+        pass
+    print("✅ Circular avatar masks")
+
+
+def test_bundled_assets_keyed_by_executable(workspace):
+    """Inside a PyInstaller bundle the exe's mtime versions the assets"""
+    root, source, thumbs = workspace
+    sys._MEIPASS = root
+    try:
+        name, version = image_cache.source_identity(source)
+    finally:
+        del sys._MEIPASS
+    assert name == 'photo.png'
+    assert version == os.stat(sys.executable).st_mtime_ns
+    print("✅ Bundled assets keyed by relative path and exe version")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING IMAGE ASSET CACHE")
+    print("="*60)
+
+    # The tests take fixtures, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All image cache tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Test the versioned schema migrations
+Tests: Fresh database, steady-state startup cost, upgrading a legacy
+       database, failed migrations rolling back
+"""
+
+import os
+import sys
+import sqlite3
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from database import DatabaseManager, initialize_database
+from database.migrations import MIGRATIONS, get_schema_version, run_migrations
+
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def test_fresh_database_reaches_latest_version(db_path):
+    """A new database runs every migration and gets default data"""
+    conn = sqlite3.connect(db_path)
+    assert get_schema_version(conn) == LATEST_VERSION
+    assert conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 2
+    assert conn.execute("SELECT COUNT(*) FROM number_sequences").fetchone()[0] == 0
+    conn.close()
+    print(f"✅ Fresh database migrated to version {LATEST_VERSION}")
+
+
+def test_steady_state_is_one_pragma_read(db_path):
+    """An up-to-date database is checked with a single statement"""
+    conn = sqlite3.connect(db_path)
+    statements = []
+    conn.set_trace_callback(statements.append)
+    assert run_migrations(conn) == 0
+    conn.close()
+
+    assert statements == ['PRAGMA user_version']
+    print("✅ Steady-state startup runs only PRAGMA user_version")
+
+
+def test_legacy_database_upgraded(empty_db_path):
+    """An unversioned database from an old release keeps its data"""
+    db_path = empty_db_path
+    conn = sqlite3.connect(db_path)
+    conn.executescript('''
+        CREATE TABLE users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            role TEXT NOT NULL,
+            full_name TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            is_active INTEGER DEFAULT 1
+        );
+        CREATE TABLE invoices (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            invoice_number TEXT UNIQUE NOT NULL,
+            customer_id INTEGER NOT NULL,
+            subtotal REAL NOT NULL,
+            discount REAL DEFAULT 0,
+            total_amount REAL NOT NULL,
+            paid_amount REAL NOT NULL,
+            balance_amount REAL NOT NULL,
+            created_by INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        INSERT INTO invoices (invoice_number, customer_id, subtotal, total_amount,
+                              paid_amount, balance_amount, created_by, created_at)
+        VALUES ('INV000007', 1, 1500, 1500, 1500, 0, 1, '2024-03-01 10:00:00');
+    ''')
+    conn.commit()
+    conn.close()
+
+    initialize_database(db_path)
+
+    conn = sqlite3.connect(db_path)
+    assert get_schema_version(conn) == LATEST_VERSION
+    columns = {col[1]: col[3] for col in conn.execute("PRAGMA table_info(invoices)")}
+    assert columns['customer_id'] == 0
+    assert 'booking_id' in columns and 'guest_name' in columns
+    user_columns = [col[1] for col in conn.execute("PRAGMA table_info(users)")]
+    assert 'profile_picture' in user_columns and 'last_login' in user_columns
+    row = conn.execute("SELECT invoice_number, total_amount FROM invoices").fetchone()
+    assert row == ('INV000007', 1500)
+    indexes = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")]
+    assert 'idx_invoices_created_at' in indexes
+    conn.close()
+
+    # Numbering continues after the migrated invoice
+    db = DatabaseManager(db_path)
+    assert db.generate_invoice_number() == 'INV000008'
+    print("✅ Legacy database upgraded with data preserved")
+
+
+def test_failed_migration_rolls_back(empty_db_path):
+    """A failing step leaves the database at the last completed version"""
+    def create_notes(cursor):
+        cursor.execute("CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)")
+
+    def broken(cursor):
+        cursor.execute("CREATE TABLE half_done (id INTEGER PRIMARY KEY)")
+        cursor.execute("INSERT INTO missing_table VALUES (1)")
+
+    migrations = [(1, 'Create notes', create_notes), (2, 'Broken step', broken)]
+    conn = sqlite3.connect(empty_db_path)
+
+    try:
+        run_migrations(conn, migrations)
+        assert False, "Broken migration should raise"
+    except sqlite3.OperationalError:
+        pass
+
+    tables = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+    assert get_schema_version(conn) == 1
+    assert 'notes' in tables and 'half_done' not in tables
+
+    # Fixing the step lets the next start finish the upgrade
+    migrations[1] = (2, 'Fixed step', lambda cursor: cursor.execute("CREATE TABLE half_done (id INTEGER)"))
+    assert run_migrations(conn, migrations) == 1
+    assert get_schema_version(conn) == 2
+    conn.close()
+    print("✅ Failed migration rolled back and retried")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING SCHEMA MIGRATIONS")
+    print("="*60)
+
+    # The tests take fixtures from conftest.py, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All migration tests passed")
+
+
+if __name__ == "__main__":
+    main()
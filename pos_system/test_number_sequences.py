@@ -0,0 +1,110 @@
+"""
+Test race-free bill and invoice number allocation
+Tests: Sequential numbering, continuation after legacy numbers, invoice_prefix
+       setting, uniqueness under many threads and many processes
+"""
+
+import os
+import sys
+import threading
+import multiprocessing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from database import DatabaseManager
+
+
+def _create_guest_bills(db_path, count):
+    """Insert bills with auto-allocated numbers (runs in a child process)"""
+    db = DatabaseManager(db_path)
+    for _ in range(count):
+        db.create_bill(None, None, 100, 0, 100, 1, guest_name='Process Guest')
+    db.pool.close()
+
+
+def test_sequential_numbers(db):
+    """Numbers are allocated in order and stored on the row"""
+    first = db.create_bill(None, None, 100, 0, 100, 1, guest_name='A')
+    second = db.create_bill(None, None, 100, 0, 100, 1, guest_name='B')
+
+    assert db.get_bill_by_id(first)['bill_number'] == 'BILL000001'
+    assert db.get_bill_by_id(second)['bill_number'] == 'BILL000002'
+    assert db.generate_bill_number() == 'BILL000003'
+    print("✅ Sequential bill numbers allocated")
+    db.pool.close()
+
+
+def test_continues_after_existing_numbers(db):
+    """A new sequence starts after numbers issued before it existed"""
+    db.create_invoice('INV000041', None, 100, 0, 100, 100, 0, 1, guest_name='Legacy')
+    invoice_id = db.create_invoice(None, None, 100, 0, 100, 100, 0, 1, guest_name='New')
+
+    assert db.get_invoice_by_id(invoice_id)['invoice_number'] == 'INV000042'
+    print("✅ Sequence continues after legacy numbers")
+    db.pool.close()
+
+
+def test_invoice_prefix_setting(db_path):
+    """Invoice numbers follow the invoice_prefix setting"""
+    from services.settings_service import SettingsService
+    SettingsService(db_path).set_setting('invoice_prefix', 'SAS')
+    db = DatabaseManager(db_path)
+
+    invoice_id = db.create_invoice(None, None, 100, 0, 100, 100, 0, 1, guest_name='Prefixed')
+    assert db.get_invoice_by_id(invoice_id)['invoice_number'] == 'SAS000001'
+    print("✅ invoice_prefix setting applied")
+    db.pool.close()
+
+
+def test_unique_under_threads(db):
+    """Many threads creating bills never collide"""
+    def worker():
+        for _ in range(25):
+            assert db.create_bill(None, None, 100, 0, 100, 1, guest_name='Thread Guest')
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    numbers = [row['bill_number'] for row in db.execute_query('SELECT bill_number FROM bills')]
+    assert len(numbers) == 200
+    assert sorted(numbers) == [f"BILL{n:06d}" for n in range(1, 201)]
+    print("✅ 200 bills from 8 threads, no duplicates or gaps")
+    db.pool.close()
+
+
+def test_unique_under_processes(db_path):
+    """Separate processes (tills) sharing the file never collide"""
+    ctx = multiprocessing.get_context('spawn')
+
+    processes = [ctx.Process(target=_create_guest_bills, args=(db_path, 20)) for _ in range(4)]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+        assert p.exitcode == 0
+
+    db = DatabaseManager(db_path)
+    numbers = [row['bill_number'] for row in db.execute_query('SELECT bill_number FROM bills')]
+    assert len(numbers) == 80
+    assert sorted(numbers) == [f"BILL{n:06d}" for n in range(1, 81)]
+    print("✅ 80 bills from 4 processes, no duplicates or gaps")
+    db.pool.close()
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING DOCUMENT NUMBER SEQUENCES")
+    print("="*60)
+
+    # The tests take fixtures from conftest.py, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All sequence tests passed")
+
+
+if __name__ == "__main__":
+    main()
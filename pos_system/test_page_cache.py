@@ -0,0 +1,121 @@
+"""
+Test navigation page caching
+Tests: Pages are built once and re-shown, refreshed only after the database
+       changed, least recently used pages are destroyed past the bound
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from ui.components import PageCache
+
+
+class FakePage:
+    """Stands in for a CTk frame: records packing, refreshes and destruction"""
+    
+    def __init__(self, name):
+        self.name = name
+        self.packed = False
+        self.refreshes = 0
+        self.alive = True
+    
+    def pack(self, **kw):
+        self.packed = True
+    
+    def pack_forget(self):
+        self.packed = False
+    
+    def destroy(self):
+        self.alive = False
+    
+    def winfo_exists(self):
+        return self.alive
+    
+    def refresh(self):
+        self.refreshes += 1
+
+
+def test_data_version(db):
+    """The version token moves on writes from the writer and from this thread"""
+    before = db.data_version()
+    assert db.data_version() == before
+    db.get_all_customers()
+    assert db.data_version() == before
+
+    db.add_customer('Nimal Perera', '0771234567')
+    after_writer = db.data_version()
+    assert after_writer != before
+
+    with db.get_connection() as conn:
+        conn.execute("UPDATE customers SET full_name = 'Nimal Silva'")
+        conn.commit()
+    assert db.data_version() != after_writer
+    print("✅ Data version changes on every write")
+    db.pool.close()
+
+
+def test_pages_built_once_and_refreshed_when_stale(db):
+    """Re-visiting a page reuses it and reloads only after a write"""
+    pages = PageCache(db.data_version)
+    built = []
+
+    def build(name):
+        def make():
+            page = FakePage(name)
+            built.append(page)
+            return page
+        return make
+
+    bills = pages.show('bills', build('bills'))
+    billing = pages.show('billing', build('billing'))
+    assert not bills.packed and billing.packed
+
+    assert pages.show('bills', build('bills')) is bills
+    assert bills.packed and not billing.packed and bills.refreshes == 0
+
+    db.add_customer('Walk-in', '0700000000')
+    assert pages.show('billing', build('billing')) is billing and billing.refreshes == 1
+    assert pages.show('bills', build('bills')) is bills and bills.refreshes == 1
+    assert pages.show('billing', build('billing')) is billing and billing.refreshes == 1
+
+    # Choosing the page on screen again reloads it
+    pages.show('billing', build('billing'))
+    assert billing.refreshes == 2 and billing.packed
+    assert [page.name for page in built] == ['bills', 'billing']
+    print("✅ Pages are built once and refreshed only when stale")
+    db.pool.close()
+
+
+def test_lru_bound():
+    """Pages beyond the bound are destroyed, least recently shown first"""
+    pages = PageCache(lambda: 0, max_pages=2)
+    first = pages.show('a', lambda: FakePage('a'))
+    second = pages.show('b', lambda: FakePage('b'))
+    pages.show('a', lambda: FakePage('a'))
+    third = pages.show('c', lambda: FakePage('c'))
+
+    assert first.alive and third.alive and not second.alive
+    rebuilt = pages.show('b', lambda: FakePage('b'))
+    assert rebuilt is not second and not first.alive
+
+    pages.clear()
+    assert not third.alive and not rebuilt.alive and pages.current is None
+    print("✅ Page cache is bounded")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING PAGE CACHE")
+    print("="*60)
+
+    # The tests take fixtures from conftest.py, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All page cache tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Test the shared PDF style registry
+Tests: registry styles are read-only, every receipt and invoice generator
+       builds from the shared styles without changing them
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import TableStyle
+
+from services import pdf_styles as styles
+from services.bill_generator import BillGenerator
+from services.invoice_generator import InvoiceGenerator
+
+CUSTOMER = {'full_name': 'Nimal Perera', 'mobile_number': '0771234567'}
+INVOICE = {'invoice_number': 'INV000123', 'created_at': '2026-10-16 10:30', 'subtotal': 12500.0,
+           'discount': 500.0, 'category_service_cost': 0, 'total_amount': 12000.0,
+           'advance_payment': 2000.0, 'balance_amount': 10000.0}
+INVOICE_ITEMS = [{'item_name': f'Photo Frame {i} - 8x12', 'item_type': 'Frame', 'item_id': i,
+                  'quantity': 2, 'unit_price': 1250.0, 'total_price': 2500.0} for i in range(5)]
+BOOKING = {'customer_name': 'Nimal Perera', 'mobile_number': '0771234567', 'booking_date': '2026-10-20',
+           'photoshoot_category': 'Wedding - Full Day', 'full_amount': 85000.0, 'advance_payment': 25000.0}
+SETTLEMENT = {'booking_id': 42, 'settlement_date': '2026-10-16', 'original_booking_date': '2026-09-01',
+              'customer_name': 'Nimal Perera', 'mobile_number': '0771234567',
+              'photoshoot_category': 'Wedding - Full Day', 'full_amount': 85000.0,
+              'original_advance': 25000.0, 'final_payment': 60000.0, 'cash_received': 60500.0, 'change_given': 500.0}
+BILL = {'bill_number': 'BILL000123', 'created_at': '2026-10-16 10:30:00', 'created_by_name': 'Staff',
+        'subtotal': 7500.0, 'discount': 0, 'service_charge': 500.0, 'total_amount': 8000.0,
+        'advance_amount': 3000.0, 'balance_due': 5000.0, 'cash_given': 0}
+BILL_ITEMS = [{'item_name': f'Passport Photo set {i}', 'quantity': 1, 'total_price': 1500.0} for i in range(5)]
+RECEIPT = {'bill_number': 'BILL000123', 'original_date': '2026-10-01 09:00:00',
+           'settlement_date': '2026-10-16 10:30', 'total_amount': 8000.0, 'advance_paid': 3000.0,
+           'balance_settled': 5000.0, 'cash_received': 5500.0, 'change_given': 500.0}
+
+
+def registry_snapshot():
+    """Every shared style with its attributes or commands"""
+    snapshot = {}
+    for name in dir(styles):
+        value = getattr(styles, name)
+        if isinstance(value, ParagraphStyle):
+            snapshot[name] = dict(value.__dict__)
+        elif isinstance(value, TableStyle):
+            snapshot[name] = value.getCommands()
+    return snapshot
+
+
+def test_styles_are_read_only():
+    """Shared styles refuse changes; clones and row styles are separate objects"""
+    try:
+        styles.CELL.fontSize = 20
+        assert False, "shared paragraph style was changed"
+    except AttributeError:
+        pass
+    try:
+        styles.ITEMS_TABLE.add('BACKGROUND', (0, 0), (-1, -1), styles.BLACK)
+        assert False, "shared table style was changed"
+    except AttributeError:
+        pass
+    commands = styles.ITEMS_TABLE.getCommands()
+    commands.append(('BACKGROUND', (0, 0), (-1, -1), styles.BLACK))
+    assert len(styles.ITEMS_TABLE.getCommands()) == len(commands) - 1
+
+    bold = styles.SUMMARY_BOLD
+    assert (bold.fontSize, bold.alignment, bold.fontName) == (11, styles.SUMMARY.alignment, 'Helvetica-Bold')
+    assert styles.SUMMARY.fontName == 'Helvetica'
+    assert len(styles.zebra_rows(6)) == 5 and styles.zebra_rows(6) is not styles.zebra_rows(6)
+    print("✅ Shared PDF styles are read-only")
+
+
+def test_generators_share_styles(tmp_path, monkeypatch):
+    """Every generator builds its PDF from the registry and leaves it untouched"""
+    before = registry_snapshot()
+    output_dir = str(tmp_path)
+    monkeypatch.chdir(output_dir)  # generate_invoice opens the relative pos_database.db
+    invoices = InvoiceGenerator(output_dir)
+    bills = BillGenerator(output_dir)
+    for _ in range(2):
+        paths = [
+            invoices.generate_invoice(INVOICE, INVOICE_ITEMS, CUSTOMER),
+            invoices.generate_booking_invoice(BOOKING, 'Staff'),
+            invoices.generate_booking_invoice_reprint(BOOKING, 'Staff', 'BK-REPRINT'),
+            invoices.generate_booking_settlement_invoice(SETTLEMENT),
+            bills.generate_bill(BILL, BILL_ITEMS, CUSTOMER),
+            bills.generate_settlement_receipt(RECEIPT, BILL_ITEMS, CUSTOMER),
+        ]
+        for path in paths:
+            with open(path, 'rb') as pdf:
+                assert pdf.read(5) == b'%PDF-', path
+    assert os.path.basename(paths[-1]) == 'SETTLEMENT_BILL000123.pdf'
+    assert registry_snapshot() == before
+    print("✅ Invoices, bills and settlement receipts build from unchanged shared styles")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING PDF STYLE REGISTRY")
+    print("="*60)
+
+    # The tests take fixtures, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All PDF style tests passed")
+
+
+if __name__ == "__main__":
+    main()
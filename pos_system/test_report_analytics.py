@@ -0,0 +1,119 @@
+"""
+Test the shared report analytics
+Tests: Period datasets against direct queries, memoization per data version,
+       invalidation by writes from other connections, the dashboard's view
+"""
+
+import os
+import sys
+import sqlite3
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.report_analytics import ReportAnalytics, get_report_analytics
+from services.dashboard_service import DashboardService
+from benchmarks.seed_data import create_seeded_database, remove_database
+
+
+def _period():
+    end = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+    start = (datetime.now() - timedelta(days=20)).strftime('%Y-%m-%d')
+    return start, end
+
+
+def test_dataset_matches_direct_queries():
+    """Totals and detail rows agree with the raw tables"""
+    db_path = create_seeded_database(customers=200, bills=500, invoices=800,
+                                     bookings=300, expenses=200, days=40)
+    start, end = _period()
+    try:
+        dataset = ReportAnalytics(db_path).period_dataset(start, end)
+        analytics = dataset['analytics']
+
+        conn = sqlite3.connect(db_path)
+        completed, completed_total = conn.execute('''
+            SELECT COUNT(*), SUM(full_amount) FROM bookings
+            WHERE booking_date BETWEEN ? AND ? AND status = 'Completed'
+        ''', (start, end)).fetchone()
+        expense_count = conn.execute(
+            'SELECT COUNT(*) FROM manual_expenses WHERE expense_date BETWEEN ? AND ?', (start, end)).fetchone()[0]
+        invoice_total = conn.execute('''
+            SELECT SUM(total_amount) FROM invoices WHERE DATE(created_at) BETWEEN ? AND ?
+        ''', (start, end)).fetchone()[0]
+        booking_count = conn.execute(
+            'SELECT COUNT(*) FROM bookings WHERE booking_date BETWEEN ? AND ?', (start, end)).fetchone()[0]
+        conn.close()
+
+        assert completed > 0 and expense_count > 0
+        assert len(analytics['income_details']) == completed
+        assert abs(sum(row[3] for row in analytics['income_details']) - completed_total) < 0.01
+        assert len(analytics['expense_details']) == len(dataset['expenses']) == expense_count
+        assert len(analytics['booking_details']) == len(dataset['bookings']) == booking_count
+        assert abs(sum(item['amount'] for item in dataset['income']) - invoice_total) < 0.01
+        assert sum(status['count'] for status in analytics['booking_status'].values()) == booking_count
+
+        # Detail lists are newest first for the PDF tables, oldest first for the financial report
+        dates = [row[0] for row in analytics['booking_details']]
+        assert dates == sorted(dates, reverse=True)
+        assert [item['date'] for item in dataset['bookings']] == sorted(dates)
+    finally:
+        remove_database(db_path)
+    print("✅ Period datasets match direct queries")
+
+
+def test_memoized_until_data_changes():
+    """The same dataset is served until any connection writes a report table"""
+    db_path = create_seeded_database(customers=100, bills=200, invoices=300,
+                                     bookings=100, expenses=80, days=30)
+    start, end = _period()
+    try:
+        analytics = get_report_analytics(db_path)
+        first = analytics.period_dataset(start, end)
+        assert analytics.period_dataset(start, end) is first
+        assert analytics.period_dataset(start, start) is not first
+
+        # A write from another connection (another terminal or process)
+        conn = sqlite3.connect(db_path)
+        conn.execute('''
+            INSERT INTO bookings (customer_name, mobile_number, photoshoot_category,
+                                  full_amount, advance_payment, balance_amount,
+                                  booking_date, status, created_by)
+            VALUES ('Analytics Test', '0770000000', 'Wedding', 12345, 0, 12345, ?, 'Completed', 1)
+        ''', (end,))
+        conn.commit()
+        conn.close()
+
+        second = analytics.period_dataset(start, end)
+        assert second is not first
+        assert len(second['analytics']['income_details']) == len(first['analytics']['income_details']) + 1
+        assert second['analytics']['income_details'][0][1] == 'Analytics Test'
+
+        # Writes to tables the reports do not read leave the cache alone
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = 1")
+        conn.commit()
+        conn.close()
+        assert analytics.period_dataset(start, end) is second
+
+        # The dashboard reads the same memoized period
+        dashboard = DashboardService(db_path).get_period_analytics(start, end)
+        assert dashboard is second['analytics']
+    finally:
+        remove_database(db_path)
+    print("✅ Datasets are memoized per data version")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING REPORT ANALYTICS")
+    print("="*60)
+
+    test_dataset_matches_direct_queries()
+    test_memoized_until_data_changes()
+
+    print("\n🎉 All report analytics tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Test the background report job runner
+Tests: Results and progress, cancellation while queued and while running,
+       failures, executive reports built on the worker with progress
+"""
+
+import os
+import sys
+import threading
+from datetime import datetime
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.report_jobs import ReportJobRunner, DONE, FAILED, CANCELLED
+from benchmarks.seed_data import create_seeded_database, remove_database
+
+
+def test_result_and_progress():
+    """Progress reaches the job and the result is kept"""
+    runner = ReportJobRunner()
+    seen = []
+
+    def build(pages, progress=None):
+        for page in range(pages):
+            progress((page + 1) / pages, f"page {page + 1}")
+            seen.append(page)
+        return 'report.pdf'
+
+    job = runner.submit('Test report', build, 3)
+    assert job.wait(5)
+    assert job.status == DONE and job.result == 'report.pdf'
+    assert job.progress == 1.0 and seen == [0, 1, 2]
+    assert runner.jobs() == []
+
+    # Functions without a progress parameter run unchanged
+    plain = runner.submit('Plain', lambda a, b: a + b, 2, 3)
+    assert plain.wait(5) and plain.result == 5
+    runner.shutdown()
+    print("✅ Jobs report progress and keep their result")
+
+
+def test_cancellation():
+    """A running job stops at its next progress call; a queued one never runs"""
+    runner = ReportJobRunner()
+    started = threading.Event()
+    release = threading.Event()
+    ran = []
+
+    def slow(progress=None):
+        started.set()
+        release.wait(5)
+        progress(0.5, "halfway")
+        ran.append('slow finished')
+
+    running = runner.submit('Slow', slow)
+    queued = runner.submit('Queued', lambda: ran.append('queued ran'))
+    assert started.wait(5)
+    assert [job.name for job in runner.jobs()] == ['Slow', 'Queued']
+    running.cancel()
+    queued.cancel()
+    release.set()
+    assert running.wait(5) and queued.wait(5)
+    assert running.status == CANCELLED and queued.status == CANCELLED
+    assert ran == []
+    runner.shutdown()
+    print("✅ Running and queued jobs can be cancelled")
+
+
+def test_failure():
+    """Exceptions are recorded on the job"""
+    runner = ReportJobRunner()
+
+    def broken(progress=None):
+        raise ValueError("no data")
+
+    job = runner.submit('Broken', broken)
+    assert job.wait(5)
+    assert job.status == FAILED and job.message == 'no data'
+    assert isinstance(job.error, ValueError)
+    runner.shutdown()
+    print("✅ Failures are recorded")
+
+
+def test_executive_report_in_background():
+    """The executive monthly report builds on the worker and can be cancelled mid-build"""
+    from services.executive_report_generator import generate_monthly_report
+    db_path = create_seeded_database(customers=200, bills=2000, invoices=1000,
+                                     bookings=200, expenses=200, days=60)
+    today = datetime.now()
+    runner = ReportJobRunner()
+    messages = []
+    try:
+        job = runner.submit('Monthly', generate_monthly_report, db_path, today.year, today.month)
+        assert job.wait(120)
+        assert job.status == DONE, job.message
+        filepath = job.result['filepath']
+        assert os.path.exists(filepath)
+        os.remove(filepath)
+
+        # Cancel once ReportLab has laid out the first page
+        def cancelling(progress=None):
+            def watch(fraction, message=''):
+                messages.append(message)
+                if message.startswith("Writing page"):
+                    job.cancel()
+                progress(fraction, message)
+            return generate_monthly_report(db_path, today.year, today.month, progress=watch)
+
+        job = runner.submit('Monthly (cancelled)', cancelling)
+        assert job.wait(120)
+        assert job.status == CANCELLED
+        assert messages[0] == "Fetching report data..." and "Building PDF..." in messages
+        assert not os.path.exists(filepath), "cancelled build left a PDF behind"
+    finally:
+        runner.shutdown()
+        remove_database(db_path)
+    print("✅ Executive report generated and cancelled on the worker")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING BACKGROUND REPORT JOBS")
+    print("="*60)
+
+    test_result_and_progress()
+    test_cancellation()
+    test_failure()
+    test_executive_report_in_background()
+
+    print("\n🎉 All report job tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Test the debounced background search
+Tests: Keystrokes debounced into one query, superseded searches skipped or
+       dropped, cancel() stopping a queued query, worker shut down on destroy
+"""
+
+import os
+import sys
+import threading
+import time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from ui.components import SearchController
+
+
+class FakeWidget:
+    """Stands in for the frame: after() callbacks run only when the test drains them"""
+
+    def __init__(self):
+        self.pending = {}
+        self.bindings = {}
+        self.alive = True
+        self._next_id = 0
+
+    def after(self, ms, func, *args):
+        self._next_id += 1
+        after_id = f'after#{self._next_id}'
+        self.pending[after_id] = (func, args)
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def winfo_exists(self):
+        return self.alive
+
+    def bind(self, sequence, func, add=None):
+        self.bindings[sequence] = func
+
+    def drain(self, timeout=5.0):
+        """Run pending callbacks (polls included) until none are left"""
+        deadline = time.time() + timeout
+        while self.pending:
+            assert time.time() < deadline, "after() callbacks never settled"
+            after_id = next(iter(self.pending))
+            func, args = self.pending.pop(after_id)
+            func(*args)
+            time.sleep(0.001)
+
+
+class FakeEntry(FakeWidget):
+    """Stands in for the search entry"""
+
+    def __init__(self, text=''):
+        super().__init__()
+        self.text = text
+
+    def get(self):
+        return self.text
+
+
+class Event:
+    """Minimal Tk event"""
+
+    def __init__(self, widget):
+        self.widget = widget
+
+
+def _controller(query):
+    """SearchController over fakes; returns it with the widget, entry and delivered results"""
+    widget, entry, results = FakeWidget(), FakeEntry(), []
+    controller = SearchController(widget, entry, query,
+                                  lambda term, found: results.append((term, found)))
+    return controller, widget, entry, results
+
+
+def test_keystrokes_debounced():
+    """Typing restarts the delay, so only the final text is searched"""
+    queries = []
+
+    def query(term):
+        queries.append(term)
+        return [term.upper()]
+
+    controller, widget, entry, results = _controller(query)
+    assert '<KeyRelease>' in entry.bindings and '<Destroy>' in widget.bindings
+
+    for text in ('n', 'ni', 'nim'):
+        entry.text = text
+        entry.bindings['<KeyRelease>'](None)
+        assert len(widget.pending) == 1
+
+    widget.drain()
+    assert queries == ['nim']
+    assert results == [('nim', ['NIM'])]
+    print("✅ Keystrokes debounced into one query")
+
+
+def test_stale_generations_dropped():
+    """Queued searches are skipped and a running one's result is discarded"""
+    started, release = threading.Event(), threading.Event()
+    queries = []
+
+    def query(term):
+        queries.append(term)
+        if term == 'a':
+            started.set()
+            release.wait(5)
+        return [term]
+
+    controller, widget, entry, results = _controller(query)
+    entry.text = 'a'
+    controller.run_now()
+    assert started.wait(5)
+
+    # 'ab' queues behind the running 'a' and is superseded by 'abc' before it starts
+    entry.text = 'ab'
+    controller.run_now()
+    entry.text = 'abc'
+    controller.run_now()
+    release.set()
+
+    widget.drain()
+    assert queries == ['a', 'abc']
+    assert results == [('abc', ['abc'])]
+    print("✅ Superseded searches skipped or dropped")
+
+
+def test_cancel_stops_queued_query():
+    """cancel() drops a queued query and a pending delay"""
+    started, release = threading.Event(), threading.Event()
+    queries = []
+
+    def query(term):
+        queries.append(term)
+        if term == 'a':
+            started.set()
+            release.wait(5)
+        return [term]
+
+    controller, widget, entry, results = _controller(query)
+    entry.text = 'a'
+    controller.run_now()
+    assert started.wait(5)
+    entry.text = 'b'
+    controller.run_now()
+
+    controller.cancel()
+    release.set()
+    widget.drain()
+    controller._executor.submit(lambda: None).result(5)
+    assert queries == ['a']
+    assert results == []
+
+    controller.schedule()
+    assert len(widget.pending) == 1
+    controller.cancel()
+    assert widget.pending == {}
+    print("✅ cancel() stops queued queries")
+
+
+def test_destroy_shuts_down_worker():
+    """Destroying the widget stops the worker; children's events are ignored"""
+    controller, widget, entry, results = _controller(lambda term: [term])
+
+    widget.bindings['<Destroy>'](Event(entry))
+    controller._executor.submit(lambda: None).result(5)
+
+    widget.bindings['<Destroy>'](Event(widget))
+    with pytest.raises(RuntimeError):
+        controller._executor.submit(lambda: None)
+    print("✅ Worker shut down with the widget")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING SEARCH CONTROLLER")
+    print("="*60)
+
+    test_keystrokes_debounced()
+    test_stale_generations_dropped()
+    test_cancel_stops_queued_query()
+    test_destroy_shuts_down_worker()
+
+    print("\n🎉 All search controller tests passed")
+
+
+if __name__ == "__main__":
+    main()
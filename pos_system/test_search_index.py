@@ -0,0 +1,123 @@
+"""
+Test the full-text search index
+Tests: Prefix and token matching, document number digits, ranking,
+       triggers keep the index in step with edits to documents, customers
+       and bookings, rebuild matches incremental state
+"""
+
+import os
+import sys
+import sqlite3
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from database.migrations import SEARCH_DOCUMENTS
+from database.search_index import match_expression, rebuild_search_index
+
+
+def _index_rows(db_path):
+    """Every search row, by table"""
+    conn = sqlite3.connect(db_path)
+    rows = {table: conn.execute(f'SELECT rowid, number, names, mobiles FROM {table}_fts '
+                                f'ORDER BY rowid').fetchall()
+            for table in SEARCH_DOCUMENTS}
+    conn.close()
+    return rows
+
+
+def _assert_matches_rebuild(db):
+    """Trigger-maintained index equals a full rebuild"""
+    incremental = _index_rows(db.db_path)
+    conn = sqlite3.connect(db.db_path)
+    rebuild_search_index(conn.cursor())
+    conn.commit()
+    conn.close()
+    assert _index_rows(db.db_path) == incremental
+
+
+def test_match_expression():
+    """User input becomes quoted prefix tokens"""
+    assert match_expression('nimal per') == '"nimal"* "per"*'
+    assert match_expression('BILL-0001') == '"BILL"* "0001"*'
+    assert match_expression('"; DROP') == '"DROP"*'
+    assert match_expression(' -- ') == ''
+    print("✅ Search terms are tokenized into prefix queries")
+
+
+def test_prefix_and_number_search(db):
+    """Names, mobiles and document numbers match by prefix"""
+    nimal = db.add_customer('Nimal Perera', '0771234567')
+    db.add_customer('Kamal Silva', '0719876543')
+    bill_id = db.create_bill(None, nimal, 1000, 0, 1000, 1)
+    db.create_bill(None, None, 500, 0, 500, 1, guest_name='Walk-in Perera')
+    bill_number = db.get_bill_by_id(bill_id)['bill_number']
+
+    assert [c['full_name'] for c in db.search_customers('nim')] == ['Nimal Perera']
+    assert [c['full_name'] for c in db.search_customers('0771')] == ['Nimal Perera']
+    assert [c['full_name'] for c in db.search_customers('nimal per')] == ['Nimal Perera']
+    assert db.search_customers('imal') == []
+    assert db.search_customers('!!') == []
+
+    assert [b['id'] for b in db.search_bills(bill_number)] == [bill_id]
+    assert [b['id'] for b in db.search_bills(str(int(bill_number[-6:])))] == [bill_id]
+    assert len(db.search_bills('perera')) == 2
+    assert db.count_bills(search_term='walk') == 1
+    assert db.get_bills_page(search_term='0771')[0][0]['id'] == bill_id
+    print("✅ Prefix search over names, mobiles and document numbers")
+    db.pool.close()
+
+
+def test_ranking(db):
+    """Documents matching a term more often rank first"""
+    db.add_customer('Perera Silva', '0700000001')
+    db.add_customer('Perera Perera', '0700000002')
+    assert [c['full_name'] for c in db.search_customers('perera')] == ['Perera Perera', 'Perera Silva']
+    print("✅ Results are ranked by relevance")
+    db.pool.close()
+
+
+def test_triggers_follow_edits(db):
+    """Edits to documents and the rows they reference update the index"""
+    customer = db.add_customer('Sunil Fernando', '0751112223')
+    booking = db.create_booking('Booking Client', '0765554443', 'Wedding', 50000, 10000,
+                                '2026-01-10', 'Studio', '', 1)
+    db.create_invoice(None, customer, 1000, 0, 1000, 1000, 0, 1)
+    invoice_id = db.create_invoice(None, None, 2000, 0, 2000, 2000, 0, 1, booking_id=booking)
+    db.create_bill(None, customer, 700, 0, 700, 1)
+    _assert_matches_rebuild(db)
+
+    # Renaming a customer re-indexes their bills and invoices
+    assert db.update_customer(customer, 'Sunil Jayasuriya', '0751112223')
+    assert db.search_bills('fernando') == [] and db.search_invoices('fernando') == []
+    assert len(db.search_bills('jayasuriya')) == 1 and len(db.search_invoices('jayasuriya')) == 1
+
+    # Renaming a booking re-indexes its invoice
+    assert db.update_booking(booking, 'Renamed Client', '0765554443', 'Wedding', 50000, 10000,
+                             '2026-01-10', 'Studio', '', 'Pending')
+    assert [i['id'] for i in db.search_invoices('renamed')] == [invoice_id]
+    assert db.count_invoices(booking_only=True, search_term='renamed') == 1
+    _assert_matches_rebuild(db)
+
+    assert db.delete_invoice(invoice_id)
+    assert db.search_invoices('renamed') == []
+    assert db.delete_booking(booking)
+    assert db.search_bookings('renamed') == []
+    _assert_matches_rebuild(db)
+    print("✅ Triggers keep the search index in sync")
+    db.pool.close()
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING SEARCH INDEX")
+    print("="*60)
+
+    # The tests take fixtures from conftest.py, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All search index tests passed")
+
+
+if __name__ == "__main__":
+    main()
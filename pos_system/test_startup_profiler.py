@@ -0,0 +1,111 @@
+"""
+Test the startup profiler
+Tests: Enabling by flag or environment, nested phase timings, per-module
+       import timing, one JSON record appended per run
+"""
+
+import os
+import sys
+import json
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from utils.startup_profiler import StartupProfiler, CLI_FLAG, ENV_FLAG, ENV_LOG
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    """Path for a throwaway profile log"""
+    return str(tmp_path / 'startup_profile.jsonl')
+
+
+def test_disabled_by_default():
+    """Without the flag nothing is hooked or recorded"""
+    profiler = StartupProfiler()
+    hooks = list(sys.meta_path)
+    assert not profiler.start(argv=['main.py'], environ={})
+    with profiler.phase('ignored'):
+        pass
+    profiler.mark('ignored')
+    profiler.finish()
+    assert sys.meta_path == hooks
+    assert profiler.record()['phases'] == [] and profiler.record()['marks'] == []
+    print("✅ Profiler is off unless requested")
+
+
+def test_flag_and_environment(log_path):
+    """The CLI flag is consumed; the environment variable also enables it"""
+    argv = ['main.py', CLI_FLAG]
+    profiler = StartupProfiler()
+    assert profiler.start(argv=argv, environ={ENV_LOG: log_path})
+    assert argv == ['main.py'] and profiler.log_path == log_path
+    profiler.finish()
+
+    profiler = StartupProfiler()
+    assert profiler.start(argv=['main.py'], environ={ENV_FLAG: '1', ENV_LOG: log_path})
+    profiler.finish()
+    with open(log_path) as f:
+        assert len(f.readlines()) == 2
+    print("✅ Enabled by --profile-startup or POS_PROFILE_STARTUP")
+
+
+def test_phases_and_imports(log_path, tmp_path):
+    """Phases nest, imports are timed per module, finish writes once"""
+    package_dir = str(tmp_path / 'modules')
+    os.mkdir(package_dir)
+    with open(os.path.join(package_dir, 'profiled_outer.py'), 'w') as f:
+        f.write("import time\ntime.sleep(0.02)\nimport profiled_inner\n")
+    with open(os.path.join(package_dir, 'profiled_inner.py'), 'w') as f:
+        f.write("import time\ntime.sleep(0.03)\nVALUE = 7\n")
+    sys.path.insert(0, package_dir)
+
+    profiler = StartupProfiler()
+    profiler.start(argv=[], environ={ENV_FLAG: 'true', ENV_LOG: log_path})
+    try:
+        with profiler.phase('outer'):
+            with profiler.phase('imports'):
+                import profiled_outer
+            profiler.mark('imported')
+    finally:
+        profiler.finish()
+        sys.path.remove(package_dir)
+
+    assert profiled_outer.profiled_inner.VALUE == 7
+    assert profiled_outer.__loader__.__class__.__name__ != '_TimedLoader'
+    assert profiler._import_timer not in sys.meta_path
+
+    with open(log_path) as f:
+        records = [json.loads(line) for line in f]
+    assert len(records) == 1
+    record = records[0]
+    phases = {phase['name']: phase for phase in record['phases']}
+    assert [phase['name'] for phase in record['phases']] == ['outer', 'imports']
+    assert phases['outer']['depth'] == 0 and phases['imports']['depth'] == 1
+    assert phases['imports']['duration_ms'] >= 50
+    assert record['marks'][0]['name'] == 'imported'
+
+    imports = {name: (self_ms, cumulative_ms) for name, self_ms, cumulative_ms in record['imports']}
+    outer_self, outer_cumulative = imports['profiled_outer']
+    inner_self, inner_cumulative = imports['profiled_inner']
+    assert 20 <= outer_self < 30 <= inner_self
+    assert outer_cumulative >= outer_self + inner_cumulative - 1
+    profiler.finish()
+    with open(log_path) as f:
+        assert len(f.readlines()) == 1
+    print("✅ Phase and import timings recorded")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING STARTUP PROFILER")
+    print("="*60)
+
+    # The tests take fixtures, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All startup profiler tests passed")
+
+
+if __name__ == "__main__":
+    main()
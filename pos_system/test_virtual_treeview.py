@@ -0,0 +1,160 @@
+"""
+Test the virtualized Treeview
+Tests: Redraw selection changes hidden from the frame, offset clamping,
+       delete keeping the selection, see and keyboard bounds, identify_row
+These need a Tk display; they are skipped when there is none
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+tk = pytest.importorskip('tkinter')
+from tkinter import ttk
+
+from ui.components import VirtualTreeview
+
+
+@pytest.fixture
+def root():
+    """Tk root window, or skip without a display"""
+    try:
+        window = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"No display: {e}")
+    window.geometry('400x300')
+    yield window
+    window.destroy()
+
+
+@pytest.fixture
+def tree(root):
+    """VirtualTreeview showing five of 30 rows r0..r29"""
+    tree = VirtualTreeview(root, columns=('name', 'amount'), show='headings', height=5)
+    tree.pack()
+    tree.set_rows([(f'r{i}', (f'Row {i}', i * 100), ()) for i in range(30)])
+    root.update()
+    # Pin the window size the tests reason about
+    tree._visible = 5
+    tree._render()
+    root.update()
+    return tree
+
+
+def test_redraw_selection_not_reported(root, tree):
+    """Selection changes made by redrawing do not reach the frame's binding"""
+    events = []
+    tree.bind('<<TreeviewSelect>>', lambda e: events.append(tree.selection()))
+
+    tree.selection_set('r3')
+    root.update()
+    assert events == [('r3',)]
+
+    # Scrolling the selected row out of view and back redraws the Tk selection
+    tree.yview('scroll', 10, 'units')
+    root.update()
+    tree.yview('moveto', 0)
+    root.update()
+    assert events == [('r3',)]
+    assert tree._sync_events == 0
+    assert tree.selection() == ('r3',)
+    print("✅ Redraws do not fire <<TreeviewSelect>> for the frame")
+
+
+def test_offset_clamped(tree):
+    """Scrolling never leaves blank lines or goes above the first row"""
+    tree.yview('moveto', 1.0)
+    assert tree._offset == 25
+    assert tree.yview() == (25 / 30, 1.0)
+
+    tree.yview('scroll', -100, 'units')
+    assert tree._offset == 0
+
+    tree.yview('scroll', 3, 'pages')
+    assert tree._offset == 15
+
+    tree.set_rows([(None, ('Only',), ())])
+    assert tree._offset == 0 and len(tree._slots) == 1
+    assert tree.yview() == (0.0, 1.0)
+    tree.set_rows([])
+    assert tree._slots == [] and tree.yview() == (0.0, 1.0)
+    print("✅ Offset clamped to the row list")
+
+
+def test_delete_keeps_selection(tree):
+    """Deleting other rows keeps the selected row selected"""
+    tree.selection_set('r10')
+    tree.delete('r2', 'r5')
+    assert tree.row_count() == 28
+    assert tree.selection() == ('r10',)
+    assert tree.index('r10') == 8
+
+    tree.delete('r10')
+    assert tree.selection() == ()
+
+    with pytest.raises(tk.TclError):
+        tree.delete('missing')
+    print("✅ Delete keeps the selection by iid")
+
+
+def test_see_and_keys_stay_in_bounds(tree):
+    """see scrolls the least needed; arrow keys stop at the ends"""
+    tree.see('r20')
+    assert tree._offset == 16
+    tree.see('r18')
+    assert tree._offset == 16
+    tree.see('r3')
+    assert tree._offset == 3
+
+    tree._on_key('end')
+    assert tree.selection() == ('r29',) and tree._offset == 25
+    tree._on_key(1)
+    assert tree.selection() == ('r29',)
+    tree._on_key('page+')
+    assert tree.selection() == ('r29',)
+
+    tree._on_key('home')
+    assert tree.selection() == ('r0',) and tree._offset == 0
+    tree._on_key(-1)
+    assert tree.selection() == ('r0',)
+    tree._on_key('page+')
+    assert tree.selection() == ('r5',) and tree._offset == 1
+
+    tree.set_rows([])
+    assert tree._on_key(1) == 'break'
+    assert tree.selection() == ()
+    print("✅ see and keyboard navigation stay within the rows")
+
+
+def test_identify_row(root, tree):
+    """Window coordinates map to row iids, not to the reused Tk items"""
+    tree.yview('moveto', 10 / 30)
+    root.update()
+    assert tree._offset == 10
+
+    bbox = ttk.Treeview.bbox(tree, tree._slots[1])
+    assert bbox
+    assert tree.identify_row(bbox[1] + bbox[3] // 2) == 'r11'
+
+    below = ttk.Treeview.bbox(tree, tree._slots[-1])
+    tree.set_rows([(f'r{i}', (f'Row {i}', i), ()) for i in range(2)])
+    root.update()
+    assert tree.identify_row(below[1] + below[3] // 2) == ''
+    print("✅ identify_row returns row iids")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 TESTING VIRTUAL TREEVIEW")
+    print("="*60)
+
+    # The tests take fixtures and skip without a display, so run them through pytest
+    if pytest.main(['-q', '-s', __file__]) == 0:
+        print("\n🎉 All virtual treeview tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,33 @@
-from .components import LoginWindow, MessageDialog, BaseFrame
-from .customer_frame import CustomerManagementFrame
-from .service_frame import ServiceManagementFrame
-from .frame_frame import FrameManagementFrame
-from .billing_frame import BillingFrame
-from .booking_frame import BookingManagementFrame
-from .invoice_history_frame import InvoiceHistoryFrame
-from .sidebar import Sidebar
-from .dashboard_frame import DashboardFrame
-from .users_frame import UsersManagementFrame
-from .settings_frame import SettingsFrame
-from .support_frame import SupportFrame
-from .user_guide_frame import UserGuideFrame
-from .profile_frame import ProfileFrame
+import importlib
 
-__all__ = [
-    'LoginWindow',
-    'MessageDialog',
-    'BaseFrame',
-    'CustomerManagementFrame',
-    'ServiceManagementFrame',
-    'FrameManagementFrame',
-    'BillingFrame',
-    'BookingManagementFrame',
-    'InvoiceHistoryFrame',
-    'Sidebar',
-    'DashboardFrame',
-    'UsersManagementFrame',
-    'SettingsFrame',
-    'SupportFrame',
-    'UserGuideFrame',
-    'ProfileFrame'
-]
+# Frames are imported on first access so that importing ui.components (the
+# login path) does not pull in every page and the report libraries behind them
+_EXPORTS = {
+    'LoginWindow': '.components',
+    'MessageDialog': '.components',
+    'BaseFrame': '.components',
+    'CustomerManagementFrame': '.customer_frame',
+    'ServiceManagementFrame': '.service_frame',
+    'FrameManagementFrame': '.frame_frame',
+    'BillingFrame': '.billing_frame',
+    'BookingManagementFrame': '.booking_frame',
+    'InvoiceHistoryFrame': '.invoice_history_frame',
+    'Sidebar': '.sidebar',
+    'DashboardFrame': '.dashboard_frame',
+    'UsersManagementFrame': '.users_frame',
+    'SettingsFrame': '.settings_frame',
+    'SupportFrame': '.support_frame',
+    'UserGuideFrame': '.user_guide_frame',
+    'ProfileFrame': '.profile_frame',
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = list(_EXPORTS)
@@ -1,12 +1,11 @@
 import customtkinter as ctk
 from tkinter import ttk
-from ui.components import BaseFrame, MessageDialog
-from services.bill_generator import BillGenerator
+from ui.components import BaseFrame, MessageDialog, PagedTreeLoader, SearchController, VirtualTreeview
 from datetime import datetime
 import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils import resource_path
+from utils import LazyInstance
 
 
 class BillHistoryFrame(BaseFrame):
@@ -14,9 +13,12 @@ class BillHistoryFrame(BaseFrame):
     
     def __init__(self, parent, auth_manager, db_manager):
         super().__init__(parent, auth_manager, db_manager)
-        self.bill_generator = BillGenerator()
+        # Loads ReportLab on first use
+        self.bill_generator = LazyInstance('services.bill_generator:BillGenerator')
         self.filter_type = "all"  # 'all', 'registered', 'guest'
         self.payment_status = "all"  # 'all', 'paid', 'pending'
+        # Filters and search term of the rows currently shown, for paging
+        self.listing = ("all", "all", "")
         self.create_widgets()
         self.load_bills()
     
@@ -43,7 +45,7 @@ class BillHistoryFrame(BaseFrame):
         
         self.search_entry = ctk.CTkEntry(controls_frame, width=300, height=35, corner_radius=15, border_width=1)
         self.search_entry.pack(side="left", padx=10, pady=15)
-        self.search_entry.bind("<KeyRelease>", lambda e: self.search_bills())
+        self.search = SearchController(self, self.search_entry, self.query_bills, self.show_bills)
         
         # Payment Status Filter - MOVED TO LEFT
         payment_filter_frame = ctk.CTkFrame(controls_frame, fg_color="transparent")
@@ -218,7 +220,7 @@ class BillHistoryFrame(BaseFrame):
         table_container.pack(fill="both", expand=True, padx=10, pady=(0, 10))
         
         columns = ("Bill #", "Date", "Customer", "Mobile", "Items", "Total", "Paid", "Balance")
-        self.tree = ttk.Treeview(table_container, columns=columns, show="headings", height=18)
+        self.tree = VirtualTreeview(table_container, columns=columns, show="headings", height=18)
         
         self.tree.heading("Bill #", text="🔢 Bill #")
         self.tree.heading("Date", text="📅 Date")
@@ -244,7 +246,9 @@ class BillHistoryFrame(BaseFrame):
         self.tree.tag_configure('hasbalance', background='#3a2e1e', foreground='#ffd93d')
         
         scrollbar = ttk.Scrollbar(table_container, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        
+        # Pages of bills are fetched as the table is scrolled
+        self.loader = PagedTreeLoader(self.tree, scrollbar, self.fetch_bills_page, self.insert_bill_rows)
         
         self.tree.pack(side="left", fill="both", expand=True, padx=(5, 0), pady=5)
         scrollbar.pack(side="right", fill="y", pady=5, padx=(0, 5))
@@ -355,60 +359,59 @@ class BillHistoryFrame(BaseFrame):
             
             menu.focus_set()
     
+    def refresh(self):
+        """Reload bills for the current filters and search"""
+        self.load_bills()
+    
     def load_bills(self):
         """Load bills from bills table with filter support"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Get all bills
-        all_bills = self.db_manager.get_all_bills(limit=500)
-        
-        # Apply customer type filter
         self.filter_type = self.filter_var.get()
-        if self.filter_type == "registered":
-            bills = [b for b in all_bills if b['customer_id'] is not None]
-        elif self.filter_type == "guest":
-            bills = [b for b in all_bills if b['customer_id'] is None and b['guest_name']]
-        else:  # all
-            bills = all_bills
-        
-        # Apply payment status filter (NEW)
-        if self.payment_status == "paid":
-            bills = [b for b in bills if (b.get('balance_due', 0) or 0) == 0]
-        elif self.payment_status == "pending":
-            bills = [b for b in bills if (b.get('balance_due', 0) or 0) > 0]
-        
-        for i, bill in enumerate(bills):
+        self.search.run_now()
+    
+    def query_bills(self, search_term):
+        """Fetch the first page and total for the current filters (worker thread)"""
+        listing = (self.filter_type, self.payment_status, search_term)
+        page = self.db_manager.get_bills_page(*listing)
+        total = self.db_manager.count_bills(*listing)
+        return listing, page, total
+    
+    def show_bills(self, search_term, results):
+        """Show the first page of a finished search"""
+        self.listing, page, total = results
+        self.loader.reset(page)
+        
+        # Update record count
+        self.record_count_label.configure(text=f"{total} records")
+    
+    def fetch_bills_page(self, cursor):
+        """Fetch the next page of bills matching the current filters"""
+        return self.db_manager.get_bills_page(*self.listing, cursor=cursor)
+    
+    def insert_bill_rows(self, bills):
+        """Append a page of bills to the table"""
+        rows = []
+        for bill in bills:
             # Calculate balance
             balance = bill.get('balance_due', 0) or 0
             advance = bill.get('advance_amount', 0) or 0
             
-            # Highlight bills with pending balance
-            if balance > 0:
-                tag = 'hasbalance'
-            else:
-                tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            
-            # Count items for this bill
-            items = self.db_manager.get_bill_items(bill['id'])
-            item_count = len(items)
+            # Highlight bills with pending balance; the table stripes the rest
+            tags = ('hasbalance',) if balance > 0 else ()
             
             # Display mobile or "Guest Customer"
             mobile_display = bill['mobile_number'] if bill['mobile_number'] else 'Guest Customer'
             
-            self.tree.insert("", "end", values=(
+            rows.append((None, (
                 bill['bill_number'],
                 bill['created_at'],
                 bill['full_name'] or 'Unknown',
                 mobile_display,
-                item_count,
+                bill['item_count'],
                 f"{bill['total_amount']:.2f}",
                 f"{advance:.2f}",
                 f"{balance:.2f}"
-            ), tags=(tag,))
-        
-        # Update record count
-        self.record_count_label.configure(text=f"{len(bills)} records")
+            ), tags))
+        self.tree.append_rows(rows)
     
     def apply_filter(self):
         """Apply the selected filter and reload bills"""
@@ -426,63 +429,8 @@ class BillHistoryFrame(BaseFrame):
     
     def search_bills(self):
         """Search bills with filter support"""
-        search_term = self.search_entry.get().strip()
-        
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        if not search_term:
-            self.load_bills()
-            return
-        
-        # Search in bills table
-        all_bills = self.db_manager.search_bills(search_term)
-        
-        # Apply customer type filter
-        self.filter_type = self.filter_var.get()
-        if self.filter_type == "registered":
-            bills = [b for b in all_bills if b['customer_id'] is not None]
-        elif self.filter_type == "guest":
-            bills = [b for b in all_bills if b['customer_id'] is None and b['guest_name']]
-        else:  # all
-            bills = all_bills
-        
-        # Apply payment status filter (NEW)
-        if self.payment_status == "paid":
-            bills = [b for b in bills if (b.get('balance_due', 0) or 0) == 0]
-        elif self.payment_status == "pending":
-            bills = [b for b in bills if (b.get('balance_due', 0) or 0) > 0]
-        
-        for i, bill in enumerate(bills):
-            # Calculate balance
-            balance = bill.get('balance_due', 0) or 0
-            advance = bill.get('advance_amount', 0) or 0
-            
-            if balance > 0:
-                tag = 'hasbalance'
-            else:
-                tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            
-            # Count items for this bill
-            items = self.db_manager.get_bill_items(bill['id'])
-            item_count = len(items)
-            
-            # Display mobile or "Guest Customer"
-            mobile_display = bill['mobile_number'] if bill['mobile_number'] else 'Guest Customer'
-            
-            self.tree.insert("", "end", values=(
-                bill['bill_number'],
-                bill['created_at'],
-                bill['full_name'] or 'Unknown',
-                mobile_display,
-                item_count,
-                f"{bill['total_amount']:.2f}",
-                f"{advance:.2f}",
-                f"{balance:.2f}"
-            ), tags=(tag,))
-        
-        # Update record count
-        self.record_count_label.configure(text=f"{len(bills)} records")
+        # The search term is applied in SQL alongside the filters
+        self.search.run_now()
     
     def view_bill_details(self):
         """View detailed bill information"""
@@ -685,16 +633,12 @@ Balance Due: LKR {balance:.2f}
             MessageDialog.show_error("Error", "Bill not found")
             return
         
-        # Delete bill and its items
-        try:
-            # Delete bill items first
-            self.db_manager.execute_query('DELETE FROM bill_items WHERE bill_id = ?', (bill['id'],))
-            # Delete bill
-            self.db_manager.execute_query('DELETE FROM bills WHERE id = ?', (bill['id'],))
+        # Delete bill and its items in one write
+        if self.db_manager.delete_bill(bill['id']):
             MessageDialog.show_success("Success", f"Bill {bill_number} deleted successfully")
             self.load_bills()
-        except Exception as e:
-            MessageDialog.show_error("Error", f"Failed to delete bill: {str(e)}")
+        else:
+            MessageDialog.show_error("Error", f"Failed to delete bill {bill_number}")
         
         # Restore focus to main window
         self.restore_focus()
@@ -707,8 +651,7 @@ Balance Due: LKR {balance:.2f}
             return
         
         # Get total count
-        all_bills = self.db_manager.get_all_bills(limit=10000)
-        total_count = len(all_bills)
+        total_count = self.db_manager.count_bills()
         
         if total_count == 0:
             MessageDialog.show_info("No Bills", "There are no bills to delete")
@@ -739,19 +682,14 @@ Balance Due: LKR {balance:.2f}
         
         # Proceed with deletion
         try:
-            deleted_count = 0
-            for bill in all_bills:
-                # Delete bill items first
-                self.db_manager.execute_query('DELETE FROM bill_items WHERE bill_id = ?', (bill['id'],))
-                # Delete bill
-                self.db_manager.execute_query('DELETE FROM bills WHERE id = ?', (bill['id'],))
-                deleted_count += 1
-            
-            MessageDialog.show_success(
-                "Success", 
-                f"Successfully deleted {deleted_count} bills from the system."
-            )
-            self.load_bills()
+            if self.db_manager.delete_all_bills():
+                MessageDialog.show_success(
+                    "Success", 
+                    f"Successfully deleted {total_count} bills from the system."
+                )
+                self.load_bills()
+            else:
+                MessageDialog.show_error("Error", "Failed to delete bills")
         except Exception as e:
             MessageDialog.show_error("Error", f"Failed to delete bills: {str(e)}")
         
@@ -1053,7 +991,7 @@ Mobile: {bill.get('mobile_number', 'Guest Customer')}"""
                     }
                 
                 # Generate settlement receipt
-                pdf_path = self.generate_settlement_receipt(settlement_data, items, customer)
+                pdf_path = self.bill_generator.generate_settlement_receipt(settlement_data, items, customer)
                 
                 MessageDialog.show_success("Success", f"Balance settled successfully!\nReceipt generated.")
                 close_dialog()
@@ -1091,267 +1029,3 @@ Mobile: {bill.get('mobile_number', 'Guest Customer')}"""
         ).pack(side="left", padx=10)
         
         cash_entry.focus()
-    
-    def generate_settlement_receipt(self, settlement_data, items, customer):
-        """Generate a professional settlement receipt"""
-        from reportlab.lib.pagesizes import letter
-        from reportlab.lib.units import inch, mm
-        from reportlab.lib.styles import ParagraphStyle
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-        from reportlab.lib import colors
-        
-        filename = f"SETTLEMENT_{settlement_data['bill_number']}.pdf"
-        filepath = os.path.join(self.bill_generator.bills_folder, filename)
-        
-        # Thermal receipt size
-        page_width = 80 * mm
-        page_height = 250 * mm
-        
-        doc = SimpleDocTemplate(
-            filepath,
-            pagesize=(page_width, page_height),
-            leftMargin=3*mm,
-            rightMargin=3*mm,
-            topMargin=3*mm,
-            bottomMargin=3*mm
-        )
-        
-        story = []
-        
-        # Define styles with pure black on white - no gray
-        header_style = ParagraphStyle(
-            'Header',
-            fontSize=11,
-            textColor=colors.black,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold',
-            spaceAfter=0,
-            spaceBefore=0,
-            leading=13
-        )
-        
-        subheader_style = ParagraphStyle(
-            'Subheader',
-            fontSize=8,
-            textColor=colors.black,
-            alignment=TA_CENTER,
-            fontName='Helvetica',
-            spaceAfter=0,
-            spaceBefore=0,
-            leading=10
-        )
-        
-        left_meta_style = ParagraphStyle(
-            'LeftMeta',
-            fontSize=8,
-            textColor=colors.black,
-            alignment=TA_LEFT,
-            fontName='Helvetica',
-            spaceAfter=0,
-            spaceBefore=0,
-            leading=10
-        )
-        
-        right_total_style = ParagraphStyle(
-            'RightTotal',
-            fontSize=8,
-            textColor=colors.black,
-            alignment=TA_RIGHT,
-            fontName='Helvetica',
-            spaceAfter=2,
-            spaceBefore=0,
-            leading=10
-        )
-        
-        grand_total_style = ParagraphStyle(
-            'GrandTotal',
-            fontSize=10,
-            textColor=colors.black,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold',
-            spaceAfter=2,
-            spaceBefore=0,
-            leading=12
-        )
-        
-        footer_style = ParagraphStyle(
-            'Footer',
-            fontSize=7,
-            textColor=colors.black,
-            fontName='Helvetica',
-            alignment=TA_CENTER,
-            spaceAfter=0,
-            spaceBefore=0,
-            leading=9
-        )
-        
-        def create_solid_line():
-            """Create a solid black line divider"""
-            from reportlab.platypus import Table as ReportLabTable
-            line_data = [['']]
-            line_table = ReportLabTable(line_data, colWidths=[74*mm])
-            line_table.setStyle(TableStyle([
-                ('LINEABOVE', (0, 0), (-1, 0), 0.5, colors.black),
-                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-            ]))
-            return line_table
-        
-        # === HEADER WITH LOGO ===
-        logo_path = resource_path(os.path.join('assets', 'logos', 'billLogo.png'))
-        if os.path.exists(logo_path):
-            try:
-                logo = Image(logo_path, width=50*mm, height=15*mm)
-                logo.hAlign = 'CENTER'
-                story.append(logo)
-                story.append(Spacer(1, 2*mm))
-            except:
-                pass
-        
-        # Official Studio Details
-        story.append(Paragraph("<b>Shine Art Studio</b>", header_style))
-        story.append(Paragraph("No: 52/1/1, Maravila Road, Nattandiya", subheader_style))
-        story.append(Paragraph("Reg No: 26/3610", subheader_style))
-        story.append(Paragraph("Tel: 0767898604 / 0322051680", subheader_style))
-        story.append(Spacer(1, 3*mm))
-        story.append(create_solid_line())
-        story.append(Spacer(1, 3*mm))
-        
-        # === SETTLEMENT RECEIPT TITLE ===
-        story.append(Paragraph("<b>BALANCE SETTLEMENT RECEIPT</b>", header_style))
-        story.append(Spacer(1, 3*mm))
-        
-        # Extract date from original date
-        original_date = settlement_data['original_date']
-        if ' ' in original_date:
-            advance_date_display = original_date.split(' ')[0]
-        else:
-            advance_date_display = original_date
-        
-        # Bill and Customer Details (Left-Aligned)
-        story.append(Paragraph(f"<b>Bill No:</b> {settlement_data['bill_number']}", left_meta_style))
-        story.append(Paragraph(f"<b>Original Advance Date:</b> {advance_date_display}", left_meta_style))
-        story.append(Spacer(1, 2*mm))
-        
-        story.append(Paragraph(f"<b>Customer:</b> {customer['full_name']}", left_meta_style))
-        story.append(Paragraph(f"<b>Mobile:</b> {customer['mobile_number']}", left_meta_style))
-        story.append(Spacer(1, 2*mm))
-        
-        story.append(Paragraph(f"<b>Settlement Date:</b> {settlement_data['settlement_date']}", left_meta_style))
-        story.append(Spacer(1, 3*mm))
-        story.append(create_solid_line())
-        story.append(Spacer(1, 3*mm))
-        
-        # === PAYMENT HISTORY ===
-        story.append(Paragraph("<b>Payment History</b>", header_style))
-        story.append(Spacer(1, 2*mm))
-        
-        # Create financial breakdown table for proper alignment
-        financial_data = [
-            ['Original Total Amount:', f'Rs. {settlement_data["total_amount"]:.2f}'],
-            [f'Advance Paid ({advance_date_display}):', f'Rs. {settlement_data["advance_paid"]:.2f}'],
-            ['Remaining Balance:', f'Rs. {settlement_data["balance_settled"]:.2f}']
-        ]
-        
-        financial_table = Table(financial_data, colWidths=[45*mm, 29*mm])
-        financial_table.setStyle(TableStyle([
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 2),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ]))
-        
-        story.append(financial_table)
-        story.append(Spacer(1, 3*mm))
-        story.append(create_solid_line())
-        story.append(Spacer(1, 3*mm))
-        
-        # === ITEMS TABLE ===
-        story.append(Paragraph("<b>Items Purchased</b>", left_meta_style))
-        story.append(Spacer(1, 2*mm))
-        
-        # Build items table
-        item_data = [['Item', 'Qty', 'Amount']]
-        for item in items:
-            item_data.append([
-                item['item_name'],
-                str(item['quantity']),
-                f"Rs. {item['total_price']:.2f}"
-            ])
-        
-        col_widths = [42*mm, 12*mm, 20*mm]
-        item_table = Table(item_data, colWidths=col_widths)
-        item_table.setStyle(TableStyle([
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-            ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 2),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-            ('LEFTPADDING', (0, 0), (-1, -1), 1),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 1),
-            ('LINEBELOW', (0, 0), (-1, 0), 0.5, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        
-        story.append(item_table)
-        story.append(Spacer(1, 3*mm))
-        story.append(create_solid_line())
-        story.append(Spacer(1, 3*mm))
-        
-        # === FINAL SETTLEMENT SUMMARY ===
-        story.append(Paragraph("<b>Settlement Summary</b>", header_style))
-        story.append(Spacer(1, 2*mm))
-        
-        # Cash and change details
-        settlement_summary_data = [
-            ['Cash Received:', f'Rs. {settlement_data["cash_received"]:.2f}'],
-            ['Balance Settled:', f'Rs. {settlement_data["balance_settled"]:.2f}']
-        ]
-        
-        if settlement_data['change_given'] > 0:
-            settlement_summary_data.append(['Change Returned:', f'Rs. {settlement_data["change_given"]:.2f}'])
-        
-        settlement_table = Table(settlement_summary_data, colWidths=[45*mm, 29*mm])
-        settlement_table.setStyle(TableStyle([
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 2),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ]))
-        
-        story.append(settlement_table)
-        story.append(Spacer(1, 3*mm))
-        
-        # STATUS: FULLY PAID
-        story.append(Paragraph("<b>STATUS: FULLY PAID</b>", grand_total_style))
-        story.append(Spacer(1, 3*mm))
-        story.append(create_solid_line())
-        story.append(Spacer(1, 3*mm))
-        
-        # === PROFESSIONAL FOOTER ===
-        story.append(Paragraph("Capturing your dreams, Creating the art.", footer_style))
-        story.append(Spacer(1, 3*mm))
-        
-        # Developer credit
-        story.append(Paragraph("System Developed by: Malinda Prabath | Email: malindaprabath876@gmail.com", footer_style))
-        story.append(Spacer(1, 2*mm))
-        
-        # Build PDF
-        doc.build(story)
-        
-        return filepath
@@ -1,7 +1,8 @@
+import threading
 import customtkinter as ctk
 from tkinter import ttk
 from ui.components import BaseFrame, MessageDialog
-from services import InvoiceGenerator, BillGenerator
+from utils import LazyInstance
 
 
 class BillingFrame(BaseFrame):
@@ -9,8 +10,9 @@ class BillingFrame(BaseFrame):
 
     def __init__(self, parent, auth_manager, db_manager):
         super().__init__(parent, auth_manager, db_manager)
-        self.invoice_generator = InvoiceGenerator()
-        self.bill_generator = BillGenerator()
+        # PDF generators load ReportLab on first use
+        self.invoice_generator = LazyInstance('services.invoice_generator:InvoiceGenerator')
+        self.bill_generator = LazyInstance('services.bill_generator:BillGenerator')
         self.selected_customer = None
         self.is_guest_customer = False
         self.guest_customer_name = ""
@@ -27,6 +29,8 @@ class BillingFrame(BaseFrame):
         self.booking_reference = None  # For linking to booking
         self.create_widgets()
         self.load_categories()
+        # Load the customer lookup cache before the first keystroke needs it
+        threading.Thread(target=self.db_manager.lookup_customers, args=('0',), daemon=True).start()
 
     def create_widgets(self):
         """Create billing widgets"""
@@ -600,6 +604,11 @@ class BillingFrame(BaseFrame):
             border_color="#ff4757"
         ).pack(side="left")
 
+    def refresh(self):
+        """Reload categories and frames; the cart and customer are kept"""
+        self.load_categories()
+        self.load_frames()
+    
     def load_categories(self):
         """Load categories data"""
         categories = self.db_manager.get_all_categories()
@@ -1151,7 +1160,7 @@ class BillingFrame(BaseFrame):
         mobile = self.mobile_search.get().strip()
 
         if len(mobile) >= 5:
-            customers = self.db_manager.search_customers(mobile)
+            customers = self.db_manager.lookup_customers(mobile)
 
             if customers:
                 self.show_suggestions(customers)
@@ -1632,16 +1641,13 @@ class BillingFrame(BaseFrame):
             MessageDialog.show_error("Error", "Please add items to cart")
             return
 
-        # Calculate totals
-        subtotal = sum(item['total'] for item in self.cart_items)
+        # Discount and category service charge (totals are priced by checkout_bill)
         discount = float(self.discount_entry.get() or 0)
 
         service_charge = 0
         if self.category_service_cost > 0 and any(item['type'] == 'Service' for item in self.cart_items):
             service_charge = self.category_service_cost
 
-        total = max(0, subtotal + service_charge - discount)
-
         # Get cash received - REQUIRED for bill generation
         cash_given_str = self.paid_entry.get().strip()
         
@@ -1656,28 +1662,11 @@ class BillingFrame(BaseFrame):
             MessageDialog.show_error("Error", "Cash received must be greater than 0")
             return
 
-        # === SMART PAYMENT LOGIC ===
-        # Automatically determine Advance vs Full Payment
-        advance_amount = 0.0
-        balance_due = 0.0
-        payment_status = "FULL"  # Default status
-        
-        if cash_given >= total:
-            # SCENARIO A: Full Payment
-            advance_amount = total
-            balance_due = 0.0
-            payment_status = "FULL"
-        else:
-            # SCENARIO B: Advance Payment
-            advance_amount = cash_given
-            balance_due = total - cash_given
-            payment_status = "ADVANCE"
+        # Advance vs Full Payment split is decided by checkout_bill from cash_given
 
         # *** FIX: Real-time timestamp - capture exact moment of bill generation ***
         from datetime import datetime
         bill_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        bill_number = self.db_manager.generate_bill_number()
 
         if self.is_guest_customer:
             customer_id = None
@@ -1686,66 +1675,27 @@ class BillingFrame(BaseFrame):
             customer_id = self.selected_customer['id']
             guest_name = None
 
-        # Create bill in database with explicit timestamp
-        bill_id = self.db_manager.create_bill(
-            bill_number,
+        # Create bill, items and stock updates in one transaction
+        result = self.db_manager.checkout_bill(
+            self.cart_items,
             customer_id,
-            subtotal,
-            discount,
-            total,
             self.auth_manager.get_user_id(),
-            service_charge,
-            cash_given,
-            guest_name,
-            advance_amount,
-            balance_due,
-            bill_timestamp  # Pass exact timestamp
+            discount=discount,
+            service_charge=service_charge,
+            cash_given=cash_given,
+            guest_name=guest_name,
+            service_charge_label=self.selected_category_name,
+            created_at=bill_timestamp  # Pass exact timestamp
         )
 
-        if not bill_id:
-            MessageDialog.show_error("Error", "Failed to create bill")
+        if not result:
+            MessageDialog.show_error("Error", "Failed to create bill. Please check frame stock and try again.")
             return
 
-        # Add items to bill
-        for item in self.cart_items:
-            buying_price = 0
-            if item['type'] == 'Frame':
-                frame_data = self.db_manager.get_photo_frame_by_id(item['id'])
-                if frame_data:
-                    buying_price = frame_data.get('buying_price', 0) or 0
-
-            self.db_manager.add_bill_item(
-                bill_id,
-                item['type'],
-                item['id'],
-                item['name'],
-                item['quantity'],
-                item['unit_price'],
-                item['total'],
-                buying_price * item['quantity']
-            )
-
-            # Update frame stock
-            if item['type'] == 'Frame':
-                self.db_manager.update_frame_quantity(item['id'], -item['quantity'])
-
-        # Add service charge as separate item
-        if service_charge > 0 and self.selected_category_name:
-            self.db_manager.add_bill_item(
-                bill_id,
-                'CategoryService',
-                0,
-                f"Service Charge - {self.selected_category_name}",
-                1,
-                service_charge,
-                service_charge,
-                0
-            )
+        bill_data, items_data = result
+        bill_number = bill_data['bill_number']
 
         # Generate PDF bill
-        bill_data = self.db_manager.get_bill_by_id(bill_id)
-        items_data = self.db_manager.get_bill_items(bill_id)
-
         if self.is_guest_customer:
             customer_data = {
                 'full_name': self.guest_customer_name,
@@ -1,9 +1,9 @@
 import customtkinter as ctk
 from tkinter import ttk
 from tkcalendar import DateEntry
-from ui.components import BaseFrame, MessageDialog, Toast
+from ui.components import BaseFrame, MessageDialog, Toast, SearchController, VirtualTreeview
 from datetime import datetime
-from services.invoice_generator import InvoiceGenerator
+from utils import LazyInstance
 
 
 class BookingManagementFrame(BaseFrame):
@@ -14,7 +14,8 @@ class BookingManagementFrame(BaseFrame):
         self.selected_booking_id = None
         self.categories_map = {}  # name -> id mapping
         self.services_map = {}  # name -> service data
-        self.invoice_generator = InvoiceGenerator()
+        # Loads ReportLab on first use
+        self.invoice_generator = LazyInstance('services.invoice_generator:InvoiceGenerator')
         self.current_filter = "Pending"  # Default filter to Pending
         self.create_widgets()
         self.load_categories()
@@ -291,7 +292,7 @@ class BookingManagementFrame(BaseFrame):
         ctk.CTkLabel(search_container, text="🔍 Search:", font=ctk.CTkFont(size=13, weight="bold")).pack(side="left", padx=(0, 5))
         self.search_entry = ctk.CTkEntry(search_container, width=250, height=35, corner_radius=20, border_width=1)
         self.search_entry.pack(side="left", padx=5)
-        self.search_entry.bind("<KeyRelease>", lambda e: self.search_bookings())
+        self.search = SearchController(self, self.search_entry, self.query_bookings, self.show_bookings)
         
         ctk.CTkButton(
             search_container,
@@ -338,7 +339,7 @@ class BookingManagementFrame(BaseFrame):
         
         # Updated column structure (NO Status column): Customer, Mobile, Service, Full Amount, Advance, Date
         columns = ("Customer", "Mobile", "Service", "FullAmount", "Advance", "Date")
-        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", height=20)
+        self.tree = VirtualTreeview(table_frame, columns=columns, show="headings", height=20)
         
         self.tree.heading("Customer", text="👤 Customer Name")
         self.tree.heading("Mobile", text="📱 Mobile Number")
@@ -976,136 +977,64 @@ class BookingManagementFrame(BaseFrame):
         # Reload services in case new ones were added
         self.load_categories()
     
+    def refresh(self):
+        """Reload services and bookings, keeping the current search"""
+        self.load_categories()
+        self.search.run_now()
+    
     def load_bookings(self):
         """Load bookings based on current filter (default: Pending only)"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Get all bookings and filter by current status
-        all_bookings = self.db_manager.get_all_bookings()
+        # Supersede any search still running
+        self.search.cancel()
+        self.render_bookings(self.query_bookings(""))
+    
+    def query_bookings(self, search_term):
+        """Fetch bookings for a search term and the current filter (worker thread for searches)"""
+        if search_term:
+            all_bookings = self.db_manager.search_bookings(search_term)
+        else:
+            all_bookings = self.db_manager.get_all_bookings()
         
         # Filter bookings based on current_filter
         if self.current_filter != "All":
-            bookings = [b for b in all_bookings if b['status'] == self.current_filter]
-        else:
-            bookings = all_bookings
-        
-        for i, booking in enumerate(bookings):
-            status = booking['status']
-            if status == 'Completed':
-                tag = 'completed'
-            elif status == 'Cancelled':
-                tag = 'cancelled'
-            elif status == 'Pending':
-                tag = 'pending'
-            else:
-                tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            
+            return [b for b in all_bookings if b['status'] == self.current_filter]
+        return all_bookings
+    
+    def show_bookings(self, search_term, bookings):
+        """Show the results of a finished search"""
+        self.render_bookings(bookings)
+    
+    def render_bookings(self, bookings):
+        """Fill the table with bookings"""
+        status_tags = {'Completed': ('completed',), 'Cancelled': ('cancelled',), 'Pending': ('pending',)}
+        rows = []
+        for booking in bookings:
             # Format service name: strip prefixes/suffixes
             service_display = self.format_service_name(booking['photoshoot_category'])
             
             # New column structure (NO Status): Customer, Mobile, Service, Full Amount, Advance, Date
-            self.tree.insert("", "end", values=(
+            rows.append((str(booking['id']), (
                 booking['customer_name'],
                 booking['mobile_number'],
                 service_display,
                 f"{booking['full_amount']:.2f}",
                 f"{booking['advance_payment']:.2f}",
                 booking['booking_date']
-            ), tags=(tag,), iid=str(booking['id']))
+            ), status_tags.get(booking['status'], ())))
+        self.tree.set_rows(rows)
         
         # Update record count
         self.record_count_label.configure(text=f"{len(bookings)} records")
     
     def search_bookings(self):
         """Search bookings (respects current filter)"""
-        search_term = self.search_entry.get().strip()
-        
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        if not search_term:
-            self.load_bookings()
-            return
-        
-        all_bookings = self.db_manager.search_bookings(search_term)
-        
-        # Apply current filter to search results
-        if self.current_filter != "All":
-            bookings = [b for b in all_bookings if b['status'] == self.current_filter]
-        else:
-            bookings = all_bookings
-        
-        for i, booking in enumerate(bookings):
-            status = booking['status']
-            if status == 'Completed':
-                tag = 'completed'
-            elif status == 'Cancelled':
-                tag = 'cancelled'
-            elif status == 'Pending':
-                tag = 'pending'
-            else:
-                tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            
-            # Format service name: strip prefixes/suffixes
-            service_display = self.format_service_name(booking['photoshoot_category'])
-            
-            # New column structure (NO Status): Customer, Mobile, Service, Full Amount, Advance, Date
-            self.tree.insert("", "end", values=(
-                booking['customer_name'],
-                booking['mobile_number'],
-                service_display,
-                f"{booking['full_amount']:.2f}",
-                f"{booking['advance_payment']:.2f}",
-                booking['booking_date']
-            ), tags=(tag,), iid=str(booking['id']))
-        
-        # Update record count
-        self.record_count_label.configure(text=f"{len(bookings)} records")
+        self.search.run_now()
     
     def filter_by_status(self, status):
         """Filter bookings by status"""
         self.current_filter = status
         self.filter_status.set(status)
-        
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Get all bookings
-        all_bookings = self.db_manager.get_all_bookings()
-        
-        # Filter by status
-        if status != "All":
-            bookings = [b for b in all_bookings if b['status'] == status]
-        else:
-            bookings = all_bookings
-        
-        for i, booking in enumerate(bookings):
-            booking_status = booking['status']
-            if booking_status == 'Completed':
-                tag = 'completed'
-            elif booking_status == 'Cancelled':
-                tag = 'cancelled'
-            elif booking_status == 'Pending':
-                tag = 'pending'
-            else:
-                tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            
-            # Format service name: strip prefixes/suffixes
-            service_display = self.format_service_name(booking['photoshoot_category'])
-            
-            # New column structure (NO Status): Customer, Mobile, Service, Full Amount, Advance, Date
-            self.tree.insert("", "end", values=(
-                booking['customer_name'],
-                booking['mobile_number'],
-                service_display,
-                f"{booking['full_amount']:.2f}",
-                f"{booking['advance_payment']:.2f}",
-                booking['booking_date']
-            ), tags=(tag,), iid=str(booking['id']))
-        
-        # Update record count
-        self.record_count_label.configure(text=f"{len(bookings)} records")
+        self.load_bookings()
     
     def on_select(self, event):
         """Handle row selection"""
@@ -367,6 +367,10 @@ class CategoryManagementFrame(BaseFrame):
         
         self.name_entry.focus()
     
+    def refresh(self):
+        """Reload categories"""
+        self.load_categories()
+    
     def load_categories(self):
         """Load all categories"""
         # Clear table
@@ -1,10 +1,48 @@
 import customtkinter as ctk
-from typing import Callable, Optional
-from PIL import Image
+import tkinter as tk
+from tkinter import ttk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import resource_path
+from utils.image_cache import get_image_cache
+from utils.startup_profiler import startup_profiler
+from services.report_jobs import get_report_runner, DONE, CANCELLED
+
+
+# Sizes handed to iconphoto for window icons
+ICON_SIZES = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
+
+# Window icon PhotoImages by image file, shared by every window
+_icon_photos: Dict[tuple, list] = {}
+
+
+def asset_image(path: str, size: Tuple[int, int], mask: Optional[str] = None,
+                scaling: float = 1.0) -> ctk.CTkImage:
+    """CTkImage of an image file at a display size, rendered through the image cache.
+
+    scaling is the window's CTk scaling, so the cached image has as many
+    pixels as the screen will show.
+    """
+    pixels = (max(1, round(size[0] * scaling)), max(1, round(size[1] * scaling)))
+    img = get_image_cache().get(path, pixels, mask)
+    return ctk.CTkImage(light_image=img, dark_image=img, size=size)
+
+
+def window_icon_photos(path: str) -> list:
+    """PhotoImages of an icon file at every ICON_SIZES size, built once"""
+    from PIL import ImageTk
+    cache = get_image_cache()
+    key = cache.key(path)
+    photos = _icon_photos.get(key)
+    if photos is None:
+        photos = [ImageTk.PhotoImage(cache.get(path, size)) for size in ICON_SIZES]
+        _icon_photos.clear()  # Only the current version of the file is kept
+        _icon_photos[key] = photos
+    return photos
 
 
 class ModernToast(ctk.CTkToplevel):
@@ -220,6 +258,169 @@ class ModernConfirmDialog(ctk.CTkToplevel):
         return self.result
 
 
+class ReportJobToast(ctk.CTkToplevel):
+    """Non-blocking progress panel for a background report job.
+    
+    Polls the job with after() while the POS stays usable, showing a
+    progress bar and a Cancel button. When the job succeeds, on_success(result)
+    runs on the main thread and may return a summary line to show; with
+    on_open, the finished panel offers to open the result. The panel then
+    closes itself like a toast.
+    """
+    
+    # Panels currently on screen, stacked upwards from the bottom right
+    _open_panels: List['ReportJobToast'] = []
+    
+    def __init__(self, parent, job, on_success: Optional[Callable[[Any], Optional[str]]] = None,
+                 on_open: Optional[Callable[[Any], None]] = None,
+                 poll_ms: int = 150, linger_ms: int = 8000):
+        self.root = parent.winfo_toplevel()
+        super().__init__(self.root)
+        
+        self.job = job
+        self.on_success = on_success
+        self.on_open = on_open
+        self.poll_ms = poll_ms
+        self.linger_ms = linger_ms
+        
+        self.overrideredirect(True)
+        self.attributes('-topmost', True)
+        self.configure(fg_color="#0d0d1a")
+        
+        self.main_frame = ctk.CTkFrame(self, fg_color="#1e1e2f", corner_radius=12,
+                                       border_width=2, border_color="#8C00FF")
+        self.main_frame.pack(fill="both", expand=True, padx=2, pady=2)
+        
+        self.title_label = ctk.CTkLabel(
+            self.main_frame,
+            text=f"📄 {job.name}",
+            font=ctk.CTkFont(size=14, weight="bold"),
+            text_color="white",
+            anchor="w"
+        )
+        self.title_label.pack(fill="x", padx=18, pady=(14, 6))
+        
+        self.progress_bar = ctk.CTkProgressBar(self.main_frame, width=300, progress_color="#8C00FF")
+        self.progress_bar.set(0)
+        self.progress_bar.pack(padx=18, pady=4)
+        
+        self.message_label = ctk.CTkLabel(
+            self.main_frame,
+            text=job.message,
+            font=ctk.CTkFont(size=12),
+            text_color="#aaaaaa",
+            anchor="w",
+            justify="left",
+            wraplength=300
+        )
+        self.message_label.pack(fill="x", padx=18, pady=(2, 4))
+        
+        self.button_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        self.button_frame.pack(fill="x", padx=18, pady=(4, 14))
+        self.action_btn = ctk.CTkButton(
+            self.button_frame,
+            text="Cancel",
+            width=90,
+            height=30,
+            fg_color="#2d2d5a",
+            hover_color="#3d3d7a",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            corner_radius=15,
+            command=self.cancel
+        )
+        self.action_btn.pack(side="right")
+        
+        ReportJobToast._open_panels.append(self)
+        self._place()
+        self.after(self.poll_ms, self._poll)
+    
+    def _place(self):
+        """Bottom-right of the main window, above earlier panels"""
+        self.update_idletasks()
+        offset = 20
+        for panel in ReportJobToast._open_panels:
+            if panel is self:
+                break
+            offset += panel.winfo_reqheight() + 10
+        x = self.root.winfo_x() + self.root.winfo_width() - self.winfo_reqwidth() - 20
+        y = self.root.winfo_y() + self.root.winfo_height() - self.winfo_reqheight() - offset
+        self.geometry(f"+{max(x, 0)}+{max(y, 0)}")
+    
+    def cancel(self):
+        """Stop the job; the panel closes once the worker notices"""
+        self.job.cancel()
+        self.action_btn.configure(state="disabled", text="Cancelling...")
+    
+    def _poll(self):
+        """Mirror the job's progress until it finishes"""
+        if not self.winfo_exists():
+            return
+        self.progress_bar.set(self.job.progress)
+        if not self.job.finished:
+            self.message_label.configure(text=self.job.message)
+            self.after(self.poll_ms, self._poll)
+            return
+        
+        if self.job.status == DONE:
+            summary = None
+            if self.on_success:
+                try:
+                    summary = self.on_success(self.job.result)
+                except Exception as e:
+                    self._show_failure(str(e))
+                    return
+            self._show_outcome("✓ Ready", summary or "Report generated successfully!", "#8C00FF")
+            if self.on_open:
+                self.action_btn.configure(text="Open", state="normal", fg_color="#8C00FF",
+                                          hover_color="#7300D6", command=self._open)
+            else:
+                self.action_btn.configure(text="Close", state="normal", command=self.close)
+            self.after(self.linger_ms, self.close)
+        elif self.job.status == CANCELLED:
+            self._show_outcome("Cancelled", "Report generation was cancelled.", "#ffd93d")
+            self.action_btn.configure(text="Close", state="normal", command=self.close)
+            self.after(2000, self.close)
+        else:
+            self._show_failure(self.job.message)
+    
+    def _show_failure(self, reason: str):
+        """Leave the error on screen until it is dismissed"""
+        self._show_outcome("✕ Failed", f"Failed to generate report: {reason}", "#ff6b6b")
+        self.action_btn.configure(text="Close", state="normal", command=self.close)
+    
+    def _show_outcome(self, status: str, message: str, accent: str):
+        """Turn the progress panel into a completion toast"""
+        self.title_label.configure(text=f"{status} · {self.job.name}")
+        self.main_frame.configure(border_color=accent)
+        self.message_label.configure(text=message)
+        self._place()
+    
+    def _open(self):
+        """Open the finished report and close the panel"""
+        try:
+            self.on_open(self.job.result)
+        finally:
+            self.close()
+    
+    def close(self):
+        """Remove the panel"""
+        if self in ReportJobToast._open_panels:
+            ReportJobToast._open_panels.remove(self)
+        try:
+            self.destroy()
+        except Exception:
+            pass
+
+
+def run_report_job(parent, name: str, func: Callable, *args,
+                   on_success: Optional[Callable[[Any], Optional[str]]] = None,
+                   on_open: Optional[Callable[[Any], None]] = None, **kwargs):
+    """Generate a report on the background runner with a progress toast; returns the job"""
+    job = get_report_runner().submit(name, func, *args, **kwargs)
+    ReportJobToast(parent, job, on_success=on_success, on_open=on_open)
+    return job
+
+
 class Toast:
     """Static class to show toast notifications"""
     
@@ -294,16 +495,9 @@ class LoginWindow(ctk.CTkToplevel):
         try:
             icon_path = resource_path(os.path.join("assets", "logos", "App logo.jpg"))
             if os.path.exists(icon_path):
-                from PIL import ImageTk
-                icon_image = Image.open(icon_path)
                 # Create multiple sizes for better display
-                icon_sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-                icon_photos = []
-                for size in icon_sizes:
-                    resized = icon_image.resize(size, Image.Resampling.LANCZOS)
-                    icon_photos.append(ImageTk.PhotoImage(resized))
-                self._icon_photos = icon_photos  # Keep reference to prevent garbage collection
-                self.iconphoto(True, *icon_photos)
+                self._icon_photos = window_icon_photos(icon_path)  # Keep reference to prevent garbage collection
+                self.iconphoto(True, *self._icon_photos)
         except Exception as e:
             print(f"Could not load login window icon: {e}")
         
@@ -327,18 +521,18 @@ class LoginWindow(ctk.CTkToplevel):
             image_path = resource_path(os.path.join("assets", "login_images", "loginimage01.jpg"))
             
             if os.path.exists(image_path):
-                login_img = Image.open(image_path)
+                orig_width, orig_height = get_image_cache().source_size(image_path)
                 
                 # Calculate image size to fill left panel while maintaining aspect ratio
                 window_height = int(self.winfo_screenheight() * 0.8)
                 target_height = window_height
-                aspect_ratio = login_img.width / login_img.height
+                aspect_ratio = orig_width / orig_height
                 target_width = int(target_height * aspect_ratio)
                 
-                self.display_image = ctk.CTkImage(
-                    light_image=login_img,
-                    dark_image=login_img,
-                    size=(target_width, target_height)
+                self.display_image = asset_image(
+                    image_path,
+                    (target_width, target_height),
+                    scaling=ctk.ScalingTracker.get_window_scaling(self)
                 )
                 
                 img_label = ctk.CTkLabel(left_panel, image=self.display_image, text="", fg_color="#060606")
@@ -367,15 +561,15 @@ class LoginWindow(ctk.CTkToplevel):
         try:
             logo_path = resource_path(os.path.join("assets", "logos", "studio-logo.png"))
             if os.path.exists(logo_path):
-                logo_img = Image.open(logo_path)
                 # Use same sizing logic as sidebar dashboard
-                orig_width, orig_height = logo_img.size
+                orig_width, orig_height = get_image_cache().source_size(logo_path)
                 target_height = 50
                 aspect_ratio = orig_width / orig_height
                 target_width = int(target_height * aspect_ratio)
                 # Constrain width to fit login panel (max 220px like sidebar)
                 target_width = max(min(target_width, 220), 160)
-                self.logo_image = ctk.CTkImage(light_image=logo_img, dark_image=logo_img, size=(target_width, target_height))
+                self.logo_image = asset_image(logo_path, (target_width, target_height),
+                                              scaling=ctk.ScalingTracker.get_window_scaling(self))
                 logo_label = ctk.CTkLabel(form_container, image=self.logo_image, text="")
                 logo_label.pack(pady=(0, 30))
         except Exception as e:
@@ -511,7 +705,8 @@ class LoginWindow(ctk.CTkToplevel):
             self.password_entry.focus()
             return
         
-        user = self.auth_manager.authenticate(username, password)
+        with startup_profiler.phase("authenticate"):
+            user = self.auth_manager.authenticate(username, password)
         
         if user:
             # Release grab before destroying to prevent input freeze
@@ -578,6 +773,485 @@ class MessageDialog:
         return False
 
 
+class VirtualTreeview(ttk.Treeview):
+    """Treeview that keeps its rows in Python and only materializes the
+    ones in view.
+    
+    The widget holds one Tk item per visible line and rewrites their values
+    as the view scrolls, so memory and redraw cost stay bounded whatever
+    the row count. Rows have an iid, values and tags; rows without tags are
+    striped evenrow/oddrow by position when drawn. insert, delete, item,
+    selection, identify_row, see and yview take and return row iids, so
+    frames use it like a plain Treeview; set_rows replaces every row in one
+    call.
+    """
+    
+    def __init__(self, master=None, **kw):
+        self._yscrollcommand = kw.pop('yscrollcommand', None)
+        super().__init__(master, **kw)
+        self._iids: List[str] = []
+        self._values: List[Tuple] = []
+        self._tags: List[Tuple] = []
+        self._positions: Optional[Dict[str, int]] = None
+        self._offset = 0
+        self._visible = int(self.cget('height')) or 10
+        self._slots: List[str] = []
+        self._selected: Optional[int] = None
+        self._next_iid = 0
+        # Selection changes made while redrawing are not reported to the frame
+        self._sync_events = 0
+        
+        # Our bindings run before the frame's and the Treeview class bindings
+        tag = f'VirtualTreeview{id(self)}'
+        self.bindtags((tag,) + self.bindtags())
+        self.bind_class(tag, '<<TreeviewSelect>>', self._on_select)
+        self.bind_class(tag, '<Configure>', self._on_configure)
+        self.bind_class(tag, '<MouseWheel>', self._on_mousewheel)
+        self.bind_class(tag, '<Button-4>', lambda e: self._scroll_by(-3))
+        self.bind_class(tag, '<Button-5>', lambda e: self._scroll_by(3))
+        for key, step in (('<Up>', -1), ('<Down>', 1), ('<Prior>', 'page-'), ('<Next>', 'page+'),
+                          ('<Home>', 'home'), ('<End>', 'end')):
+            self.bind_class(tag, key, lambda e, step=step: self._on_key(step))
+    
+    # ---- rows ----
+    
+    def set_rows(self, rows: List[Tuple[Optional[str], Tuple, Tuple]]):
+        """Replace every row with (iid, values, tags) tuples; iid None numbers the row"""
+        self._iids, self._values, self._tags = [], [], []
+        self._positions = None
+        self._offset = 0
+        self._selected = None
+        self._append(rows)
+        self._render()
+    
+    def append_rows(self, rows: List[Tuple[Optional[str], Tuple, Tuple]]):
+        """Add (iid, values, tags) rows after the existing ones"""
+        self._append(rows)
+        self._render()
+    
+    def _append(self, rows):
+        """Store rows without redrawing"""
+        for iid, values, tags in rows:
+            if iid is None:
+                iid = f'row{self._next_iid}'
+                self._next_iid += 1
+            iid = str(iid)
+            if self._positions is not None:
+                self._positions[iid] = len(self._iids)
+            self._iids.append(iid)
+            self._values.append(tuple(values))
+            self._tags.append(tuple(tags) if tags else ())
+    
+    def _position(self, iid) -> int:
+        """Row index of iid"""
+        if self._positions is None:
+            self._positions = {row_iid: i for i, row_iid in enumerate(self._iids)}
+        try:
+            return self._positions[str(iid)]
+        except KeyError:
+            raise tk.TclError(f'Item {iid} not found') from None
+    
+    def row_count(self) -> int:
+        """Number of rows, visible or not"""
+        return len(self._iids)
+    
+    # ---- Treeview API over rows ----
+    
+    def insert(self, parent, index, iid=None, **kw):
+        """Append a row ('end' only; rows are flat)"""
+        if parent != '' or index not in ('end', len(self._iids)):
+            raise tk.TclError('VirtualTreeview only appends top-level rows')
+        if iid is None:
+            iid = f'row{self._next_iid}'
+            self._next_iid += 1
+        self._append([(iid, kw.get('values', ()), kw.get('tags', ()))])
+        if len(self._iids) - self._offset <= self._visible:
+            self._render()
+        else:
+            self._update_scrollbar()
+        return str(iid)
+    
+    def delete(self, *items):
+        """Remove rows by iid"""
+        if not items:
+            return
+        if len(items) == len(self._iids):
+            self.set_rows([])
+            return
+        doomed = {self._position(iid) for iid in items}
+        selected = self._iids[self._selected] if self._selected is not None else None
+        keep = [i for i in range(len(self._iids)) if i not in doomed]
+        self._iids = [self._iids[i] for i in keep]
+        self._values = [self._values[i] for i in keep]
+        self._tags = [self._tags[i] for i in keep]
+        self._positions = None
+        self._selected = self._position(selected) if selected in self._iids else None
+        self._render()
+    
+    def get_children(self, item=None):
+        """Every row iid, in order"""
+        return tuple(self._iids) if not item else ()
+    
+    def index(self, item):
+        """Row index of item"""
+        return self._position(item)
+    
+    def item(self, item, option=None, **kw):
+        """Read or change a row's values and tags"""
+        position = self._position(item)
+        if kw:
+            if 'values' in kw:
+                self._values[position] = tuple(kw['values'])
+            if 'tags' in kw:
+                self._tags[position] = tuple(kw['tags']) if kw['tags'] else ()
+            self._render()
+            return None
+        row = {'text': '', 'image': '', 'values': list(self._values[position]),
+               'open': 0, 'tags': list(self._tags[position])}
+        return row[option] if option else row
+    
+    def selection(self):
+        """The selected row iid, if any"""
+        return (self._iids[self._selected],) if self._selected is not None else ()
+    
+    def selection_set(self, *items):
+        """Select a row (single selection)"""
+        items = items[0] if len(items) == 1 and isinstance(items[0], (list, tuple)) else items
+        self._selected = self._position(items[0]) if items else None
+        self._render(notify=True)
+    
+    def selection_remove(self, *items):
+        """Clear the selection"""
+        self.selection_set()
+    
+    def identify_row(self, y):
+        """Row iid at window coordinate y"""
+        slot = super().identify_row(y)
+        if not slot:
+            return ''
+        return self._iids[self._offset + self._slots.index(slot)]
+    
+    def see(self, item):
+        """Scroll so item is in view"""
+        position = self._position(item)
+        if position < self._offset:
+            self._offset = position
+        elif position >= self._offset + self._visible:
+            self._offset = position - self._visible + 1
+        self._render()
+    
+    def yview(self, *args):
+        """Scroll by rows: Scrollbar 'moveto' and 'scroll' commands"""
+        if not args:
+            return self._fractions()
+        if args[0] == 'moveto':
+            self._offset = round(float(args[1]) * len(self._iids))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            self._offset += amount * self._visible if args[2] == 'pages' else amount
+        self._render()
+    
+    def configure(self, cnf=None, **kw):
+        """Keep yscrollcommand for ourselves; Tk only sees the visible lines"""
+        if 'yscrollcommand' in kw:
+            self._yscrollcommand = kw.pop('yscrollcommand')
+            self._update_scrollbar()
+            if not kw and cnf is None:
+                return None
+        return super().configure(cnf, **kw)
+    
+    config = configure
+    
+    # ---- drawing ----
+    
+    def _render(self, notify: bool = False):
+        """Write the rows in view into the visible lines"""
+        total = len(self._iids)
+        self._offset = max(0, min(self._offset, total - self._visible))
+        count = min(self._visible, total - self._offset)
+        while len(self._slots) < count:
+            self._slots.append(super().insert('', 'end'))
+        if len(self._slots) > count:
+            super().delete(*self._slots[count:])
+            del self._slots[count:]
+        
+        for line, slot in enumerate(self._slots):
+            position = self._offset + line
+            tags = self._tags[position] or ('evenrow' if position % 2 == 0 else 'oddrow',)
+            super().item(slot, values=self._values[position], tags=tags)
+        
+        wanted = ()
+        if self._selected is not None and 0 <= self._selected - self._offset < count:
+            wanted = (self._slots[self._selected - self._offset],)
+        if tuple(super().selection()) != wanted:
+            if not notify:
+                self._sync_events += 1
+            super().selection_set(wanted)
+        self._update_scrollbar()
+    
+    def _fractions(self) -> Tuple[float, float]:
+        """Scrollbar position of the rows in view"""
+        total = len(self._iids)
+        if not total:
+            return 0.0, 1.0
+        return self._offset / total, min(1.0, (self._offset + self._visible) / total)
+    
+    def _update_scrollbar(self):
+        """Report the view to the scrollbar (and any paged loader)"""
+        if self._yscrollcommand is not None:
+            self._yscrollcommand(*self._fractions())
+    
+    # ---- events ----
+    
+    def _on_select(self, event):
+        """Track clicks on visible lines as row selections"""
+        if self._sync_events:
+            self._sync_events -= 1
+            return 'break'
+        selected = super().selection()
+        if selected and selected[0] in self._slots:
+            self._selected = self._offset + self._slots.index(selected[0])
+        return None
+    
+    def _on_configure(self, event):
+        """Fit the number of visible lines to the widget height"""
+        row_height = int(ttk.Style(self).lookup(self.cget('style') or 'Treeview', 'rowheight') or 20)
+        top = row_height
+        if self._slots:
+            bbox = super().bbox(self._slots[0])
+            if bbox:
+                top = bbox[1]
+        visible = max(1, (event.height - top) // row_height)
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+    
+    def _on_mousewheel(self, event):
+        """Scroll three rows per wheel notch"""
+        self._scroll_by(-3 if event.delta > 0 else 3)
+        return 'break'
+    
+    def _scroll_by(self, rows: int):
+        """Move the view by rows"""
+        self._offset += rows
+        self._render()
+        return 'break'
+    
+    def _on_key(self, step):
+        """Keyboard navigation across the whole row list"""
+        if not self._iids:
+            return 'break'
+        current = self._offset if self._selected is None else self._selected
+        if step == 'home':
+            target = 0
+        elif step == 'end':
+            target = len(self._iids) - 1
+        elif step == 'page-':
+            target = current - self._visible
+        elif step == 'page+':
+            target = current + self._visible
+        else:
+            target = current + step
+        target = max(0, min(target, len(self._iids) - 1))
+        self.see(self._iids[target])
+        self.selection_set(self._iids[target])
+        return 'break'
+
+
+class PagedTreeLoader:
+    """Fill a VirtualTreeview one keyset page at a time, fetching the next
+    page when the view is scrolled near its end.
+    
+    fetch_page(cursor) returns (rows, next_cursor) as DatabaseManager's
+    *_page methods do; insert_rows(rows) appends them to the tree.
+    """
+    
+    def __init__(self, tree, scrollbar,
+                 fetch_page: Callable[[Optional[Tuple]], Tuple[List[Dict[str, Any]], Optional[Tuple]]],
+                 insert_rows: Callable[[List[Dict[str, Any]]], None],
+                 threshold: float = 0.9):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.fetch_page = fetch_page
+        self.insert_rows = insert_rows
+        self.threshold = threshold
+        self.cursor = None
+        self.loaded = 0
+        self.exhausted = True
+        self._pending = False
+        tree.configure(yscrollcommand=self._on_scroll)
+    
+    def reset(self, first_page: Optional[Tuple[List[Dict[str, Any]], Optional[Tuple]]] = None):
+        """Clear the tree and load the first page (or show one fetched elsewhere)"""
+        self.tree.set_rows([])
+        self.cursor = None
+        self.loaded = 0
+        self.exhausted = False
+        if first_page is None:
+            self.load_more()
+        else:
+            self._show(*first_page)
+    
+    def load_more(self):
+        """Append the next page, if there is one"""
+        self._pending = False
+        if self.exhausted or not self.tree.winfo_exists():
+            return
+        self._show(*self.fetch_page(self.cursor))
+    
+    def _show(self, rows, cursor):
+        """Append a fetched page and remember where the next one starts"""
+        self.cursor = cursor
+        self.exhausted = cursor is None
+        self.insert_rows(rows)
+        self.loaded += len(rows)
+    
+    def _on_scroll(self, first, last):
+        """Keep the scrollbar in sync and prefetch when the end comes into view"""
+        self.scrollbar.set(first, last)
+        if not self.exhausted and not self._pending and float(last) >= self.threshold:
+            self._pending = True
+            self.tree.after_idle(self.load_more)
+
+
+class SearchController:
+    """Debounced search box that queries off the Tk main thread.
+    
+    Each keystroke restarts a short delay. When it expires, query(term) runs
+    on a worker thread, and on_results(term, results) is called back on the
+    main thread via after(). A newer search supersedes older ones: queued
+    queries are skipped and late results are dropped.
+    """
+    
+    def __init__(self, widget, entry, query: Callable[[str], Any],
+                 on_results: Callable[[str, Any], None],
+                 delay_ms: int = 250, poll_ms: int = 20):
+        self.widget = widget
+        self.entry = entry
+        self.query = query
+        self.on_results = on_results
+        self.delay_ms = delay_ms
+        self.poll_ms = poll_ms
+        self._after_id = None
+        self._generation = 0
+        # One worker per box: searches run in order, stale ones are skipped
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='search')
+        entry.bind("<KeyRelease>", self.schedule, add="+")
+        widget.bind("<Destroy>", self._on_destroy, add="+")
+    
+    def schedule(self, event=None):
+        """Restart the debounce delay"""
+        self.cancel()
+        self._after_id = self.widget.after(self.delay_ms, self.run_now)
+    
+    def cancel(self):
+        """Drop the pending search and any result still in flight"""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        self._generation += 1
+    
+    def run_now(self):
+        """Search for the current entry text without waiting for the delay"""
+        self.cancel()
+        generation = self._generation
+        term = self.entry.get().strip()
+        future = self._executor.submit(self._run_query, generation, term)
+        self._poll(future, generation, term)
+    
+    def _run_query(self, generation: int, term: str):
+        """Worker thread: skip searches superseded while queued"""
+        if generation != self._generation:
+            return None
+        return self.query(term)
+    
+    def _poll(self, future, generation: int, term: str):
+        """Main thread: deliver the result once the worker is done"""
+        if generation != self._generation or not self.widget.winfo_exists():
+            return
+        if not future.done():
+            self.widget.after(self.poll_ms, self._poll, future, generation, term)
+            return
+        try:
+            results = future.result()
+        except Exception as e:
+            print(f"Search error: {e}")
+            return
+        self.on_results(term, results)
+    
+    def _on_destroy(self, event):
+        """Let the worker thread exit with the widget"""
+        # Children's <Destroy> events also reach a toplevel's bindings
+        if event.widget is not self.widget:
+            return
+        self.cancel()
+        self._executor.shutdown(wait=False)
+
+
+class PageCache:
+    """Keep constructed pages alive between visits instead of rebuilding them.
+    
+    show(page, build) hides the current page and packs the cached one,
+    calling build() only on the first visit. Pages are refreshed on show
+    when data_version() has changed since they last loaded their data
+    (their refresh() method reloads data without rebuilding widgets). At most
+    max_pages pages are kept; the least recently shown is destroyed first.
+    """
+    
+    def __init__(self, data_version: Callable[[], Any], max_pages: int = 6):
+        self.data_version = data_version
+        self.max_pages = max_pages
+        # page -> [frame, data version when its data was last loaded]
+        self._pages: 'OrderedDict[str, List[Any]]' = OrderedDict()
+        self.current = None
+    
+    def show(self, page: str, build: Callable[[], Any]):
+        """Display page, building it if it is not cached; returns the frame"""
+        version = self.data_version()
+        if page == self.current and page in self._pages:
+            # Choosing the page on screen again reloads its data
+            entry = self._pages[page]
+            self._refresh(entry[0])
+            entry[1] = version
+            return entry[0]
+        
+        if self.current is not None and self.current in self._pages:
+            self._pages[self.current][0].pack_forget()
+        
+        entry = self._pages.pop(page, None)
+        if entry is not None and not entry[0].winfo_exists():
+            entry = None
+        if entry is None:
+            entry = [build(), version]
+        elif entry[1] != version:
+            self._refresh(entry[0])
+            entry[1] = version
+        
+        self._pages[page] = entry
+        self.current = page
+        entry[0].pack(fill="both", expand=True)
+        
+        while len(self._pages) > self.max_pages:
+            _, (frame, _) = self._pages.popitem(last=False)
+            frame.destroy()
+        return entry[0]
+    
+    @staticmethod
+    def _refresh(frame):
+        """Reload a page's data, if it knows how"""
+        refresh = getattr(frame, 'refresh', None)
+        if refresh is not None:
+            refresh()
+    
+    def clear(self):
+        """Destroy every cached page"""
+        for frame, _ in self._pages.values():
+            if frame.winfo_exists():
+                frame.destroy()
+        self._pages.clear()
+        self.current = None
+
+
 class BaseFrame(ctk.CTkFrame):
     """Base frame with common functionality"""
     
@@ -607,6 +1281,10 @@ class BaseFrame(ctk.CTkFrame):
         """Check if current user is admin"""
         return self.auth_manager.is_admin()
     
+    def refresh(self):
+        """Reload data shown by a cached page after the database changed"""
+        pass
+    
     def restore_focus(self, widget=None):
         """Restore focus to widget or main window after dialog/popup closes"""
         try:
@@ -626,9 +1304,7 @@ class BaseFrame(ctk.CTkFrame):
                 pass
     
     def create_modern_table(self, parent, columns, column_widths=None, height=15):
-        """Create a modern styled treeview table with enhanced visuals"""
-        from tkinter import ttk
-        
+        """Create a modern styled (virtualized) treeview table with enhanced visuals"""
         # Create container frame with rounded corners effect
         table_container = ctk.CTkFrame(parent, fg_color="#0d0d1a", corner_radius=10)
         table_container.pack(fill="both", expand=True, padx=5, pady=5)
@@ -637,8 +1313,8 @@ class BaseFrame(ctk.CTkFrame):
         inner_frame = ctk.CTkFrame(table_container, fg_color="transparent")
         inner_frame.pack(fill="both", expand=True, padx=2, pady=2)
         
-        # Create Treeview
-        tree = ttk.Treeview(inner_frame, columns=columns, show="headings", height=height)
+        # Create Treeview; only the rows in view are materialized
+        tree = VirtualTreeview(inner_frame, columns=columns, show="headings", height=height)
         
         # Configure columns
         default_width = 120
@@ -666,6 +1342,10 @@ class BaseFrame(ctk.CTkFrame):
     
     def insert_table_row(self, tree, values, index=None):
         """Insert a row with alternating colors"""
+        if isinstance(tree, VirtualTreeview):
+            # Striped when drawn
+            tree.insert("", "end", values=values)
+            return
         if index is None:
             index = len(tree.get_children())
         tag = 'evenrow' if index % 2 == 0 else 'oddrow'
@@ -673,6 +1353,9 @@ class BaseFrame(ctk.CTkFrame):
     
     def refresh_table_tags(self, tree):
         """Refresh alternating row colors after modifications"""
+        if isinstance(tree, VirtualTreeview):
+            # Stripes follow row positions on every redraw
+            return
         for i, item in enumerate(tree.get_children()):
             tag = 'evenrow' if i % 2 == 0 else 'oddrow'
             tree.item(item, tags=(tag,))
@@ -1,6 +1,6 @@
 import customtkinter as ctk
 from tkinter import ttk
-from ui.components import BaseFrame, MessageDialog
+from ui.components import BaseFrame, MessageDialog, SearchController, VirtualTreeview
 
 
 class CustomerManagementFrame(BaseFrame):
@@ -107,7 +107,7 @@ class CustomerManagementFrame(BaseFrame):
         
         self.search_entry = ctk.CTkEntry(search_frame, width=300, height=35, corner_radius=20)
         self.search_entry.pack(side="left", padx=10, pady=10)
-        self.search_entry.bind("<KeyRelease>", lambda e: self.search_customers())
+        self.search = SearchController(self, self.search_entry, self.query_customers, self.show_customers)
         
         refresh_btn = ctk.CTkButton(
             search_frame,
@@ -152,7 +152,7 @@ class CustomerManagementFrame(BaseFrame):
         
         # Create Treeview
         columns = ("ID", "Full Name", "Mobile Number", "Created At")
-        self.tree = ttk.Treeview(table_container, columns=columns, show="headings", height=15)
+        self.tree = VirtualTreeview(table_container, columns=columns, show="headings", height=15)
         
         # Configure columns with modern styling
         self.tree.heading("ID", text="🔢 ID")
@@ -289,51 +289,41 @@ class CustomerManagementFrame(BaseFrame):
         self.delete_btn.configure(state="disabled")
         self.name_entry.focus()
     
+    def refresh(self):
+        """Reload customers, keeping the current search"""
+        self.search.run_now()
+    
     def load_customers(self):
         """Load all customers"""
-        # Clear table
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        customers = self.db_manager.get_all_customers()
-        
-        for i, customer in enumerate(customers):
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.tree.insert("", "end", values=(
-                customer['id'],
-                customer['full_name'],
-                customer['mobile_number'],
-                customer['created_at']
-            ), tags=(tag,))
+        # Supersede any search still running
+        self.search.cancel()
+        self.render_customers(self.db_manager.get_all_customers())
+    
+    def query_customers(self, search_term):
+        """Fetch customers matching a search term (worker thread)"""
+        if not search_term:
+            return self.db_manager.get_all_customers()
+        return self.db_manager.search_customers(search_term)
+    
+    def show_customers(self, search_term, customers):
+        """Show the results of a finished search"""
+        self.render_customers(customers)
+    
+    def render_customers(self, customers):
+        """Fill the table with customers"""
+        self.tree.set_rows([(None, (
+            customer['id'],
+            customer['full_name'],
+            customer['mobile_number'],
+            customer['created_at']
+        ), ()) for customer in customers])
         
         # Update record count
         self.record_count_label.configure(text=f"{len(customers)} records")
     
     def search_customers(self):
         """Search customers"""
-        search_term = self.search_entry.get().strip()
-        
-        # Clear table
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        if not search_term:
-            self.load_customers()
-            return
-        
-        customers = self.db_manager.search_customers(search_term)
-        
-        for i, customer in enumerate(customers):
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.tree.insert("", "end", values=(
-                customer['id'],
-                customer['full_name'],
-                customer['mobile_number'],
-                customer['created_at']
-            ), tags=(tag,))
-        
-        # Update record count
-        self.record_count_label.configure(text=f"{len(customers)} records")
+        self.search.run_now()
     
     def on_select(self, event):
         """Handle row selection"""
@@ -1,10 +1,6 @@
 import customtkinter as ctk
 from services.dashboard_service import DashboardService
-from services.executive_report_generator import (
-    generate_daily_report,
-    generate_weekly_report,
-    generate_monthly_report
-)
+from ui.components import Toast, run_report_job
 from datetime import datetime, timedelta
 from tkinter import messagebox
 import os
@@ -21,6 +17,8 @@ class DashboardFrame(ctk.CTkFrame):
         self.db_manager = db_manager
         self.dashboard_service = DashboardService()
         self.main_app = main_app
+        # Background report jobs by report type
+        self.report_jobs = {}
         
         # Filter variables
         self.filter_mode = "daily"  # daily, weekly, monthly
@@ -781,88 +779,59 @@ class DashboardFrame(ctk.CTkFrame):
             messagebox.showerror("Error", "Failed to add expense")
     
     def generate_report(self, report_type: str):
-        """Generate Executive PDF report with cover page and TOC"""
-        try:
-            if report_type == "daily":
-                result = generate_daily_report()
-            elif report_type == "weekly":
-                # Check if using specific week filter
-                if self.filter_mode == "weekly":
-                    # Generate report for specific week
-                    start_date, end_date = self.get_week_range(self.selected_year, self.selected_month, self.selected_week)
-                    result = generate_weekly_report(
-                        start_date=start_date.strftime('%Y-%m-%d'),
-                        end_date=end_date.strftime('%Y-%m-%d')
-                    )
-                else:
-                    result = generate_weekly_report()
-            elif report_type == "monthly":
-                # Check if using specific month filter
-                if self.filter_mode == "monthly":
-                    # Generate report for specific month and year
-                    result = generate_monthly_report(year=self.selected_year, month=self.selected_month)
-                else:
-                    today = datetime.now()
-                    result = generate_monthly_report(year=today.year, month=today.month)
-            else:
-                messagebox.showerror("Error", "Invalid report type")
-                return
-            
-            if result['success']:
-                summary = result['summary']
-                analytics = result.get('analytics', {})
-                
-                # Enhanced message with analytics
-                analytics_info = ""
-                if 'user_insights' in analytics:
-                    user_insights = analytics['user_insights']
-                    analytics_info = (
-                        f"\n📈 Analytics:\n"
-                        f"New Customers: {user_insights.get('new_customers', 0)}\n"
-                        f"Total Customers: {user_insights.get('total_customers', 0)}\n"
-                    )
-                
-                # Add filter information to message
-                filter_info = ""
-                if report_type == "weekly" and self.filter_mode == "weekly":
-                    start_date, end_date = self.get_week_range(self.selected_year, self.selected_month, self.selected_week)
-                    months = ["January", "February", "March", "April", "May", "June",
-                              "July", "August", "September", "October", "November", "December"]
-                    month_name = months[self.selected_month - 1]
-                    filter_info = f"\n📅 Period: Week {self.selected_week} of {month_name} {self.selected_year}\n"
-                elif report_type == "monthly" and self.filter_mode == "monthly":
-                    months = ["January", "February", "March", "April", "May", "June",
-                              "July", "August", "September", "October", "November", "December"]
-                    month_name = months[self.selected_month - 1]
-                    filter_info = f"\n📅 Period: {month_name} {self.selected_year}\n"
-                
-                message = (
-                    f"✅ {report_type.capitalize()} Executive Report Generated!\n"
-                    f"{filter_info}\n"
-                    f"📊 Financial Summary:\n"
-                    f"Opening Balance: LKR {summary['opening_balance']:,.2f}\n"
-                    f"Total Income: LKR {summary['total_income']:,.2f}\n"
-                    f"Total Expenses: LKR {summary['total_expenses']:,.2f}\n"
-                    f"Net Profit/Loss: LKR {summary['net_balance']:,.2f}\n"
-                    f"Closing Balance: LKR {summary['closing_balance']:,.2f}"
-                    f"{analytics_info}\n"
-                    f"📄 Features: Cover Page, Table of Contents, Dynamic Insights\n"
-                    f"👨‍💻 Developer: Malinda Prabath\n\n"
-                    f"📁 Saved as: {result['filename']}"
-                )
-                
-                response = messagebox.askyesno(
-                    "Report Generated",
-                    f"{message}\n\nWould you like to open the report now?"
-                )
-                
-                if response:
-                    self.open_file(result['filepath'])
+        """Generate Executive PDF report with cover page and TOC in the background"""
+        if report_type not in ("daily", "weekly", "monthly"):
+            messagebox.showerror("Error", "Invalid report type")
+            return
+        
+        running = self.report_jobs.get(report_type)
+        if running is not None and not running.finished:
+            Toast.show_toast(self, "Please wait", f"The {report_type} report is already being generated.", "warning")
+            return
+        
+        # Read the period filters now; the job runs on a worker thread
+        filter_info = ""
+        kwargs = {}
+        months = ["January", "February", "March", "April", "May", "June",
+                  "July", "August", "September", "October", "November", "December"]
+        if report_type == "weekly" and self.filter_mode == "weekly":
+            # Generate report for specific week
+            start_date, end_date = self.get_week_range(self.selected_year, self.selected_month, self.selected_week)
+            kwargs = {'start_date': start_date.strftime('%Y-%m-%d'), 'end_date': end_date.strftime('%Y-%m-%d')}
+            filter_info = f"Week {self.selected_week} of {months[self.selected_month - 1]} {self.selected_year}"
+        elif report_type == "monthly":
+            # Specific month and year when filtering by month, else this month
+            if self.filter_mode == "monthly":
+                kwargs = {'year': self.selected_year, 'month': self.selected_month}
+                filter_info = f"{months[self.selected_month - 1]} {self.selected_year}"
             else:
-                messagebox.showerror("Error", "Failed to generate report")
+                today = datetime.now()
+                kwargs = {'year': today.year, 'month': today.month}
+        
+        def build(progress=None):
+            # ReportLab and matplotlib are only loaded once a report is requested
+            from services import executive_report_generator
+            generate = getattr(executive_report_generator, f"generate_{report_type}_report")
+            return generate(progress=progress, **kwargs)
+        
+        def on_success(result):
+            if not result.get('success'):
+                raise RuntimeError("Failed to generate report")
+            summary = result['summary']
+            period = f"{filter_info} · " if filter_info else ""
+            return (
+                f"{period}Net Profit/Loss: LKR {summary['net_balance']:,.2f}\n"
+                f"Closing Balance: LKR {summary['closing_balance']:,.2f}\n"
+                f"📁 Saved as: {result['filename']}"
+            )
         
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred while generating report:\n{str(e)}")
+        self.report_jobs[report_type] = run_report_job(
+            self,
+            f"{report_type.capitalize()} Executive Report",
+            build,
+            on_success=on_success,
+            on_open=lambda result: self.open_file(result['filepath'])
+        )
     
     def open_file(self, filepath: str):
         """Open file with default application"""
@@ -895,36 +864,37 @@ class DashboardFrame(ctk.CTkFrame):
             # Re-enable refresh button
             self.refresh_btn.configure(state="normal", text="🔄 Refresh")
     
+    def refresh(self):
+        """Reload statistics"""
+        self.load_stats()
+    
     def load_stats(self):
         """Load dashboard statistics"""
         today = datetime.now().strftime('%Y-%m-%d')
         
         # Load appropriate stats based on user role
         if self.is_admin():
-            stats = self.dashboard_service.get_admin_dashboard_stats()
-            
-            # Update balance summary based on filter mode
-            opening_balance = self.dashboard_service.get_opening_balance(today)
-            
-            # Get income and expenses based on filter
-            if self.filter_mode == "daily":
-                total_income = stats['today_sales']
-                total_expenses = self.dashboard_service.get_expenses_by_date(today)
-            elif self.filter_mode == "weekly":
-                # Get specific week range
+            # Balance summary period based on filter mode
+            if self.filter_mode == "weekly":
                 start_date, end_date = self.get_week_range(self.selected_year, self.selected_month, self.selected_week)
-                total_income = self.dashboard_service.get_income_by_range(
-                    start_date.strftime('%Y-%m-%d'),
-                    end_date.strftime('%Y-%m-%d')
-                )
-                total_expenses = self.dashboard_service.get_expenses_by_range(
-                    start_date.strftime('%Y-%m-%d'),
-                    end_date.strftime('%Y-%m-%d')
-                )
+                period_start = start_date.strftime('%Y-%m-%d')
+                period_end = end_date.strftime('%Y-%m-%d')
             elif self.filter_mode == "monthly":
-                # Get specific month data
-                total_income = self.dashboard_service.get_income_by_month(self.selected_year, self.selected_month)
-                total_expenses = self.dashboard_service.get_expenses_by_month(self.selected_year, self.selected_month)
+                from calendar import monthrange
+                _, last_day = monthrange(self.selected_year, self.selected_month)
+                period_start = datetime(self.selected_year, self.selected_month, 1).strftime('%Y-%m-%d')
+                period_end = datetime(self.selected_year, self.selected_month, last_day).strftime('%Y-%m-%d')
+            else:
+                period_start = period_end = today
+            
+            # All KPIs and the balance summary in one connection
+            snapshot = self.dashboard_service.get_dashboard_snapshot(period_start, period_end)
+            stats = snapshot.as_dict()
+            
+            opening_balance = snapshot.opening_balance
+            if self.filter_mode in ("daily", "weekly", "monthly"):
+                total_income = snapshot.period_income
+                total_expenses = snapshot.period_expenses
             else:
                 total_income = 0.0
                 total_expenses = 0.0
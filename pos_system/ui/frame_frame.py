@@ -1,6 +1,6 @@
 import customtkinter as ctk
 from tkinter import ttk
-from ui.components import BaseFrame, MessageDialog
+from ui.components import BaseFrame, MessageDialog, VirtualTreeview
 
 
 class FrameManagementFrame(BaseFrame):
@@ -166,7 +166,7 @@ class FrameManagementFrame(BaseFrame):
         # Create Treeview - columns vary based on admin status
         if self.is_admin():
             columns = ("ID", "Frame Name", "Size", "Buying", "Selling", "Price", "Qty", "Profit", "Created At")
-            self.tree = ttk.Treeview(table_container, columns=columns, show="headings", height=12)
+            self.tree = VirtualTreeview(table_container, columns=columns, show="headings", height=12)
             
             self.tree.heading("ID", text="🔢 ID")
             self.tree.heading("Frame Name", text="🖼️ Frame Name")
@@ -189,7 +189,7 @@ class FrameManagementFrame(BaseFrame):
             self.tree.column("Created At", width=130)
         else:
             columns = ("ID", "Frame Name", "Size", "Price", "Quantity", "Created At")
-            self.tree = ttk.Treeview(table_container, columns=columns, show="headings", height=12)
+            self.tree = VirtualTreeview(table_container, columns=columns, show="headings", height=12)
             
             self.tree.heading("ID", text="🔢 ID")
             self.tree.heading("Frame Name", text="🖼️ Frame Name")
@@ -372,27 +372,25 @@ class FrameManagementFrame(BaseFrame):
         self.delete_btn.configure(state="disabled" if not self.is_admin() else "normal")
         self.name_entry.focus()
     
+    def refresh(self):
+        """Reload photo frames"""
+        self.load_frames()
+    
     def load_frames(self):
         """Load all photo frames"""
-        # Clear table
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
         frames = self.db_manager.get_all_photo_frames()
         
-        for i, frame in enumerate(frames):
+        rows = []
+        for frame in frames:
             buying = frame.get('buying_price', 0) or 0
             selling = frame.get('selling_price', 0) or 0
             profit = selling - buying
             
-            # Color code low stock items, otherwise use alternating colors
-            if frame['quantity'] < 10:
-                tag = 'lowstock'
-            else:
-                tag = 'evenrow' if i % 2 == 0 else 'oddrow'
+            # Color code low stock items; the table stripes the rest
+            tags = ('lowstock',) if frame['quantity'] < 10 else ()
             
             if self.is_admin():
-                self.tree.insert("", "end", values=(
+                rows.append((None, (
                     frame['id'],
                     frame['frame_name'],
                     frame['size'],
@@ -402,16 +400,17 @@ class FrameManagementFrame(BaseFrame):
                     frame['quantity'],
                     f"{profit:.2f}",
                     frame['created_at']
-                ), tags=(tag,))
+                ), tags))
             else:
-                self.tree.insert("", "end", values=(
+                rows.append((None, (
                     frame['id'],
                     frame['frame_name'],
                     frame['size'],
                     f"{frame['price']:.2f}",
                     frame['quantity'],
                     frame['created_at']
-                ), tags=(tag,))
+                ), tags))
+        self.tree.set_rows(rows)
         
         # Update record count
         self.record_count_label.configure(text=f"{len(frames)} records")
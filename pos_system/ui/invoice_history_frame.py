@@ -1,7 +1,7 @@
 import customtkinter as ctk
 from tkinter import ttk
-from ui.components import BaseFrame, MessageDialog
-from services import InvoiceGenerator
+from ui.components import BaseFrame, MessageDialog, PagedTreeLoader, SearchController, VirtualTreeview
+from utils import LazyInstance
 
 
 class InvoiceHistoryFrame(BaseFrame):
@@ -9,8 +9,11 @@ class InvoiceHistoryFrame(BaseFrame):
     
     def __init__(self, parent, auth_manager, db_manager):
         super().__init__(parent, auth_manager, db_manager)
-        self.invoice_generator = InvoiceGenerator()
+        # Loads ReportLab on first use
+        self.invoice_generator = LazyInstance('services.invoice_generator:InvoiceGenerator')
         self.current_filter = "All"  # Show all records by default
+        # Status filter and search term of the rows currently shown, for paging
+        self.listing = ("All", "")
         self.create_widgets()
         self.load_invoices()
     
@@ -99,7 +102,7 @@ class InvoiceHistoryFrame(BaseFrame):
         
         self.search_entry = ctk.CTkEntry(search_middle, width=200, height=35, corner_radius=15, border_width=1)
         self.search_entry.pack(side="left", padx=5, pady=15)
-        self.search_entry.bind("<KeyRelease>", lambda e: self.search_invoices())
+        self.search = SearchController(self, self.search_entry, self.query_invoices, self.show_invoices)
         
         # Right side - Action buttons
         actions_right = ctk.CTkFrame(controls_frame, fg_color="transparent")
@@ -194,7 +197,7 @@ class InvoiceHistoryFrame(BaseFrame):
         table_container.pack(fill="both", expand=True, padx=10, pady=(0, 10))
         
         columns = ("Invoice #", "Date", "Customer", "Mobile", "Service", "Total", "Paid", "Balance")
-        self.tree = ttk.Treeview(table_container, columns=columns, show="headings", height=18)
+        self.tree = VirtualTreeview(table_container, columns=columns, show="headings", height=18)
         
         self.tree.heading("Invoice #", text="🔢 Invoice #")
         self.tree.heading("Date", text="📅 Date")
@@ -220,7 +223,9 @@ class InvoiceHistoryFrame(BaseFrame):
         self.tree.tag_configure('hasbalance', background='#3a2e1e', foreground='#ffd93d')
         
         scrollbar = ttk.Scrollbar(table_container, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        
+        # Pages of invoices are fetched as the table is scrolled
+        self.loader = PagedTreeLoader(self.tree, scrollbar, self.fetch_invoices_page, self.insert_invoice_rows)
         
         self.tree.pack(side="left", fill="both", expand=True, padx=(5, 0), pady=5)
         scrollbar.pack(side="right", fill="y", pady=5, padx=(0, 5))
@@ -246,53 +251,46 @@ class InvoiceHistoryFrame(BaseFrame):
         
         return service_name
     
-    def get_booking_status(self, booking_id):
-        """Get booking status if this is a booking invoice"""
-        if not booking_id:
-            return "Completed"  # Default for non-booking invoices
-        
-        booking = self.db_manager.get_booking_by_id(booking_id)
-        if booking:
-            return booking.get('status', 'Completed')
-        return "Completed"
+    def refresh(self):
+        """Reload invoices for the current filter and search"""
+        self.load_invoices()
     
     def load_invoices(self):
-        """Load booking invoices (respects current filter)"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Get only booking invoices (invoice_number starts with 'BK-' or has booking_id)
-        all_invoices = self.db_manager.get_all_invoices(limit=200)
-        booking_invoices = [inv for inv in all_invoices if inv['invoice_number'].startswith('BK-') or inv.get('booking_id')]
-        
-        # Apply status filter
-        if self.current_filter != "All":
-            invoices = []
-            for inv in booking_invoices:
-                booking_status = self.get_booking_status(inv.get('booking_id'))
-                if booking_status == self.current_filter:
-                    invoices.append(inv)
-        else:
-            invoices = booking_invoices
+        """Load booking invoices (respects current filter and search)"""
+        self.search.run_now()
+    
+    def query_invoices(self, search_term):
+        """Fetch the first page and total for the current filter (worker thread)"""
+        listing = (self.current_filter, search_term)
+        page = self.db_manager.get_invoices_page(True, *listing)
+        total = self.db_manager.count_invoices(True, *listing)
+        return listing, page, total
+    
+    def show_invoices(self, search_term, results):
+        """Show the first page of a finished search"""
+        self.listing, page, total = results
+        self.loader.reset(page)
         
-        for i, invoice in enumerate(invoices):
-            balance = invoice['balance_amount']
-            # Highlight invoices with pending balance
-            if balance > 0:
-                tag = 'hasbalance'
-            else:
-                tag = 'evenrow' if i % 2 == 0 else 'oddrow'
+        # Update record count
+        self.record_count_label.configure(text=f"{total} records")
+    
+    def fetch_invoices_page(self, cursor):
+        """Fetch the next page of booking invoices matching the current filter"""
+        return self.db_manager.get_invoices_page(True, *self.listing, cursor=cursor)
+    
+    def insert_invoice_rows(self, invoices):
+        """Append a page of invoices to the table"""
+        rows = []
+        for invoice in invoices:
+            # Highlight invoices with pending balance; the table stripes the rest
+            tags = ('hasbalance',) if invoice['balance_amount'] > 0 else ()
             
-            # Get service name from booking
+            # Service name comes from the booking joined into the listing
             service_name = 'N/A'
-            if invoice.get('booking_id'):
-                booking = self.db_manager.get_booking_by_id(invoice['booking_id'])
-                if booking:
-                    service_name = booking.get('photoshoot_category', 'N/A')
-                    # Format service name
-                    service_name = self.format_service_name(service_name)
+            if invoice.get('booking_category'):
+                service_name = self.format_service_name(invoice['booking_category'])
             
-            self.tree.insert("", "end", values=(
+            rows.append((None, (
                 invoice['invoice_number'],
                 invoice['created_at'],
                 invoice['full_name'],
@@ -301,65 +299,13 @@ class InvoiceHistoryFrame(BaseFrame):
                 f"{invoice['total_amount']:.2f}",
                 f"{invoice['paid_amount']:.2f}",
                 f"{invoice['balance_amount']:.2f}"
-            ), tags=(tag,))
-        
-        # Update record count
-        self.record_count_label.configure(text=f"{len(invoices)} records")
+            ), tags))
+        self.tree.append_rows(rows)
     
     def search_invoices(self):
         """Search booking invoices (respects current filter)"""
-        search_term = self.search_entry.get().strip()
-        
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        if not search_term:
-            self.load_invoices()
-            return
-        
-        all_invoices = self.db_manager.search_invoices(search_term)
-        # Filter to only booking invoices
-        booking_invoices = [inv for inv in all_invoices if inv['invoice_number'].startswith('BK-') or inv.get('booking_id')]
-        
-        # Apply status filter
-        if self.current_filter != "All":
-            invoices = []
-            for inv in booking_invoices:
-                booking_status = self.get_booking_status(inv.get('booking_id'))
-                if booking_status == self.current_filter:
-                    invoices.append(inv)
-        else:
-            invoices = booking_invoices
-        
-        for i, invoice in enumerate(invoices):
-            balance = invoice['balance_amount']
-            if balance > 0:
-                tag = 'hasbalance'
-            else:
-                tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            
-            # Get service name from booking
-            service_name = 'N/A'
-            if invoice.get('booking_id'):
-                booking = self.db_manager.get_booking_by_id(invoice['booking_id'])
-                if booking:
-                    service_name = booking.get('photoshoot_category', 'N/A')
-                    # Format service name
-                    service_name = self.format_service_name(service_name)
-            
-            self.tree.insert("", "end", values=(
-                invoice['invoice_number'],
-                invoice['created_at'],
-                invoice['full_name'],
-                invoice['mobile_number'],
-                service_name,
-                f"{invoice['total_amount']:.2f}",
-                f"{invoice['paid_amount']:.2f}",
-                f"{invoice['balance_amount']:.2f}"
-            ), tags=(tag,))
-        
-        # Update record count
-        self.record_count_label.configure(text=f"{len(invoices)} records")
+        # The search term is applied in SQL alongside the status filter
+        self.search.run_now()
     
     def filter_by_status(self, status):
         """Filter invoices by booking status"""
@@ -212,6 +212,10 @@ class PermissionsFrame(ctk.CTkFrame):
         
         self.permission_switches[perm_key] = switch
     
+    def refresh(self):
+        """Reload staff users"""
+        self.load_staff_users()
+    
     def load_staff_users(self):
         """Load staff users into the list"""
         # Clear existing
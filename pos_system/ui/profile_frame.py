@@ -1,7 +1,7 @@
 import customtkinter as ctk
 from tkinter import filedialog
 from services.user_service import UserService
-from ui.components import Toast
+from ui.components import Toast, asset_image
 from PIL import Image
 import os
 
@@ -278,26 +278,8 @@ class ProfileFrame(ctk.CTkFrame):
         try:
             profile_path = self.user_service.get_profile_picture(user_id)
             if profile_path and os.path.exists(profile_path):
-                img = Image.open(profile_path)
-                # Make square crop from center
-                min_dim = min(img.size)
-                left = (img.width - min_dim) // 2
-                top = (img.height - min_dim) // 2
-                img = img.crop((left, top, left + min_dim, top + min_dim))
-                img = img.resize((100, 100), Image.Resampling.LANCZOS)
-                
-                # Create circular mask
-                from PIL import ImageDraw
-                mask = Image.new('L', (100, 100), 0)
-                draw = ImageDraw.Draw(mask)
-                draw.ellipse((0, 0, 100, 100), fill=255)
-                
-                # Apply mask
-                output = Image.new('RGBA', (100, 100), (0, 0, 0, 0))
-                img = img.convert('RGBA')
-                output.paste(img, (0, 0), mask)
-                
-                self.profile_image = ctk.CTkImage(light_image=output, dark_image=output, size=(100, 100))
+                # Square crop, resize and circular mask come from the image cache
+                self.profile_image = asset_image(profile_path, (100, 100), mask='circle')
                 self.avatar_label.configure(image=self.profile_image, text="")
             else:
                 self.avatar_label.configure(image=None, text="👤", font=ctk.CTkFont(size=50))
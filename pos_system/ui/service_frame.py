@@ -178,6 +178,11 @@ class ServiceManagementFrame(BaseFrame):
         # Bind selection
         self.tree.bind("<<TreeviewSelect>>", self.on_select)
     
+    def refresh(self):
+        """Reload categories and services"""
+        self.load_categories()
+        self.load_services()
+    
     def load_categories(self):
         """Load categories for dropdown"""
         categories = self.db_manager.get_all_categories()
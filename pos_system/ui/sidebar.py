@@ -1,10 +1,11 @@
 import customtkinter as ctk
 from typing import Callable, Dict, List, Tuple
-from PIL import Image, ImageDraw, ImageOps
 import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import resource_path
+from utils.image_cache import get_image_cache
+from ui.components import asset_image
 
 
 class Sidebar(ctk.CTkFrame):
@@ -44,14 +45,14 @@ class Sidebar(ctk.CTkFrame):
         try:
             logo_path = resource_path(os.path.join("assets", "logos", "studio-logo.png"))
             if os.path.exists(logo_path):
-                logo_img = Image.open(logo_path)
                 # Calculate proportional width for text-based logo (expanded)
-                orig_width, orig_height = logo_img.size
+                orig_width, orig_height = get_image_cache().source_size(logo_path)
                 target_height = 50
                 aspect_ratio = orig_width / orig_height
                 target_width = int(target_height * aspect_ratio)
                 target_width = max(min(target_width, 220), 160)
-                self.sidebar_logo_image = ctk.CTkImage(light_image=logo_img, dark_image=logo_img, size=(target_width, target_height))
+                self.sidebar_logo_image = asset_image(logo_path, (target_width, target_height),
+                                                      scaling=ctk.ScalingTracker.get_widget_scaling(self))
                 
                 self.logo_img_label = ctk.CTkLabel(self.logo_frame, image=self.sidebar_logo_image, text="")
                 self.logo_img_label.pack(pady=(10, 5))
@@ -159,43 +160,8 @@ class Sidebar(ctk.CTkFrame):
             user_service = UserService()
             profile_path = user_service.get_profile_picture(user_id)
             if profile_path and os.path.exists(profile_path):
-                img = Image.open(profile_path)
-                
-                # Convert to RGB if necessary (handle RGBA, P mode, etc.)
-                if img.mode in ('RGBA', 'P', 'LA'):
-                    background = Image.new('RGB', img.size, (26, 26, 46))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                    img = background
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Object-fit: cover - crop from center to make square
-                width, height = img.size
-                min_dim = min(width, height)
-                
-                left = (width - min_dim) // 2
-                top = (height - min_dim) // 2
-                right = left + min_dim
-                bottom = top + min_dim
-                
-                img = img.crop((left, top, right, bottom))
-                img = img.resize(size, Image.Resampling.LANCZOS)
-                
-                # Create perfect circular mask with anti-aliasing
-                mask_size = (size[0] * 4, size[1] * 4)
-                mask = Image.new('L', mask_size, 0)
-                draw = ImageDraw.Draw(mask)
-                draw.ellipse((0, 0, mask_size[0] - 1, mask_size[1] - 1), fill=255)
-                mask = mask.resize(size, Image.Resampling.LANCZOS)
-                
-                output = Image.new('RGBA', size, (0, 0, 0, 0))
-                img_rgba = img.convert('RGBA')
-                output.paste(img_rgba, (0, 0))
-                output.putalpha(mask)
-                
-                self.user_avatar = ctk.CTkImage(light_image=output, dark_image=output, size=size)
+                # Cropped to a square, resized and circle-masked once per picture
+                self.user_avatar = asset_image(profile_path, size, mask='circle')
                 return self.user_avatar
         except Exception as e:
             print(f"Error loading sidebar avatar: {e}")
@@ -2,8 +2,8 @@ import customtkinter as ctk
 from tkinter import ttk
 from datetime import datetime, date
 from tkcalendar import DateEntry
-from ui.components import Toast
-from services.staff_report_generator import StaffReportGenerator
+from ui.components import Toast, run_report_job
+from utils import LazyInstance
 
 
 class StaffReportsFrame(ctk.CTkFrame):
@@ -14,7 +14,8 @@ class StaffReportsFrame(ctk.CTkFrame):
         
         self.auth_manager = auth_manager
         self.db_manager = db_manager
-        self.report_generator = StaffReportGenerator()
+        # Loads ReportLab on first use
+        self.report_generator = LazyInstance('services.staff_report_generator:StaffReportGenerator')
         self.selected_user_id = None
         self.selected_user_data = None
         
@@ -385,6 +386,10 @@ class StaffReportsFrame(ctk.CTkFrame):
         self.customers_tree.pack(side="left", fill="both", expand=True, padx=(5, 0), pady=5)
         scrollbar.pack(side="right", fill="y", pady=5, padx=(0, 5))
     
+    def refresh(self):
+        """Reload staff users"""
+        self.load_users()
+    
     def load_users(self):
         """Load all users into dropdown"""
         users = self.db_manager.get_all_users_for_reports()
@@ -492,17 +497,17 @@ class StaffReportsFrame(ctk.CTkFrame):
             return
         
         selected_date = self.date_entry.get_date().strftime('%Y-%m-%d')
+        staff_data = dict(self.selected_user_data)
+        records = self.current_records
         
-        try:
-            filepath = self.report_generator.generate_daily_report(
-                self.selected_user_data,
-                selected_date,
-                self.current_records
-            )
-            
+        def build(progress=None):
+            # Runs on the report worker thread, which also loads ReportLab
+            return self.report_generator.generate_daily_report(staff_data, selected_date, records,
+                                                               progress=progress)
+        
+        def on_success(filepath):
             # Open the PDF
             self.report_generator.open_report(filepath)
-            Toast.show_toast(self, "Success", "PDF report generated successfully!", "success")
-            
-        except Exception as e:
-            Toast.show_toast(self, "Error", f"Failed to generate report: {str(e)}", "error")
+            return "PDF report generated successfully!"
+        
+        run_report_job(self, f"Staff Report · {staff_data['full_name']}", build, on_success=on_success)
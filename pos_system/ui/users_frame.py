@@ -391,6 +391,11 @@ class UsersManagementFrame(ctk.CTkFrame):
         self.update_btn.configure(state="disabled")
         self.delete_btn.configure(state="disabled")
     
+    def refresh(self):
+        """Reload users"""
+        if self.auth_manager.is_admin():
+            self.load_users()
+    
     def load_users(self):
         """Load all users into table"""
         for item in self.tree.get_children():
@@ -3,5 +3,7 @@ Utility modules for the POS system.
 """
 
 from .resource_path import resource_path
+from .lazy import import_attribute, LazyInstance
+from .startup_profiler import startup_profiler
 
-__all__ = ['resource_path']
+__all__ = ['resource_path', 'import_attribute', 'LazyInstance', 'startup_profiler']
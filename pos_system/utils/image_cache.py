@@ -0,0 +1,178 @@
+"""
+Image Asset Cache
+
+Logos, window icons and profile pictures used to be decoded and
+LANCZOS-resized (and avatars circle-masked) every time a screen was built.
+ImageCache renders each (file, modification time, size, mask) variant once,
+keeps recent ones in memory and stores resized variants as PNG thumbnails
+on disk, so a restart loads a small PNG instead of decoding the original.
+
+Files bundled in the PyInstaller exe are re-extracted on every start, so
+their modification time is meaningless; they are keyed by path relative to
+the bundle and the exe's own modification time instead.
+"""
+
+import os
+import sys
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from PIL import Image, ImageDraw
+
+DEFAULT_CACHE_DIR = os.path.join('cache', 'images')
+
+# Supported masks: None (plain resize) or 'circle' (centre-cropped avatar)
+MASKS = (None, 'circle')
+
+
+def source_identity(path: str) -> Tuple[str, int]:
+    """(name, version) of an image file; version changes when the file does"""
+    bundle_dir = getattr(sys, '_MEIPASS', None)
+    absolute = os.path.abspath(path)
+    if bundle_dir and absolute.startswith(os.path.abspath(bundle_dir) + os.sep):
+        return os.path.relpath(absolute, bundle_dir), os.stat(sys.executable).st_mtime_ns
+    return absolute, os.stat(absolute).st_mtime_ns
+
+
+def render(img: Image.Image, size: Optional[Tuple[int, int]], mask: Optional[str]) -> Image.Image:
+    """Resize (and mask) a decoded image"""
+    if mask == 'circle':
+        # Flatten transparency onto the sidebar background
+        if img.mode in ('RGBA', 'P', 'LA'):
+            background = Image.new('RGB', img.size, (26, 26, 46))
+            if img.mode != 'RGBA':
+                img = img.convert('RGBA')
+            background.paste(img, mask=img.split()[-1])
+            img = background
+        elif img.mode != 'RGB':
+            img = img.convert('RGB')
+
+        # Object-fit: cover - crop from centre to make square
+        min_dim = min(img.size)
+        left = (img.width - min_dim) // 2
+        top = (img.height - min_dim) // 2
+        img = img.crop((left, top, left + min_dim, top + min_dim))
+        size = size or (min_dim, min_dim)
+        img = img.resize(size, Image.Resampling.LANCZOS)
+
+        # Circular mask drawn at 4x and scaled down for anti-aliasing
+        mask_size = (size[0] * 4, size[1] * 4)
+        circle = Image.new('L', mask_size, 0)
+        ImageDraw.Draw(circle).ellipse((0, 0, mask_size[0] - 1, mask_size[1] - 1), fill=255)
+        output = img.convert('RGBA')
+        output.putalpha(circle.resize(size, Image.Resampling.LANCZOS))
+        return output
+
+    if img.mode not in ('RGB', 'RGBA'):
+        img = img.convert('RGBA')
+    if size and img.size != tuple(size):
+        img = img.resize(size, Image.Resampling.LANCZOS)
+    return img
+
+
+class ImageCache:
+    """Rendered image variants in memory and resized thumbnails on disk"""
+
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR, max_entries: int = 64):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._images: 'OrderedDict[tuple, Image.Image]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, path: str, size: Optional[Tuple[int, int]] = None, mask: Optional[str] = None) -> tuple:
+        """Cache key of a variant; changes when the file is modified"""
+        if mask not in MASKS:
+            raise ValueError(f"Unknown image mask: {mask}")
+        name, version = source_identity(path)
+        return name, version, tuple(size) if size else None, mask
+
+    def source_size(self, path: str) -> Tuple[int, int]:
+        """Pixel size of the original image (reads only its header)"""
+        with Image.open(path) as img:
+            return img.size
+
+    def get(self, path: str, size: Optional[Tuple[int, int]] = None,
+            mask: Optional[str] = None) -> Image.Image:
+        """The image at path, resized to size and masked; treat it as read-only"""
+        key = self.key(path, size, mask)
+        with self._lock:
+            img = self._images.get(key)
+            if img is not None:
+                self._images.move_to_end(key)
+                return img
+
+        img = self._load_thumbnail(key) if size else None
+        if img is None:
+            with Image.open(path) as source:
+                source.load()
+                img = render(source, size, mask)
+                if img is source:
+                    # Closing the file would invalidate the image itself
+                    img = source.copy()
+            if size:
+                self._store_thumbnail(key, img)
+
+        with self._lock:
+            self._images[key] = img
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_entries:
+                self._images.popitem(last=False)
+        return img
+
+    def _thumbnail_paths(self, key: tuple) -> Tuple[str, str]:
+        """(file for this version, file name prefix shared by all versions)"""
+        name, version, size, mask = key
+        variant = hashlib.sha1(repr((name, size, mask)).encode('utf-8')).hexdigest()[:20]
+        return os.path.join(self.cache_dir, f"{variant}-{version}.png"), f"{variant}-"
+
+    def _load_thumbnail(self, key: tuple) -> Optional[Image.Image]:
+        """A stored thumbnail, or None"""
+        if not self.cache_dir:
+            return None
+        thumbnail_path, _ = self._thumbnail_paths(key)
+        try:
+            with Image.open(thumbnail_path) as img:
+                return img.copy()
+        except (OSError, ValueError):
+            return None
+
+    def _store_thumbnail(self, key: tuple, img: Image.Image):
+        """Save a thumbnail and drop older versions of the same variant"""
+        if not self.cache_dir:
+            return
+        thumbnail_path, prefix = self._thumbnail_paths(key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for existing in os.listdir(self.cache_dir):
+                if existing.startswith(prefix):
+                    os.remove(os.path.join(self.cache_dir, existing))
+            # Written under a temporary name so a crash never leaves half a PNG
+            temp_path = f"{thumbnail_path}.{threading.get_ident()}.tmp"
+            img.save(temp_path, format='PNG')
+            os.replace(temp_path, thumbnail_path)
+        except OSError as e:
+            print(f"Error storing image thumbnail: {e}")
+
+    def clear(self, remove_thumbnails: bool = False):
+        """Forget rendered images, and optionally the on-disk thumbnails"""
+        with self._lock:
+            self._images.clear()
+        if remove_thumbnails and self.cache_dir and os.path.isdir(self.cache_dir):
+            for existing in os.listdir(self.cache_dir):
+                if existing.endswith('.png'):
+                    os.remove(os.path.join(self.cache_dir, existing))
+
+
+_cache: Optional[ImageCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_image_cache() -> ImageCache:
+    """Get the shared image cache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ImageCache()
+        return _cache
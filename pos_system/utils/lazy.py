@@ -0,0 +1,50 @@
+"""
+Lazy Loading Helpers
+
+Startup only imports what the login window needs. UI pages and the
+ReportLab/matplotlib services behind them are named by "module:attribute"
+paths and imported the first time they are used.
+"""
+
+import importlib
+import threading
+from typing import Any
+
+
+def import_attribute(path: str) -> Any:
+    """Import "package.module:attribute" and return the attribute"""
+    module_name, _, attribute = path.partition(':')
+    module = importlib.import_module(module_name)
+    return getattr(module, attribute) if attribute else module
+
+
+class LazyInstance:
+    """Stand-in for an object whose class is imported and instantiated on
+    first attribute access.
+
+    LazyInstance('services.bill_generator:BillGenerator') behaves like
+    BillGenerator() once touched, without importing ReportLab up front.
+    """
+
+    def __init__(self, path: str, *args, **kwargs):
+        self._path = path
+        self._args = args
+        self._kwargs = kwargs
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def _resolve(self) -> Any:
+        """Build the real object (once)"""
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = import_attribute(self._path)(*self._args, **self._kwargs)
+        return self._instance
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set in __init__
+        return getattr(self._resolve(), name)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._instance is not None else 'not loaded'
+        return f"<LazyInstance {self._path} ({state})>"
@@ -0,0 +1,189 @@
+"""
+Startup Profiler
+
+Records how long each startup phase takes (imports, database setup, window
+styling, the login window, the first page after login) and what every module
+import cost, then appends one JSON record per run to a log file.
+
+Off by default. Enable it with the --profile-startup flag or by setting
+POS_PROFILE_STARTUP=1 (this also works for the packaged exe). The log goes
+to logs/startup_profile.jsonl, or to the file named by POS_PROFILE_LOG.
+Summarize it with benchmarks/startup_profile_report.py.
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import platform
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+ENV_FLAG = 'POS_PROFILE_STARTUP'
+ENV_LOG = 'POS_PROFILE_LOG'
+CLI_FLAG = '--profile-startup'
+DEFAULT_LOG = os.path.join('logs', 'startup_profile.jsonl')
+
+# Imports kept in each record, slowest first by cumulative time
+TOP_IMPORTS = 40
+
+
+class _TimedLoader:
+    """Wraps a module loader to time exec_module"""
+
+    def __init__(self, loader, timer: '_ImportTimer'):
+        self._loader = loader
+        self._timer = timer
+
+    def create_module(self, spec):
+        create = getattr(self._loader, 'create_module', None)
+        return create(spec) if create else None
+
+    def exec_module(self, module):
+        # The module should see its real loader, not this wrapper
+        module.__loader__ = self._loader
+        if getattr(module, '__spec__', None) is not None:
+            module.__spec__.loader = self._loader
+        self._timer.run(module.__name__, self._loader.exec_module, module)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimer:
+    """Meta path hook recording self and cumulative time per imported module"""
+
+    def __init__(self):
+        self.modules: Dict[str, List[float]] = {}
+        self._local = threading.local()
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def run(self, name: str, exec_module, module):
+        """Execute a module, charging nested imports to their own modules"""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            cumulative = time.perf_counter() - started
+            nested = stack.pop()
+            if stack:
+                stack[-1] += cumulative
+            self.modules[name] = [(cumulative - nested) * 1000, cumulative * 1000]
+
+
+class StartupProfiler:
+    """Phase and import timings for one application start"""
+
+    def __init__(self):
+        self.enabled = False
+        self.log_path = DEFAULT_LOG
+        self._origin = time.perf_counter()
+        self._phases = []
+        self._marks = []
+        self._depth = 0
+        self._import_timer: Optional[_ImportTimer] = None
+        self._finished = False
+
+    def start(self, argv: Optional[List[str]] = None, environ=None) -> bool:
+        """Turn profiling on if requested by flag or environment"""
+        argv = sys.argv if argv is None else argv
+        environ = os.environ if environ is None else environ
+        if self.enabled:
+            return True
+        if CLI_FLAG not in argv and environ.get(ENV_FLAG, '').lower() not in ('1', 'true', 'yes'):
+            return False
+        if CLI_FLAG in argv:
+            argv.remove(CLI_FLAG)
+
+        self.enabled = True
+        self.log_path = environ.get(ENV_LOG) or DEFAULT_LOG
+        self._import_timer = _ImportTimer()
+        sys.meta_path.insert(0, self._import_timer)
+        atexit.register(self.finish)
+        return True
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since this module was imported"""
+        return (time.perf_counter() - self._origin) * 1000
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block of startup work"""
+        if not self.enabled:
+            yield
+            return
+        started = self.elapsed_ms()
+        # Appended on entry so phases stay in start order, parents first
+        entry = {'name': name, 'start_ms': round(started, 2), 'duration_ms': None,
+                 'depth': self._depth}
+        self._phases.append(entry)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            entry['duration_ms'] = round(self.elapsed_ms() - started, 2)
+
+    def mark(self, name: str):
+        """Record the moment a startup milestone is reached"""
+        if self.enabled:
+            self._marks.append({'name': name, 'at_ms': round(self.elapsed_ms(), 2)})
+
+    def record(self) -> dict:
+        """The profile collected so far"""
+        modules = self._import_timer.modules if self._import_timer else {}
+        imports = sorted(([name, round(self_ms, 2), round(cumulative_ms, 2)]
+                          for name, (self_ms, cumulative_ms) in list(modules.items())),
+                         key=lambda item: -item[2])
+        return {
+            'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'frozen': bool(getattr(sys, 'frozen', False)),
+            'executable': sys.executable,
+            'total_ms': round(self.elapsed_ms(), 2),
+            'phases': [dict(phase) for phase in self._phases],
+            'marks': self._marks,
+            'import_count': len(imports),
+            'import_ms': round(sum(item[1] for item in imports), 2),
+            'imports': imports[:TOP_IMPORTS],
+        }
+
+    def finish(self):
+        """Write the record to the log and stop profiling (once)"""
+        if not self.enabled or self._finished:
+            return
+        self._finished = True
+        if self._import_timer in sys.meta_path:
+            sys.meta_path.remove(self._import_timer)
+        try:
+            directory = os.path.dirname(self.log_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(self.record()) + '\n')
+            print(f"Startup profile written to {self.log_path}")
+        except OSError as e:
+            print(f"Error writing startup profile: {e}")
+
+
+startup_profiler = StartupProfiler()